@@ -0,0 +1,82 @@
+"""
+    Scheduler and Allocation - create teacher/lab/course schedules
+    Copyright (C) 2025  Sandy Bultena
+
+    This program comes with ABSOLUTELY NO WARRANTY.
+    This is free software, and licensed under the GNU General Public License.
+    (see <https://www.gnu.org/licenses/>)
+"""
+import argparse
+import os
+import sys
+
+bin_dir: str = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(bin_dir, "../"))
+
+def CIReport():
+    """write the CI of every teacher in the department (csv or json) for the given semester files"""
+    from scheduling_and_allocation.model import load_many, SemesterType, CouldNotReadFileError
+    from scheduling_and_allocation.ci_calculator.ci_report import department_report, write_csv, write_json
+    from scheduling_and_allocation.ci_calculator.ci_formula import load_formulas
+
+    parser = argparse.ArgumentParser(prog="CIReport", description="CI report for all teachers in a department")
+    parser.add_argument("--fall", help="fall schedule csv file")
+    parser.add_argument("--winter", help="winter schedule csv file")
+    parser.add_argument("--summer", help="summer schedule csv file")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv", help="report format (default csv)")
+    parser.add_argument("--alias", action="append", default=[], metavar="OTHER_ID=TEACHER_ID",
+                        help="same teacher with a different name in another semester (can be repeated)")
+    parser.add_argument("--formulas", metavar="FILE",
+                        help="ini file with the CI constants of each agreement (default: the built in constants)")
+    parser.add_argument("--agreement", metavar="VERSION",
+                        help="which agreement in the formulas file to use (default: the last one)")
+    parser.add_argument("-o", "--output", help="report file (default: standard output)")
+    args = parser.parse_args()
+
+    files = {semester: getattr(args, semester.name) for semester in
+             (SemesterType.fall, SemesterType.winter, SemesterType.summer)}
+    files = {semester: file for semester, file in files.items() if file}
+    if not files:
+        parser.error("at least one of --fall, --winter or --summer is required")
+
+    aliases = {}
+    for alias in args.alias:
+        if "=" not in alias:
+            parser.error(f"alias '{alias}' is not OTHER_ID=TEACHER_ID")
+        other, teacher = alias.split("=", 1)
+        aliases[other] = teacher
+
+    formula = None
+    if args.formulas:
+        try:
+            formulas = load_formulas(args.formulas)
+        except (FileNotFoundError, ValueError) as e:
+            print(e, file=sys.stderr)
+            sys.exit(2)
+        if not formulas:
+            parser.error(f"{args.formulas} does not have any agreements")
+        version = args.agreement if args.agreement else list(formulas)[-1]
+        if version not in formulas:
+            parser.error(f"agreement '{version}' is not in {args.formulas}")
+        formula = formulas[version]
+    elif args.agreement:
+        parser.error("--agreement needs --formulas")
+
+    try:
+        schedules = dict(zip(files.keys(), load_many(files.values())))
+    except CouldNotReadFileError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+    report = department_report(schedules, aliases, formula)
+    write = write_json if args.format == "json" else write_csv
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write(report, f)
+    else:
+        write(report, sys.stdout)
+
+
+
+if __name__ == "__main__":
+    CIReport()
@@ -0,0 +1,43 @@
+"""
+    Scheduler and Allocation - create teacher/lab/course schedules
+    Copyright (C) 2025  Sandy Bultena
+
+    This program comes with ABSOLUTELY NO WARRANTY.
+    This is free software, and licensed under the GNU General Public License.
+    (see <https://www.gnu.org/licenses/>)
+"""
+import argparse
+import os
+import sys
+
+bin_dir: str = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(bin_dir, "../"))
+
+def ScheduleDiff():
+    """show what has changed between two schedule files, exit status is 1 if they are different"""
+    from scheduling_and_allocation.model import load_many, diff_schedules, CouldNotReadFileError
+
+    parser = argparse.ArgumentParser(prog="ScheduleDiff", description="show the differences between two schedules")
+    parser.add_argument("old", help="original schedule csv file")
+    parser.add_argument("new", help="modified schedule csv file")
+    parser.add_argument("--kind", action="append",
+                        choices=("teacher", "lab", "stream", "course", "section", "block", "allocation"),
+                        help="only show changes of this kind (can be repeated)")
+    args = parser.parse_args()
+
+    try:
+        old, new = load_many((args.old, args.new))
+    except CouldNotReadFileError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+    changes = [c for c in diff_schedules(old, new) if args.kind is None or c.kind in args.kind]
+    for change in changes:
+        print(change)
+
+    sys.exit(1 if changes else 0)
+
+
+
+if __name__ == "__main__":
+    ScheduleDiff()
@@ -0,0 +1,38 @@
+"""
+    Scheduler and Allocation - create teacher/lab/course schedules
+    Copyright (C) 2025  Sandy Bultena
+
+    This program comes with ABSOLUTELY NO WARRANTY.
+    This is free software, and licensed under the GNU General Public License.
+    (see <https://www.gnu.org/licenses/>)
+"""
+import argparse
+import os
+import sys
+
+bin_dir: str = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(bin_dir, "../"))
+
+def ScheduleLint():
+    """check schedule files for problems, exit status is 1 if any errors were found"""
+    from scheduling_and_allocation.model.lint import lint_file, ERROR
+
+    parser = argparse.ArgumentParser(prog="ScheduleLint", description="check schedule csv files for problems")
+    parser.add_argument("files", nargs="+", help="schedule csv files")
+    parser.add_argument("--errors-only", action="store_true", help="do not report warnings")
+    args = parser.parse_args()
+
+    found_errors = False
+    for file in args.files:
+        for msg in lint_file(file):
+            if args.errors_only and msg.level != ERROR:
+                continue
+            found_errors = found_errors or msg.level == ERROR
+            print(f"{file}: {msg}")
+
+    sys.exit(1 if found_errors else 0)
+
+
+
+if __name__ == "__main__":
+    ScheduleLint()
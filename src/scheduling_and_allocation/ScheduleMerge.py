@@ -0,0 +1,43 @@
+"""
+    Scheduler and Allocation - create teacher/lab/course schedules
+    Copyright (C) 2025  Sandy Bultena
+
+    This program comes with ABSOLUTELY NO WARRANTY.
+    This is free software, and licensed under the GNU General Public License.
+    (see <https://www.gnu.org/licenses/>)
+"""
+import argparse
+import os
+import sys
+
+bin_dir: str = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.join(bin_dir, "../"))
+
+def ScheduleMerge():
+    """merge two schedules that were edited from the same original, exit status is 1 if there were conflicts"""
+    from scheduling_and_allocation.model import merge_files, CouldNotReadFileError, CouldNotWriteFileError
+
+    parser = argparse.ArgumentParser(prog="ScheduleMerge",
+                                     description="merge two edited copies of the same schedule")
+    parser.add_argument("base", help="the original schedule csv file")
+    parser.add_argument("ours", help="our edited copy (wins any conflicts)")
+    parser.add_argument("theirs", help="their edited copy")
+    parser.add_argument("-o", "--output", required=True, help="where to write the merged schedule")
+    args = parser.parse_args()
+
+    try:
+        merged, conflicts = merge_files(args.base, args.ours, args.theirs)
+        merged.write_file(args.output)
+    except (CouldNotReadFileError, CouldNotWriteFileError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+    for conflict in conflicts:
+        print(conflict)
+
+    sys.exit(1 if conflicts else 0)
+
+
+
+if __name__ == "__main__":
+    ScheduleMerge()
@@ -6,6 +6,7 @@
     This is free software, and licensed under the GNU General Public License.
     (see <https://www.gnu.org/licenses/>)
 """
+import argparse
 import os
 import sys
 import traceback
@@ -14,6 +15,24 @@ bin_dir: str = os.path.dirname(os.path.realpath(__file__))
 sys.path.append(os.path.join(bin_dir, "../"))
 
 def SchedulerProgram():
+    parser = argparse.ArgumentParser(prog="Scheduler", description="create teacher/lab/course schedules")
+    parser.add_argument("file", nargs="?", help="schedule csv file (required with --export)")
+    parser.add_argument("--export", choices=("pdf", "latex", "svg"),
+                        help="export the schedule views, without starting the gui")
+    parser.add_argument("--type", choices=("teacher", "lab", "stream", "all"), default="all",
+                        help="which views to export (default: all)")
+    parser.add_argument("--output-dir", default=".", help="where to write the exported files (default: .)")
+    parser.add_argument("--one-file", action="store_true",
+                        help="export all the views as pages of one file (pdf or latex only)")
+    args, _ = parser.parse_known_args()
+
+    if args.export:
+        if not args.file:
+            parser.error("--export requires a schedule file")
+        if args.one_file and args.export == "svg":
+            parser.error("--one-file can not be used with svg")
+        sys.exit(export_views(args.file, args.export, args.type, args.output_dir, args.one_file))
+
     try:
         from scheduling_and_allocation.presenter.scheduler import Scheduler
         Scheduler(bin_dir=bin_dir)
@@ -40,5 +59,45 @@ def SchedulerProgram():
 
 
 
+def export_views(file: str, canvas_name: str, type_name: str, directory: str, one_file: bool = False) -> int:
+    """
+    export the views of a schedule (no gui is required)
+    :return: the exit status (1 if any files could not be written, 2 if the schedule could not be read)
+    """
+    from scheduling_and_allocation.model import Schedule, ResourceType, CouldNotReadFileError
+    from scheduling_and_allocation.export.batch_export import BatchExport, CanvasType, export_jobs, EXTENSIONS
+
+    try:
+        schedule = Schedule(file)
+    except CouldNotReadFileError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    canvas_type = CanvasType[canvas_name]
+    resource_types = (ResourceType.teacher, ResourceType.lab, ResourceType.stream) if type_name == "all" \
+        else (ResourceType[type_name],)
+    jobs = []
+    for resource_type in resource_types:
+        group = f"{resource_type.name.capitalize()}s" if len(resource_types) > 1 else ""
+        jobs.extend(export_jobs(schedule, resource_type, canvas_type, directory, group))
+
+    document = None
+    if one_file:
+        name = os.path.splitext(os.path.basename(file))[0]
+        what = f"{type_name}s" if type_name != "all" else "all"
+        document = os.path.join(directory, f"{name}_{what}.{EXTENSIONS[canvas_type]}")
+
+    exporter = BatchExport(jobs, document=document, title=f"{schedule.filename} ({type_name})")
+    exporter.start()
+    progress = exporter.wait()
+
+    for written in progress.files:
+        print(written)
+    for error in progress.errors:
+        print(error, file=sys.stderr)
+    return 1 if progress.errors else 0
+
+
+
 if __name__ == "__main__":
     SchedulerProgram()
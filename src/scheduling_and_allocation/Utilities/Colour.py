@@ -8,7 +8,6 @@ Allows the user to manipulate colors.
 
 RGB is in readable format (#......) unless specified otherwise.
 """
-import re
 
 """
 
@@ -24,34 +23,10 @@ print(Colour.string("mistyrose3"))          # "#FF0000"
 print(Colour.hsl_from_percent(0, 1, 0.5))   # "#FF0000"
 """
 
-colour_list: dict[str, tuple[int, int, int]] = dict()
-
 MAX_COLOUR = 255
 LEN = 2
 
 
-# --------------------------------------------------------
-# __initialize_colours
-# --------------------------------------------------------
-def initialize_colours():
-    """this function initializes all the colors"""
-    global colour_list
-
-    # if we have already done this, don't do it again
-    if colour_list:
-        return
-
-    _colour_list = __colour_data.split("\n")
-    for c in _colour_list:
-        if not c:
-            continue
-        r, g, b, name = re.split(r"\s+", c.strip(), 3)
-        if not name:
-            continue
-        name: str = name.strip()
-        colour_list[name] = (int(r), int(g), int(b))
-
-
 # --------------------------------------------------------
 # _rgb2hsl
 # Source:
@@ -151,10 +126,7 @@ def string(colour: str) -> str:
     global LEN
     if colour[0] != "#":
         colour_string: str = "#000000"
-        if not colour_list:
-            initialize_colours()
-
-        if colour_list and colour in colour_list:
+        if colour in colour_list:
             colour_string = get_colour_string_from_rgb(
                 colour_list[colour][0] / 255,
                 colour_list[colour][1] / 255,
@@ -310,756 +282,760 @@ def add(c1: str, c2: str) -> str:
     return get_colour_string_from_rgb(r1 * r2, g1 * g2, b1 * b2)
 
 
-__colour_data = """
-199  21 133		medium violet red
-176 196 222		light steel blue
-102 139 139		paleturquoise4
-159 121 238		mediumpurple2
-141 182 205		lightskyblue3
-  0 238 118		springgreen2
-255 160 122		light salmon
-154 205  50		yellowgreen
-178  58 238		darkorchid2
- 69 139 116		aquamarine4
- 71  60 139		slateblue4
-131 111 255		slateblue1
-192 255  62		olivedrab1
-139 105  20		goldenrod4
-205 155  29		goldenrod3
-142 229 238		cadetblue2
-255 211 155		burlywood1
-112 128 144		slategrey
-255 228 225		mistyrose
- 50 205  50		limegreen
-224 255 255		lightcyan
-218 165  32		goldenrod
-220 220 220		gainsboro
-135 206 255		skyblue1
-240 255 240		honeydew
-238 238   0		yellow2
-205  79  57		tomato3
-135 206 235		skyblue
- 85  26 139		purple4
-205 133   0		orange3
-205 183 158		bisque3
-238 213 183		bisque2
- 87  87  87		grey34
-252 252 252		gray99
-161 161 161		gray63
-112 112 112		gray44
- 94  94  94		gray37
- 84  84  84		gray33
- 66  66  66		gray26
-240 255 255		azure1
-139 137 137		snow4
-205 133  63		peru
-219 112 147		pale violet red
-139 129  76		lightgoldenrod4
- 60 179 113		mediumseagreen
-255 240 245		lavender blush
-209  95 238		mediumorchid2
-176 226 255		lightskyblue1
- 72  61 139		darkslateblue
- 25  25 112		midnightblue
-255 160 122		lightsalmon1
-255 250 205		lemonchiffon
-173 255  47		green yellow
-255 160 122		lightsalmon
-240 128 128		light coral
- 24 116 205		dodgerblue3
-139  69   0		darkorange4
-106  90 205		slate blue
- 39  64 139		royalblue4
-255  69   0		orange red
- 50 205  50		lime green
-224 255 255		light cyan
-148   0 211		darkviolet
-233 150 122		darksalmon
-255 140   0		darkorange
- 95 158 160		cadet blue
-255  20 147		deep pink
-238   0 238		magenta2
-139  71  38		sienna4
-238 230 133		khaki2
-191 191 191		grey75
-189 189 189		grey74
-186 186 186		grey73
-176 176 176		grey69
-173 173 173		grey68
- 89  89  89		grey35
- 33  33  33		grey13
-229 229 229		gray90
-207 207 207		gray81
-140 140 140		gray55
-130 130 130		gray51
- 79  79  79		gray31
-238 233 233		snow2
-205 145 158		pink3
- 18  18  18		grey7
-  3   3   3		gray1
-139   0   0		red4
-205   0   0		red3
-210 180 140		tan
-255   0   0		red
-199  21 133		mediumvioletred
-119 136 153		lightslategrey
-135 206 250		lightskyblue
-139  87  66		lightsalmon4
- 34 139  34		forestgreen
- 16  78 139		dodgerblue4
-153  50 204		dark orchid
-188 143 143		rosy brown
-205 175 149		peachpuff3
-124 205 124		palegreen3
-238  64   0		orangered2
-122 139 139		lightcyan4
-139  58  58		indianred4
-205  85  85		indianred3
-  0   0 128		navyblue
-105 105 105		dim grey
-255  20 147		deeppink
-139  76  57		salmon4
-205 112  84		salmon3
-196 196 196		grey77
-145 145 145		gray57
- 28  28  28		gray11
-205 150 205		plum3
- 23  23  23		gray9
- 20  20  20		gray8
-  0   0 139		blue4
-245 245 220		beige
-250 250 210		light goldenrod yellow
-139 131 134		lavenderblush4
-  0 206 209		dark turquoise
-  0 206 209		darkturquoise
- 47  79  79		darkslategrey
-205 129  98		lightsalmon3
-139 105 105		rosybrown4
-255 228 225		misty rose
- 78 238 148		seagreen2
-205  92  92		indianred
-255  20 147		deeppink1
-  0   0 139		dark blue
-230 230 250		lavender
-253 245 230		oldlace
-199 199 199		grey78
-138 138 138		grey54
-115 115 115		grey45
- 54  54  54		grey21
-247 247 247		gray97
-245 245 245		gray96
-242 242 242		gray95
-224 224 224		gray88
-222 222 222		gray87
-219 219 219		gray86
-179 179 179		gray70
- 97  97  97		gray38
- 31  31  31		gray12
-250 240 230		linen
- 72 209 204		medium turquoise
- 72  61 139		dark slate blue
-139 137 112		lemonchiffon4
-193 255 193		darkseagreen1
-205 192 176		antiquewhite3
-186  85 211		mediumorchid
-  0 255 127		springgreen
-  0 134 139		turquoise4
- 79 148 205		steelblue3
-238 213 210		mistyrose2
-209 238 238		lightcyan2
-205  92  92		indian red
-238  44  44		firebrick2
- 65 105 225		royalblue
- 95 158 160		cadetblue
-108 166 205		skyblue3
-205 205   0		yellow3
-255 140 105		salmon1
-139  90   0		orange4
-255 105 180		hotpink
-229 229 229		grey90
-143 143 143		gray56
- 99  99  99		gray39
- 46  46  46		gray18
- 36  36  36		gray14
-139 102 139		plum4
- 15  15  15		grey6
- 15  15  15		gray6
-205 173   0		gold3
-255 215   0		gold1
-  0   0 238		blue2
-238 154  73		tan2
-  0 255 255		cyan
-  0 250 154		mediumspringgreen
-188 238 104		darkolivegreen2
-238 232 170		pale goldenrod
-176 196 222		lightsteelblue
-244 164  96		sandy brown
-255 239 213		papaya whip
-102 205   0		chartreuse3
-139  34  82		violetred4
- 67 110 238		royalblue2
- 72 118 255		royalblue1
-255 239 213		papayawhip
-205 183 181		mistyrose3
-224 255 255		lightcyan1
-127 255 212		aquamarine
- 74 112 139		skyblue4
-139  58  98		hotpink4
-205  96 144		hotpink3
-238 106 167		hotpink2
-169 169 169		darkgrey
-105 105 105		dimgray
-255  99  71		tomato
-168 168 168		grey66
-166 166 166		grey65
-163 163 163		grey64
- 84  84  84		grey33
- 69  69  69		grey27
-194 194 194		gray76
-176 176 176		gray69
-173 173 173		gray68
-  0   0   0		grey0
-240 255 255		azure
-  0 250 154		medium spring green
-139 101   8		darkgoldenrod4
-205 149  12		darkgoldenrod3
-238 173  14		darkgoldenrod2
-184 134  11		darkgoldenrod
-139  69  19		saddle brown
-238 149 114		lightsalmon2
-  0 104 139		deepskyblue4
-  0 154 205		deepskyblue3
-  0 178 238		deepskyblue2
-  0 191 255		deepskyblue
-255 127   0		darkorange1
-205  50 120		violetred3
-238  58 140		violetred2
-255  62 150		violetred1
-105  89 205		slateblue3
-122 103 238		slateblue2
-107 142  35		olive drab
-255 106 106		indianred1
-255  48  48		firebrick1
- 83 134 139		cadetblue4
-208  32 144		violetred
-188 143 143		rosybrown
-  0   0 128		navy blue
-178  34  34		firebrick
-139   0   0		dark red
-255 255 255		grey100
-139 126 102		wheat4
-201 201 201		grey79
-194 194 194		grey76
-156 156 156		grey61
-237 237 237		gray93
-214 214 214		gray84
-166 166 166		gray65
- 92  92  92		gray36
- 82  82  82		gray32
- 33  33  33		gray13
- 26  26  26		gray10
-193 205 205		azure3
-255 250 250		snow1
-255 165  79		tan1
-119 136 153		light slate gray
-202 255 112		darkolivegreen1
-100 149 237		cornflower blue
-255 235 205		blanched almond
-205 193 197		lavenderblush3
-238 224 229		lavenderblush2
-255 240 245		lavenderblush1
- 85 107  47		darkolivegreen
-255 240 245		lavenderblush
-118 238 198		aquamarine2
-208  32 144		violet red
-179 238  58		olivedrab2
-139 125 123		mistyrose4
-255 228 225		mistyrose1
-180 205 205		lightcyan3
-240 128 128		lightcoral
-127 255   0		chartreuse
-255 218 185		peachpuff
-152 251 152		palegreen
-245 255 250		mintcream
-126 192 238		skyblue2
-255 228 181		moccasin
-255  99  71		tomato1
-205 105 201		orchid3
-205  41 144		maroon3
-250 128 114		salmon
-207 207 207		grey81
-158 158 158		grey62
- 99  99  99		grey39
- 97  97  97		grey38
- 94  94  94		grey37
-235 235 235		gray92
-212 212 212		gray83
-168 168 168		gray66
-138 138 138		gray54
-127 127 127		gray50
- 77  77  77		gray30
- 48  48  48		gray19
- 38  38  38		gray15
-131 139 139		azure4
-  8   8   8		grey3
-205 133  63		tan3
-255 192 203		pink
-190 190 190		gray
-  0   0 255		blue
-188 210 238		lightsteelblue2
-202 225 255		lightsteelblue1
- 32 178 170		light sea green
-119 136 153		lightslategray
-238 233 191		lemonchiffon2
-  0 255 127		springgreen1
-173 255  47		greenyellow
-118 238   0		chartreuse2
-112 128 144		slate grey
- 58  95 205		royalblue3
-176 224 230		powderblue
-238 203 173		peachpuff2
-144 238 144		palegreen2
-245 255 250		mint cream
-106  90 205		slateblue
-238 229 222		seashell2
-238  18 137		deeppink2
-189 183 107		darkkhaki
-139  28  98		maroon4
-160  82  45		sienna
-181 181 181		grey71
-171 171 171		grey67
- 46  46  46		grey18
-150 150 150		gray59
-110 110 110		gray43
- 64  64  64		gray25
-255 228 196		bisque
-255   0   0		red1
-123 104 238		mediumslateblue
-255 236 139		lightgoldenrod1
-238 221 130		light goldenrod
-150 205 205		paleturquoise3
- 96 123 139		lightskyblue4
-  0 255 127		spring green
-255 255 224		light yellow
-245 245 245		white smoke
-  0   0 205		medium blue
-248 248 255		ghost white
- 54 100 139		steelblue4
-205 155 155		rosybrown3
-255 218 185		peachpuff1
-154 255 154		palegreen1
-138  43 226		blueviolet
-139 134 130		seashell4
-169 169 169		darkgray
-205 104  57		sienna3
-102 102 102		grey40
-232 232 232		gray91
-209 209 209		gray82
- 13  13  13		gray5
-  0 238 238		cyan2
-  0 255 255		cyan1
-  0   0 255		blue1
-255 250 250		snow
-238 220 130		lightgoldenrod2
-132 112 255		lightslateblue
-180  82 205		mediumorchid3
-105 139 105		darkseagreen4
-  0 205 102		springgreen3
- 34 139  34		forest green
-108 123 139		slategray4
-159 182 205		slategray3
-185 211 238		slategray2
- 65 105 225		royal blue
-139 119 101		peachpuff4
- 84 139  84		palegreen4
-152 251 152		pale green
-205  55   0		orangered3
-255 193  37		goldenrod1
-248 248 255		ghostwhite
-139  26  26		firebrick4
-205  38  38		firebrick3
-122 197 205		cadetblue3
-112 128 144		slategray
-205 197 191		seashell3
-193 205 193		honeydew3
-139 136 120		cornsilk4
-238 232 205		cornsilk2
-155  48 255		purple1
-105 105 105		dimgrey
-139   0   0		darkred
-255 246 143		khaki1
-205 205 193		ivory3
-179 179 179		grey70
-153 153 153		grey60
- 82  82  82		grey32
- 56  56  56		grey22
- 31  31  31		grey12
-250 250 250		gray98
-227 227 227		gray89
-181 181 181		gray71
-163 163 163		gray64
-153 153 153		gray60
-125 125 125		gray49
-224 238 238		azure2
-  8   8   8		gray3
-187 255 255		paleturquoise1
-171 130 255		mediumpurple1
-147 112 219		medium purple
-255 250 205		lemonchiffon1
-  0 191 255		deep sky blue
-205 179 139		navajowhite3
-191  62 255		darkorchid1
-255 140   0		dark orange
-238 180  34		goldenrod2
-189 183 107		dark khaki
-238 118  33		chocolate2
-238 197 145		burlywood2
-240 255 240		honeydew1
-  0 100   0		darkgreen
-205 181 205		thistle3
-238 210 238		thistle2
-255 225 255		thistle1
-  0   0 139		darkblue
-216 191 216		thistle
-238  48 167		maroon2
-255  52 179		maroon1
-135 135 135		grey53
-112 112 112		grey44
- 64  64  64		grey25
-189 189 189		gray74
-115 115 115		gray45
-105 105 105		gray41
- 89  89  89		gray35
- 69  69  69		gray27
- 59  59  59		gray23
- 41  41  41		gray16
-139  35  35		brown4
-245 222 179		wheat
-255 127  80		coral
-139  90  43		tan4
-250 250 210		lightgoldenrodyellow
-132 112 255		light slate blue
- 85 107  47		dark olive green
- 47  79  79		dark slate gray
-205 104 137		palevioletred3
- 93  71 139		mediumpurple4
-137 104 205		mediumpurple3
-139  69  19		saddlebrown
-176 224 230		powder blue
-104  34 139		darkorchid4
-154  50 205		darkorchid3
-255 218 185		peach puff
-105 139  34		olivedrab4
-104 131 139		lightblue4
-255 182 193		lightpink
-211 211 211		lightgray
-224 238 224		honeydew2
-255 248 220		cornsilk1
-253 245 230		old lace
-255 130  71		sienna1
-139 125 107		bisque4
-218 112 214		orchid
-205 198 115		khaki3
-214 214 214		grey84
-212 212 212		grey83
-209 209 209		grey82
-184 184 184		grey72
-133 133 133		grey52
-110 110 110		grey43
- 66  66  66		grey26
- 36  36  36		grey14
- 26  26  26		grey10
-191 191 191		gray75
-135 135 135		gray53
- 54  54  54		gray21
- 51  51  51		gray20
-205  51  51		brown3
- 20  20  20		grey8
-238   0   0		red2
-  0   0 128		navy
-190 190 190		grey
-255 215   0		gold
-102 205 170		mediumaquamarine
-238 221 130		lightgoldenrod
- 82 139 139		darkslategray4
-155 205 155		darkseagreen3
-180 238 180		darkseagreen2
-139 131 120		antiquewhite4
-250 235 215		antique white
-  0 139  69		springgreen4
-139 139 122		lightyellow4
-255 250 240		floral white
-127 255 212		aquamarine1
-  0 197 205		turquoise3
- 92 172 238		steelblue2
-238 180 180		rosybrown2
-255 182 193		light pink
-211 211 211		light gray
-238  99  99		indianred2
- 30 144 255		dodgerblue
-  0 100   0		dark green
- 84 255 159		seagreen1
-139  10  80		deeppink4
-240 248 255		aliceblue
-255   0 255		magenta1
-255 105 180		hot pink
-238 121  66		sienna2
-255 131 250		orchid1
-255 255 255		gray100
-247 247 247		grey97
-240 240 240		grey94
-222 222 222		grey87
-219 219 219		grey86
-130 130 130		grey51
-107 107 107		grey42
- 48  48  48		grey19
-240 240 240		gray94
-217 217 217		gray85
-156 156 156		gray61
-238  59  59		brown2
-240 230 140		khaki
-  3   3   3		grey1
-139 117   0		gold4
-123 104 238		medium slate blue
- 60 179 113		medium sea green
- 47  79  79		dark slate grey
-175 238 238		pale turquoise
-175 238 238		paleturquoise
-122  55 139		mediumorchid4
-238 223 204		antiquewhite2
-238 238 209		lightyellow2
-144 238 144		light green
-148   0 211		dark violet
-233 150 122		dark salmon
-127 255   0		chartreuse1
-  0 245 255		turquoise1
-244 164  96		sandybrown
-255  69   0		orangered1
-255 174 185		lightpink1
-178 223 238		lightblue2
-191 239 255		lightblue1
-211 211 211		light grey
- 46 139  87		seagreen4
- 67 205 128		seagreen3
-173 216 230		lightblue
-205  16 118		deeppink3
-169 169 169		dark grey
-  0 139 139		dark cyan
-222 184 135		burlywood
-255 245 238		seashell
-255 110 180		hotpink1
-105 105 105		dim gray
-  0 139 139		darkcyan
-139 139   0		yellow4
-255 255   0		yellow
-160  32 240		purple
-255 165   0		orange
-139 139 131		ivory4
-252 252 252		grey99
-227 227 227		grey89
-161 161 161		grey63
-148 148 148		grey58
-125 125 125		grey49
- 79  79  79		grey31
- 61  61  61		grey24
- 51  51  51		grey20
-  0 139   0		green4
-  0 255   0		green1
-186 186 186		gray73
-171 171 171		gray67
-205  91  69		coral3
-238 106  80		coral2
-238 174 238		plum2
-139  99 108		pink4
-255 255 240		ivory
- 10  10  10		gray4
-  5   5   5		gray2
-238 201   0		gold2
-102 205 170		medium aquamarine
-119 136 153		light slate grey
-205 190 112		lightgoldenrod3
-162 205  90		darkolivegreen3
-255 185  15		darkgoldenrod1
-184 134  11		dark goldenrod
-186  85 211		medium orchid
-255 250 205		lemon chiffon
-139 121  94		navajowhite4
-  0 191 255		deepskyblue1
-255 255 224		lightyellow
-255 250 240		floralwhite
- 30 144 255		dodger blue
-  0   0 205		mediumblue
-144 238 144		lightgreen
-139  69  19		chocolate4
-205 102  29		chocolate3
-139 115  85		burlywood4
- 64 224 208		turquoise
- 70 130 180		steelblue
- 46 139  87		sea green
-124 252   0		lawngreen
-131 139 131		honeydew4
-169 169 169		dark gray
- 46 139  87		seagreen
-139  71 137		orchid4
-255 231 186		wheat1
-238 130 238		violet
-255 255 240		ivory1
-224 224 224		grey88
-217 217 217		grey85
-145 145 145		grey57
-143 143 143		grey56
-140 140 140		grey55
-122 122 122		grey48
-120 120 120		grey47
-117 117 117		grey46
- 77  77  77		grey30
- 43  43  43		grey17
-120 120 120		gray47
- 74  74  74		gray29
-238 169 184		pink2
- 13  13  13		grey5
- 10  10  10		grey4
-  0 255   0		green
-  0   0   0		gray0
-165  42  42		brown
-110 123 139		lightsteelblue4
-110 139  61		darkolivegreen4
-139  71  93		palevioletred4
-135 206 250		light sky blue
-121 205 205		darkslategray3
-141 238 238		darkslategray2
-151 255 255		darkslategray1
-255 235 205		blanchedalmond
-238 232 170		palegoldenrod
- 25  25 112		midnight blue
- 32 178 170		lightseagreen
-205 201 165		lemonchiffon3
- 47  79  79		darkslategray
-154 205  50		yellow green
-143 188 143		darkseagreen
-250 235 215		antiquewhite
-238 118   0		darkorange2
- 69 139   0		chartreuse4
- 70 130 180		steel blue
-255 193 193		rosybrown1
-154 205  50		olivedrab3
-238 162 173		lightpink2
-255  69   0		orangered
-139 123 139		thistle4
-135 206 235		sky blue
-255 248 220		cornsilk
-238 130  98		salmon2
-238 122 233		orchid2
-238 238 224		ivory2
-237 237 237		grey93
-235 235 235		grey92
-232 232 232		grey91
- 92  92  92		grey36
- 74  74  74		grey29
- 71  71  71		grey28
- 41  41  41		grey16
-201 201 201		gray79
-199 199 199		gray78
-196 196 196		gray77
-122 122 122		gray48
- 43  43  43		gray17
-139  62  47		coral4
-255 114  86		coral1
-255 187 255		plum1
-255 181 197		pink1
- 23  23  23		grey9
-  5   5   5		grey2
- 18  18  18		gray7
-  0 139 139		cyan4
-  0   0 205		blue3
-221 160 221		plum
-100 149 237		cornflowerblue
-164 211 238		lightskyblue2
-255 239 219		antiquewhite1
-238 207 161		navajowhite2
-255 222 173		navajowhite1
-205 205 180		lightyellow3
-139   0 139		dark magenta
-255 222 173		navajowhite
-205 102   0		darkorange3
-245 245 245		whitesmoke
-  0 229 238		turquoise2
- 99 184 255		steelblue1
-139  95 101		lightpink4
-154 192 205		lightblue3
-124 252   0		lawn green
-255 127  36		chocolate1
-240 248 255		alice blue
-107 142  35		olivedrab
-211 211 211		lightgrey
-210 105  30		chocolate
-139   0 139		magenta4
-205   0 205		magenta3
-255 255   0		yellow1
-125  38 205		purple3
-145  44 238		purple2
-238 154   0		orange2
-255 165   0		orange1
-255   0 255		magenta
-255 228 196		bisque1
-238 216 174		wheat2
-176  48  96		maroon
-139 134  78		khaki4
-245 245 245		grey96
-242 242 242		grey95
-204 204 204		grey80
-127 127 127		grey50
-105 105 105		grey41
- 38  38  38		grey15
- 28  28  28		grey11
-204 204 204		gray80
-148 148 148		gray58
-102 102 102		gray40
- 87  87  87		gray34
- 56  56  56		gray22
-255  64  64		brown1
-205 201 201		snow3
- 72 209 204		mediumturquoise
-162 181 205		lightsteelblue3
-238 121 159		palevioletred2
-255 130 171		palevioletred1
-174 238 238		paleturquoise2
-143 188 143		dark sea green
-219 112 147		palevioletred
-224 102 255		mediumorchid1
-255 222 173		navajo white
-147 112 219		mediumpurple
-255 255 224		lightyellow1
- 28 134 238		dodgerblue2
- 30 144 255		dodgerblue1
-139   0 139		darkmagenta
-138  43 226		blue violet
-102 205 170		aquamarine3
-198 226 255		slategray1
-112 128 144		slate gray
-139  37   0		orangered4
-205 140 149		lightpink3
-173 216 230		light blue
-153  50 204		darkorchid
-152 245 255		cadetblue1
-205 170 125		burlywood3
-255 245 238		seashell1
-205 200 177		cornsilk3
-139  54  38		tomato4
-238  92  66		tomato2
-205 186 150		wheat3
-250 250 250		grey98
-150 150 150		grey59
- 59  59  59		grey23
-  0 205   0		green3
-  0 238   0		green2
-184 184 184		gray72
-158 158 158		gray62
-133 133 133		gray52
-117 117 117		gray46
-107 107 107		gray42
- 71  71  71		gray28
- 61  61  61		gray24
-255 255 255		white
-  0 205 205		cyan3
-  0   0   0		black"""
+# --------------------------------------------------------
+# colour names (as given by the *nix 'showrgb' command)
+# --------------------------------------------------------
+colour_list: dict[str, tuple[int, int, int]] = {
+    "medium violet red": (199, 21, 133),
+    "light steel blue": (176, 196, 222),
+    "paleturquoise4": (102, 139, 139),
+    "mediumpurple2": (159, 121, 238),
+    "lightskyblue3": (141, 182, 205),
+    "springgreen2": (0, 238, 118),
+    "light salmon": (255, 160, 122),
+    "yellowgreen": (154, 205, 50),
+    "darkorchid2": (178, 58, 238),
+    "aquamarine4": (69, 139, 116),
+    "slateblue4": (71, 60, 139),
+    "slateblue1": (131, 111, 255),
+    "olivedrab1": (192, 255, 62),
+    "goldenrod4": (139, 105, 20),
+    "goldenrod3": (205, 155, 29),
+    "cadetblue2": (142, 229, 238),
+    "burlywood1": (255, 211, 155),
+    "slategrey": (112, 128, 144),
+    "mistyrose": (255, 228, 225),
+    "limegreen": (50, 205, 50),
+    "lightcyan": (224, 255, 255),
+    "goldenrod": (218, 165, 32),
+    "gainsboro": (220, 220, 220),
+    "skyblue1": (135, 206, 255),
+    "honeydew": (240, 255, 240),
+    "yellow2": (238, 238, 0),
+    "tomato3": (205, 79, 57),
+    "skyblue": (135, 206, 235),
+    "purple4": (85, 26, 139),
+    "orange3": (205, 133, 0),
+    "bisque3": (205, 183, 158),
+    "bisque2": (238, 213, 183),
+    "grey34": (87, 87, 87),
+    "gray99": (252, 252, 252),
+    "gray63": (161, 161, 161),
+    "gray44": (112, 112, 112),
+    "gray37": (94, 94, 94),
+    "gray33": (84, 84, 84),
+    "gray26": (66, 66, 66),
+    "azure1": (240, 255, 255),
+    "snow4": (139, 137, 137),
+    "peru": (205, 133, 63),
+    "pale violet red": (219, 112, 147),
+    "lightgoldenrod4": (139, 129, 76),
+    "mediumseagreen": (60, 179, 113),
+    "lavender blush": (255, 240, 245),
+    "mediumorchid2": (209, 95, 238),
+    "lightskyblue1": (176, 226, 255),
+    "darkslateblue": (72, 61, 139),
+    "midnightblue": (25, 25, 112),
+    "lightsalmon1": (255, 160, 122),
+    "lemonchiffon": (255, 250, 205),
+    "green yellow": (173, 255, 47),
+    "lightsalmon": (255, 160, 122),
+    "light coral": (240, 128, 128),
+    "dodgerblue3": (24, 116, 205),
+    "darkorange4": (139, 69, 0),
+    "slate blue": (106, 90, 205),
+    "royalblue4": (39, 64, 139),
+    "orange red": (255, 69, 0),
+    "lime green": (50, 205, 50),
+    "light cyan": (224, 255, 255),
+    "darkviolet": (148, 0, 211),
+    "darksalmon": (233, 150, 122),
+    "darkorange": (255, 140, 0),
+    "cadet blue": (95, 158, 160),
+    "deep pink": (255, 20, 147),
+    "magenta2": (238, 0, 238),
+    "sienna4": (139, 71, 38),
+    "khaki2": (238, 230, 133),
+    "grey75": (191, 191, 191),
+    "grey74": (189, 189, 189),
+    "grey73": (186, 186, 186),
+    "grey69": (176, 176, 176),
+    "grey68": (173, 173, 173),
+    "grey35": (89, 89, 89),
+    "grey13": (33, 33, 33),
+    "gray90": (229, 229, 229),
+    "gray81": (207, 207, 207),
+    "gray55": (140, 140, 140),
+    "gray51": (130, 130, 130),
+    "gray31": (79, 79, 79),
+    "snow2": (238, 233, 233),
+    "pink3": (205, 145, 158),
+    "grey7": (18, 18, 18),
+    "gray1": (3, 3, 3),
+    "red4": (139, 0, 0),
+    "red3": (205, 0, 0),
+    "tan": (210, 180, 140),
+    "red": (255, 0, 0),
+    "mediumvioletred": (199, 21, 133),
+    "lightslategrey": (119, 136, 153),
+    "lightskyblue": (135, 206, 250),
+    "lightsalmon4": (139, 87, 66),
+    "forestgreen": (34, 139, 34),
+    "dodgerblue4": (16, 78, 139),
+    "dark orchid": (153, 50, 204),
+    "rosy brown": (188, 143, 143),
+    "peachpuff3": (205, 175, 149),
+    "palegreen3": (124, 205, 124),
+    "orangered2": (238, 64, 0),
+    "lightcyan4": (122, 139, 139),
+    "indianred4": (139, 58, 58),
+    "indianred3": (205, 85, 85),
+    "navyblue": (0, 0, 128),
+    "dim grey": (105, 105, 105),
+    "deeppink": (255, 20, 147),
+    "salmon4": (139, 76, 57),
+    "salmon3": (205, 112, 84),
+    "grey77": (196, 196, 196),
+    "gray57": (145, 145, 145),
+    "gray11": (28, 28, 28),
+    "plum3": (205, 150, 205),
+    "gray9": (23, 23, 23),
+    "gray8": (20, 20, 20),
+    "blue4": (0, 0, 139),
+    "beige": (245, 245, 220),
+    "light goldenrod yellow": (250, 250, 210),
+    "lavenderblush4": (139, 131, 134),
+    "dark turquoise": (0, 206, 209),
+    "darkturquoise": (0, 206, 209),
+    "darkslategrey": (47, 79, 79),
+    "lightsalmon3": (205, 129, 98),
+    "rosybrown4": (139, 105, 105),
+    "misty rose": (255, 228, 225),
+    "seagreen2": (78, 238, 148),
+    "indianred": (205, 92, 92),
+    "deeppink1": (255, 20, 147),
+    "dark blue": (0, 0, 139),
+    "lavender": (230, 230, 250),
+    "oldlace": (253, 245, 230),
+    "grey78": (199, 199, 199),
+    "grey54": (138, 138, 138),
+    "grey45": (115, 115, 115),
+    "grey21": (54, 54, 54),
+    "gray97": (247, 247, 247),
+    "gray96": (245, 245, 245),
+    "gray95": (242, 242, 242),
+    "gray88": (224, 224, 224),
+    "gray87": (222, 222, 222),
+    "gray86": (219, 219, 219),
+    "gray70": (179, 179, 179),
+    "gray38": (97, 97, 97),
+    "gray12": (31, 31, 31),
+    "linen": (250, 240, 230),
+    "medium turquoise": (72, 209, 204),
+    "dark slate blue": (72, 61, 139),
+    "lemonchiffon4": (139, 137, 112),
+    "darkseagreen1": (193, 255, 193),
+    "antiquewhite3": (205, 192, 176),
+    "mediumorchid": (186, 85, 211),
+    "springgreen": (0, 255, 127),
+    "turquoise4": (0, 134, 139),
+    "steelblue3": (79, 148, 205),
+    "mistyrose2": (238, 213, 210),
+    "lightcyan2": (209, 238, 238),
+    "indian red": (205, 92, 92),
+    "firebrick2": (238, 44, 44),
+    "royalblue": (65, 105, 225),
+    "cadetblue": (95, 158, 160),
+    "skyblue3": (108, 166, 205),
+    "yellow3": (205, 205, 0),
+    "salmon1": (255, 140, 105),
+    "orange4": (139, 90, 0),
+    "hotpink": (255, 105, 180),
+    "grey90": (229, 229, 229),
+    "gray56": (143, 143, 143),
+    "gray39": (99, 99, 99),
+    "gray18": (46, 46, 46),
+    "gray14": (36, 36, 36),
+    "plum4": (139, 102, 139),
+    "grey6": (15, 15, 15),
+    "gray6": (15, 15, 15),
+    "gold3": (205, 173, 0),
+    "gold1": (255, 215, 0),
+    "blue2": (0, 0, 238),
+    "tan2": (238, 154, 73),
+    "cyan": (0, 255, 255),
+    "mediumspringgreen": (0, 250, 154),
+    "darkolivegreen2": (188, 238, 104),
+    "pale goldenrod": (238, 232, 170),
+    "lightsteelblue": (176, 196, 222),
+    "sandy brown": (244, 164, 96),
+    "papaya whip": (255, 239, 213),
+    "chartreuse3": (102, 205, 0),
+    "violetred4": (139, 34, 82),
+    "royalblue2": (67, 110, 238),
+    "royalblue1": (72, 118, 255),
+    "papayawhip": (255, 239, 213),
+    "mistyrose3": (205, 183, 181),
+    "lightcyan1": (224, 255, 255),
+    "aquamarine": (127, 255, 212),
+    "skyblue4": (74, 112, 139),
+    "hotpink4": (139, 58, 98),
+    "hotpink3": (205, 96, 144),
+    "hotpink2": (238, 106, 167),
+    "darkgrey": (169, 169, 169),
+    "dimgray": (105, 105, 105),
+    "tomato": (255, 99, 71),
+    "grey66": (168, 168, 168),
+    "grey65": (166, 166, 166),
+    "grey64": (163, 163, 163),
+    "grey33": (84, 84, 84),
+    "grey27": (69, 69, 69),
+    "gray76": (194, 194, 194),
+    "gray69": (176, 176, 176),
+    "gray68": (173, 173, 173),
+    "grey0": (0, 0, 0),
+    "azure": (240, 255, 255),
+    "medium spring green": (0, 250, 154),
+    "darkgoldenrod4": (139, 101, 8),
+    "darkgoldenrod3": (205, 149, 12),
+    "darkgoldenrod2": (238, 173, 14),
+    "darkgoldenrod": (184, 134, 11),
+    "saddle brown": (139, 69, 19),
+    "lightsalmon2": (238, 149, 114),
+    "deepskyblue4": (0, 104, 139),
+    "deepskyblue3": (0, 154, 205),
+    "deepskyblue2": (0, 178, 238),
+    "deepskyblue": (0, 191, 255),
+    "darkorange1": (255, 127, 0),
+    "violetred3": (205, 50, 120),
+    "violetred2": (238, 58, 140),
+    "violetred1": (255, 62, 150),
+    "slateblue3": (105, 89, 205),
+    "slateblue2": (122, 103, 238),
+    "olive drab": (107, 142, 35),
+    "indianred1": (255, 106, 106),
+    "firebrick1": (255, 48, 48),
+    "cadetblue4": (83, 134, 139),
+    "violetred": (208, 32, 144),
+    "rosybrown": (188, 143, 143),
+    "navy blue": (0, 0, 128),
+    "firebrick": (178, 34, 34),
+    "dark red": (139, 0, 0),
+    "grey100": (255, 255, 255),
+    "wheat4": (139, 126, 102),
+    "grey79": (201, 201, 201),
+    "grey76": (194, 194, 194),
+    "grey61": (156, 156, 156),
+    "gray93": (237, 237, 237),
+    "gray84": (214, 214, 214),
+    "gray65": (166, 166, 166),
+    "gray36": (92, 92, 92),
+    "gray32": (82, 82, 82),
+    "gray13": (33, 33, 33),
+    "gray10": (26, 26, 26),
+    "azure3": (193, 205, 205),
+    "snow1": (255, 250, 250),
+    "tan1": (255, 165, 79),
+    "light slate gray": (119, 136, 153),
+    "darkolivegreen1": (202, 255, 112),
+    "cornflower blue": (100, 149, 237),
+    "blanched almond": (255, 235, 205),
+    "lavenderblush3": (205, 193, 197),
+    "lavenderblush2": (238, 224, 229),
+    "lavenderblush1": (255, 240, 245),
+    "darkolivegreen": (85, 107, 47),
+    "lavenderblush": (255, 240, 245),
+    "aquamarine2": (118, 238, 198),
+    "violet red": (208, 32, 144),
+    "olivedrab2": (179, 238, 58),
+    "mistyrose4": (139, 125, 123),
+    "mistyrose1": (255, 228, 225),
+    "lightcyan3": (180, 205, 205),
+    "lightcoral": (240, 128, 128),
+    "chartreuse": (127, 255, 0),
+    "peachpuff": (255, 218, 185),
+    "palegreen": (152, 251, 152),
+    "mintcream": (245, 255, 250),
+    "skyblue2": (126, 192, 238),
+    "moccasin": (255, 228, 181),
+    "tomato1": (255, 99, 71),
+    "orchid3": (205, 105, 201),
+    "maroon3": (205, 41, 144),
+    "salmon": (250, 128, 114),
+    "grey81": (207, 207, 207),
+    "grey62": (158, 158, 158),
+    "grey39": (99, 99, 99),
+    "grey38": (97, 97, 97),
+    "grey37": (94, 94, 94),
+    "gray92": (235, 235, 235),
+    "gray83": (212, 212, 212),
+    "gray66": (168, 168, 168),
+    "gray54": (138, 138, 138),
+    "gray50": (127, 127, 127),
+    "gray30": (77, 77, 77),
+    "gray19": (48, 48, 48),
+    "gray15": (38, 38, 38),
+    "azure4": (131, 139, 139),
+    "grey3": (8, 8, 8),
+    "tan3": (205, 133, 63),
+    "pink": (255, 192, 203),
+    "gray": (190, 190, 190),
+    "blue": (0, 0, 255),
+    "lightsteelblue2": (188, 210, 238),
+    "lightsteelblue1": (202, 225, 255),
+    "light sea green": (32, 178, 170),
+    "lightslategray": (119, 136, 153),
+    "lemonchiffon2": (238, 233, 191),
+    "springgreen1": (0, 255, 127),
+    "greenyellow": (173, 255, 47),
+    "chartreuse2": (118, 238, 0),
+    "slate grey": (112, 128, 144),
+    "royalblue3": (58, 95, 205),
+    "powderblue": (176, 224, 230),
+    "peachpuff2": (238, 203, 173),
+    "palegreen2": (144, 238, 144),
+    "mint cream": (245, 255, 250),
+    "slateblue": (106, 90, 205),
+    "seashell2": (238, 229, 222),
+    "deeppink2": (238, 18, 137),
+    "darkkhaki": (189, 183, 107),
+    "maroon4": (139, 28, 98),
+    "sienna": (160, 82, 45),
+    "grey71": (181, 181, 181),
+    "grey67": (171, 171, 171),
+    "grey18": (46, 46, 46),
+    "gray59": (150, 150, 150),
+    "gray43": (110, 110, 110),
+    "gray25": (64, 64, 64),
+    "bisque": (255, 228, 196),
+    "red1": (255, 0, 0),
+    "mediumslateblue": (123, 104, 238),
+    "lightgoldenrod1": (255, 236, 139),
+    "light goldenrod": (238, 221, 130),
+    "paleturquoise3": (150, 205, 205),
+    "lightskyblue4": (96, 123, 139),
+    "spring green": (0, 255, 127),
+    "light yellow": (255, 255, 224),
+    "white smoke": (245, 245, 245),
+    "medium blue": (0, 0, 205),
+    "ghost white": (248, 248, 255),
+    "steelblue4": (54, 100, 139),
+    "rosybrown3": (205, 155, 155),
+    "peachpuff1": (255, 218, 185),
+    "palegreen1": (154, 255, 154),
+    "blueviolet": (138, 43, 226),
+    "seashell4": (139, 134, 130),
+    "darkgray": (169, 169, 169),
+    "sienna3": (205, 104, 57),
+    "grey40": (102, 102, 102),
+    "gray91": (232, 232, 232),
+    "gray82": (209, 209, 209),
+    "gray5": (13, 13, 13),
+    "cyan2": (0, 238, 238),
+    "cyan1": (0, 255, 255),
+    "blue1": (0, 0, 255),
+    "snow": (255, 250, 250),
+    "lightgoldenrod2": (238, 220, 130),
+    "lightslateblue": (132, 112, 255),
+    "mediumorchid3": (180, 82, 205),
+    "darkseagreen4": (105, 139, 105),
+    "springgreen3": (0, 205, 102),
+    "forest green": (34, 139, 34),
+    "slategray4": (108, 123, 139),
+    "slategray3": (159, 182, 205),
+    "slategray2": (185, 211, 238),
+    "royal blue": (65, 105, 225),
+    "peachpuff4": (139, 119, 101),
+    "palegreen4": (84, 139, 84),
+    "pale green": (152, 251, 152),
+    "orangered3": (205, 55, 0),
+    "goldenrod1": (255, 193, 37),
+    "ghostwhite": (248, 248, 255),
+    "firebrick4": (139, 26, 26),
+    "firebrick3": (205, 38, 38),
+    "cadetblue3": (122, 197, 205),
+    "slategray": (112, 128, 144),
+    "seashell3": (205, 197, 191),
+    "honeydew3": (193, 205, 193),
+    "cornsilk4": (139, 136, 120),
+    "cornsilk2": (238, 232, 205),
+    "purple1": (155, 48, 255),
+    "dimgrey": (105, 105, 105),
+    "darkred": (139, 0, 0),
+    "khaki1": (255, 246, 143),
+    "ivory3": (205, 205, 193),
+    "grey70": (179, 179, 179),
+    "grey60": (153, 153, 153),
+    "grey32": (82, 82, 82),
+    "grey22": (56, 56, 56),
+    "grey12": (31, 31, 31),
+    "gray98": (250, 250, 250),
+    "gray89": (227, 227, 227),
+    "gray71": (181, 181, 181),
+    "gray64": (163, 163, 163),
+    "gray60": (153, 153, 153),
+    "gray49": (125, 125, 125),
+    "azure2": (224, 238, 238),
+    "gray3": (8, 8, 8),
+    "paleturquoise1": (187, 255, 255),
+    "mediumpurple1": (171, 130, 255),
+    "medium purple": (147, 112, 219),
+    "lemonchiffon1": (255, 250, 205),
+    "deep sky blue": (0, 191, 255),
+    "navajowhite3": (205, 179, 139),
+    "darkorchid1": (191, 62, 255),
+    "dark orange": (255, 140, 0),
+    "goldenrod2": (238, 180, 34),
+    "dark khaki": (189, 183, 107),
+    "chocolate2": (238, 118, 33),
+    "burlywood2": (238, 197, 145),
+    "honeydew1": (240, 255, 240),
+    "darkgreen": (0, 100, 0),
+    "thistle3": (205, 181, 205),
+    "thistle2": (238, 210, 238),
+    "thistle1": (255, 225, 255),
+    "darkblue": (0, 0, 139),
+    "thistle": (216, 191, 216),
+    "maroon2": (238, 48, 167),
+    "maroon1": (255, 52, 179),
+    "grey53": (135, 135, 135),
+    "grey44": (112, 112, 112),
+    "grey25": (64, 64, 64),
+    "gray74": (189, 189, 189),
+    "gray45": (115, 115, 115),
+    "gray41": (105, 105, 105),
+    "gray35": (89, 89, 89),
+    "gray27": (69, 69, 69),
+    "gray23": (59, 59, 59),
+    "gray16": (41, 41, 41),
+    "brown4": (139, 35, 35),
+    "wheat": (245, 222, 179),
+    "coral": (255, 127, 80),
+    "tan4": (139, 90, 43),
+    "lightgoldenrodyellow": (250, 250, 210),
+    "light slate blue": (132, 112, 255),
+    "dark olive green": (85, 107, 47),
+    "dark slate gray": (47, 79, 79),
+    "palevioletred3": (205, 104, 137),
+    "mediumpurple4": (93, 71, 139),
+    "mediumpurple3": (137, 104, 205),
+    "saddlebrown": (139, 69, 19),
+    "powder blue": (176, 224, 230),
+    "darkorchid4": (104, 34, 139),
+    "darkorchid3": (154, 50, 205),
+    "peach puff": (255, 218, 185),
+    "olivedrab4": (105, 139, 34),
+    "lightblue4": (104, 131, 139),
+    "lightpink": (255, 182, 193),
+    "lightgray": (211, 211, 211),
+    "honeydew2": (224, 238, 224),
+    "cornsilk1": (255, 248, 220),
+    "old lace": (253, 245, 230),
+    "sienna1": (255, 130, 71),
+    "bisque4": (139, 125, 107),
+    "orchid": (218, 112, 214),
+    "khaki3": (205, 198, 115),
+    "grey84": (214, 214, 214),
+    "grey83": (212, 212, 212),
+    "grey82": (209, 209, 209),
+    "grey72": (184, 184, 184),
+    "grey52": (133, 133, 133),
+    "grey43": (110, 110, 110),
+    "grey26": (66, 66, 66),
+    "grey14": (36, 36, 36),
+    "grey10": (26, 26, 26),
+    "gray75": (191, 191, 191),
+    "gray53": (135, 135, 135),
+    "gray21": (54, 54, 54),
+    "gray20": (51, 51, 51),
+    "brown3": (205, 51, 51),
+    "grey8": (20, 20, 20),
+    "red2": (238, 0, 0),
+    "navy": (0, 0, 128),
+    "grey": (190, 190, 190),
+    "gold": (255, 215, 0),
+    "mediumaquamarine": (102, 205, 170),
+    "lightgoldenrod": (238, 221, 130),
+    "darkslategray4": (82, 139, 139),
+    "darkseagreen3": (155, 205, 155),
+    "darkseagreen2": (180, 238, 180),
+    "antiquewhite4": (139, 131, 120),
+    "antique white": (250, 235, 215),
+    "springgreen4": (0, 139, 69),
+    "lightyellow4": (139, 139, 122),
+    "floral white": (255, 250, 240),
+    "aquamarine1": (127, 255, 212),
+    "turquoise3": (0, 197, 205),
+    "steelblue2": (92, 172, 238),
+    "rosybrown2": (238, 180, 180),
+    "light pink": (255, 182, 193),
+    "light gray": (211, 211, 211),
+    "indianred2": (238, 99, 99),
+    "dodgerblue": (30, 144, 255),
+    "dark green": (0, 100, 0),
+    "seagreen1": (84, 255, 159),
+    "deeppink4": (139, 10, 80),
+    "aliceblue": (240, 248, 255),
+    "magenta1": (255, 0, 255),
+    "hot pink": (255, 105, 180),
+    "sienna2": (238, 121, 66),
+    "orchid1": (255, 131, 250),
+    "gray100": (255, 255, 255),
+    "grey97": (247, 247, 247),
+    "grey94": (240, 240, 240),
+    "grey87": (222, 222, 222),
+    "grey86": (219, 219, 219),
+    "grey51": (130, 130, 130),
+    "grey42": (107, 107, 107),
+    "grey19": (48, 48, 48),
+    "gray94": (240, 240, 240),
+    "gray85": (217, 217, 217),
+    "gray61": (156, 156, 156),
+    "brown2": (238, 59, 59),
+    "khaki": (240, 230, 140),
+    "grey1": (3, 3, 3),
+    "gold4": (139, 117, 0),
+    "medium slate blue": (123, 104, 238),
+    "medium sea green": (60, 179, 113),
+    "dark slate grey": (47, 79, 79),
+    "pale turquoise": (175, 238, 238),
+    "paleturquoise": (175, 238, 238),
+    "mediumorchid4": (122, 55, 139),
+    "antiquewhite2": (238, 223, 204),
+    "lightyellow2": (238, 238, 209),
+    "light green": (144, 238, 144),
+    "dark violet": (148, 0, 211),
+    "dark salmon": (233, 150, 122),
+    "chartreuse1": (127, 255, 0),
+    "turquoise1": (0, 245, 255),
+    "sandybrown": (244, 164, 96),
+    "orangered1": (255, 69, 0),
+    "lightpink1": (255, 174, 185),
+    "lightblue2": (178, 223, 238),
+    "lightblue1": (191, 239, 255),
+    "light grey": (211, 211, 211),
+    "seagreen4": (46, 139, 87),
+    "seagreen3": (67, 205, 128),
+    "lightblue": (173, 216, 230),
+    "deeppink3": (205, 16, 118),
+    "dark grey": (169, 169, 169),
+    "dark cyan": (0, 139, 139),
+    "burlywood": (222, 184, 135),
+    "seashell": (255, 245, 238),
+    "hotpink1": (255, 110, 180),
+    "dim gray": (105, 105, 105),
+    "darkcyan": (0, 139, 139),
+    "yellow4": (139, 139, 0),
+    "yellow": (255, 255, 0),
+    "purple": (160, 32, 240),
+    "orange": (255, 165, 0),
+    "ivory4": (139, 139, 131),
+    "grey99": (252, 252, 252),
+    "grey89": (227, 227, 227),
+    "grey63": (161, 161, 161),
+    "grey58": (148, 148, 148),
+    "grey49": (125, 125, 125),
+    "grey31": (79, 79, 79),
+    "grey24": (61, 61, 61),
+    "grey20": (51, 51, 51),
+    "green4": (0, 139, 0),
+    "green1": (0, 255, 0),
+    "gray73": (186, 186, 186),
+    "gray67": (171, 171, 171),
+    "coral3": (205, 91, 69),
+    "coral2": (238, 106, 80),
+    "plum2": (238, 174, 238),
+    "pink4": (139, 99, 108),
+    "ivory": (255, 255, 240),
+    "gray4": (10, 10, 10),
+    "gray2": (5, 5, 5),
+    "gold2": (238, 201, 0),
+    "medium aquamarine": (102, 205, 170),
+    "light slate grey": (119, 136, 153),
+    "lightgoldenrod3": (205, 190, 112),
+    "darkolivegreen3": (162, 205, 90),
+    "darkgoldenrod1": (255, 185, 15),
+    "dark goldenrod": (184, 134, 11),
+    "medium orchid": (186, 85, 211),
+    "lemon chiffon": (255, 250, 205),
+    "navajowhite4": (139, 121, 94),
+    "deepskyblue1": (0, 191, 255),
+    "lightyellow": (255, 255, 224),
+    "floralwhite": (255, 250, 240),
+    "dodger blue": (30, 144, 255),
+    "mediumblue": (0, 0, 205),
+    "lightgreen": (144, 238, 144),
+    "chocolate4": (139, 69, 19),
+    "chocolate3": (205, 102, 29),
+    "burlywood4": (139, 115, 85),
+    "turquoise": (64, 224, 208),
+    "steelblue": (70, 130, 180),
+    "sea green": (46, 139, 87),
+    "lawngreen": (124, 252, 0),
+    "honeydew4": (131, 139, 131),
+    "dark gray": (169, 169, 169),
+    "seagreen": (46, 139, 87),
+    "orchid4": (139, 71, 137),
+    "wheat1": (255, 231, 186),
+    "violet": (238, 130, 238),
+    "ivory1": (255, 255, 240),
+    "grey88": (224, 224, 224),
+    "grey85": (217, 217, 217),
+    "grey57": (145, 145, 145),
+    "grey56": (143, 143, 143),
+    "grey55": (140, 140, 140),
+    "grey48": (122, 122, 122),
+    "grey47": (120, 120, 120),
+    "grey46": (117, 117, 117),
+    "grey30": (77, 77, 77),
+    "grey17": (43, 43, 43),
+    "gray47": (120, 120, 120),
+    "gray29": (74, 74, 74),
+    "pink2": (238, 169, 184),
+    "grey5": (13, 13, 13),
+    "grey4": (10, 10, 10),
+    "green": (0, 255, 0),
+    "gray0": (0, 0, 0),
+    "brown": (165, 42, 42),
+    "lightsteelblue4": (110, 123, 139),
+    "darkolivegreen4": (110, 139, 61),
+    "palevioletred4": (139, 71, 93),
+    "light sky blue": (135, 206, 250),
+    "darkslategray3": (121, 205, 205),
+    "darkslategray2": (141, 238, 238),
+    "darkslategray1": (151, 255, 255),
+    "blanchedalmond": (255, 235, 205),
+    "palegoldenrod": (238, 232, 170),
+    "midnight blue": (25, 25, 112),
+    "lightseagreen": (32, 178, 170),
+    "lemonchiffon3": (205, 201, 165),
+    "darkslategray": (47, 79, 79),
+    "yellow green": (154, 205, 50),
+    "darkseagreen": (143, 188, 143),
+    "antiquewhite": (250, 235, 215),
+    "darkorange2": (238, 118, 0),
+    "chartreuse4": (69, 139, 0),
+    "steel blue": (70, 130, 180),
+    "rosybrown1": (255, 193, 193),
+    "olivedrab3": (154, 205, 50),
+    "lightpink2": (238, 162, 173),
+    "orangered": (255, 69, 0),
+    "thistle4": (139, 123, 139),
+    "sky blue": (135, 206, 235),
+    "cornsilk": (255, 248, 220),
+    "salmon2": (238, 130, 98),
+    "orchid2": (238, 122, 233),
+    "ivory2": (238, 238, 224),
+    "grey93": (237, 237, 237),
+    "grey92": (235, 235, 235),
+    "grey91": (232, 232, 232),
+    "grey36": (92, 92, 92),
+    "grey29": (74, 74, 74),
+    "grey28": (71, 71, 71),
+    "grey16": (41, 41, 41),
+    "gray79": (201, 201, 201),
+    "gray78": (199, 199, 199),
+    "gray77": (196, 196, 196),
+    "gray48": (122, 122, 122),
+    "gray17": (43, 43, 43),
+    "coral4": (139, 62, 47),
+    "coral1": (255, 114, 86),
+    "plum1": (255, 187, 255),
+    "pink1": (255, 181, 197),
+    "grey9": (23, 23, 23),
+    "grey2": (5, 5, 5),
+    "gray7": (18, 18, 18),
+    "cyan4": (0, 139, 139),
+    "blue3": (0, 0, 205),
+    "plum": (221, 160, 221),
+    "cornflowerblue": (100, 149, 237),
+    "lightskyblue2": (164, 211, 238),
+    "antiquewhite1": (255, 239, 219),
+    "navajowhite2": (238, 207, 161),
+    "navajowhite1": (255, 222, 173),
+    "lightyellow3": (205, 205, 180),
+    "dark magenta": (139, 0, 139),
+    "navajowhite": (255, 222, 173),
+    "darkorange3": (205, 102, 0),
+    "whitesmoke": (245, 245, 245),
+    "turquoise2": (0, 229, 238),
+    "steelblue1": (99, 184, 255),
+    "lightpink4": (139, 95, 101),
+    "lightblue3": (154, 192, 205),
+    "lawn green": (124, 252, 0),
+    "chocolate1": (255, 127, 36),
+    "alice blue": (240, 248, 255),
+    "olivedrab": (107, 142, 35),
+    "lightgrey": (211, 211, 211),
+    "chocolate": (210, 105, 30),
+    "magenta4": (139, 0, 139),
+    "magenta3": (205, 0, 205),
+    "yellow1": (255, 255, 0),
+    "purple3": (125, 38, 205),
+    "purple2": (145, 44, 238),
+    "orange2": (238, 154, 0),
+    "orange1": (255, 165, 0),
+    "magenta": (255, 0, 255),
+    "bisque1": (255, 228, 196),
+    "wheat2": (238, 216, 174),
+    "maroon": (176, 48, 96),
+    "khaki4": (139, 134, 78),
+    "grey96": (245, 245, 245),
+    "grey95": (242, 242, 242),
+    "grey80": (204, 204, 204),
+    "grey50": (127, 127, 127),
+    "grey41": (105, 105, 105),
+    "grey15": (38, 38, 38),
+    "grey11": (28, 28, 28),
+    "gray80": (204, 204, 204),
+    "gray58": (148, 148, 148),
+    "gray40": (102, 102, 102),
+    "gray34": (87, 87, 87),
+    "gray22": (56, 56, 56),
+    "brown1": (255, 64, 64),
+    "snow3": (205, 201, 201),
+    "mediumturquoise": (72, 209, 204),
+    "lightsteelblue3": (162, 181, 205),
+    "palevioletred2": (238, 121, 159),
+    "palevioletred1": (255, 130, 171),
+    "paleturquoise2": (174, 238, 238),
+    "dark sea green": (143, 188, 143),
+    "palevioletred": (219, 112, 147),
+    "mediumorchid1": (224, 102, 255),
+    "navajo white": (255, 222, 173),
+    "mediumpurple": (147, 112, 219),
+    "lightyellow1": (255, 255, 224),
+    "dodgerblue2": (28, 134, 238),
+    "dodgerblue1": (30, 144, 255),
+    "darkmagenta": (139, 0, 139),
+    "blue violet": (138, 43, 226),
+    "aquamarine3": (102, 205, 170),
+    "slategray1": (198, 226, 255),
+    "slate gray": (112, 128, 144),
+    "orangered4": (139, 37, 0),
+    "lightpink3": (205, 140, 149),
+    "light blue": (173, 216, 230),
+    "darkorchid": (153, 50, 204),
+    "cadetblue1": (152, 245, 255),
+    "burlywood3": (205, 170, 125),
+    "seashell1": (255, 245, 238),
+    "cornsilk3": (205, 200, 177),
+    "tomato4": (139, 54, 38),
+    "tomato2": (238, 92, 66),
+    "wheat3": (205, 186, 150),
+    "grey98": (250, 250, 250),
+    "grey59": (150, 150, 150),
+    "grey23": (59, 59, 59),
+    "green3": (0, 205, 0),
+    "green2": (0, 238, 0),
+    "gray72": (184, 184, 184),
+    "gray62": (158, 158, 158),
+    "gray52": (133, 133, 133),
+    "gray46": (117, 117, 117),
+    "gray42": (107, 107, 107),
+    "gray28": (71, 71, 71),
+    "gray24": (61, 61, 61),
+    "white": (255, 255, 255),
+    "cyan3": (0, 205, 205),
+    "black": (0, 0, 0),
+}
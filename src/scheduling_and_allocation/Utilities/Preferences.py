@@ -206,6 +206,15 @@ class Preferences:
             return False
 
 
+    # ---------------------------------------------------------------------------------------------
+    # teacher aliases
+    # ---------------------------------------------------------------------------------------------
+    def teacher_aliases(self) -> dict[str, str]:
+        """teachers whose names are different in different semesters (alternate teacher id = teacher id)"""
+        if 'TEACHER_ALIASES' not in self._config:
+            return {}
+        return dict(self._config['TEACHER_ALIASES'])
+
     # ---------------------------------------------------------------------------------------------
     # save the current preferences
     # ---------------------------------------------------------------------------------------------
@@ -11,17 +11,28 @@ class Foo
         self.id = Foo.ids.get_new_id(block_id)
 """
 
+import threading
 from typing import Optional
 
 
 class IdGenerator:
     """
     A generic class to create and keep track of id numbers for collections of objects
+
+    Thread safe, so that several schedules can be created at the same time
     """
 
     def __init__(self, the_id: int = -1):
         self._current_id = the_id
         self._iter = self.__iter__()
+        self._lock = threading.Lock()
+
+    # generators and locks cannot be pickled, so only keep the current id
+    def __getstate__(self):
+        return {"_current_id": self._current_id}
+
+    def __setstate__(self, state):
+        self.__init__(state["_current_id"])
 
     def __iter__(self):
         while True:
@@ -41,13 +52,14 @@ class IdGenerator:
     def get_new_id(self, value: Optional[int|str] = None) -> int:
         """Change the current id, else get the next value"""
 
-        if value is None:
-            value = next(self._iter)
-        else:
-            try:
-                value = int(value)
-            except TypeError:
+        with self._lock:
+            if value is None:
                 value = next(self._iter)
+            else:
+                try:
+                    value = int(value)
+                except TypeError:
+                    value = next(self._iter)
 
-        self._current_id = max(self._current_id, value)
-        return value
+            self._current_id = max(self._current_id, value)
+            return value
@@ -1,3 +1,7 @@
 from .Utilities import Colour
 from .SchedulerProgram import SchedulerProgram
 from .AllocationManager import AllocationManager
+from .ScheduleLint import ScheduleLint
+from .ScheduleDiff import ScheduleDiff
+from .ScheduleMerge import ScheduleMerge
+from .CIReport import CIReport
@@ -0,0 +1,202 @@
+"""
+Propose teacher allocations (hours per section) so that every teacher has about the same CI.
+
+Any unallocated (or over allocated) hours are given to (or taken from) the teachers where it
+does the most good, and then hours are moved from one teacher to another, for as long as
+the moves make the CI more even.  Each move only changes two teachers, so the CI is
+updated incrementally (see CICalc.set_section_hours), and the schedule is not modified
+until the proposal is applied.
+
+Because release is part of the CI, teachers with release are given fewer hours.
+
+SYNOPSIS
+
+    proposal = balance_allocations(schedule, locked={(section, teacher)})
+    print(proposal.spread_before, proposal.spread_after)
+    proposal.apply()
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from .ci_calculation import ci_calculators_for_all, CICalc
+
+if TYPE_CHECKING:
+    from ..model.schedule import Schedule
+    from ..model.course import Course
+    from ..model.section import Section
+    from ..model.teacher import Teacher
+
+EPSILON = 1e-9
+
+
+# ============================================================================
+# the result
+# ============================================================================
+@dataclass
+class BalanceProposal:
+    allocations: dict[tuple[Section, Teacher], float] = field(default_factory=dict)
+    ci: dict[Teacher, float] = field(default_factory=dict)
+    unallocated: dict[Section, float] = field(default_factory=dict)
+    spread_before: float = 0
+    spread_after: float = 0
+    moves: int = 0
+
+    def apply(self):
+        """Set the proposed allocations in the schedule"""
+        for (section, teacher), hours in self.allocations.items():
+            section.set_teacher_allocation(teacher, hours)
+
+
+# ============================================================================
+# balance
+# ============================================================================
+def balance_allocations(schedule: Schedule, locked: Iterable[tuple[Section, Teacher]] = (),
+                        teachers: Optional[Iterable[Teacher]] = None, step: float = 0.5,
+                        max_moves: int = 100_000) -> BalanceProposal:
+    """
+    Propose allocations that make the CI of the teachers as equal as possible
+    :param schedule:
+    :param locked: section/teacher allocations that can not be changed
+    :param teachers: the teachers that can be given hours (default: all the teachers)
+    :param step: the smallest number of hours that are moved from one teacher to another
+    :param max_moves: stop after this many moves
+    :return: the proposed allocations (only those that are different from the schedule)
+    """
+    balancer = _Balancer(schedule, locked, teachers, step)
+    spread_before = balancer.spread()
+    balancer.allocate_remaining_hours()
+    balancer.even_out(max_moves)
+
+    proposal = BalanceProposal(spread_before=spread_before, spread_after=balancer.spread(), moves=balancer.moves)
+    for section, hours in balancer.hours.items():
+        for teacher in set(hours) | set(balancer.original[section]):
+            if hours.get(teacher, 0) != balancer.original[section].get(teacher, 0):
+                proposal.allocations[section, teacher] = hours.get(teacher, 0)
+        unallocated = balancer.unallocated(section)
+        if abs(unallocated) > EPSILON:
+            proposal.unallocated[section] = unallocated
+    proposal.ci = {teacher: balancer.calcs[teacher].ci for teacher in balancer.teachers}
+    return proposal
+
+
+# ============================================================================
+# the work is done here
+# ============================================================================
+class _Balancer:
+    def __init__(self, schedule: Schedule, locked: Iterable[tuple[Section, Teacher]],
+                 teachers: Optional[Iterable[Teacher]], step: float):
+        self.step = step
+        self.moves = 0
+        self.locked = set(locked)
+        self.calcs: dict[Teacher, CICalc] = ci_calculators_for_all(schedule)
+        self.teachers: list[Teacher] = sorted(t for t in (teachers if teachers is not None else schedule.teachers())
+                                              if t in self.calcs)
+
+        self.sections: list[tuple[Course, Section]] = [(course, section)
+                                                       for course in schedule.courses_with_allocation()
+                                                       for section in course.sections()]
+        self.hours: dict[Section, dict[Teacher, float]] = {}
+        for _, section in self.sections:
+            allocated = set(section.teachers()) | set(section.section_defined_teachers())
+            self.hours[section] = {t: section.get_teacher_allocation(t) for t in allocated}
+        self.original = {section: dict(hours) for section, hours in self.hours.items()}
+
+        # the spread is measured as n * variance = sum(ci^2) - sum(ci)^2 / n, which
+        # can be updated when only a couple of teachers change
+        self.ci: dict[Teacher, float] = {t: self.calcs[t].ci for t in self.teachers}
+        self.sum_ci = sum(self.ci.values())
+        self.sum_ci2 = sum(ci * ci for ci in self.ci.values())
+
+    # ------------------------------------------------------------------------
+    # measurements
+    # ------------------------------------------------------------------------
+    def spread(self) -> float:
+        """difference between the highest and lowest CI"""
+        return max(self.ci.values()) - min(self.ci.values()) if self.ci else 0
+
+    def _variance(self, sum_ci: float, sum_ci2: float) -> float:
+        return sum_ci2 - sum_ci * sum_ci / len(self.teachers)
+
+    def unallocated(self, section: Section) -> float:
+        return section.course.hours_per_week - sum(self.hours[section].values())
+
+    def _can_change(self, section: Section, teacher: Teacher) -> bool:
+        return (section, teacher) not in self.locked and teacher in self.ci
+
+    # ------------------------------------------------------------------------
+    # changing hours
+    # ------------------------------------------------------------------------
+    def _change(self, course: Course, section: Section, changes: dict[Teacher, float]):
+        """add (or subtract) hours for the teachers in this section"""
+        for teacher, delta in changes.items():
+            hours = self.hours[section].get(teacher, 0) + delta
+            if abs(hours) < EPSILON:
+                self.hours[section].pop(teacher, None)
+                hours = 0
+            else:
+                self.hours[section][teacher] = hours
+            self.calcs[teacher].set_section_hours(course, section, hours)
+
+            old, new = self.ci[teacher], self.calcs[teacher].ci
+            self.ci[teacher] = new
+            self.sum_ci += new - old
+            self.sum_ci2 += new * new - old * old
+
+    def _try(self, course: Course, section: Section, changes: dict[Teacher, float]) -> float:
+        """how much would the variance change if these changes were made?"""
+        before = self._variance(self.sum_ci, self.sum_ci2)
+        self._change(course, section, changes)
+        after = self._variance(self.sum_ci, self.sum_ci2)
+        self._change(course, section, {teacher: -delta for teacher, delta in changes.items()})
+        return after - before
+
+    # ------------------------------------------------------------------------
+    # make sure each section has exactly the course hours allocated
+    # ------------------------------------------------------------------------
+    def allocate_remaining_hours(self):
+        for course, section in self.sections:
+            while abs(remaining := self.unallocated(section)) > EPSILON:
+                amount = min(self.step, abs(remaining))
+                if remaining > 0:
+                    candidates = [{t: amount} for t in self.ci if self._can_change(section, t)]
+                else:
+                    candidates = [{t: -amount} for t, h in self.hours[section].items()
+                                  if self._can_change(section, t) and h >= amount - EPSILON]
+                if not candidates:
+                    break
+                best = min(candidates, key=lambda changes: self._try(course, section, changes))
+                self._change(course, section, best)
+                self.moves += 1
+
+    # ------------------------------------------------------------------------
+    # move hours from one teacher to another while it makes things better
+    # ------------------------------------------------------------------------
+    def even_out(self, max_moves: int):
+        improved = True
+        while improved and self.moves < max_moves:
+            improved = False
+            for course, section in self.sections:
+                for giver in list(self.hours[section]):
+                    hours = self.hours[section].get(giver, 0)
+                    if hours < EPSILON or not self._can_change(section, giver):
+                        continue
+
+                    # move part of the hours, or all of them (which also removes a prep)
+                    best, best_delta = None, -EPSILON
+                    for amount in {min(self.step, hours), hours}:
+                        for taker in self.ci:
+                            if taker is giver or not self._can_change(section, taker):
+                                continue
+                            changes = {giver: -amount, taker: amount}
+                            delta = self._try(course, section, changes)
+                            if delta < best_delta:
+                                best, best_delta = changes, delta
+
+                    if best is not None:
+                        self._change(course, section, best)
+                        self.moves += 1
+                        improved = True
+                        if self.moves >= max_moves:
+                            return
@@ -1,11 +1,14 @@
 """Calculate the CI for a given teacher"""
 from __future__ import annotations
-from .ci_constants import *
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from .ci_formula import CIFormula, CIBreakdown, DEFAULT_FORMULA
 
 if TYPE_CHECKING:
     from ..model.schedule import Schedule
+    from ..model.scenario import ScenarioSet
     from ..model.course import Course
+    from ..model.section import Section
     from ..model.teacher import Teacher
 
 # for debugging
@@ -17,21 +20,111 @@ def debug(*args):
         return
     print(args)
 
-def calculate_ci(teacher:Teacher, schedule: Schedule):
-    c = CICalc(teacher, schedule)
+def calculate_ci(teacher:Teacher, schedule: Schedule, formula: CIFormula = None):
+    c = CICalc(teacher, schedule, formula)
     return c.calculate()
 
+
+def calculate_ci_for_all(schedule: Schedule, formula: CIFormula = None) -> dict[Teacher, float]:
+    """
+    Calculate the CI for every teacher in the schedule, going through the sections only once
+    :param schedule:
+    :param formula: the CI formula constants (default: ci_constants)
+    :return: CI for each teacher
+    """
+    return {teacher: calc.ci for teacher, calc in ci_calculators_for_all(schedule, formula).items()}
+
+
+def ci_calculators_for_all(schedule: Schedule, formula: CIFormula = None) -> dict[Teacher, CICalc]:
+    """
+    Accumulate the CI information (pes, preps, hours, students) for every teacher in the schedule,
+    going through the sections only once
+    :param schedule:
+    :param formula: the CI formula constants (default: ci_constants)
+    :return: CI calculator (with accumulated info) for each teacher
+    """
+    calcs: dict[Teacher, CICalc] = {}
+
+    def calc_for(teacher: Teacher) -> CICalc:
+        if teacher not in calcs:
+            calcs[teacher] = CICalc(teacher, schedule, formula)
+            calcs[teacher].release = teacher.release or 0
+        return calcs[teacher]
+
+    for teacher in schedule.teachers():
+        calc_for(teacher)
+
+    for course in schedule.courses():
+        for section in course.sections():
+            for teacher in set(section.teachers()) | set(section.section_defined_teachers()):
+                calc_for(teacher).set_section_hours(course, section, section.get_teacher_allocation(teacher))
+
+    return calcs
+
+
+def compare_scenarios(scenarios: ScenarioSet, formula: CIFormula = None) -> dict[Optional[str], dict[Teacher, float]]:
+    """
+    The CI of every teacher for every scenario (and for the original schedule).  The CI of the
+    schedule is calculated once, and each scenario only recalculates the teachers whose
+    allocations are different
+    :param scenarios:
+    :param formula: the CI formula constants (default: ci_constants)
+    :return: scenario name (None for the original schedule) -> teacher -> CI
+    """
+    schedule = scenarios.schedule
+    calcs = ci_calculators_for_all(schedule, formula)
+
+    # the schedule may have the active scenario's allocations, so put back the originals
+    active = scenarios.active
+    if active is not None:
+        _set_allocations(schedule, calcs, {key: scenarios.original_allocation(*key) for key in active.allocations()},
+                         formula)
+    original = {teacher: calc.ci for teacher, calc in calcs.items()}
+
+    comparison: dict[Optional[str], dict[Teacher, float]] = {None: original}
+    for scenario in scenarios:
+        changed = _set_allocations(schedule, calcs, scenario.allocations(), formula, copy=True)
+        comparison[scenario.name] = {**original, **{teacher: calc.ci for teacher, calc in changed.items()}}
+    return comparison
+
+
+def _set_allocations(schedule: Schedule, calcs: dict[Teacher, CICalc],
+                     allocations: dict[tuple[Section, Teacher], float], formula: CIFormula = None,
+                     copy: bool = False) -> dict[Teacher, CICalc]:
+    """
+    set the hours for these section/teachers
+    :param formula: the CI formula constants for teachers that do not have a calculator yet (default: ci_constants)
+    :param copy: if true, copies of the calculators are changed instead
+    :return: the calculators that were changed
+    """
+    changed: dict[Teacher, CICalc] = {}
+    for (section, teacher), hours in allocations.items():
+        if teacher not in changed:
+            if teacher not in calcs:
+                calcs[teacher] = CICalc(teacher, schedule, formula)
+                calcs[teacher].release = teacher.release or 0
+            changed[teacher] = calcs[teacher].copy() if copy else calcs[teacher]
+        changed[teacher].set_section_hours(section.course, section, hours)
+    return changed
+
+
 class CICalc:
-    def __init__(self, teacher:Teacher, schedule: Schedule):
+    def __init__(self, teacher:Teacher, schedule: Schedule, formula: CIFormula = None):
         """
         :param teacher:
         :parm schedule:
+        :param formula: the CI formula constants (default: ci_constants)
         """
         self._reset()
         self.prep_hours = 0
         self.schedule = schedule
         self.teacher = teacher
         self.release = 0
+        self.formula = formula if formula is not None else DEFAULT_FORMULA
+
+        # hours for each section that the teacher teaches, so that the totals can be updated
+        # when only one section changes
+        self._section_hours: dict[Course, dict[Section, float]] = {}
 
     def _reset(self):
         self.pes = 0
@@ -41,6 +134,7 @@ class CICalc:
         self.ntu_students = 0
         self.release = 0
         self.dirty_flag = False
+        self._section_hours = {}
 
     def calculate(self, ) -> float:
         """
@@ -52,6 +146,7 @@ class CICalc:
         courses: list[Course] = [c for c in schedule.courses() if c.has_allocated_teacher(teacher)]
 
         self._reset()
+        self.prep_hours = 0
         self.release = teacher.release or 0
 
         debug("")
@@ -72,81 +167,78 @@ class CICalc:
             for section in course.get_sections_for_allocated_teacher(teacher):
                 debug(f"   Section: {section}")
                 hours = section.get_teacher_allocation(teacher)
-                students = section.num_students
 
                 debug(f"{course.name}, Section: {section.number}, hours: {hours}")
 
                 max_prep_hours = max_prep_hours if max_prep_hours > hours else hours
 
-                self.pes = self.pes + hours * students
-                self.students += students
-                # Perl ver includes commented hours >= 3 check
-                self.ntu_students += students
-                self.hours += hours
-
-            self.prep_hours += hours
-            self.num_preps += 1
+                self.set_section_hours(course, section, hours)
 
         # return
         total = self._total()
         debug(f"CI {teacher}: {total}")
         return total
 
-    def _total(self) -> float:
+    def copy(self) -> CICalc:
+        """a copy that can be changed without changing this one"""
+        other = CICalc(self.teacher, self.schedule, self.formula)
+        other.__dict__.update(self.__dict__)
+        other._section_hours = {course: dict(sections) for course, sections in self._section_hours.items()}
+        return other
+
+    @property
+    def ci(self) -> float:
+        """the CI for the information that has been accumulated so far"""
+        return self._total()
+
+    def set_section_hours(self, course: Course, section: Section, hours: float):
+        """
+        Set the teacher's hours for a section, updating the totals with only the change
+        :param course:
+        :param section:
+        :param hours: 0 if the teacher does not teach this section
+        """
+        course_sections = self._section_hours.setdefault(course, {})
+        old_prep = self._prep_hours_for(course)
+
+        old_hours = course_sections.pop(section, 0)
+        if old_hours:
+            self._add_section(old_hours, section.num_students, -1)
+        if hours:
+            course_sections[section] = hours
+            self._add_section(hours, section.num_students)
+
+        new_prep = self._prep_hours_for(course)
+        if old_prep is not None:
+            self.prep_hours -= old_prep
+            self.num_preps -= 1
+        if new_prep is not None:
+            self.prep_hours += new_prep
+            self.num_preps += 1
 
-        # ------------------------------------------------------------------------
-        # PES (based on # of students and contact hours)
-        # ------------------------------------------------------------------------
-        CI_student = self.pes * PES_FACTOR
-        debug(f"PES: {self.pes}\nStudent factor: {CI_student}")
-
-        # bonus if pes is over 415
-        surplus = self.pes - PES_BONUS_LIMIT
-        bonus = surplus * PES_BONUS_FACTOR if surplus > 0 else 0
-        debug(f"Bonus PES > 415: {bonus}")
-        CI_student += bonus
-
-        # another bonus if total number of students is over student_bonus_limit
-        # (only for courses over 3 hours)
-        debug(f"Students {self.students}")
-        bonus = self.ntu_students * STUDENT_BONUS_FACTOR if self.ntu_students >= STUDENT_BONUS_LIMIT else 0
-        debug(f"Bonus students over 75: {bonus}")
-        CI_student += bonus
-
-        # and yet another bonus if number of students is over Crazy student limit
-        if self.ntu_students >= STUDENT_CRAZY_BONUS_LIMIT:
-            bonus = (self.ntu_students - STUDENT_CRAZY_BONUS_LIMIT) * STUDENT_CRAZY_BONUS_FACTOR
-            CI_student += bonus
-
-        # ------------------------------------------------------------------------
-        # Preps (based on # of prep hours PER course)
-        # ------------------------------------------------------------------------
-        CI_preps = self.prep_hours * PREP_FACTOR
-        debug(f"Prep Hours {self.prep_hours}\nCI prep: {CI_preps}")
-
-        # bonus if number is the PREP_BONUS_LIMIT
-        if self.num_preps == PREP_BONUS_LIMIT:
-            CI_preps += self.prep_hours * PREP_BONUS_FACTOR
-            debug(f"CI bonus prep: {self.prep_hours * PREP_BONUS_FACTOR}")
-
-        # more bonus if over the limit
-        elif self.num_preps > PREP_BONUS_LIMIT:
-            CI_preps += self.prep_hours * PREP_CRAZY_BONUS_FACTOR
-            debug(f"CI bonus bonus prep: {self.prep_hours * PREP_CRAZY_BONUS_FACTOR}")
-
-        # ------------------------------------------------------------------------
-        # Hours (based on contact hours per week)
-        # ------------------------------------------------------------------------
-        CI_hours = self.hours * HOURS_FACTOR
-        debug(f"CI hours: {CI_hours}")
-
-        # ------------------------------------------------------------------------
-        # Release
-        # ------------------------------------------------------------------------
-        CI_release = self.release * CI_FTE_PER_SEMESTER
-        debug(f"CI release: {CI_release}")
-
-        # ------------------------------------------------------------------------
-        # all done
-        # ------------------------------------------------------------------------
-        return float(CI_release) + float(CI_hours) + float(CI_preps) + float(CI_student)
+    def _add_section(self, hours: float, students: int, sign: int = 1):
+        """add (or with sign -1, remove) a section's hours and students to the totals"""
+        self.pes = self.pes + sign * hours * students
+        self.students += sign * students
+        # Perl ver includes commented hours >= 3 check
+        self.ntu_students += sign * students
+        self.hours += sign * hours
+
+    def _prep_hours_for(self, course: Course) -> Optional[float]:
+        """prep hours are the hours of the last section of the course, None if no sections"""
+        course_sections = self._section_hours.get(course, {})
+        if not course_sections:
+            return None
+        return course_sections[max(course_sections)]
+
+    def _total(self) -> float:
+        return self.breakdown().total
+
+    def breakdown(self) -> CIBreakdown:
+        """the CI (for the information accumulated so far) split into its parts"""
+        parts = self.formula.breakdown(self.pes, self.ntu_students, self.prep_hours, self.num_preps,
+                                       self.hours, self.release)
+        debug(f"PES: {self.pes}, Students {self.students}, CI students: {parts.pes}")
+        debug(f"Prep Hours {self.prep_hours}, CI prep: {parts.prep}")
+        debug(f"CI hours: {parts.hours}, CI release: {parts.release}")
+        return parts
@@ -0,0 +1,194 @@
+"""
+The CI formula, with the constants of a collective agreement.
+
+The constants (factors, limits and bonus tiers) change every few agreements, so they can be
+read from a config file, with one section per agreement version.  Anything not in the config
+file has the value from ci_constants.
+
+The formula can be evaluated for one teacher, or for columns of values (one entry per
+teacher), so the CI of many teachers/semesters/scenarios can be recalculated with different
+constants quickly (sensitivity analysis).
+
+CONFIG FILE
+
+    [2023]
+    pes_bonus_limit = 415
+    pes_bonus_factor = 0.03
+
+    [2027]
+    pes_bonus_limit = 400
+
+SYNOPSIS
+
+    formulas = load_formulas("ci_formulas.ini")
+    columns = CIColumns.from_calculators(ci_calculators_for_all(schedule).values())
+    for version, formula in formulas.items():
+        print(version, formula.evaluate(columns))
+
+    higher_limit = DEFAULT_FORMULA.replace(pes_bonus_limit=450)
+"""
+from __future__ import annotations
+
+import configparser as cp
+from dataclasses import dataclass, field, fields, replace
+from typing import Iterable, TYPE_CHECKING
+
+from . import ci_constants
+
+if TYPE_CHECKING:
+    from .ci_calculation import CICalc
+
+
+# ============================================================================
+# the parts of the CI
+# ============================================================================
+@dataclass
+class CIBreakdown:
+    """the parts that the CI is made of"""
+    pes: float = 0
+    prep: float = 0
+    hours: float = 0
+    release: float = 0
+
+    @property
+    def total(self) -> float:
+        return float(self.release) + float(self.hours) + float(self.prep) + float(self.pes)
+
+
+# ============================================================================
+# the formula
+# ============================================================================
+@dataclass(frozen=True)
+class CIFormula:
+    version: str = "default"
+
+    pes_factor: float = ci_constants.PES_FACTOR
+    pes_bonus_limit: float = ci_constants.PES_BONUS_LIMIT
+    pes_bonus_factor: float = ci_constants.PES_BONUS_FACTOR
+
+    student_bonus_limit: float = ci_constants.STUDENT_BONUS_LIMIT
+    student_bonus_factor: float = ci_constants.STUDENT_BONUS_FACTOR
+    student_crazy_bonus_limit: float = ci_constants.STUDENT_CRAZY_BONUS_LIMIT
+    student_crazy_bonus_factor: float = ci_constants.STUDENT_CRAZY_BONUS_FACTOR
+
+    prep_factor: float = ci_constants.PREP_FACTOR
+    prep_bonus_limit: float = ci_constants.PREP_BONUS_LIMIT
+    prep_bonus_factor: float = ci_constants.PREP_BONUS_FACTOR
+    prep_crazy_bonus_factor: float = ci_constants.PREP_CRAZY_BONUS_FACTOR
+
+    hours_factor: float = ci_constants.HOURS_FACTOR
+    ci_fte_per_semester: float = ci_constants.CI_FTE_PER_SEMESTER
+
+    def replace(self, **changes) -> CIFormula:
+        """a copy of this formula, with some of the constants changed"""
+        return replace(self, **changes)
+
+    # ------------------------------------------------------------------------
+    # one teacher
+    # ------------------------------------------------------------------------
+    def breakdown(self, pes: float, ntu_students: float, prep_hours: float, num_preps: int,
+                  hours: float, release: float) -> CIBreakdown:
+        """the CI split into its parts"""
+        return CIBreakdown(pes=self._pes_ci(pes, ntu_students), prep=self._prep_ci(prep_hours, num_preps),
+                           hours=hours * self.hours_factor, release=release * self.ci_fte_per_semester)
+
+    def ci(self, pes: float, ntu_students: float, prep_hours: float, num_preps: int,
+           hours: float, release: float) -> float:
+        return self.breakdown(pes, ntu_students, prep_hours, num_preps, hours, release).total
+
+    def _pes_ci(self, pes: float, ntu_students: float) -> float:
+        # PES (based on # of students and contact hours), with a bonus if pes is over the limit
+        ci = pes * self.pes_factor
+        surplus = pes - self.pes_bonus_limit
+        ci += surplus * self.pes_bonus_factor if surplus > 0 else 0
+
+        # another bonus if total number of students is over student_bonus_limit,
+        # and yet another if it is over the crazy limit
+        ci += ntu_students * self.student_bonus_factor if ntu_students >= self.student_bonus_limit else 0
+        if ntu_students >= self.student_crazy_bonus_limit:
+            ci += (ntu_students - self.student_crazy_bonus_limit) * self.student_crazy_bonus_factor
+        return ci
+
+    def _prep_ci(self, prep_hours: float, num_preps: int) -> float:
+        # preps (based on # of prep hours PER course), with bonuses for too many preps
+        ci = prep_hours * self.prep_factor
+        if num_preps == self.prep_bonus_limit:
+            ci += prep_hours * self.prep_bonus_factor
+        elif num_preps > self.prep_bonus_limit:
+            ci += prep_hours * self.prep_crazy_bonus_factor
+        return ci
+
+    # ------------------------------------------------------------------------
+    # many teachers at once
+    # ------------------------------------------------------------------------
+    def evaluate(self, columns: CIColumns) -> list[float]:
+        """the CI for every entry in the columns"""
+        return [self.ci(pes, students, prep, num, hours, release)
+                for pes, students, prep, num, hours, release in zip(columns.pes, columns.ntu_students,
+                                                                    columns.prep_hours, columns.num_preps,
+                                                                    columns.hours, columns.release)]
+
+
+DEFAULT_FORMULA = CIFormula()
+
+
+# ============================================================================
+# the values needed by the formula, for many teachers
+# ============================================================================
+@dataclass
+class CIColumns:
+    pes: list[float] = field(default_factory=list)
+    ntu_students: list[float] = field(default_factory=list)
+    prep_hours: list[float] = field(default_factory=list)
+    num_preps: list[int] = field(default_factory=list)
+    hours: list[float] = field(default_factory=list)
+    release: list[float] = field(default_factory=list)
+
+    @classmethod
+    def from_calculators(cls, calcs: Iterable[CICalc]) -> CIColumns:
+        """the accumulated info of the CI calculators, in the same order"""
+        columns = cls()
+        for calc in calcs:
+            columns.pes.append(calc.pes)
+            columns.ntu_students.append(calc.ntu_students)
+            columns.prep_hours.append(calc.prep_hours)
+            columns.num_preps.append(calc.num_preps)
+            columns.hours.append(calc.hours)
+            columns.release.append(calc.release)
+        return columns
+
+    def __len__(self):
+        return len(self.pes)
+
+
+# ============================================================================
+# sensitivity analysis
+# ============================================================================
+def sensitivity(columns: CIColumns, formulas: dict[str, CIFormula]) -> dict[str, list[float]]:
+    """the CI of every entry in the columns, for each of the formulas"""
+    return {name: formula.evaluate(columns) for name, formula in formulas.items()}
+
+
+# ============================================================================
+# read formulas from a config file
+# ============================================================================
+def load_formulas(file: str) -> dict[str, CIFormula]:
+    """
+    Read the formula constants for each agreement version
+    :param file: ini file, one section per version
+    :return: version -> formula
+    """
+    config = cp.ConfigParser()
+    if not config.read(file):
+        raise FileNotFoundError(f"Could not read CI formulas from {file}")
+
+    names = {f.name for f in fields(CIFormula) if f.name != "version"}
+    formulas: dict[str, CIFormula] = {}
+    for version in config.sections():
+        values = {}
+        for key, value in config[version].items():
+            if key not in names:
+                raise ValueError(f"{file} [{version}]: unknown CI constant '{key}'")
+            values[key] = float(value)
+        formulas[version] = CIFormula(version=version, **values)
+    return formulas
@@ -0,0 +1,149 @@
+"""
+CI report for a whole department, without the gui.
+
+The CI of every teacher is calculated for each semester (all teachers at once, see
+ci_calculators_for_all), split into its parts (PES, preps, hours, release), and added up
+for the year.  The sections that do not have all their hours allocated are also reported.
+
+SYNOPSIS
+
+    report = department_report({SemesterType.fall: fall, SemesterType.winter: winter})
+    with open("ci.csv", "w", newline="") as f:
+        write_csv(report, f)
+"""
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Optional, TextIO, TYPE_CHECKING
+
+from .ci_calculation import ci_calculators_for_all
+from ..model.teacher_index import TeacherIndex
+
+if TYPE_CHECKING:
+    from .ci_formula import CIFormula
+    from ..model.enums import SemesterType
+    from ..model.schedule import Schedule
+
+EPSILON = 1e-9
+
+
+# ============================================================================
+# what is reported
+# ============================================================================
+@dataclass
+class SemesterCI:
+    semester: str
+    hours: float
+    pes_ci: float
+    prep_ci: float
+    hours_ci: float
+    release_ci: float
+    ci: float
+
+
+@dataclass
+class TeacherCI:
+    teacher: str
+    department: str
+    semesters: dict[str, SemesterCI] = field(default_factory=dict)
+
+    @property
+    def year_ci(self) -> float:
+        return sum(s.ci for s in self.semesters.values())
+
+
+@dataclass
+class UnallocatedHours:
+    semester: str
+    course: str
+    section: str
+    hours: float
+
+
+@dataclass
+class CIReport:
+    semesters: list[str] = field(default_factory=list)
+    teachers: list[TeacherCI] = field(default_factory=list)
+    unallocated: list[UnallocatedHours] = field(default_factory=list)
+
+
+# ============================================================================
+# create the report
+# ============================================================================
+def department_report(schedules: dict[SemesterType, Optional[Schedule]],
+                      aliases: Optional[dict[str, str]] = None, formula: CIFormula = None) -> CIReport:
+    """
+    Calculate the CI of all the teachers, for all the semesters
+    :param schedules: schedule for each semester (semesters with no schedule are ignored)
+    :param aliases: alternate teacher id -> teacher id, for teachers whose names are different in different semesters
+    :param formula: the CI formula constants (default: ci_constants)
+    """
+    schedules = {semester: schedule for semester, schedule in schedules.items() if schedule is not None}
+    index = TeacherIndex(schedules, aliases)
+    report = CIReport(semesters=[semester.name for semester in schedules])
+    by_identity: dict[str, TeacherCI] = {}
+
+    for semester, schedule in schedules.items():
+        for teacher, calc in ci_calculators_for_all(schedule, formula).items():
+            key = index.identity(teacher)
+            if key not in by_identity:
+                by_identity[key] = TeacherCI(teacher=str(teacher), department=teacher.department)
+            parts = calc.breakdown()
+            by_identity[key].semesters[semester.name] = SemesterCI(
+                semester=semester.name, hours=calc.hours, pes_ci=parts.pes, prep_ci=parts.prep,
+                hours_ci=parts.hours, release_ci=parts.release, ci=parts.total)
+
+        for course in schedule.courses_with_allocation():
+            for section in course.sections():
+                teachers = set(section.teachers()) | set(section.section_defined_teachers())
+                remaining = course.hours_per_week - sum(section.get_teacher_allocation(t) for t in teachers)
+                if abs(remaining) > EPSILON:
+                    report.unallocated.append(UnallocatedHours(semester.name, course.number,
+                                                               section.number, remaining))
+
+    report.teachers = [by_identity[key] for key in sorted(by_identity)]
+    return report
+
+
+# ============================================================================
+# write the report
+# ============================================================================
+SEMESTER_FIELDS = ("hours", "pes_ci", "prep_ci", "hours_ci", "release_ci", "ci")
+
+
+def write_csv(report: CIReport, f: TextIO):
+    """
+    One row per teacher, followed by (after an empty row) the unallocated hours per section
+    """
+    writer = csv.writer(f)
+    writer.writerow(["teacher", "department",
+                     *(f"{semester}_{name}" for semester in report.semesters for name in SEMESTER_FIELDS),
+                     "year_ci"])
+    for teacher in report.teachers:
+        row = [teacher.teacher, teacher.department]
+        for semester in report.semesters:
+            semester_ci = teacher.semesters.get(semester)
+            row.extend(_round(getattr(semester_ci, name)) if semester_ci is not None else 0
+                       for name in SEMESTER_FIELDS)
+        row.append(_round(teacher.year_ci))
+        writer.writerow(row)
+
+    writer.writerow([])
+    writer.writerow(["semester", "course", "section", "unallocated_hours"])
+    for unallocated in report.unallocated:
+        writer.writerow([unallocated.semester, unallocated.course, unallocated.section, _round(unallocated.hours)])
+
+
+def write_json(report: CIReport, f: TextIO):
+    data = {
+        "semesters": report.semesters,
+        "teachers": [dict(asdict(teacher), year_ci=teacher.year_ci) for teacher in report.teachers],
+        "unallocated": [asdict(unallocated) for unallocated in report.unallocated],
+    }
+    json.dump(data, f, indent=2)
+
+
+def _round(value: float) -> float:
+    return round(value, 2)
@@ -0,0 +1,299 @@
+"""
+Exports the views of many resources at the same time, in a process pool, so that the gui
+does not have to wait for every file to be written.
+
+Only plain data (titles and block positions/text) is sent to the other processes, each one
+creates its own canvas and writes its own file.
+
+Views can also be exported as pages of one document, which is written in the background, one page at a time.
+
+Nothing here needs Tk (or a display), so views can also be exported from the command line.
+"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, CancelledError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from enum import Enum
+from pickle import PicklingError
+from typing import Optional, Callable
+
+from ..model import ResourceType, Schedule
+from ..gui_generics.block_colours import get_block_colours
+from ..gui_generics.view_layout import ViewLayout
+from ..presenter.block_text import get_block_text
+from .view_export_canvases import PDFCanvas, LatexCanvas, SVGCanvas, PDFDocument, LatexDocument
+
+# the scale used to draw a view on a pdf page (or an svg)
+PDF_SCALE = 0.8
+
+
+class CanvasType(Enum):
+    latex = 1
+    pdf = 2
+    svg = 3
+
+
+EXTENSIONS: dict[CanvasType, str] = {CanvasType.latex: "tex", CanvasType.pdf: "pdf", CanvasType.svg: "svg"}
+
+
+# =====================================================================================================================
+# what needs to be drawn for one resource
+# =====================================================================================================================
+@dataclass
+class ExportBlock:
+    day: int
+    start: float
+    duration: float
+    text: str
+
+
+@dataclass
+class ExportJob:
+    canvas_type: CanvasType
+    title: str
+    schedule_name: str
+    directory: str
+    resource_type: ResourceType = ResourceType.teacher
+    blocks: list[ExportBlock] = field(default_factory=list)
+
+    # when exporting to one document, the pages are bookmarked under this name
+    group: str = ""
+
+
+@dataclass
+class ExportProgress:
+    total: int
+    done: int = 0
+    files: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    cancelled: bool = False
+
+    @property
+    def finished(self) -> bool:
+        # cancelled files count as done
+        return self.done >= self.total
+
+
+# =====================================================================================================================
+# what needs to be drawn for each resource of a type
+# =====================================================================================================================
+def export_jobs(schedule: Schedule, resource_type: ResourceType, canvas_type: CanvasType, directory: str,
+                group: str = "") -> list[ExportJob]:
+    """
+    :param schedule:
+    :param resource_type: teacher, lab or stream
+    :param canvas_type: pdf, latex or svg
+    :param directory: where the files are written
+    :param group: when exporting to one document, the pages are bookmarked under this name
+    :return: one job per resource
+    """
+    resources = ()
+    match resource_type:
+        case ResourceType.teacher:
+            resources = schedule.teachers()
+        case ResourceType.lab:
+            resources = schedule.labs()
+        case ResourceType.stream:
+            resources = schedule.streams()
+
+    jobs: list[ExportJob] = []
+    for resource in resources:
+        job = ExportJob(canvas_type=canvas_type, title=str(resource), schedule_name=schedule.filename,
+                        directory=directory, group=group)
+        for block in schedule.get_blocks_for_obj(resource):
+            text = get_block_text(block, scale=1, resource_type=ResourceType.teacher)
+            job.blocks.append(ExportBlock(block.day.value, block.start, block.duration, text))
+        jobs.append(job)
+    return jobs
+
+
+# =====================================================================================================================
+# export one view (done in a separate process)
+# =====================================================================================================================
+def export_view(job: ExportJob, document: Optional[PDFDocument | LatexDocument] = None) -> str:
+    """
+    draw the blocks of one resource, and write the file
+    :param job: what to draw
+    :param document: if given, the view is added as a page of this document
+    :return: the name of the file that was written
+    """
+    # latex draws its own view
+    if job.canvas_type == CanvasType.latex:
+        cn = LatexCanvas(title=job.title, schedule_name=job.schedule_name, directory=job.directory,
+                         document=document)
+        for block in job.blocks:
+            cn.draw_block(resource_type=job.resource_type,
+                          day=block.day, start_time=block.start, duration=block.duration,
+                          text=block.text,
+                          gui_tag="",
+                          movable=True,
+                          )
+        cn.save()
+        return cn.filename
+
+    # pdf and svg are drawn with the same layout as the views in the gui
+    layout = ViewLayout(PDF_SCALE)
+    if job.canvas_type == CanvasType.pdf:
+        cn = PDFCanvas(title=job.title, schedule_name=job.schedule_name, directory=job.directory,
+                       document=document, group=job.group)
+    else:
+        cn = SVGCanvas(title=job.title, schedule_name=job.schedule_name, directory=job.directory,
+                       size=layout.size())
+
+    layout.draw_background(cn)
+    colour, text_colour = get_block_colours(job.resource_type)
+    for block in job.blocks:
+        layout.draw_block_items(cn, block.day, block.start, block.duration, block.text, colour, text_colour)
+    cn.save()
+    return cn.filename
+
+
+# =====================================================================================================================
+# export many views as one document (the pages are written as soon as they are drawn)
+# =====================================================================================================================
+def export_document(jobs: list[ExportJob], filename: str, title: str = "",
+                    page_done: Callable[[], None] = lambda: None,
+                    is_cancelled: Callable[[], bool] = lambda: False) -> str:
+    """
+    :param jobs: one page per job (all jobs must be the same canvas type)
+    :param filename: the pdf or tex file
+    :param title: the title of the document
+    :param page_done: called after each page is written
+    :param is_cancelled: checked before each page, if true, the document is finished without the remaining pages
+    :return: the name of the file that was written
+    """
+    canvas_type = jobs[0].canvas_type if jobs else CanvasType.pdf
+    if canvas_type == CanvasType.svg:
+        raise ValueError("svg files can only have one view each")
+    document = PDFDocument(filename, title) if canvas_type == CanvasType.pdf else LatexDocument(filename)
+    try:
+        for job in jobs:
+            if is_cancelled():
+                break
+            export_view(job, document)
+            page_done()
+    finally:
+        document.close()
+    return filename
+
+
+# =====================================================================================================================
+# BatchExport
+# =====================================================================================================================
+class BatchExport:
+    """Export the views of many resources in parallel"""
+
+    def __init__(self, jobs: list[ExportJob], use_processes: bool = True, max_workers: Optional[int] = None,
+                 document: Optional[str] = None, title: str = ""):
+        """
+        :param jobs: one job per resource
+        :param use_processes: export in a process pool (else in a thread pool)
+        :param max_workers: defaults to the number of processors
+        :param document: if given, every view is a page of this one file (written in one background thread)
+        :param title: the title of the document
+        """
+        self.jobs = list(jobs)
+        self.use_processes = use_processes
+        self.max_workers = max_workers
+        self.document = document
+        self.title = title
+        self._progress = ExportProgress(total=len(self.jobs))
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor | ThreadPoolExecutor] = None
+        self._futures: list[Future] = []
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # start (returns immediately)
+    # ----------------------------------------------------------------------------------------------------------------
+    def start(self):
+        """start exporting, in the background"""
+        if not self.jobs:
+            return
+
+        # one document has to be written in order, by one thread
+        if self.document is not None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            future = self._executor.submit(export_document, self.jobs, self.document, self.title,
+                                           self._page_done, self._is_cancelled)
+            future.add_done_callback(self._document_done)
+            self._futures.append(future)
+            return
+
+        # no point starting up other processes for only one file
+        if self.use_processes and len(self.jobs) > 1:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                self._submit_all()
+                return
+            except (BrokenProcessPool, PicklingError, OSError):
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                self._futures.clear()
+                self._progress = ExportProgress(total=len(self.jobs))
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._submit_all()
+
+    def _submit_all(self):
+        for job in self.jobs:
+            future = self._executor.submit(export_view, job)
+            future.add_done_callback(self._job_done)
+            self._futures.append(future)
+
+    def _job_done(self, future: Future):
+        """called (from a worker thread) when a file has been written, or failed"""
+        with self._lock:
+            self._progress.done += 1
+            try:
+                self._progress.files.append(future.result())
+            except CancelledError:
+                pass
+            except Exception as e:
+                self._progress.errors.append(str(e))
+
+    def _page_done(self):
+        with self._lock:
+            self._progress.done += 1
+
+    def _is_cancelled(self) -> bool:
+        with self._lock:
+            return self._progress.cancelled
+
+    def _document_done(self, future: Future):
+        """called (from the worker thread) when the document has been written, or failed"""
+        with self._lock:
+            self._progress.done = self._progress.total
+            try:
+                self._progress.files.append(future.result())
+            except Exception as e:
+                self._progress.errors.append(str(e))
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # progress
+    # ----------------------------------------------------------------------------------------------------------------
+    def progress(self) -> ExportProgress:
+        """a snapshot of how many files have been exported so far"""
+        with self._lock:
+            p = self._progress
+            return ExportProgress(p.total, p.done, list(p.files), list(p.errors), p.cancelled)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # cancel (files that are already being written are finished)
+    # ----------------------------------------------------------------------------------------------------------------
+    def cancel(self):
+        """stop exporting any files that have not been started yet"""
+        with self._lock:
+            self._progress.cancelled = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # wait (mostly for command line use)
+    # ----------------------------------------------------------------------------------------------------------------
+    def wait(self) -> ExportProgress:
+        """wait until every file has been exported (or cancelled)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        return self.progress()
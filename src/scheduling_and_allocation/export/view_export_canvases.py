@@ -1,6 +1,15 @@
 """
 Provides canvases for drawing views, other than the Tk canvas
+
+A canvas can write its own file, or be one page of a document (LatexDocument, PDFDocument) which
+has a page for every resource
 """
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, TextIO
+from xml.sax.saxutils import escape
+
 from reportlab.lib.pagesizes import LETTER
 from reportlab.pdfgen.canvas import Canvas
 from datetime import datetime
@@ -15,15 +24,64 @@ CWD = pathlib.Path().resolve()
 # ====================================================================================================================
 # Latex
 # ====================================================================================================================
+PAGE_START = r"\begin{center}"
+PAGE_END = r"\end{center}"
+
+
+@lru_cache(maxsize=1)
+def latex_template() -> tuple[str, str, str]:
+    """
+    the latex template, only read once
+    :return: the start of the document, one page, and the end of the document
+    """
+    with open(f"{CODE_PATH}/view_template.tex", "r") as template_file:
+        tex = template_file.read()
+    start = tex.index(PAGE_START)
+    end = tex.index(PAGE_END) + len(PAGE_END)
+    return tex[:start], tex[start:end], tex[end:]
+
+
+class LatexDocument:
+    """A latex file with a page for every view, each page is written as soon as it is done"""
+
+    def __init__(self, filename: str):
+        """
+        :param filename: the tex file
+        """
+        self.filename = filename
+        self.pages = 0
+        header, _, _ = latex_template()
+        self._fh: Optional[TextIO] = open(filename, "w")
+        self._fh.write(header)
+
+    def write_page(self, tex: str):
+        """add a page to the document"""
+        if self.pages:
+            self._fh.write("\n\\clearpage\n")
+        self._fh.write(tex)
+        self.pages += 1
+
+    def close(self):
+        """finish the document"""
+        if self._fh is None:
+            return
+        _, _, footer = latex_template()
+        self._fh.write(footer)
+        self._fh.close()
+        self._fh = None
+
+
 class LatexCanvas:
     """Doesn't 'draw' a canvas so much as uses a template and inserts latex stuff"""
 
-    def __init__(self, title="Title", schedule_name="sub_title", filename=None, directory=None):
+    def __init__(self, title="Title", schedule_name="sub_title", filename=None, directory=None,
+                 document: Optional[LatexDocument] = None):
         """
         creates the latex file to work with
         :param title: title to be displayed
         :param schedule_name: the filename of the schedule
         :param filename: the file to save the tex file to (defaults to title, in current working directory)
+        :param document: if given, this is a page of the document, instead of its own file
         """
         if directory is None:
             directory = CWD
@@ -32,10 +90,9 @@ class LatexCanvas:
             filename = filename.replace(" ","_")
             filename = f"{directory}/{filename}.tex"
 
-        self.filename = filename
-        template_file = open(f"{CODE_PATH}/view_template.tex","r")
-        self.tex = template_file.read()
-        template_file.close()
+        self.document = document
+        self.filename = filename if document is None else document.filename
+        _, self.tex, _ = latex_template()
         title = title.replace("_",r"\_")
         schedule_name = schedule_name.replace("_",r"\_")
 
@@ -67,26 +124,79 @@ class LatexCanvas:
         )
 
     def save(self):
-        """writes the tex file"""
+        """writes the tex file (or the page of the document)"""
         self.tex = self.tex.replace("%%CLASS_TIMES%%", "\n".join(self.blocks))
+        if self.document is not None:
+            self.document.write_page(self.tex)
+            return
+        header, _, footer = latex_template()
         fh = open(self.filename, "w")
-        fh.write(self.tex)
+        fh.write(header + self.tex + footer)
         fh.close()
 
 
 # ====================================================================================================================
 # PDF
 # ====================================================================================================================
+class PDFDocument:
+    """A pdf file with a page (and a bookmark) for every view, all pages share the same fonts, etc."""
+
+    def __init__(self, filename: str, title: str = ""):
+        """
+        :param filename: the pdf file
+        :param title: the title of the document
+        """
+        self.filename = filename
+        self.pages = 0
+        self.cn = Canvas(filename, bottomup=0, pagesize=LETTER)
+        self.cn.setTitle(title)
+        self.cn.showOutline()
+        self._group: Optional[str] = None
+
+    def bookmark(self, title: str, group: str = ""):
+        """
+        bookmark the current page
+        :param title: the name of the bookmark
+        :param group: if given, the bookmark is put under a bookmark with this name
+        """
+        if group and group != self._group:
+            key = f"group_{self.pages}"
+            self.cn.bookmarkPage(key)
+            self.cn.addOutlineEntry(group, key, level=0)
+            self._group = group
+        key = f"page_{self.pages}"
+        self.cn.bookmarkPage(key)
+        self.cn.addOutlineEntry(title, key, level=1 if group else 0)
+
+    def end_page(self):
+        self.cn.showPage()
+        self.pages += 1
+
+    def close(self):
+        """write the pdf"""
+        self.cn.save()
+
+
 class PDFCanvas:
     """Provides a canvas for drawing a pdf"""
 
-    def __init__(self, title="Title", schedule_name="sub_title", filename=None, directory=None):
+    def __init__(self, title="Title", schedule_name="sub_title", filename=None, directory=None,
+                 document: Optional[PDFDocument] = None, group: str = ""):
         """
         creates a pdf canvas to draw on
         :param title: title to be displayed
         :param schedule_name: the filename of the schedule
         :param filename: the file to save the pdf file to (defaults to title, in current working directory)
+        :param document: if given, this is a page of the document, instead of its own file
+        :param group: the bookmark that the bookmark for this page goes under (if part of a document)
         """
+        self.document = document
+        if document is not None:
+            self.filename = document.filename
+            self.cn = document.cn
+            document.bookmark(str(title), group)
+            self._draw_title(title, schedule_name)
+            return
 
         if directory is None:
             directory = CWD
@@ -96,7 +206,11 @@ class PDFCanvas:
             filename = filename.replace(" ","_")
             filename = f"{directory}/{filename}.pdf"
 
+        self.filename = filename
         self.cn = Canvas(filename, bottomup=0, pagesize=LETTER)
+        self._draw_title(title, schedule_name)
+
+    def _draw_title(self, title, schedule_name):
         self.cn.setFont("Helvetica", 14)
         self.cn.drawCentredString(LETTER[0]/2,50, str(title))
         self.cn.setFont("Helvetica", 10)
@@ -164,6 +278,100 @@ class PDFCanvas:
         return 1
 
     def save(self):
-        """save the pdf"""
-        self.cn.save()
+        """save the pdf (or finish the page of the document)"""
+        if self.document is not None:
+            self.document.end_page()
+        else:
+            self.cn.save()
+
+
+# ====================================================================================================================
+# SVG
+# ====================================================================================================================
+SVG_HEADER_HEIGHT = 70
+SVG_LINE_HEIGHT = 10
+
+
+class SVGCanvas:
+    """Provides a canvas for drawing an svg file"""
+
+    def __init__(self, title="Title", schedule_name="sub_title", filename=None, directory=None,
+                 size: tuple[float, float] = (600, 700)):
+        """
+        creates an svg canvas to draw on
+        :param title: title to be displayed
+        :param schedule_name: the filename of the schedule
+        :param filename: the file to save the svg file to (defaults to title, in current working directory)
+        :param size: the width and height of the drawing (not including the title)
+        """
+        if directory is None:
+            directory = CWD
+
+        if filename is None:
+            filename = title.lower()
+            filename = filename.replace(" ","_")
+            filename = f"{directory}/{filename}.svg"
+
+        self.filename = filename
+        width, height = size
+        self.items: list[str] = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height + SVG_HEADER_HEIGHT:g}" '
+            f'font-family="Helvetica, Arial, sans-serif" font-size="8">',
+            f'<rect width="100%" height="100%" fill="white"/>',
+            f'<text x="{width / 2:g}" y="25" font-size="14" text-anchor="middle">{escape(str(title))}</text>',
+            f'<text x="{width / 2:g}" y="45" font-size="10" text-anchor="middle">{escape(str(schedule_name))}</text>',
+            f'<text x="{width / 2:g}" y="55" font-size="6" text-anchor="middle">'
+            f'Printed: {datetime.today().strftime("%Y-%m-%d")}</text>',
+            f'<g transform="translate(0,{SVG_HEADER_HEIGHT})">',
+        ]
+
+    def config(self,*args, **kwargs):
+        pass
 
+    def addtag_withtag(self,*args,**kwargs):
+        """not needed for this canvas"""
+        pass
+
+    def create_line(self, x1:float, y1:float, x2:float, y2:float, fill:str="grey", dash="", tags: str|tuple=""):
+        """draws a line"""
+        dash_array = ' stroke-dasharray="6,3"' if dash == "-" else ' stroke-dasharray="1,2"' if dash == "." else ""
+        self.items.append(f'<line x1="{x1:g}" y1="{y1:g}" x2="{x2:g}" y2="{y2:g}" '
+                          f'stroke="{Colour.string(fill)}" stroke-width="0.5"{dash_array}/>')
+
+    def create_text(self, x:float, y:float, text:str="", fill:str='black', tags:str|tuple="")->int:
+        """
+        draws the text, centered on x/y
+        :param x:
+        :param y:
+        :param text:
+        :param fill:
+        :param tags: not used
+        """
+        lines = text.split("\n")
+        y = y - (len(lines)-1)*SVG_LINE_HEIGHT/2
+        spans = "".join(f'<tspan x="{x:g}" y="{y + i*SVG_LINE_HEIGHT:g}">{escape(t)}</tspan>'
+                        for i, t in enumerate(lines))
+        self.items.append(f'<text text-anchor="middle" dominant-baseline="middle" '
+                          f'fill="{Colour.string(fill)}">{spans}</text>')
+        return 1
+
+    def create_rectangle(self, coords:tuple[float,float,float,float], fill:str='grey', outline:str='grey',
+                                        tags:str|tuple="")->int:
+        """
+        creates a rectangle with bounding coordinates
+        :param coords:
+        :param fill:
+        :param outline:
+        :param tags: (not used)
+        """
+        x1,y1,x2,y2 = coords
+        self.items.append(f'<rect x="{min(x1,x2):g}" y="{min(y1,y2):g}" width="{abs(x2-x1):g}" '
+                          f'height="{abs(y2-y1):g}" fill="{Colour.string(fill)}" '
+                          f'stroke="{Colour.string(outline)}" stroke-width="0.5"/>')
+        return 1
+
+    def save(self):
+        """save the svg"""
+        with open(self.filename, "w") as fh:
+            fh.write("\n".join(self.items))
+            fh.write("\n</g>\n</svg>\n")
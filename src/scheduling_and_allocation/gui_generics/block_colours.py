@@ -15,6 +15,38 @@ RESOURCE_COLOURS: dict[ResourceType, str] = {
     ResourceType.stream: TEAL
 }
 
+# ==============================================================================================================
+# the fill and text colour of a block
+# ==============================================================================================================
+_block_colours: dict[tuple[ResourceType, ConflictType, bool], tuple[str, str]] = {}
+
+def get_block_colours(resource_type: ResourceType, conflict: ConflictType = None, movable: bool = True) \
+        -> tuple[str, str]:
+    """
+    The colours are only calculated the first time they are asked for, after that it is a simple lookup
+    :param resource_type: teacher/lab/stream
+    :param conflict: the conflicts of the block (the most severe one for this resource type is shown)
+    :param movable: immovable blocks are always grey
+    :return: fill colour, text colour
+    """
+    conflict = ConflictType.NONE if conflict is None else conflict
+    key = (resource_type, conflict, movable)
+    colours = _block_colours.get(key)
+    if colours is not None:
+        return colours
+
+    colour = RESOURCE_COLOURS.get(resource_type, IMMOVABLE_COLOUR)
+    severest = ConflictType.most_severe(conflict, resource_type)
+    if severest != ConflictType.NONE:
+        colour = ConflictType.colours().get(severest, "pink")
+    if not movable:
+        colour = IMMOVABLE_COLOUR
+
+    colour = Colour.string(colour)
+    text_colour = "black" if Colour.is_light(colour) else "white"
+    colours = _block_colours[key] = (colour, text_colour)
+    return colours
+
 # ==============================================================================================================
 # return a list of colours with names, defining what colours go with what conflict types
 # ==============================================================================================================
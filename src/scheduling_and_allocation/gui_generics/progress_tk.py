@@ -0,0 +1,71 @@
+"""
+# ============================================================================
+# A small window with a progress bar and a cancel button, for work that is done in the background
+#
+# The window polls for progress, so the work never has to touch the gui
+#
+# EVENT HANDLERS:
+#         poll_handler() -> (done, total, finished)
+#         cancel_handler()
+#         finished_handler()
+# ============================================================================
+"""
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+# how often to check for progress (milliseconds)
+POLL_MS = 100
+
+
+class ProgressTk:
+    def __init__(self, frame, title: str, msg: str,
+                 poll_handler: Callable[[], tuple[int, int, bool]],
+                 cancel_handler: Callable[[], None] = lambda: None,
+                 finished_handler: Callable[[], None] = lambda: None):
+        """
+        :param frame: used to find the main window
+        :param title: title of the window
+        :param msg: what is being done
+        :param poll_handler: returns how much has been done, out of how much, and if it is finished
+        :param cancel_handler: called when the user presses 'cancel'
+        :param finished_handler: called once the work is finished (after the window is closed)
+        """
+        self.mw = frame.winfo_toplevel()
+        self.poll_handler = poll_handler
+        self.cancel_handler = cancel_handler
+        self.finished_handler = finished_handler
+
+        tl = tk.Toplevel(self.mw)
+        self.toplevel = tl
+        tl.title(title)
+        tl.resizable(False, False)
+        tl.transient(self.mw)
+        tl.protocol('WM_DELETE_WINDOW', self._cancel)
+
+        tk.Label(tl, text=msg, anchor='w').pack(fill='x', padx=20, pady=(20, 5))
+        self.progress_bar = ttk.Progressbar(tl, orient='horizontal', length=300, mode='determinate')
+        self.progress_bar.pack(padx=20, pady=5)
+        self.status = tk.Label(tl, text="", anchor='w')
+        self.status.pack(fill='x', padx=20)
+        self.cancel_button = tk.Button(tl, text="Cancel", command=self._cancel)
+        self.cancel_button.pack(pady=(5, 20))
+
+        self.toplevel.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        done, total, finished = self.poll_handler()
+        self.progress_bar.configure(maximum=max(total, 1), value=done)
+        self.status.configure(text=f"{done} of {total}")
+        if finished:
+            self.toplevel.destroy()
+            self.finished_handler()
+        else:
+            self.toplevel.after(POLL_MS, self._poll)
+
+    def _cancel(self):
+        """cancel the work, the window stays until the work that has already started is finished"""
+        self.cancel_button.configure(state='disabled', text="Cancelling...")
+        self.cancel_handler()
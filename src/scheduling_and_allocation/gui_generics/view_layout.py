@@ -0,0 +1,251 @@
+"""
+# ============================================================================
+# Where things go when drawing a view (the days, the times, and the blocks).  No gui required.
+#
+# PURPOSE: The coordinate maths for drawing a view, shared by the Tk canvas (ViewCanvasTk) and the
+#          export canvases (PDF, LaTeX, SVG), so that views can be exported without a display
+# ============================================================================
+"""
+from __future__ import annotations
+
+from typing import Protocol
+
+from .drawing_scale import DrawingScale
+
+DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+Times: dict[int, str] = {
+    8: "8am",
+    9: "9am",
+    10: "10am",
+    11: "11am",
+    12: "12pm",
+    13: "1pm",
+    14: "2pm",
+    15: "3pm",
+    16: "4pm",
+    17: "5pm",
+    18: "6pm"
+}
+RECTANGLE_X1_OFFSET = 3
+RECTANGLE_Y1_OFFSET = 2
+RECTANGLE_X2_OFFSET = -2
+RECTANGLE_Y2_OFFSET = -3
+
+EARLIEST_TIME = min(Times.keys())
+LATEST_TIME = max(Times.keys())
+
+DEFAULT_FG_COLOUR = "#000000"
+DEFAULT_BG_COLOUR = "#ffffff"
+
+
+# =====================================================================================================================
+# what is the minimal requirements for the canvas object to have if we want to draw
+# =====================================================================================================================
+class GenericCanvas(Protocol):
+    def __init__(self, title="Title", schedule_name="sub_title", filename=None):...
+    def create_line(self, x1:float, y1:float, x2:float, y2:float, fill:str="grey", dash="", tags: str|tuple=""):...
+    def addtag_withtag(self,*args,**kwargs):...
+    def create_text(self, x:float, y:float, text:str="", fill:str='black', tags:str|tuple="")->int:...
+    def create_rectangle(self, coords:tuple[float,float,float,float], fill:str='grey', outline:str='grey',
+                                        tags:str|tuple="")->int:...
+    def save(self):...
+
+
+# =====================================================================================================================
+# ViewLayout
+# =====================================================================================================================
+class ViewLayout:
+    """The coordinates of the days, times and blocks of a view, for a given scale"""
+
+    def __init__(self, scale_factor: float = 1):
+        """
+        :param scale_factor: scaling factors
+        """
+        self.scale = DrawingScale(scale_factor)
+
+    # =================================================================
+    # draw the days and times (things that don't change)
+    # =================================================================
+    def draw_background(self, canvas: GenericCanvas, fg_colour: str = DEFAULT_FG_COLOUR):
+        """
+        Draws the days and times of the timetable on the specified canvas.
+        :param canvas: what to draw on
+        :param fg_colour: the colour used to draw the text
+        """
+        scale = self.scale
+
+        # --------------------------------------------------------------------
+        # draw hourly lines
+        # --------------------------------------------------------------------
+        (dummy_x, x_max) = self._days_x_coords(len(DAYS))
+        (x_min, dummy_y) = self._days_x_coords(1)
+
+        for time in Times.keys():
+
+            # Draw each hour line.
+            (y_hour, y_half) = self._time_y_coords(time, 0.5)
+            canvas.create_line(
+                x_min, y_hour, x_max, y_hour,
+                fill="dark grey",
+                dash="-",
+                tags="baseline",
+            )
+
+            # Hour text.
+            canvas.create_text(
+                (x_min + scale.x_origin) / 2,
+                y_hour, text=Times[time],
+                fill=fg_colour,
+                tags="baseline",
+            )
+
+            # for all inner times, draw a dotted line for the half hour.
+            if time != LATEST_TIME:
+                canvas.create_line(
+                    x_min, y_half, x_max, y_half,
+                    fill="grey",
+                    dash=".",
+                    tags="baseline",
+                )
+
+                # Half-hour text.
+                if scale.current_scale > 0.5:
+                    canvas.create_text(
+                        (x_min + scale.x_origin) / 2,
+                        y_half, text=":30",
+                        fill=fg_colour,
+                        tags="baseline",
+                    )
+
+        # --------------------------------------------------------------------
+        # draw day lines
+        # --------------------------------------------------------------------
+        (y_min, y_max) = self._time_y_coords(EARLIEST_TIME, (LATEST_TIME - EARLIEST_TIME))
+
+        for i in range(len(DAYS) + 1):
+            (x_day, x_day_end) = self._days_x_coords(i + 1)
+            canvas.create_line(x_day, scale.y_height_scale, x_day, y_max, fill=fg_colour,tags="baseline",)
+
+            # day text
+            if i < len(DAYS):
+                if scale.current_scale <= 0.5:
+                    canvas.create_text(
+                        (x_day + x_day_end) / 2,
+                        (y_min + scale.y_origin) / 2,
+                        text=DAYS[i][0:1],
+                        fill=fg_colour,
+                        tags=("baseline",),
+                    )
+                else:
+                    canvas.create_text(
+                        (x_day + x_day_end) / 2,
+                        (y_min + scale.y_origin) / 2,
+                        text=DAYS[i],
+                        fill=fg_colour,
+                        tags=("baseline",),
+                    )
+
+    # =================================================================
+    # draw a block
+    # =================================================================
+    def draw_block_items(self, canvas: GenericCanvas, day: int, start_time: float, duration: float, text: str,
+                         colour: str, text_colour: str,
+                         rectangle_tags: tuple = (), text_tags: tuple = ()) -> tuple[int, int]:
+        """
+        Draws the rectangle and text of a block
+        :return: the rectangle and text items
+        """
+        x1, y1, x2, y2 = self.get_coords(day, start_time, duration)
+        rectangle_item = canvas.create_rectangle(self.block_rectangle(day, start_time, duration),
+                                                 fill=colour, outline=colour, tags=rectangle_tags)
+        text_item = canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=text, fill=text_colour, tags=text_tags)
+        return rectangle_item, text_item
+
+    # =================================================================
+    # the size of the whole view
+    # =================================================================
+    def size(self) -> tuple[float, float]:
+        """the width and height needed to draw the view (with a margin on the right and bottom)"""
+        (x_min, _) = self._days_x_coords(1)
+        (_, x_max) = self._days_x_coords(len(DAYS))
+        (y_min, y_max) = self._time_y_coords(EARLIEST_TIME, LATEST_TIME - EARLIEST_TIME)
+        return x_max + x_min / 2, y_max + y_min / 2
+
+    # =================================================================
+    # the rectangle of a block (a little smaller than its time slot)
+    # =================================================================
+    def block_rectangle(self, day: float, start: float, duration: float) -> tuple[float, float, float, float]:
+        x1, y1, x2, y2 = self.get_coords(day, start, duration)
+        return (x1 + RECTANGLE_X1_OFFSET,
+                y1 + RECTANGLE_Y1_OFFSET,
+                x2 + RECTANGLE_X2_OFFSET,
+                y2 + RECTANGLE_Y2_OFFSET)
+
+    # =================================================================
+    # coords_to_day_time_duration
+    # =================================================================
+    def coords_to_day_time_duration(self, x, y, y2) -> tuple[float, float, float]:
+        """
+        Determines the day, time_start time, and duration based on canvas coordinates.
+        :param x: x position (determines day)
+        :param y: y position (determines time_start)
+        :param y2: y2 position (with y - determines duration)
+        :return: day, time, duration
+        """
+        scale = self.scale
+        day = x / scale.x_width_scale - scale.x_offset + 1 - scale.x_origin
+        time = y / scale.y_height_scale - scale.y_offset + EARLIEST_TIME - scale.y_origin
+        duration = (y2 + 1 - y) / scale.y_height_scale
+
+        return day, time, duration
+
+    # =================================================================
+    # get_coords
+    # =================================================================
+    def get_coords(self, day:float, start: float, duration: float=1.0):
+        """Determines the canvas coordinates based on day, time_start time, and duration.
+            :param start:
+            :param day:
+            :param duration:
+        """
+        (x, x2) = self._days_x_coords(round(day))
+        (y, y2) = self._time_y_coords(start, duration)
+
+        return x, y, x2, y2
+
+    # =================================================================
+    # using scale info, get the y limits for a specific time period
+    # =================================================================
+    def _time_y_coords(self, start, duration):
+        """using scale info, get the y limits for a specific time period."""
+
+        y_offset = self.scale.y_offset * self.scale.y_height_scale + self.scale.y_origin
+        y = y_offset + (start - EARLIEST_TIME) * self.scale.y_height_scale
+        y2 = duration * self.scale.y_height_scale + y - 1
+
+        return y, y2
+
+
+    # =================================================================
+    # using scale info, get the x limits for a specific day
+    # =================================================================
+    def _days_x_coords(self, day: int) -> tuple[float,float]:
+        """
+        what can be the maximum and minimum number for day
+        :param day:
+        :return: minimum_x, maximum_x
+        """
+
+        x_offset = self.scale.x_offset * self.scale.x_width_scale + self.scale.x_origin
+        x = x_offset + (day - 1) * self.scale.x_width_scale
+        x2 = x_offset + day * self.scale.x_width_scale - 1
+
+        return x, x2
+
+
+    # ==================================================================
+    # update scale
+    # ==================================================================
+    def adjust_scale(self, factor):
+        """change the scale information based on the scaling factor"""
+        self.scale = DrawingScale(factor)
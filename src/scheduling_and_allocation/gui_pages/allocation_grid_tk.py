@@ -1,4 +1,10 @@
-"""Creates a horizontally scrollable grid with surrounding data frames that are not scrollable"""
+"""
+Creates a scrollable grid with surrounding data frames that are not scrollable
+
+Only the cells that are visible have entry widgets.  The data is kept separately, and as the
+grid is scrolled, the same widgets are used to show different cells, so the number of widgets
+depends on the size of the window, not on the number of teachers and sections.
+"""
 from functools import partial
 from typing import Optional, Literal, Callable, Any
 
@@ -6,12 +12,10 @@ import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter.messagebox import showerror
 
-from ..modified_tk import get_fonts_and_colours
-from ..modified_tk import Pane
+from ..modified_tk import get_fonts_and_colours, Hovertip, Viewport
 
 from ..Utilities import Colour
 from ..gui_generics.number_validations import entry_float
-from ..modified_tk import Hovertip
 
 
 # =====================================================================================================================
@@ -43,6 +47,10 @@ PAD_ROW_0 = 0
 PAD_ROW_1 = 0
 PAD_ROW_2 = 0
 
+# how many rows/columns to show before the window size is known
+INITIAL_ROWS = 25
+INITIAL_COLS = 20
+
 # entry widget properties
 ENTRY_PROPS = {
     'width': WIDTH,
@@ -57,12 +65,6 @@ ENTRY_PROPS = {
 }
 
 
-# trigger for data change
-DATA_CHANGED: dict[tuple[int,int], tk.StringVar] = dict()
-def on_var_change(v, row, col, *_):
-    DATA_CHANGED[row,col] = v
-
-
 # =====================================================================================================================
 # Allocation Grid Tk
 # =====================================================================================================================
@@ -78,11 +80,11 @@ class AllocationGridTk:
 
     @property
     def num_rows(self):
-        return len(self.title_widgets)
+        return self.rows_view.total
 
     @property
     def num_cols(self):
-        return len(self.sub_header_widgets)
+        return self.cols_view.total
 
 
     # -----------------------------------------------------------------------------------------------------------------
@@ -104,7 +106,7 @@ class AllocationGridTk:
 
 
         Column Merge Example: if you want this for your 2 heading rows
-    
+
         +-------------+----------+--------------------+
         | heading1    | heading2 | heading3           |
         +------+------+----------+------+------+------+
@@ -122,7 +124,6 @@ class AllocationGridTk:
         # keep this for later
         self.frame = frame
         self.process_data_change_handler = cb_process_data_change
-        self.panes = []
         self.bottom_cell_valid = bottom_cell_valid
 
         # set up the font for the entry widgets
@@ -130,32 +131,61 @@ class AllocationGridTk:
 
         ENTRY_PROPS['font'] = self.fonts.normal
 
-        # make the frames
-        self._layout(frame)
+        # which rows and columns are visible
+        self.rows_view = Viewport(rows, min(rows, INITIAL_ROWS))
+        self.cols_view = Viewport(sum(col_merge), min(sum(col_merge), INITIAL_COLS))
 
-        # make the other stuff
+        # what header group each column belongs to, and the column colours
+        self.column_colours: dict[int, str] = dict()
+        self._group_of_col: list[int] = []
+        self._group_end: list[int] = []
+        for group, header in enumerate(col_merge):
+            for _ in range(header):
+                self.column_colours[len(self._group_of_col)] = VERY_LIGHT_GREY if group % 2 == 0 else BG_COLOUR
+                self._group_of_col.append(group)
+            self._group_end.append(len(self._group_of_col))
+
+        # the data (only the visible part is shown in widgets)
+        self._header_text: list[str] = [""] * len(col_merge)
+        self._balloon_text: list[str] = [""] * len(col_merge)
+        self._sub_header_text: list[str] = [""] * self.num_cols
+        self._title_text: list[str] = [""] * rows
+        self._data: dict[tuple[int,int], str] = dict()
+        self._summary: dict[tuple[int,int], str] = dict()
+        self._bottom: list[str] = [""] * self.num_cols
+        self._focus: Optional[tuple[int,int]] = None
+        self._loading = False
+
+        # cells that have been edited, but not processed yet
+        self._data_changed: dict[tuple[int,int], tk.StringVar] = dict()
+
+        # the widgets that show the visible part of the grid
         self.header_widgets: list[tk.Entry] = []
+        self.header_tips: list[Hovertip] = []
         self.sub_header_widgets: list[tk.Entry] = []
         self.summary_sub_header_widgets: list[tk.Entry] = []
+        self.summary_header_widgets: list[tk.Entry] = []
 
         self.title_widgets: list[tk.Entry] = []
-        self.widgets_row_col: dict[tk.Entry, tuple[int,int]] = dict()
-        self.entry_widgets: dict[tuple[int,int], tk.Entry] = dict()
-        self.summary_widgets: dict[tuple[int,int], tk.Entry] = dict()
-        self.summary_header_widgets: list[tk.Entry] = []
+        self.entry_widgets: list[list[tk.Entry]] = []
+        self.entry_vars: list[list[tk.StringVar]] = []
+        self.widgets_slot: dict[tk.Entry, tuple[int,int]] = dict()
+        self.summary_widgets: list[list[tk.Entry]] = []
 
         self.bottom_title_widget: Optional[tk.Entry] = None
-
         self.bottom_widgets: list[tk.Entry] = []
-        self.column_colours: dict[int, str] = dict()
 
-        self.make_header_columns(col_merge)
+        # make the frames
+        self._layout(frame)
+
+        # make the other stuff
         self.make_summary_header(summary_merge)
-        self.make_row_titles(rows)
-        self.make_data_grid(rows, col_merge)
-        self.make_summary_grid(rows, summary_merge)
         self.make_bottom_header()
-        self.make_bottom(col_merge)
+        self._measure()
+        self._make_cells()
+        self._refresh()
+
+        self.data_frame.bind("<Configure>", self._data_frame_resized)
 
 
     # -----------------------------------------------------------------------------------------------------------------
@@ -167,16 +197,16 @@ class AllocationGridTk:
         │       ┌──────────────────────────────────────────────────┐┌────┐ │
         │       │               header                             ││  1 │ │
         │       └──────────────────────────────────────────────────┘└────┘ │
-        │ ┌────┐┌──────────────────────────────────────────────────┐┌────┐ │
-        │ │ t  ││                                                  ││ s  │ │
-        │ │ i  ││                                                  ││ u  │ │
-        │ │ t  ││                                                  ││ m  │ │
-        │ │ l  ││                data                              ││ m  │ │
-        │ │ e  ││                                                  ││ a  │ │
-        │ │ s  ││                                                  ││ r  │ │
-        │ │    ││                                                  ││ y  │ │
-        │ │    ││                                                  ││    │ │
-        │ └────┘└──────────────────────────────────────────────────┘└────┘ │
+        │ ┌────┐┌──────────────────────────────────────────────────┐┌────┐^│
+        │ │ t  ││                                                  ││ s  │|│
+        │ │ i  ││                                                  ││ u  │|│
+        │ │ t  ││                                                  ││ m  │|│
+        │ │ l  ││                data                              ││ m  │|│
+        │ │ e  ││                                                  ││ a  │|│
+        │ │ s  ││                                                  ││ r  │|│
+        │ │    ││                                                  ││ y  │|│
+        │ │    ││                                                  ││    │|│
+        │ └────┘└──────────────────────────────────────────────────┘└────┘v│
         │ ┌────┐┌──────────────────────────────────────────────────┐       │
         │ │  2 ││               bottom                             │       │
         │ └────┘└──────────────────────────────────────────────────┘       │
@@ -185,119 +215,149 @@ class AllocationGridTk:
         1 = summary header
         2 = bottom title
         """
-        
-        # NOTE: weird shit happens if outer_frame is a 'Pane' (it's a pain... get it?)
         self.outer_frame = tk.Frame(frame, background="white")
         self.outer_frame.pack(expand=1, fill='both')
 
-        # make the frames
-        self.header_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.header_frame = self.header_pane.frame
-        self.panes.append(self.header_pane)
-        self.header_pane.canvas.config(background="white")
-
-        summary_header_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.summary_header_frame = summary_header_pane.frame
-        self.panes.append(summary_header_pane)
-
-        titles_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.titles_frame = titles_pane.frame
-        self.panes.append(titles_pane)
-
-        data_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.data_pane = data_pane
-        self.data_frame = data_pane.frame
-        self.data_pane.canvas.config(background="white")
-        self.panes.append(data_pane)
-
-        summary_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.summary_frame = summary_pane.frame
-        self.panes.append(summary_pane)
-
-        bottom_title_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.bottom_title_frame = bottom_title_pane.frame
-        self.panes.append(bottom_title_pane)
-
-        self.bottom_pane = Pane(self.outer_frame, background=FRAME_BACKGROUND)
-        self.bottom_frame = self.bottom_pane.frame
-        self.panes.append(self.bottom_pane)
-        self.bottom_pane.canvas.config(background="white")
+        # make the frames (the size of the frames is set once the size of the entry widgets is known)
+        def make_frame():
+            f = tk.Frame(self.outer_frame, background=FRAME_BACKGROUND)
+            f.grid_propagate(False)
+            return f
 
+        self.header_frame = make_frame()
+        self.summary_header_frame = tk.Frame(self.outer_frame, background=FRAME_BACKGROUND)
+        self.titles_frame = make_frame()
+        self.data_frame = make_frame()
+        self.summary_frame = make_frame()
+        self.bottom_title_frame = tk.Frame(self.outer_frame, background=FRAME_BACKGROUND)
+        self.bottom_frame = make_frame()
 
         # make the scrollbars
-        scrollbar = ttk.Scrollbar(self.outer_frame, orient="horizontal")
-        horizontal_scrollable = (self.header_pane, titles_pane, data_pane, self.bottom_pane)
-
-        self.data_pane.horizontal_scrollbar = scrollbar
-        self.header_pane.horizontal_scrollbar = scrollbar
-        self.bottom_pane.horizontal_scrollbar = scrollbar
-
-        def sync_horizontal_scroll(*args):
-            for w in horizontal_scrollable:
-                w.xview(*args)
-
-        scrollbar.config(command=sync_horizontal_scroll)
-        for f in horizontal_scrollable:
-            f.canvas.config(xscrollcommand=scrollbar.set)
+        self.horizontal_scrollbar = ttk.Scrollbar(self.outer_frame, orient="horizontal",
+                                                  command=partial(self._scroll, self.cols_view))
+        self.vertical_scrollbar = ttk.Scrollbar(self.outer_frame, orient="vertical",
+                                                command=partial(self._scroll, self.rows_view))
 
+        # mouse wheel scrolls the rows (or the columns if shift is pressed)
+        for f in (self.titles_frame, self.data_frame, self.summary_frame, self.header_frame, self.bottom_frame):
+            self._bind_mouse_wheel(f)
 
         # configure the layout
         self.outer_frame.columnconfigure(0,weight=0)
         self.outer_frame.columnconfigure(1,weight=100)
         self.outer_frame.columnconfigure(2,weight=0)
-
-        self.header_pane.grid(row=0, column=1, sticky='nsew', pady=PAD_ROW_0, padx=PAD_COL_1)
-        summary_header_pane.grid(row=0, column=2, sticky='nsew', pady=PAD_ROW_0, padx=PAD_COL_2)
-        titles_pane.grid(row=1, column=0, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_0)
-        data_pane.grid(row=1, column=1, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_1)
-        summary_pane.grid(row=1, column=2, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_2)
-        bottom_title_pane.grid(row=2, column=0, sticky='nsew', pady=PAD_ROW_2, padx=PAD_COL_0)
-        self.bottom_pane.grid(row=2, column=1, sticky='nsew', pady=PAD_ROW_2,padx=PAD_COL_1)
-        scrollbar.grid(row=3, column=1, sticky='nsew', padx=PAD_COL_1)
+        self.outer_frame.rowconfigure(1, weight=100)
+
+        self.header_frame.grid(row=0, column=1, sticky='nsew', pady=PAD_ROW_0, padx=PAD_COL_1)
+        self.summary_header_frame.grid(row=0, column=2, sticky='nsew', pady=PAD_ROW_0, padx=PAD_COL_2)
+        self.titles_frame.grid(row=1, column=0, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_0)
+        self.data_frame.grid(row=1, column=1, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_1)
+        self.summary_frame.grid(row=1, column=2, sticky='nsew', pady=PAD_ROW_1, padx=PAD_COL_2)
+        self.vertical_scrollbar.grid(row=1, column=3, sticky='ns')
+        self.bottom_title_frame.grid(row=2, column=0, sticky='nsew', pady=PAD_ROW_2, padx=PAD_COL_0)
+        self.bottom_frame.grid(row=2, column=1, sticky='nsew', pady=PAD_ROW_2,padx=PAD_COL_1)
+        self.horizontal_scrollbar.grid(row=3, column=1, sticky='nsew', padx=PAD_COL_1)
+
+    def _measure(self):
+        """find the size of the entry widgets, and size the frames accordingly"""
+        def size_of(**props):
+            e = tk.Entry(self.data_frame, **{**ENTRY_PROPS, **props})
+            width, height = e.winfo_reqwidth() + 2 * ENTRY_PADDING, e.winfo_reqheight() + 2 * ENTRY_PADDING
+            e.destroy()
+            return width, height
+
+        self.cell_width, self.cell_height = size_of()
+        title_width, _ = size_of(width=TITLE_WIDTH)
+        summary_width, _ = size_of(width=SUMMARY_WIDTH)
+
+        self.header_frame.configure(height=2 * self.cell_height, width=self.cols_view.size * self.cell_width)
+        self.data_frame.configure(width=self.cols_view.size * self.cell_width,
+                                  height=self.rows_view.size * self.cell_height)
+        self.bottom_frame.configure(height=self.cell_height, width=self.cols_view.size * self.cell_width)
+        self.titles_frame.configure(width=title_width, height=self.rows_view.size * self.cell_height)
+        self.summary_frame.configure(width=summary_width * self.num_summary_sub_col,
+                                     height=self.rows_view.size * self.cell_height)
 
     # -----------------------------------------------------------------------------------------------------------------
-    # make the header columns
+    # make the entry widgets for the visible part of the grid (more are made if the window gets bigger)
     # -----------------------------------------------------------------------------------------------------------------
-    def make_header_columns(self, col_merge: list):
-        """
-        Create disabled entry widgets for the columns (scrollable horizontally).
-
-        Stores widgets in self.header_widgets and self.sub_header_widgets (lists)
+    def _make_cells(self):
+        rows, cols = self.rows_view.size, self.cols_view.size
 
-        :param col_merge: a list of number of subheadings per heading
-        """
+        # header (a merged header needs at most one widget per column), sub header and bottom
         prop = ENTRY_PROPS.copy()
         prop['state'] = 'disabled'
-
-        # merged header
-        for i, header in enumerate(col_merge):
-
-            prop['disabledbackground'] = HEADER_COLOUR2 if i % 2 else HEADER_COLOUR1
-            prop['highlightbackground'] = HEADER_COLOUR2 if i % 2 else HEADER_COLOUR1
-
-            # frame to hold the merged header, and the subheadings
-            mini_frame = tk.Frame(self.header_frame)
-            mini_frame.pack(side='left')
-            mini_frame.configure(background=self.header_frame.cget("background"))
-
-            # widget
-            me = tk.Entry(mini_frame, **prop)
-            me.pack(side='top', expand=0, fill='both', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
-
-            # keep these widgets so that they can be configured later
+        for col in range(len(self.sub_header_widgets), cols):
+            me = tk.Entry(self.header_frame, **prop, textvariable=tk.StringVar())
             self.header_widgets.append(me)
+            self.header_tips.append(Hovertip(me, text=""))
 
-            # subsections
-            for sub_section in range(header):
-                # frame within the mini-frame, so we can stack 'left'
-                (hf2 := tk.Frame(mini_frame)).pack(side='left')
-                hf2.configure(background=self.header_frame.cget("background"))
+            (se := tk.Entry(self.header_frame, **prop, textvariable=tk.StringVar())).grid(
+                row=1, column=col, padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+            self.sub_header_widgets.append(se)
 
-                # widget
-                (se := tk.Entry(hf2, **prop)).pack(side='left', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
+            (be := tk.Entry(self.bottom_frame, **prop, validate='key', textvariable=tk.StringVar())).grid(
+                row=0, column=col, padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+            self.bottom_widgets.append(be)
+            for w in (me, se, be):
+                self._bind_mouse_wheel(w)
 
-                # keep these widgets so that they can be configured later
-                self.sub_header_widgets.append(se)
+        # row titles
+        prop = ENTRY_PROPS.copy()
+        prop['width'] = TITLE_WIDTH
+        prop['justify'] = 'left'
+        for row in range(len(self.title_widgets), rows):
+            (re := tk.Entry(self.titles_frame, **prop, state='disabled', textvariable=tk.StringVar())).grid(
+                row=row, column=0, padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+            self.title_widgets.append(re)
+            self._bind_mouse_wheel(re)
+
+        # summary
+        prop = ENTRY_PROPS.copy()
+        prop['disabledbackground'] = SUMMARY_COLOUR
+        prop['highlightbackground'] = SUMMARY_COLOUR
+        prop['width'] = SUMMARY_WIDTH
+        prop['state'] = 'disabled'
+        for row in range(len(self.summary_widgets), rows):
+            self.summary_widgets.append([])
+            for col in range(self.num_summary_sub_col):
+                (de := tk.Entry(self.summary_frame, **prop, textvariable=tk.StringVar())).grid(
+                    row=row, column=col, padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+                self.summary_widgets[row].append(de)
+                self._bind_mouse_wheel(de)
+
+        # data
+        for row in range(rows):
+            if row == len(self.entry_widgets):
+                self.entry_widgets.append([])
+                self.entry_vars.append([])
+            for col in range(len(self.entry_widgets[row]), cols):
+                self._make_data_cell(row, col)
+
+    def _make_data_cell(self, row, col):
+        """an entry widget for the data at this slot (row/col of the visible part of the grid)"""
+        var = tk.StringVar(value="")
+        de = entry_float(self.data_frame, textvariable=var, **ENTRY_PROPS)
+        de.grid(row=row, column=col, padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+        var.trace_add('write', partial(self._data_cell_changed, row, col))
+
+        self.entry_widgets[row].append(de)
+        self.entry_vars[row].append(var)
+        self.widgets_slot[de] = row, col
+
+        # binding
+        de.bind("<Tab>", partial(self._move, 'nextCell'))
+        de.bind("<Key-Return>", partial(self._move, 'nextRow'))
+        de.bind("<Shift-Tab>", partial(self._move, 'prevCell'))
+        de.bind("<Key-Up>", partial(self._move, 'prevRow'))
+        de.bind("<Key-uparrow>", partial(self._move, 'prevRow'))
+        de.bind("<Key-Down>", partial(self._move, 'nextRow'))
+        de.bind("<Key-downarrow>", partial(self._move, 'nextRow'))
+
+        de.bind("<FocusIn>", partial(self.focus_changed, 'focusIn', colour=ROW_COL_INDICATOR_COLOUR))
+        de.bind("<Leave>", self.process_data_change)
+        de.bind("<FocusOut>", partial(self.focus_changed, 'focusOut'))
+        self._bind_mouse_wheel(de)
 
     # -----------------------------------------------------------------------------------------------------------------
     # summary header
@@ -316,137 +376,24 @@ class AllocationGridTk:
         prop['highlightbackground'] = SUMMARY_HEADER_COLOUR
         prop['state'] = 'disabled'
 
+        col = 0
         for header in summary_merge:
 
-            # frame to hold the totals header, and the subheadings
-            (mini_frame := tk.Frame(self.summary_header_frame)).pack(side='left')
-            mini_frame.configure(background=self.header_frame.cget("background"))
-
             # widget
-            (me := tk.Entry(mini_frame, **prop)).pack(side='top', expand=0, fill='both', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
+            (me := tk.Entry(self.summary_header_frame, **prop)).grid(row=0, column=col, columnspan=header,
+                                                                     sticky='nsew', padx=ENTRY_PADDING,
+                                                                     pady=ENTRY_PADDING)
 
             # keep these widgets so that they can be configured later
             self.summary_header_widgets.append(me)
 
-            for sub_section in range(header):
-                # frame within the mini-frame so we can stack left
-                (hf2 := tk.Frame(mini_frame)).pack(side='left')
-                hf2.configure(background=self.header_frame.cget("background"))
-
-                # widget
-                (se := tk.Entry(hf2, **prop)).pack(side='left', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
+            for _ in range(header):
+                (se := tk.Entry(self.summary_header_frame, **prop)).grid(row=1, column=col, padx=ENTRY_PADDING,
+                                                                         pady=ENTRY_PADDING)
 
                 # keep these widgets so that they can be configured later
                 self.summary_sub_header_widgets.append(se)
-
-    # -----------------------------------------------------------------------------------------------------------------
-    # row titles
-    # -----------------------------------------------------------------------------------------------------------------
-    def make_row_titles(self, rows):
-        """
-        For each row, create a disabled entry widget to describe each row
-
-        Stores widgets in self.title_widgets (list)
-
-         :param rows: number of rows
-        """
-        prop = ENTRY_PROPS.copy()
-        prop['width'] = TITLE_WIDTH
-        prop['justify'] = 'left'
-        for _ in range(rows):
-            re = tk.Entry(self.titles_frame, **prop, state='disabled', )
-            re.pack(side='top', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
-
-            self.title_widgets.append(re)
-
-    # -----------------------------------------------------------------------------------------------------------------
-    # data grid
-    # -----------------------------------------------------------------------------------------------------------------
-    def make_data_grid(self, rows, col_merge: list):
-        """
-        For each row and column, create an entry widget to hold data
-
-        Stores widgets in self.entry_widgets                (dict[tuple[row,col], tk.Entry])
-        Conversely stores row, col in self.widget_row_col   (dict[tk.Entry], tuple[row,col])
-
-        :param rows: number of rows
-        :param col_merge: a list of number of subheadings per heading
-        """
-        prop = ENTRY_PROPS.copy()
-
-        for row in range(rows):
-            (df1 := tk.Frame(self.data_frame)).pack(side='top', expand=1, fill='x')
-            df1.configure(background=self.data_frame.cget("background"))
-
-            # foreach header
-            col: int = 0
-            for column_index, header in enumerate(col_merge):
-                prop['background'] = VERY_LIGHT_GREY if column_index%2 == 0 else BG_COLOUR
-                prop['highlightbackground'] = VERY_LIGHT_GREY if column_index%2 == 0 else BG_COLOUR
-
-                # subsections
-                for subsection in range(header):
-                    self.column_colours[col] = prop['highlightbackground']
-
-                    # data entry box
-                    de = entry_float(df1, textvariable=tk.StringVar(value=""), **prop)
-                    de.pack(side='left', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
-
-                    # save row/column with data entry, and vice versa
-                    self.entry_widgets[row,col] = de
-                    self.widgets_row_col[de] = row, col
-
-                    # binding
-                    de.bind("<Tab>", partial(self._move, 'nextCell'))
-                    de.bind("<Key-Return>", partial(self._move, 'nextRow'))
-                    de.bind("<Shift-Tab>", partial(self._move, 'prevCell'))
-                    de.bind("<Key-Up>", partial(self._move, 'prevRow'))
-                    de.bind("<Key-uparrow>", partial(self._move, 'prevRow'))
-                    de.bind("<Key-Down>", partial(self._move, 'nextRow'))
-                    de.bind("<Key-downarrow>", partial(self._move, 'nextRow'))
-
-                    de.bind("<FocusIn>", partial(self.focus_changed, 'focusIn', colour=ROW_COL_INDICATOR_COLOUR))
-                    de.bind("<Leave>", self.process_data_change)
-                    de.bind("<FocusOut>", partial(self.focus_changed, 'focusOut'))
-                    de.bindtags([*de.bindtags(), 1, 0, 2, 3])
-
-                    col += 1
-
-    # -----------------------------------------------------------------------------------------------------------------
-    # summary
-    # -----------------------------------------------------------------------------------------------------------------
-    def make_summary_grid(self, rows, summary_merge):
-        """
-        create a list of disabled entry widgets to hold summary data per row
-
-        Stores widgets in self.summary_widget (dict[tuple[row,col], tk.Entry]
-
-        :param rows: number of rows
-        :param summary_merge: a list of number of subheadings per heading
-        """
-        prop = ENTRY_PROPS.copy()
-        prop['disabledbackground'] = SUMMARY_COLOUR
-        prop['highlightbackground'] = SUMMARY_COLOUR
-        prop['width'] = SUMMARY_WIDTH
-        prop['state'] = 'disabled'
-
-        for row in range(rows):
-            (df1 := tk.Frame(self.summary_frame)).pack(side='top', expand=1, fill='x')
-            df1.configure(background=self.header_frame.cget("background"))
-
-            # foreach header
-            col = 0
-            for header in range(len(summary_merge)):
-
-                # subsections
-                for _ in range( summary_merge[header]):
-
-                    # data entry box
-                    (de := tk.Entry(df1, **prop)).pack(side='left', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
-
-                    # save row/column with totals entry
-                    self.summary_widgets[row,col] = de
-                    col += 1
+                col += 1
 
     # -----------------------------------------------------------------------------------------------------------------
     # bottom row header
@@ -465,37 +412,6 @@ class AllocationGridTk:
         # keep these widgets so that they can be configured later
         self.bottom_title_widget = se
 
-
-    # -----------------------------------------------------------------------------------------------------------------
-    # bottom
-    # -----------------------------------------------------------------------------------------------------------------
-    def make_bottom(self, col_merge):
-        """
-        create a list of disabled widgets to hold the summary of the columns
-
-        Stores widgets in self.bottom_widgets (list)
-
-        :param col_merge: a list of number of subheadings per heading
-        """
-
-        # merged header
-        prop = ENTRY_PROPS.copy()
-        col = 0
-        for column_index, header in enumerate(col_merge):
-            for sub_section in range(header):
-
-                # widget
-                prop['disabledbackground'] = HEADER_COLOUR2 if column_index % 2 == 0 else HEADER_COLOUR1
-                prop['highlightbackground'] = HEADER_COLOUR2 if column_index % 2 == 0 else HEADER_COLOUR1
-                # change Colour every second merged header
-
-                se = tk.Entry(self.bottom_frame, **prop, state='disabled', validate='key')
-                se.pack(side='left', padx=ENTRY_PADDING,pady=ENTRY_PADDING)
-
-                # keep these widgets so that they can be configured later
-                self.bottom_widgets.append(se)
-            col+=1
-
     # -----------------------------------------------------------------------------------------------------------------
     # populate: assign text variables to each of the entry widgets
     # -----------------------------------------------------------------------------------------------------------------
@@ -518,62 +434,199 @@ class AllocationGridTk:
         :param bottom_row_vars: a list of data for the bottom row
         :return:
         """
-        balloon_text = list(balloon_text)
-
-        # add the tool tips to the header
-        for w,text in zip(self.header_widgets, balloon_text):
-            if text != "":
-                Hovertip(w,text=text)
+        # header, sub header and row titles
+        for i, text in enumerate(list(header_text)[:len(self._header_text)]):
+            self._header_text[i] = text
+        for i, text in enumerate(list(balloon_text)[:len(self._balloon_text)]):
+            self._balloon_text[i] = text
+        for i, text in enumerate(list(sub_header_text)[:self.num_cols]):
+            self._sub_header_text[i] = text
+        for i, text in enumerate(list(title_text)[:self.num_rows]):
+            self._title_text[i] = text
 
         # bottom row
         self.bottom_title_widget.configure(textvariable=tk.StringVar(value=bottom_header_text))
-
-        for c in range(len(self.bottom_widgets)):
-            self.update_data('bottom',row=0, col=c, value=bottom_row_vars[c])
+        for col in range(self.num_cols):
+            self._bottom[col] = bottom_row_vars[col]
 
         # the summary header
         for col in range(self.num_summary_col):
             self.summary_header_widgets[col].configure(textvariable=tk.StringVar(value=summary_header_texts[col]))
 
-        # the summary sub header
+        # the summary sub header and summary data
         for col in range(self.num_summary_sub_col):
             self.summary_sub_header_widgets[col].configure(textvariable=tk.StringVar(value=summary_sub_texts[col]))
-
-            # the summary data
             for row in range(self.num_rows):
-                self.update_data('summary', row, col, summary_vars[row][col])
+                self._summary[row, col] = summary_vars[row][col]
 
         # the data grid
         for col in range(self.num_cols):
             for row in range(self.num_rows):
-                self.update_data('data', row, col, data_vars[row,col])
-
-
-        # the header data
-        i = 0
-        for ht in header_text:
-            self.header_widgets[i].configure(textvariable=tk.StringVar(value=ht))
-            Hovertip(self.header_widgets[i], balloon_text[i])
-            i += 1
-
-        # the sub header data
-        i = 0
-        for sht in sub_header_text:
-            if len(self.sub_header_widgets) > i:
-                self.sub_header_widgets[i].configure(textvariable=tk.StringVar(value=sht))
-                i += 1
-            else:
-                break
-
-        # the row titles
-        i = 0
-        for rht in title_text:
-            self.title_widgets[i].configure(textvariable=tk.StringVar(value=rht))
-            i += 1
-
-        # get the panes to match their internal structure
-        for pane in self.panes:
-            pane.after(10, lambda *_: pane.configure_interior(*_))
+                value = data_vars[row, col]
+                self._data[row, col] = str(value) if float(value) != 0.0 else ""
+
+        self._refresh()
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # show the visible part of the data in the widgets
+    # -----------------------------------------------------------------------------------------------------------------
+    def _refresh(self):
+        self._loading = True
+        try:
+            self._refresh_header()
+            self._refresh_rows()
+            self._refresh_data()
+        finally:
+            self._loading = False
+
+        self.horizontal_scrollbar.set(*self.cols_view.fractions())
+        self.vertical_scrollbar.set(*self.rows_view.fractions())
+
+    def _refresh_header(self):
+
+        # merged headers (one widget for the visible columns of each group)
+        used = 0
+        slot = 0
+        while (col := self.cols_view.index(slot)) is not None:
+            group = self._group_of_col[col]
+            span = min(self._group_end[group], self.cols_view.last) - col
+            colour = HEADER_COLOUR2 if group % 2 else HEADER_COLOUR1
+
+            me = self.header_widgets[used]
+            me.grid(row=0, column=slot, columnspan=span, sticky='nsew', padx=ENTRY_PADDING, pady=ENTRY_PADDING)
+            me.configure(disabledbackground=colour, highlightbackground=colour)
+            me.setvar(me.cget('textvariable'), self._header_text[group])
+            self.header_tips[used].text = self._balloon_text[group]
+
+            used += 1
+            slot += span
+        for me in self.header_widgets[used:]:
+            me.grid_remove()
+
+        # sub headers and bottom row
+        for slot, (se, be) in enumerate(zip(self.sub_header_widgets, self.bottom_widgets)):
+            col = self.cols_view.index(slot)
+            if col is None:
+                se.grid_remove()
+                be.grid_remove()
+                continue
+            group_colour = HEADER_COLOUR2 if self._group_of_col[col] % 2 else HEADER_COLOUR1
+            se.grid()
+            se.configure(disabledbackground=group_colour, highlightbackground=group_colour)
+            se.setvar(se.cget('textvariable'), self._sub_header_text[col])
+            be.grid()
+            self._show_bottom(be, col)
+
+    def _refresh_rows(self):
+        for slot, (title, summary) in enumerate(zip(self.title_widgets, self.summary_widgets)):
+            row = self.rows_view.index(slot)
+            for w in (title, *summary):
+                w.grid() if row is not None else w.grid_remove()
+            if row is None:
+                continue
+
+            title.setvar(title.cget('textvariable'), self._title_text[row])
+            for col, w in enumerate(summary):
+                w.setvar(w.cget('textvariable'), self._summary.get((row, col), ""))
+            self._colour_row_header(row, slot)
+
+    def _refresh_data(self):
+        for row_slot, (widgets, variables) in enumerate(zip(self.entry_widgets, self.entry_vars)):
+            row = self.rows_view.index(row_slot)
+            for col_slot, (w, var) in enumerate(zip(widgets, variables)):
+                col = self.cols_view.index(col_slot)
+                if row is None or col is None:
+                    w.grid_remove()
+                    continue
+                w.grid()
+                var.set(self._data.get((row, col), ""))
+                colour = self._cell_colour(row, col)
+                w.configure(bg=colour, highlightbackground=colour, foreground=FG_COLOUR)
+
+    def _show_bottom(self, bw: tk.Entry, col: int):
+        value = self._bottom[col]
+        bw.setvar(bw.cget('textvariable'), value)
+        dark = self.column_colours[col] == VERY_LIGHT_GREY
+        if self.bottom_cell_valid(value):
+            colour = HEADER_COLOUR1 if dark else HEADER_COLOUR2
+        else:
+            colour = NOT_OK_DARK_COLOUR if dark else NOT_OK_COLOUR
+        bw.configure(highlightbackground=colour, disabledbackground=colour)
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # colours (the row and column with the focus are highlighted)
+    # -----------------------------------------------------------------------------------------------------------------
+    def _cell_colour(self, row, col) -> str:
+        if self._focus is not None and (row == self._focus[0] or col == self._focus[1]):
+            return Colour.add(ROW_COL_INDICATOR_COLOUR, self.column_colours.get(col))
+        return self.column_colours.get(col)
+
+    def _colour_row_header(self, row, slot):
+        focused = self._focus is not None and self._focus[0] == row
+        colour = ROW_COL_INDICATOR_COLOUR if focused else BG_COLOUR
+        summary_colour = Colour.add(ROW_COL_INDICATOR_COLOUR, SUMMARY_COLOUR) if focused else SUMMARY_COLOUR
+
+        self.title_widgets[slot].configure(disabledbackground=colour, highlightbackground=colour)
+        for widget in self.summary_widgets[slot]:
+            widget.configure(disabledbackground=summary_colour, highlightbackground=colour)
+
+    def _recolour(self):
+        for row_slot, widgets in enumerate(self.entry_widgets):
+            row = self.rows_view.index(row_slot)
+            if row is None:
+                continue
+            self._colour_row_header(row, row_slot)
+            for col_slot, w in enumerate(widgets):
+                col = self.cols_view.index(col_slot)
+                if col is not None:
+                    colour = self._cell_colour(row, col)
+                    w.configure(bg=colour, highlightbackground=colour)
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # scrolling
+    # -----------------------------------------------------------------------------------------------------------------
+    def _scroll(self, view: Viewport, *args):
+        self.process_data_change()
+        if view.command(*args):
+            self._view_moved()
+
+    def _bind_mouse_wheel(self, widget):
+        widget.bind("<MouseWheel>", partial(self._mouse_wheel, self.rows_view))
+        widget.bind("<Shift-MouseWheel>", partial(self._mouse_wheel, self.cols_view))
+        widget.bind("<Button-4>", lambda *_: self._scroll(self.rows_view, "scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda *_: self._scroll(self.rows_view, "scroll", 1, "units"))
+        widget.bind("<Shift-Button-4>", lambda *_: self._scroll(self.cols_view, "scroll", -1, "units"))
+        widget.bind("<Shift-Button-5>", lambda *_: self._scroll(self.cols_view, "scroll", 1, "units"))
+
+    def _mouse_wheel(self, view: Viewport, e):
+        if e.delta:
+            self._scroll(view, "scroll", -1 if e.delta > 0 else 1, "units")
+
+    def _view_moved(self):
+        """show the newly visible cells, keeping the focus on the same cell (if still visible)"""
+        focus = self._focus
+        self._refresh()
+        if focus is None:
+            return
+
+        row_slot, col_slot = self.rows_view.slot(focus[0]), self.cols_view.slot(focus[1])
+        if row_slot is None or col_slot is None:
+            self.data_frame.focus_set()
+        else:
+            self.entry_widgets[row_slot][col_slot].focus_set()
+
+    def _data_frame_resized(self, e):
+        """show as many rows/columns as will fit"""
+        rows = max(e.height // self.cell_height, 1)
+        cols = max(e.width // self.cell_width, 1)
+        if rows == self.rows_view.size and cols == self.cols_view.size:
+            return
+
+        self.process_data_change()
+        self.rows_view.resize(size=rows)
+        self.cols_view.resize(size=cols)
+        self._make_cells()
+        self._view_moved()
 
     # -----------------------------------------------------------------------------------------------------------------
     # navigation routines
@@ -582,7 +635,7 @@ class AllocationGridTk:
         w: tk.Entry = ev.widget
 
         w.selection_clear()
-        row, col = self.widgets_row_col.get(w, (0,0))
+        row, col = self._cell_of(w) or (0, 0)
 
         if where == 'nextRow':
             row = min(max(row+1, 0), self.num_rows - 1)
@@ -593,21 +646,30 @@ class AllocationGridTk:
         elif where == 'prevCell':
             col = min(max(col-1, 0), self.num_cols - 1)
 
-        e = self.entry_widgets.get((row,col), None)
-        if e is not None:
-            self.set_focus(e)
+        self.process_data_change()
+        moved = self.rows_view.see(row)
+        moved = self.cols_view.see(col) or moved
+        if moved:
+            self._refresh()
+
+        e = self.entry_widgets[self.rows_view.slot(row)][self.cols_view.slot(col)]
+        self.set_focus(e)
 
         # forces Tk to not continue applying any binding routines after this
         return "break"
 
+    def _cell_of(self, w: tk.Entry) -> Optional[tuple[int,int]]:
+        """the row/col of the data that is currently shown in this widget"""
+        row_slot, col_slot = self.widgets_slot.get(w, (None, None))
+        if row_slot is None:
+            return None
+        row, col = self.rows_view.index(row_slot), self.cols_view.index(col_slot)
+        return (row, col) if row is not None and col is not None else None
+
     # -----------------------------------------------------------------------------------------------------------------
     # what to do when the widget gets the focus
     # -----------------------------------------------------------------------------------------------------------------
     def set_focus(self, e):
-        dx, dy = self.data_pane.see(e)
-        self.bottom_pane.xview_moveto(dx)
-        self.header_pane.xview_moveto(dx)
-
         e.focus()
 
     # -----------------------------------------------------------------------------------------------------------------
@@ -617,66 +679,46 @@ class AllocationGridTk:
         w: tk.Entry = e.widget
         if inout == "focusIn":
             w.selection_range(0, 'end')
+            self._focus = self._cell_of(w)
         else:
             w.selection_clear()
+            self._focus = None
 
-        # set Colour and totals Colour
-        dcolour = colour or BG_COLOUR
-        tcolour = colour
-
-        # get the widget
-        r, c = self.widgets_row_col.get(w, (0,0))
-
-        # set colors for rows (data)
-        col_colour = Colour.add(dcolour, self.column_colours.get(c))
-        for row in range(self.num_rows):
-            wid = self.entry_widgets.get((row,c), None)
-            if wid is not None:
-                wid.configure(bg=col_colour)
-                wid.configure(highlightbackground=col_colour)
-
-        # set colors for cols (data)
-        for col in range(self.num_cols):
-            wid = self.entry_widgets.get((r,col), None)
-            if wid is not None:
-                col_colour = Colour.add(dcolour, self.column_colours.get(col))
-                wid.configure(bg=col_colour)
-                wid.configure(highlightbackground=col_colour)
-
-        # set Colour for row header
-        widget = self.title_widgets[r]
-        widget.configure(disabledbackground=dcolour)
-        widget.configure(highlightbackground=dcolour)
-
-        # set colors for summary row
-        if tcolour:
-            tcolour = Colour.add(tcolour, SUMMARY_COLOUR)
-        else:
-            tcolour = SUMMARY_COLOUR
-
-        for col in range(self.num_summary_sub_col):
-            widget = self.summary_widgets[r,col]
-            widget.configure(disabledbackground=tcolour)
-            widget.configure(highlightbackground=dcolour)
-
+        self._recolour()
         self.process_data_change()
 
     # -----------------------------------------------------------------------------------------------------------------
     # process a data change
     # -----------------------------------------------------------------------------------------------------------------
+    def _data_cell_changed(self, row_slot, col_slot, *_):
+        """the user has typed in a data cell"""
+        if self._loading:
+            return
+        row, col = self.rows_view.index(row_slot), self.cols_view.index(col_slot)
+        if row is not None and col is not None:
+            self._data_changed[row, col] = self.entry_vars[row_slot][col_slot]
+
+    def _widget_at(self, row, col) -> Optional[tk.Entry]:
+        row_slot, col_slot = self.rows_view.slot(row), self.cols_view.slot(col)
+        if row_slot is None or col_slot is None:
+            return None
+        return self.entry_widgets[row_slot][col_slot]
+
     def process_data_change(self, *_):
-        if len(DATA_CHANGED) == 0:
+        if len(self._data_changed) == 0:
             return
 
-        for loc, v in DATA_CHANGED.items():
+        for loc, v in self._data_changed.items():
             r,c = loc
-            w = self.entry_widgets.get((r, c), None)
+            w = self._widget_at(r, c)
             v_str = v.get().strip()
             try:
                 if v_str == "":
+                    self._data[r, c] = ""
                     self.process_data_change_handler(r,c,0)
                 else:
                     value = float(v_str)
+                    self._data[r, c] = v_str if value != 0 else ""
                     self.process_data_change_handler(r,c,value)
                     if value == 0:
                         v.set(value="")
@@ -697,37 +739,30 @@ class AllocationGridTk:
                     w.focus_set()
                 return
 
-        DATA_CHANGED.clear()
+        self._data_changed.clear()
 
     # -----------------------------------------------------------------------------------------------------------------
     # process a data update (can only update widgets in the data/summary/bottom panes
     # -----------------------------------------------------------------------------------------------------------------
     def update_data(self, which: Literal['data','summary','bottom'], row, col, value):
         if which == 'bottom':
-            bw = self.bottom_widgets[col]
-            bw.configure(textvariable=tk.StringVar(value=value))
-            if self.bottom_cell_valid(value):
-                bw.configure(highlightbackground=HEADER_COLOUR2)
-                bw.configure(disabledbackground = HEADER_COLOUR2)
-                if self.column_colours[col] == VERY_LIGHT_GREY:
-                    bw.configure(highlightbackground=HEADER_COLOUR1)
-                    bw.configure(disabledbackground=HEADER_COLOUR1)
-            else:
-                bw.configure(highlightbackground=NOT_OK_COLOUR)
-                bw.configure(disabledbackground=NOT_OK_COLOUR)
-                if self.column_colours[col] == VERY_LIGHT_GREY:
-                    bw.configure(highlightbackground=NOT_OK_DARK_COLOUR)
-                    bw.configure(disabledbackground=NOT_OK_DARK_COLOUR)
+            self._bottom[col] = value
+            slot = self.cols_view.slot(col)
+            if slot is not None:
+                self._show_bottom(self.bottom_widgets[slot], col)
 
         elif which == 'data':
-                widget = self.entry_widgets.get((row, col), None)
-                if widget is not None:
-                    value = value if float(value) != 0.0 else ""
-                    var = tk.StringVar(value=value)
-                    widget.configure(textvariable=var)
-                    var.trace_add('write', partial(on_var_change, var, row, col))
+                value = value if float(value) != 0.0 else ""
+                self._data[row, col] = str(value)
+                row_slot, col_slot = self.rows_view.slot(row), self.cols_view.slot(col)
+                if row_slot is not None and col_slot is not None:
+                    self._loading = True
+                    self.entry_vars[row_slot][col_slot].set(str(value))
+                    self._loading = False
 
         elif which == 'summary':
-            widget = self.summary_widgets.get((row, col), None)
-            if widget:
-                widget.configure(textvariable=tk.Variable(value=value))
+            self._summary[row, col] = value
+            slot = self.rows_view.slot(row)
+            if slot is not None and col < len(self.summary_widgets[slot]):
+                w = self.summary_widgets[slot][col]
+                w.setvar(w.cget('textvariable'), value)
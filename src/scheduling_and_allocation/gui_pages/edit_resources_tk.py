@@ -113,13 +113,8 @@ class EditResourcesTk:
         refresh the data
         :param data: a list of lists (a 2-d array sort of)
         """
-        self.data_entry.clear_data()
-        for row, row_data in enumerate(data):
-            for col, cell_data in enumerate(row_data):
-                self.data_entry.put(row, col, str(cell_data))
-
-        if self.data_entry.number_of_rows <= len(data):
-            self.data_entry.add_empty_row()
+        # the widgets are reused, only the data changes (with an empty row at the end for new data)
+        self.data_entry.set_data([*data, []])
 
         # stupid Tk won't update image unless I do this.  Oh well, at least it worked
         self.frame.focus_set()
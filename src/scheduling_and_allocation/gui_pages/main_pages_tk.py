@@ -24,6 +24,7 @@ from ..modified_tk import set_default_fonts_and_colours, TkColours, TkFonts
 from ..gui_dialogs.change_font_tk import ChangeFont
 from ..gui_pages.note_book_frame_tk import NoteBookFrameTk, TabInfoProtocol
 from ..gui_generics.menu_and_toolbars import MenuItem, ToolbarItem, generate_menu, make_toolbar
+from ..gui_generics.progress_tk import ProgressTk
 from ..Utilities.Preferences import Preferences
 from ..modified_tk.InitGuiFontsAndColours import set_system_colours
 
@@ -331,6 +332,11 @@ class MainPageBaseTk:
     def ask_yes_no(self, title: str, msg: str, detail: str = ""):
         return askyesno(title=title, message=msg, detail=detail, icon='info')
 
+    def show_progress(self, title: str, msg: str, poll_handler: Callable[[], tuple[int, int, bool]],
+                      cancel_handler: Callable[[], None], finished_handler: Callable[[], None]):
+        """show the progress of work being done in the background (the gui is not blocked)"""
+        ProgressTk(self.mw, title, msg, poll_handler, cancel_handler, finished_handler)
+
     def show_custom_message(self, title="", msg=""):
         dialog = tk.Tk()
         dialog.title(title)
@@ -0,0 +1,241 @@
+"""
+# ============================================================================
+# Draws all the resources of one type as lanes on one weekly timeline
+#
+# Only the lanes that are visible are drawn.  When the lanes are small, only the times when the
+# resource is busy are drawn, when they are large, each block is drawn with its text
+#
+# EVENT HANDLERS:
+#         get_lane_blocks_handler(lane, detailed, scale)
+#         open_view_handler(lane)
+#         on_closing_handler()
+# ============================================================================
+"""
+from __future__ import annotations
+
+from functools import partial
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, TYPE_CHECKING
+
+from ..gui_generics.block_colours import get_block_colours
+from ..gui_generics.menu_and_toolbars import generate_menu, MenuItem, MenuType
+from ..gui_pages.view_canvas_tk import DAYS, EARLIEST_TIME, LATEST_TIME
+from ..model import ResourceType
+from ..modified_tk import Viewport, get_fonts_and_colours
+
+if TYPE_CHECKING:
+    from ..presenter.overview import OverviewBlock
+
+# zoom levels: (lane height, width of one hour, scale of the block text (None = no text))
+ZOOM_LEVELS: tuple[tuple[int, int, float | None], ...] = (
+    (12, 12, None),
+    (24, 16, None),
+    (48, 40, 0.5),
+    (96, 60, 1.0),
+)
+DEFAULT_ZOOM = 1
+
+NAME_WIDTH = 140
+HEADER_HEIGHT = 30
+HOURS_PER_DAY = LATEST_TIME - EARLIEST_TIME
+DEFAULT_CANVAS_WIDTH = 1000
+DEFAULT_CANVAS_HEIGHT = 600
+
+
+class OverviewTk:
+    """All the resources of one type, on one canvas"""
+
+    # =================================================================================================================
+    # Init
+    # =================================================================================================================
+    def __init__(self, frame: tk.Frame, title: str, resource_type: ResourceType):
+        """
+        :param frame: used to find the main window
+        :param title: title of the toplevel window
+        :param resource_type: what type of resources are being shown
+        """
+        self.mw = frame.winfo_toplevel()
+        self.resource_type = resource_type
+        self.colours, self.fonts = get_fonts_and_colours()
+
+        # ------------------------------------------------------------------------------------------------------------
+        # handlers
+        # ------------------------------------------------------------------------------------------------------------
+        # returns what needs to be drawn in the lane
+        self.get_lane_blocks_handler: Callable[[int, bool, float], list[OverviewBlock]] = lambda *_: []
+
+        # handles a double click on a lane
+        self.open_view_handler: Callable[[int], None] = lambda lane: None
+
+        # handles the closing of this overview
+        self.on_closing_handler: Callable = lambda *_: None
+
+        # ------------------------------------------------------------------------------------------------------------
+        # what lanes are shown
+        # ------------------------------------------------------------------------------------------------------------
+        self._names: list[str] = []
+        self.zoom = DEFAULT_ZOOM
+        self.lanes_view = Viewport(0, self._lanes_that_fit(DEFAULT_CANVAS_HEIGHT))
+
+        # ------------------------------------------------------------------------------------------------------------
+        # create a new toplevel window with a canvas and scrollbars
+        # ------------------------------------------------------------------------------------------------------------
+        tl = tk.Toplevel(self.mw)
+        self.toplevel = tl
+        tl.protocol('WM_DELETE_WINDOW', self.destroy)
+        tl.title(title)
+
+        self.y_scrollbar = ttk.Scrollbar(tl, orient='vertical', command=self._scroll)
+        self.x_scrollbar = ttk.Scrollbar(tl, orient='horizontal')
+        self.cn = tk.Canvas(tl, width=DEFAULT_CANVAS_WIDTH, height=DEFAULT_CANVAS_HEIGHT,
+                            background=self.colours.DataBackground if self.colours else "white",
+                            xscrollcommand=self.x_scrollbar.set)
+        self.x_scrollbar.configure(command=self.cn.xview)
+
+        self.y_scrollbar.pack(side='right', fill='y')
+        self.x_scrollbar.pack(side='bottom', fill='x')
+        self.cn.pack(side='left', expand=1, fill='both')
+
+        self.cn.bind("<Configure>", self._resized)
+        self.cn.bind("<Double-1>", self._double_clicked)
+        self.cn.bind("<MouseWheel>", lambda e: self._scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.cn.bind("<Button-4>", lambda *_: self._scroll("scroll", -1, "units"))
+        self.cn.bind("<Button-5>", lambda *_: self._scroll("scroll", 1, "units"))
+
+        # ------------------------------------------------------------------------------------------------------------
+        # zoom menu
+        # ------------------------------------------------------------------------------------------------------------
+        main_menu = tk.Menu(tl)
+        tl.configure(menu=main_menu)
+        zoom_menu = MenuItem(name='view', menu_type=MenuType.Cascade, label='View')
+        zoom_menu.add_child(MenuItem(menu_type=MenuType.Command, label='Zoom in', command=partial(self.set_zoom, 1)))
+        zoom_menu.add_child(MenuItem(menu_type=MenuType.Command, label='Zoom out', command=partial(self.set_zoom, -1)))
+        generate_menu(tl, [zoom_menu], main_menu)
+
+        self._draw_header()
+
+    # =================================================================================================================
+    # the lanes (one per resource)
+    # =================================================================================================================
+    def set_lanes(self, names: list[str]):
+        """
+        set the names of the lanes, and redraw
+        :param names: one name for each resource
+        """
+        self._names = list(names)
+        self.lanes_view.resize(total=len(self._names))
+        self.draw()
+
+    # =================================================================================================================
+    # zoom
+    # =================================================================================================================
+    def set_zoom(self, change: int):
+        """
+        zoom in (change > 0) or out (change < 0)
+        """
+        zoom = max(0, min(self.zoom + change, len(ZOOM_LEVELS) - 1))
+        if zoom == self.zoom:
+            return
+        self.zoom = zoom
+        self.lanes_view.resize(size=self._lanes_that_fit(self.cn.winfo_height()))
+        self._draw_header()
+        self.draw()
+
+    def _lanes_that_fit(self, height: int) -> int:
+        lane_height = ZOOM_LEVELS[self.zoom][0]
+        return max((height - HEADER_HEIGHT) // lane_height + 1, 1)
+
+    # =================================================================================================================
+    # coordinates
+    # =================================================================================================================
+    def _x(self, day: float, time: float) -> float:
+        hour_width = ZOOM_LEVELS[self.zoom][1]
+        return NAME_WIDTH + ((day - 1) * HOURS_PER_DAY + time - EARLIEST_TIME) * hour_width
+
+    def _lane_y(self, slot: int) -> tuple[float, float]:
+        lane_height = ZOOM_LEVELS[self.zoom][0]
+        y = HEADER_HEIGHT + slot * lane_height
+        return y, y + lane_height
+
+    # =================================================================================================================
+    # the days and times along the top (only changes with the zoom)
+    # =================================================================================================================
+    def _draw_header(self):
+        cn = self.cn
+        cn.delete('header')
+        x_max = self._x(len(DAYS) + 1, EARLIEST_TIME)
+        cn.configure(scrollregion=(0, 0, x_max, DEFAULT_CANVAS_HEIGHT))
+
+        for day in range(1, len(DAYS) + 1):
+            x1 = self._x(day, EARLIEST_TIME)
+            x2 = self._x(day + 1, EARLIEST_TIME)
+            cn.create_line(x1, 0, x1, 10000, fill="black", tags=('header', 'grid'))
+            name = DAYS[day - 1] if ZOOM_LEVELS[self.zoom][1] >= 16 else DAYS[day - 1][0:3]
+            cn.create_text((x1 + x2) / 2, HEADER_HEIGHT / 2, text=name, tags=('header',))
+            for hour in range(EARLIEST_TIME + 1, LATEST_TIME):
+                x = self._x(day, hour)
+                cn.create_line(x, HEADER_HEIGHT, x, 10000, fill="light grey", dash=".", tags=('header', 'grid'))
+        cn.create_line(x_max, 0, x_max, 10000, fill="black", tags=('header', 'grid'))
+        cn.create_line(0, HEADER_HEIGHT, x_max, HEADER_HEIGHT, fill="black", tags=('header',))
+
+    # =================================================================================================================
+    # draw the visible lanes
+    # =================================================================================================================
+    def draw(self):
+        """redraw the visible lanes"""
+        cn = self.cn
+        cn.delete('lane')
+        _, _, text_scale = ZOOM_LEVELS[self.zoom]
+        detailed = text_scale is not None
+        x_max = self._x(len(DAYS) + 1, EARLIEST_TIME)
+
+        for lane in self.lanes_view.visible():
+            y1, y2 = self._lane_y(self.lanes_view.slot(lane))
+            if lane % 2:
+                cn.create_rectangle(0, y1, x_max, y2, fill="#f4f4f4", outline="", tags=('lane', 'lane_background'))
+            cn.create_line(0, y2, x_max, y2, fill="light grey", tags=('lane',))
+            cn.create_text(4, (y1 + y2) / 2, text=self._names[lane], anchor='w', tags=('lane',))
+
+            for block in self.get_lane_blocks_handler(lane, detailed, text_scale or 1):
+                colour, text_colour = get_block_colours(self.resource_type, block.conflict, block.movable)
+                x1 = self._x(block.day, block.start)
+                x2 = self._x(block.day, block.start + block.duration)
+                cn.create_rectangle(x1 + 1, y1 + 2, x2 - 1, y2 - 2, fill=colour, outline=colour, tags=('lane',))
+                if detailed and block.text:
+                    cn.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=block.text, fill=text_colour,
+                                   width=x2 - x1, tags=('lane',))
+
+        cn.tag_lower('lane_background')
+        self.y_scrollbar.set(*self.lanes_view.fractions())
+
+    # =================================================================================================================
+    # scrolling, resizing, clicking
+    # =================================================================================================================
+    def _scroll(self, *args):
+        if self.lanes_view.command(*args):
+            self.draw()
+
+    def _resized(self, e: tk.Event):
+        if self.lanes_view.resize(size=self._lanes_that_fit(e.height)):
+            self.draw()
+
+    def _double_clicked(self, e: tk.Event):
+        slot = int((self.cn.canvasy(e.y) - HEADER_HEIGHT) // ZOOM_LEVELS[self.zoom][0])
+        lane = self.lanes_view.index(slot) if e.y > HEADER_HEIGHT else None
+        if lane is not None:
+            self.open_view_handler(lane)
+
+    # =================================================================================================================
+    # closing
+    # =================================================================================================================
+    def raise_to_top(self):
+        self.toplevel.lift()
+
+    def destroy(self):
+        """Close/destroy the gui window."""
+        self.on_closing_handler(self)
+        self.toplevel.destroy()
+
+    def kill(self):
+        self.toplevel.destroy()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 import tkinter as tk
+from tkinter import ttk
 from functools import partial
+from typing import Optional
 
-from ..modified_tk import Scrolled
+from ..modified_tk import Viewport
 from ..gui_generics.number_validations import validate_int, entry_int
 
+# how many lines to show before the size of the window is known
+INITIAL_LINES = 25
+
+
 # =======================================================================================================
 # data class for holding info about sections
 # =======================================================================================================
@@ -32,86 +38,157 @@ class StudentNumbersTk:
             w.destroy()
 
         self.data = data if data is not None else {}
-        self._update_handlers = []
 
-        f = Scrolled(
-            self.frame,
-            "Frame",
-            scrollbars='e',
-            border=5,
-            relief='flat',
-        )
-
-        self.pane = f
+        # one line per course, followed by one line per section.  Only the visible lines have widgets
+        self._lines: list[tuple[str, Optional[SectionData]]] = []
+        self._values: list[str] = []
+        self.lines_view = Viewport(0, INITIAL_LINES)
+        self._loading = False
+
+        self._labels: list[tk.Label] = []
+        self._entries: list[tk.Entry] = []
+        self._vars: list[tk.StringVar] = []
+
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', takefocus=0, command=self._scroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.pane = tk.Frame(self.frame, border=5, relief='flat')
+        self.pane.pack(side='left', expand=1, fill='both')
+        self.pane.grid_propagate(False)
+        self.pane.columnconfigure(1, weight=5)
+        self.pane.columnconfigure(0, weight=1)
+        self._bind_mouse_wheel(self.pane)
 
         # put data into widget
         self.refresh()
         self.pane.bind('<Leave>', func=self.save)
+        self.pane.bind('<Configure>', self._resized)
 
     # -----------------------------------------------------------------------------------------------------------------
-    # recreate the gui based on the information in self.data
+    # show the information in self.data
     # -----------------------------------------------------------------------------------------------------------------
     def refresh(self):
         """
         Refresh the gui
         """
-        self._update_handlers.clear()
+        self._lines.clear()
+        for course_name, sections in self.data.items():
+            self._lines.append((course_name, None))
+            self._lines.extend((course_name, section_data) for section_data in sections)
+        self._values = ["" if section_data is None else str(section_data.number_of_students)
+                        for _, section_data in self._lines]
+        self.lines_view.resize(total=len(self._lines))
+
+        while len(self._labels) < self.lines_view.size:
+            self._add_slot()
+        self._show()
 
-        if self.pane is None:
-            return
+    # -----------------------------------------------------------------------------------------------------------------
+    # a label and an entry widget, that can show any line
+    # -----------------------------------------------------------------------------------------------------------------
+    def _add_slot(self):
+        slot = len(self._labels)
+        label = tk.Label(self.pane, anchor='w', width=40)
+        tk_var = tk.StringVar(value="")
+        entry = entry_int(self.pane, tk_var)
+        tk_var.trace_add('write', partial(self._entry_changed, slot))
+        entry.bind("<Return>", partial(self._next_section, slot))
+
+        label.grid(column=0, row=slot, sticky='nsew')
+        entry.grid(column=1, row=slot, sticky='nw')
+        for w in (label, entry):
+            self._bind_mouse_wheel(w)
+
+        self._labels.append(label)
+        self._entries.append(entry)
+        self._vars.append(tk_var)
 
-        frame = self.pane.widget
-        for w in frame.winfo_children():
-            w.destroy()
+    # -----------------------------------------------------------------------------------------------------------------
+    # show the visible lines
+    # -----------------------------------------------------------------------------------------------------------------
+    def _show(self):
+        self._loading = True
+        for slot, (label, entry, tk_var) in enumerate(zip(self._labels, self._entries, self._vars)):
+            line = self.lines_view.index(slot)
+            if line is None:
+                label.grid_remove()
+                entry.grid_remove()
+                continue
+
+            course_name, section_data = self._lines[line]
+            if section_data is None:
+                label.configure(text=course_name, anchor='w', width=40)
+                label.grid(column=0, row=slot, columnspan=2, sticky='nsew')
+                entry.grid_remove()
+            else:
+                label.configure(text=section_data.name, anchor='e', width=4)
+                label.grid(column=0, row=slot, columnspan=1, sticky='nsew')
+                entry.grid()
+                tk_var.set(self._values[line])
+        self._loading = False
+        self.scrollbar.set(*self.lines_view.fractions())
+
+    def _entry_changed(self, slot, *_):
+        line = self.lines_view.index(slot)
+        if not self._loading and line is not None:
+            self._values[line] = self._vars[slot].get()
 
-        frame.columnconfigure(1, weight=5)
-        frame.columnconfigure(0, weight=1)
-
-        row = 1
-        for course_name in self.data.keys():
-            tk.Label(frame,
-                     text=course_name,
-                     anchor='w',
-                     width=40
-                     ).grid(column=0, row=row, columnspan=2, sticky='nsew', pady=(10,0))
-            row += 1
-
-            for section_data in self.data[course_name]:
-                tk.Label(frame,
-                         width=4,
-                         text=section_data.name,
-                         anchor='e',
-                         ).grid(column=0, row=row, sticky='nsew')
-                tk_var = tk.StringVar(value=section_data.number_of_students)
-                entry = entry_int(frame, tk_var)
-                entry.grid(column=1, row=row, sticky='nw')
-                entry.bind("<Return>", lambda e: e.widget.tk_focusNext().focus())
-                entry.bind("<FocusIn>", lambda e: self.pane.see(e.widget))
-
-                # create a separate handler for every entry widget, called when
-                # this entire widget loses focus (as opposed to every time the data is
-                # modified)
-                self._update_handlers.append(partial(_update_number, tk_var, section_data.handler))
-                row += 1
+    # -----------------------------------------------------------------------------------------------------------------
+    # scrolling
+    # -----------------------------------------------------------------------------------------------------------------
+    def _scroll(self, *args):
+        if self.lines_view.command(*args):
+            if self.pane.focus_get() in self._entries:
+                self.pane.focus_set()
+            self._show()
+
+    def _bind_mouse_wheel(self, w):
+        w.bind("<MouseWheel>", lambda e: self._scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        w.bind("<Button-4>", lambda *_: self._scroll("scroll", -1, "units"))
+        w.bind("<Button-5>", lambda *_: self._scroll("scroll", 1, "units"))
+
+    def _resized(self, e):
+        if not self._entries:
+            return
+        line_height = max(self._labels[0].winfo_reqheight(), self._entries[0].winfo_reqheight())
+        if self.lines_view.resize(size=max(e.height // line_height, 1)):
+            while len(self._labels) < self.lines_view.size:
+                self._add_slot()
+            self._show()
+
+    def _next_section(self, slot, *_):
+        """move to the next section (skipping over the course names)"""
+        line = self.lines_view.index(slot)
+        if line is None:
+            return "break"
+        line = next((i for i in range(line + 1, len(self._lines)) if self._lines[i][1] is not None), line)
+        if self.lines_view.see(line):
+            self._show()
+        self._entries[self.lines_view.slot(line)].focus_set()
+        return "break"
 
     # -----------------------------------------------------------------------------------------------------------------
     # called when the user focus for the entry widget is lost
     # -----------------------------------------------------------------------------------------------------------------
     def save(self, *_):
-        """Call each save or update handlers.
-        Inputs to the handler are
+        """Call the update handler of each section that has been changed.
+        Input to the handler is the new number of students
         """
-        for handler in self._update_handlers:
-            handler()
+        for (_, section_data), value in zip(self._lines, self._values):
+            if section_data is not None and value != str(section_data.number_of_students):
+                if _update_number(value, section_data.handler):
+                    section_data.number_of_students = int(value)
 
 # =======================================================================================================
 # update number
 # =======================================================================================================
-def _update_number(tk_var: tk.StringVar, handler, *_):
+def _update_number(value: str, handler, *_) -> bool:
     """
-    :param tk_var: the variable holding the data in the entry widget
+    :param value: the data in the entry widget
     :param handler: the presenter defined function to update the section number
     :param _: tk event
+    :return: True if the number was valid
     """
-    if validate_int(tk_var.get(),"Invalid Int","number of students must be a valid number"):
-        handler(int(tk_var.get()))
+    if validate_int(value,"Invalid Int","number of students must be a valid number"):
+        handler(int(value))
+        return True
+    return False
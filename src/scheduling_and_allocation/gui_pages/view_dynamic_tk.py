@@ -7,9 +7,10 @@
 #
 # EVENT HANDLERS:
 #         get_popup_menu_handler(gui_block_id)
-#         refresh_blocks_handler()
+#         refresh_blocks_handler()     (blocks already on the canvas are kept, unless the scale changes)
 #         on_closing_handler()
 #         double_click_block_handler(gui_id)
+#         get_drop_targets_handler(gui_id)
 #         gui_block_is_moving_handler(gui_id, day, start)
 #         gui_block_has_dropped_handler(gui_id)
 #         undo_handler()
@@ -20,18 +21,25 @@ from __future__ import annotations
 
 from functools import partial
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Optional
 
 from ..gui_generics.menu_and_toolbars import generate_menu, MenuItem, MenuType
-from ..Utilities import Colour
 from ..Utilities.id_generator import IdGenerator
-from ..gui_generics.block_colours import get_conflict_colour_info, IMMOVABLE_COLOUR, RESOURCE_COLOURS
+from ..gui_generics.block_colours import get_conflict_colour_info, get_block_colours
 from ..gui_pages.view_canvas_tk import ViewCanvasTk
 from ..model import ResourceType, ConflictType
 
 DEFAULT_CANVAS_WIDTH = 700
 DEFAULT_CANVAS_HEIGHT = 700
 
+# while dragging, the presenter is told about the block position at most once per frame (milliseconds)
+DRAG_FRAME_MS = 16
+
+# while dragging, the colour of each place the block could be dropped, by the number of conflicts it would have
+# (no colour if there would not be any conflicts, the last colour is used for anything more)
+DROP_TARGET_COLOURS = ("#fff0c0", "#ffc890", "#ff9080")
+DROP_TARGET_TAG = "drop_target"
+
 
 def _default_menu(*_) -> list[MenuItem]:
     menu = MenuItem(name="nothing", label="nothing", menu_type=MenuType.Command, command=lambda: None)
@@ -72,6 +80,9 @@ class ViewDynamicTk:
         # handles a double click on a gui block
         self.double_click_block_handler: Callable[[str], None] = lambda gui_id: None
 
+        # returns the number of conflicts a gui block would have at each (day, start)
+        self.get_drop_targets_handler: Callable[[str], dict[tuple[int, float], int]] = lambda gui_id: {}
+
         # handles the movement of a gui block
         self.gui_block_is_moving_handler: Callable[[str, float, float], None] = lambda gui_id, day, start: None
 
@@ -111,6 +122,10 @@ class ViewDynamicTk:
         cn.pack()
         self.cn = cn
 
+        # the gui block whose movement has not yet been sent to the handler
+        self._pending_move: Optional[str] = None
+        self._pending_after: Optional[str] = None
+
         # create the view_canvas
         self.view_canvas = self._draw_view_canvas()
 
@@ -179,13 +194,16 @@ class ViewDynamicTk:
     def get_scale(self):
         return self.view_canvas.scale.current_scale
 
-    def draw(self, scale_factor: float = 1.0):
+    def draw(self, scale_factor: Optional[float] = None):
         """
-        Draw the view, calls event handler refresh_blocks_handler to get info about the blocks
-        :param scale_factor:
+        Draw the view, calls event handler refresh_blocks_handler to get info about the blocks.
+        The background (and all the blocks) are only redrawn if the scale has changed, otherwise
+        the existing gui blocks are kept, and the event handler only updates what has changed.
+        :param scale_factor: default is to keep the current scale
         :return:
         """
-        self._draw_view_canvas(scale_factor)
+        if scale_factor is not None and scale_factor != self.get_scale():
+            self._draw_view_canvas(scale_factor)
 
         # update blocks
         self.refresh_blocks_handler()
@@ -219,6 +237,29 @@ class ViewDynamicTk:
             gui_tag=gui_block_id,
             movable=movable)
 
+    # =================================================================================================================
+    # change the text of a gui block
+    # =================================================================================================================
+    def set_block_text(self, gui_block_id: str, text: str):
+        """
+        Change the text that is displayed on the gui block
+        :param gui_block_id:
+        :param text:
+        """
+        self.view_canvas.set_block_text(gui_block_id, text)
+
+    # =================================================================================================================
+    # remove a gui block
+    # =================================================================================================================
+    def remove_block(self, gui_block_id: str):
+        """
+        Remove the gui block from the canvas
+        :param gui_block_id:
+        """
+        if self._pending_move == gui_block_id:
+            self._pending_move = None
+        self.view_canvas.remove_block(gui_block_id)
+
     # =================================================================================================================
     # modify movability of gui block
     # =================================================================================================================
@@ -245,26 +286,17 @@ class ViewDynamicTk:
         :return:
         """
 
-        conflict = ConflictType.most_severe(conflict, resource_type)
-        colour = RESOURCE_COLOURS[resource_type]
-
-        if conflict != ConflictType.NONE:
-            colour = ConflictType.colours().get(conflict, "pink")
-
-        if not is_movable:
-            colour = IMMOVABLE_COLOUR
-
+        colour, text_colour = get_block_colours(resource_type, conflict, is_movable)
         cn = self.cn
 
-        colour = Colour.string(colour)
-        text_colour = "black"
-        if not Colour.is_light(colour):
-            text_colour = "white"
-
-        # if tag name doesn't exist, then don't do anything
+        # if gui block doesn't exist, then don't do anything
+        items = self.view_canvas.gui_block_items.get(gui_block_id)
+        if items is None:
+            return
+        rectangle, text = items
         try:
-            cn.itemconfigure(f"{self.view_canvas.Rectange_Tag_Name} && {gui_block_id}", fill=colour)
-            cn.itemconfigure(f"{self.view_canvas.Text_Tag_Name} && {gui_block_id}", fill=text_colour)
+            cn.itemconfigure(rectangle, fill=colour)
+            cn.itemconfigure(text, fill=text_colour)
         except tk.TclError:
             pass
 
@@ -356,6 +388,7 @@ class ViewDynamicTk:
     def _select_gui_block_to_move(self, event: tk.Event):
 
         gui_block_id = self.view_canvas.get_gui_block_id_from_selected_item()
+        self._draw_drop_targets(gui_block_id)
         self.cn.tag_raise(gui_block_id, 'all')
 
         # unbind any previous binding for clicking and motion, just in case
@@ -377,20 +410,49 @@ class ViewDynamicTk:
         # move the widget
         self.cn.move(gui_block_id, event.x - original_x, event.y - original_y)
 
-        # get the information about the movement and call event handler
+        # the event handler is only called once per frame, with the latest position
+        self._pending_move = gui_block_id
+        if self._pending_after is None:
+            self._pending_after = self.cn.after(DRAG_FRAME_MS, self._process_pending_move)
+
+        # rebind for motion
+        self.cn.bind("<Motion>", partial(self._gui_block_is_moving, gui_block_id, event.x, event.y))
+
+    def _process_pending_move(self):
+        """get the information about the movement and call event handler"""
+        gui_block_id = self._pending_move
+        self._pending_move = None
+        self._pending_after = None
+        if gui_block_id is None:
+            return
         info = self.view_canvas.gui_block_to_day_time_duration(gui_block_id)
         if info is not None:
             day, start_time, _ = info
             self.gui_block_is_moving_handler(gui_block_id, day, start_time)
 
-        # rebind for motion
-        self.cn.bind("<Motion>", partial(self._gui_block_is_moving, gui_block_id, event.x, event.y))
-
     def _gui_block_has_stopped_moving(self, gui_block_id, _: tk.Event):
         self.cn.tag_bind(self.view_canvas.Movable_Tag_Name, "<Button-1>", self._select_gui_block_to_move)
         self.cn.bind("<Motion>", "")
         self.cn.bind("<ButtonRelease-1>", "")
+        self.cn.delete(DROP_TARGET_TAG)
+
+        # make sure the last movement has been processed before the block is dropped
+        if self._pending_after is not None:
+            self.cn.after_cancel(self._pending_after)
+        self._process_pending_move()
         info = self.view_canvas.gui_block_to_day_time_duration(gui_block_id)
         if info is not None:
             self.gui_block_has_dropped_handler(gui_block_id)
 
+    def _draw_drop_targets(self, gui_block_id):
+        """shade every half-hour where the block could start, by how many conflicts it would have there"""
+        self.cn.delete(DROP_TARGET_TAG)
+        for (day, start), conflicts in self.get_drop_targets_handler(gui_block_id).items():
+            if conflicts <= 0:
+                continue
+            colour = DROP_TARGET_COLOURS[min(conflicts, len(DROP_TARGET_COLOURS)) - 1]
+            x1, y1, x2, y2 = self.view_canvas.get_coords(day, start, 0.5)
+            self.cn.create_rectangle(x1, y1, x2, y2, fill=colour, outline="", tags=(DROP_TARGET_TAG,))
+
+        # below the grid lines and the blocks
+        self.cn.tag_lower(DROP_TARGET_TAG)
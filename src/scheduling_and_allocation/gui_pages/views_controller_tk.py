@@ -11,6 +11,7 @@
 #
 # EVENT HANDLERS:
 #    btn_callback(resource)
+#    overview_callback(resource_type)
 # ============================================================================
 """
 
@@ -33,10 +34,12 @@ class ViewsControllerTk:
     # ============================================================================
     # constructor
     # ============================================================================
-    def __init__(self, parent: tk.Frame, resources:dict[ResourceType,list], btn_callback: Callable):
+    def __init__(self, parent: tk.Frame, resources:dict[ResourceType,list], btn_callback: Callable,
+                 overview_callback: Callable = None):
         """
         Initialize this manager
         :param parent: where to put the gui objects
+        :param overview_callback: if defined, a button for each resource type opens an overview of all of them
         """
 
         # remove anything that was already in the frame
@@ -60,9 +63,15 @@ class ViewsControllerTk:
             l_frame = tk.LabelFrame(scrolled_frame, text=resource_type.name)
             l_frame.pack(expand=1,fill='both', padx=5,pady=15)
 
+            first_row = 0
+            if overview_callback is not None:
+                tk.Button(l_frame, text=f"All {resource_type.name}s", command=partial(overview_callback, resource_type)
+                          ).grid(column=0, row=0, columnspan=4, sticky='nsew', padx=2, pady=2)
+                first_row = 1
+
             for index,resource in enumerate(resources[resource_type]):
-                row = int(index/4)
-                col = index-row*4
+                row = first_row + int(index/4)
+                col = index % 4
                 command = partial(btn_callback, resource)
                 self._button_refs[resource.number] = tk.Button(l_frame, text=str(resource), highlightthickness=4, command=command, width=15)
                 self._button_refs[resource.number].grid(column = col, row=row, sticky='nsew',ipadx=20, ipady=10, padx=2, pady=2)
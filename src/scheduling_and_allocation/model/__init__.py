@@ -7,9 +7,14 @@ from .teacher import Teacher
 from .section import Section
 from .stream import Stream
 from .course import Course
-from .schedule import Schedule
+from .schedule import Schedule, load_many
+from .lint import lint_file, lint_lines, LintMessage
+from .diff import diff_schedules, index_schedule, Change
+from .merge import merge_schedules, merge_files, MergeConflict
+from .teacher_index import TeacherIndex
+from .scenario import Scenario, ScenarioSet
 from .exceptions import InvalidSectionNumberForCourseError, InvalidHoursForSectionError, \
-    CouldNotReadFileError
+    CouldNotReadFileError, CouldNotWriteFileError
 from .conflicts import set_block_conflicts, set_lunch_break_conflicts, \
     set_number_of_days_conflict, MAX_HOURS_PER_WEEK, set_availability_hours_conflict
 from .time_slot import MINIMUM_DURATION, DEFAULT_DAY, DEFAULT_START, DEFAULT_DURATION, \
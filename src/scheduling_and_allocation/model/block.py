@@ -5,6 +5,7 @@ Define a class time for teaching
 from __future__ import annotations
 
 import copy
+from itertools import count
 from typing import TYPE_CHECKING, Optional
 from ..Utilities.id_generator import IdGenerator
 from .enums import WeekDay, ConflictType
@@ -22,6 +23,9 @@ DEFAULT_DAY = WeekDay.Monday
 DEFAULT_START = 8.0
 DEFAULT_DURATION = 1.5
 
+# version numbers are never reused, so they are unique across all blocks
+_versions = count()
+
 # =====================================================================================================================
 # Block - Class time
 # =====================================================================================================================
@@ -41,7 +45,8 @@ class Block:
                  start: float = DEFAULT_START,
                  duration: float = DEFAULT_DURATION,
                  movable: bool = True,
-                 block_id: OptionalId = None) -> None:
+                 block_id: OptionalId = None,
+                 block_ids: Optional[IdGenerator] = None) -> None:
         """
         Creates a new block object (class time)
         :param section: a block must be part of a course/section
@@ -50,6 +55,7 @@ class Block:
         :param duration: how long does the class last
         :param movable: can the time/day of this class be moved
         :param block_id:
+        :param block_ids: the id generator to use (defaults to the one shared by all blocks)
         """
         self._sync: list[Block] = []
         self.section = section
@@ -58,7 +64,9 @@ class Block:
         self._teachers: set[Teacher] = set()
         self._labs: set[Lab] = set()
         self.conflict = ConflictType.NONE
-        self._block_id = Block.block_ids.get_new_id(block_id)
+        self._version = next(_versions)
+        block_ids = Block.block_ids if block_ids is None else block_ids
+        self._block_id = block_ids.get_new_id(block_id)
 
     # -----------------------------------------------------------------------------------------------------------------
     # generic properites
@@ -73,6 +81,18 @@ class Block:
         """block id"""
         return str(self._block_id)
 
+    @property
+    def version(self) -> tuple[int, int]:
+        """
+        Changes every time the teachers or labs of this block, or the name, number or streams of its
+        section change (the time slot is not included).  Versions are never reused.
+        """
+        return self._version, (self.section.version if self.section is not None else -1)
+
+    def mark_changed(self):
+        """something that this block depends on (like a teacher's name) has changed"""
+        self._version = next(_versions)
+
     def description(self) -> str:
         """Returns text string that describes this Block."""
         return str(self._time_slot)
@@ -160,14 +180,17 @@ class Block:
     def add_lab(self, lab: Lab):
         """Assign a new lab, to this block"""
         self._labs.add(lab)
+        self._version = next(_versions)
 
     def remove_lab(self, lab: Lab):
         """Removes the specified Lab from this Block."""
         self._labs.discard(lab)
+        self._version = next(_versions)
 
     def remove_all_labs(self):
         """Removes ALL Labs from this Block."""
         self._labs.clear()
+        self._version = next(_versions)
 
     def has_lab(self, lab: Lab) -> bool:
         """Returns true if the Block has the specified Lab."""
@@ -183,14 +206,17 @@ class Block:
     def add_teacher(self, teacher: Teacher):
         """Assign a new teacher, to this block"""
         self._teachers.add(teacher)
+        self._version = next(_versions)
 
     def remove_teacher(self, teacher: Teacher):
         """Removes the specified teacher from this Block."""
         self._teachers.discard(teacher)
+        self._version = next(_versions)
 
     def remove_all_teachers(self):
         """Removes ALL Teachers from this Block."""
         self._teachers.clear()
+        self._version = next(_versions)
 
     def has_teacher(self, teacher: Teacher) -> bool:
         """Returns true if the Block has the specified Lab."""
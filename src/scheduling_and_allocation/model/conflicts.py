@@ -3,8 +3,10 @@ Provides classes for managing scheduling conflicts
 """
 from __future__ import annotations
 import itertools
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Iterable
 from .enums import ConflictType
+from .time_slot import MINUTE_BLOCK_SIZE, MIN_START_TIME, MAX_END_TIME
 
 if TYPE_CHECKING:
     from .block import Block
@@ -17,6 +19,9 @@ if TYPE_CHECKING:
 LUNCH_START: float = 11
 LUNCH_END: float = 14
 MAX_HOURS_PER_WEEK = 32.5
+SLOTS_PER_HOUR = 60 // MINUTE_BLOCK_SIZE
+SLOTS_PER_DAY = (MAX_END_TIME - MIN_START_TIME) * SLOTS_PER_HOUR
+SCHOOL_DAYS = range(1, 6)
 
 
 # -----------------------------------------------------------------------------------------------------------------
@@ -183,6 +188,65 @@ def has_availability_hours_conflict(blocks: tuple[Block, ...]) -> bool:
     return False
 
 
+# -----------------------------------------------------------------------------------------------------------------
+# how many conflicts would a block have, at every place it could be dropped
+# -----------------------------------------------------------------------------------------------------------------
+def drop_target_conflicts(block: Block, resource_blocks: Iterable[tuple[Block, ...]],
+                          teacher_blocks: Iterable[tuple[Block, ...]] = ()) -> dict[tuple[int, float], int]:
+    """
+    For every day and start time (on the half-hour) where the block could be dropped, count the
+    conflicts it would have there, without moving the block.
+
+    Each resource's blocks are indexed once as half-hour slots, and a prefix sum gives the number of
+    blocks that each possible position of the block would overlap.
+
+    :param block: the block being moved
+    :param resource_blocks: the blocks of each of the block's teachers, labs and streams
+    :param teacher_blocks: the blocks of each of the block's teachers (to check for lunch breaks)
+    :return: (day, start) -> number of conflicts
+    """
+    length = min(max(math.ceil(block.duration * SLOTS_PER_HOUR - 0.01), 1), SLOTS_PER_DAY)
+    positions = SLOTS_PER_DAY - length + 1
+
+    # changes[day][s] is the change in the number of overlapping blocks between starting at slot s-1 and slot s
+    changes = {day: [0] * (positions + 1) for day in SCHOOL_DAYS}
+    for blocks in resource_blocks:
+        for day, first, last in _occupied_slots(block, blocks):
+            lo, hi = max(first - length + 1, 0), min(last, positions)
+            if lo < hi:
+                changes[day][lo] += 1
+                changes[day][hi] -= 1
+
+    counts = {day: list(itertools.accumulate(changes[day][:positions])) for day in SCHOOL_DAYS}
+
+    # no lunch break, if the block covers every free half-hour over lunch
+    lunch = range(int((LUNCH_START - MIN_START_TIME) * SLOTS_PER_HOUR),
+                  int((LUNCH_END - MIN_START_TIME) * SLOTS_PER_HOUR))
+    for blocks in teacher_blocks:
+        busy = {day: set() for day in SCHOOL_DAYS}
+        for day, first, last in _occupied_slots(block, blocks):
+            busy[day].update(range(first, last))
+        for day in SCHOOL_DAYS:
+            free = [s for s in lunch if s not in busy[day]]
+            lo = max(free[-1] - length + 1 if free else lunch.start - length + 1, 0)
+            hi = min(free[0] + 1 if free else lunch.stop, positions)
+            for s in range(lo, hi):
+                counts[day][s] += 1
+
+    return {(day, MIN_START_TIME + s / SLOTS_PER_HOUR): counts[day][s]
+            for day in SCHOOL_DAYS for s in range(positions)}
+
+
+def _occupied_slots(block: Block, blocks: Iterable[Block]) -> Iterable[tuple[int, int, int]]:
+    """the day, first and last (exclusive) half-hour slots of every block except the given one"""
+    for b in blocks:
+        if b is block or b.day.value not in SCHOOL_DAYS:
+            continue
+        first = max(math.floor((b.start - MIN_START_TIME) * SLOTS_PER_HOUR + 0.01), 0)
+        last = min(math.ceil((b.end - MIN_START_TIME) * SLOTS_PER_HOUR - 0.01), SLOTS_PER_DAY)
+        if first < last:
+            yield b.day.value, first, last
+
 
 def _mark_block_conflict(conflict_type: ConflictType, conflict_blocks: tuple[Block, ...]):
     for cb in conflict_blocks:
@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING, Optional
 from .exceptions import InvalidSectionNumberForCourseError
 from .enums import SemesterType
 from .section import Section
+from .block import Block
+from ..Utilities.id_generator import IdGenerator
 
 # stuff that we need just for type checking, not for actual functionality
 if TYPE_CHECKING:
-    from .block import Block
     from .teacher import Teacher
     from .stream import Stream
     from .lab import Lab
@@ -27,13 +28,16 @@ class Course:
                  name: str = "New Course",
                  semester: SemesterType = SemesterType.any,
                  hours_per_week: float = 3.0,
-                 needs_allocation: bool = True):
+                 needs_allocation: bool = True,
+                 section_ids: Optional[IdGenerator] = None,
+                 block_ids: Optional[IdGenerator] = None):
         """Creates and returns a course object.
         :param number: Course number
         :param name: Course name
         :param semester: Which semester is it taught in
         :param needs_allocation: This requires someone to teach it
-        :course_id: if not specified, will create one as required
+        :param section_ids: id generator for the sections of this course (usually owned by the schedule)
+        :param block_ids: id generator for the blocks of this course (usually owned by the schedule)
         """
 
         self._number: str = number
@@ -42,6 +46,8 @@ class Course:
         self.hours_per_week = float(hours_per_week)
         self._sections: set[Section] = set()
         self.semester: SemesterType = semester
+        self.section_ids: IdGenerator = Section.section_ids if section_ids is None else section_ids
+        self.block_ids: IdGenerator = Block.block_ids if block_ids is None else block_ids
 
     # =================================================================
     # unique identifier
@@ -79,7 +85,7 @@ class Course:
                     pass
             number = str(max_number + 1)
 
-        section = Section(self, number, name, section_id)
+        section = Section(self, number, name, section_id, section_ids=self.section_ids)
         self._sections.add(section)
 
         return section
@@ -0,0 +1,202 @@
+"""
+Find the differences between two schedules.
+
+Everything in a schedule is indexed by a key (course number, section number, teacher id, etc.),
+so that the two schedules can be compared with dictionary lookups, rather than searching.
+
+Keys must be unique, so sections of a course with the same number are numbered '1', '1#2', '1#3',
+and blocks of a section in the same time slot have an ordinal (0, 1, ...) at the end of their key.
+
+SYNOPSIS
+
+    for change in diff_schedules(Schedule("fall_v1.csv"), Schedule("fall_v2.csv")):
+        print(change)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional, TYPE_CHECKING
+
+from .enums import WeekDay
+from .time_slot import get_clock_string_from_hours
+
+if TYPE_CHECKING:
+    from .schedule import Schedule
+
+KEY = tuple
+FIELDS = dict[str, Any]
+
+# the order that the different kinds of things are reported in
+KINDS = ("teacher", "lab", "stream", "course", "section", "block", "allocation")
+
+# separates a section number from its ordinal, when a course has sections with the same number
+SECTION_ORDINAL = "#"
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+# ============================================================================
+# a single difference
+# ============================================================================
+@dataclass
+class Change:
+    action: str
+    key: KEY
+    before: Optional[FIELDS] = None
+    after: Optional[FIELDS] = None
+
+    @property
+    def kind(self) -> str:
+        """teacher, lab, stream, course, section, block or allocation"""
+        return self.key[0]
+
+    def changed_fields(self) -> list[str]:
+        """which fields are different"""
+        if self.before is None or self.after is None:
+            return []
+        return [name for name in self.after if self.before.get(name) != self.after.get(name)]
+
+    def __str__(self):
+        text = f"{self.action} {describe_key(self.key)}"
+        if self.action == CHANGED:
+            text += ": " + "; ".join(f"{name} {self.before.get(name)} -> {self.after.get(name)}"
+                                     for name in self.changed_fields())
+        return text
+
+
+def describe_key(key: KEY) -> str:
+    """a readable description of the key"""
+    match key:
+        case ("block", course, section, day, start, ordinal):
+            text = f"block {course} section {section} {WeekDay(day).name} {get_clock_string_from_hours(start)}"
+            return text if ordinal == 0 else f"{text} ({ordinal + 1})"
+        case ("section", course, section):
+            return f"section {course} section {section}"
+        case ("allocation", course, section, teacher):
+            return f"allocation {course} section {section} {teacher}"
+        case _:
+            return " ".join(str(k) for k in key)
+
+
+# ============================================================================
+# index everything in a schedule
+# ============================================================================
+def index_schedule(schedule: Schedule) -> dict[KEY, FIELDS]:
+    """
+    All the objects in the schedule, keyed by their identity
+    :param schedule:
+    :return: dictionary of key -> values of the object's fields
+    """
+    index: dict[KEY, FIELDS] = {}
+
+    for teacher in schedule.teachers():
+        index[("teacher", teacher.number)] = {"firstname": teacher.firstname, "lastname": teacher.lastname,
+                                              "department": teacher.department, "release": teacher.release}
+    for lab in schedule.labs():
+        index[("lab", lab.number)] = {"description": lab.description,
+                                      "unavailable": tuple(sorted((s.day.value, float(s.start), s.duration, s.movable)
+                                                                  for s in lab.unavailable_slots()))}
+    for stream in schedule.streams():
+        index[("stream", stream.number)] = {"description": stream.description}
+
+    for course in schedule.courses():
+        index[("course", course.number)] = {"name": course.name, "semester": course.semester.name,
+                                            "hours_per_week": course.hours_per_week,
+                                            "needs_allocation": course.needs_allocation}
+        numbers_used: dict[str, int] = {}
+        for section in course.sections():
+            numbers_used[section.number] = numbers_used.get(section.number, 0) + 1
+            number = section.number
+            if numbers_used[number] > 1:
+                number = f"{number}{SECTION_ORDINAL}{numbers_used[number]}"
+
+            index[("section", course.number, number)] = {
+                "name": section.name, "num_students": section.num_students,
+                "streams": tuple(s.number for s in section.streams())}
+
+            # blocks in the same time slot are told apart by an ordinal, in the order of their fields
+            by_slot: dict[tuple[int, float], list[FIELDS]] = {}
+            for block in section.blocks():
+                by_slot.setdefault((block.day.value, block.start), []).append({
+                    "duration": block.duration, "movable": block.movable,
+                    "teachers": tuple(sorted(t.number for t in block.teachers())),
+                    "labs": tuple(sorted(lab.number for lab in block.labs()))})
+            for (day, start), blocks in by_slot.items():
+                blocks.sort(key=lambda f: (f["duration"], f["movable"], f["teachers"], f["labs"]))
+                for ordinal, fields in enumerate(blocks):
+                    index[("block", course.number, number, day, start, ordinal)] = fields
+
+            # only the explicit allocations, the teachers of the blocks are part of the blocks
+            for teacher in section.section_defined_teachers():
+                index[("allocation", course.number, number, teacher.number)] = {
+                    "hours": section.section_defined_allocation(teacher)}
+
+    return index
+
+
+# ============================================================================
+# diff
+# ============================================================================
+def diff_schedules(old: Schedule, new: Schedule) -> list[Change]:
+    """
+    What was added, removed or changed going from the old schedule to the new schedule
+    :param old:
+    :param new:
+    :return: the list of changes, teachers/labs/streams first, then courses, sections, blocks and allocations
+    """
+    return diff_indexes(index_schedule(old), index_schedule(new))
+
+
+def diff_indexes(old: dict[KEY, FIELDS], new: dict[KEY, FIELDS]) -> list[Change]:
+    """
+    What was added, removed or changed going from the old index to the new index
+    (see index_schedule)
+    """
+    changes: list[Change] = []
+    removed_blocks: dict[KEY, list[KEY]] = {}
+    added_blocks: dict[KEY, list[KEY]] = {}
+
+    for key, fields in old.items():
+        if key not in new:
+            if key[0] == "block":
+                removed_blocks.setdefault(key[1:3], []).append(key)
+            else:
+                changes.append(Change(REMOVED, key, before=fields))
+        elif new[key] != fields:
+            changes.append(Change(CHANGED, key, before=fields, after=new[key]))
+
+    for key, fields in new.items():
+        if key not in old:
+            if key[0] == "block":
+                added_blocks.setdefault(key[1:3], []).append(key)
+            else:
+                changes.append(Change(ADDED, key, after=fields))
+
+    # blocks are identified by their time slot, so a block that has moved looks like it was
+    # removed and another added ... if this happens in the same section, it is a changed block
+    for section_key in set(removed_blocks) | set(added_blocks):
+        removed = sorted(removed_blocks.get(section_key, []))
+        added = sorted(added_blocks.get(section_key, []))
+        for old_key, new_key in zip(removed, added):
+            before = dict(old[old_key], time=_slot(old_key))
+            after = dict(new[new_key], time=_slot(new_key))
+            changes.append(Change(CHANGED, old_key, before=before, after=after))
+        for old_key in removed[len(added):]:
+            changes.append(Change(REMOVED, old_key, before=old[old_key]))
+        for new_key in added[len(removed):]:
+            changes.append(Change(ADDED, new_key, after=new[new_key]))
+
+    changes.sort(key=lambda c: (KINDS.index(c.kind), c.key[1:], c.action))
+    return changes
+
+
+def section_number(number: str) -> str:
+    """the section number used in a key, without its ordinal (see index_schedule)"""
+    return number.split(SECTION_ORDINAL)[0]
+
+
+def _slot(block_key: KEY) -> str:
+    _, _, _, day, start, _ = block_key
+    return f"{WeekDay(day).name} {get_clock_string_from_hours(start)}"
@@ -0,0 +1,265 @@
+"""
+Check a schedule csv file for problems, without creating a schedule.
+
+The file is read in one pass, and only the current course/section/block is kept in memory,
+so many large files can be checked quickly.  Every problem is reported (with its line number),
+rather than stopping at the first one.
+
+SYNOPSIS
+
+    for msg in lint_file("fall.csv"):
+        print(msg)
+"""
+from __future__ import annotations
+
+import csv
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .enums import WeekDay, SemesterType
+from .section import blocks_for_allocation
+from .teacher import teacher_id_from_name
+
+ERROR = "ERROR"
+WARNING = "WARNING"
+
+
+# ============================================================================
+# what is reported
+# ============================================================================
+@dataclass
+class LintMessage:
+    line_number: int
+    level: str
+    message: str
+
+    def __str__(self):
+        return f"{self.level}: line {self.line_number}: {self.message}"
+
+
+# ============================================================================
+# what we need to remember while reading
+# ============================================================================
+@dataclass
+class _BlockInfo:
+    line_number: int
+    day: int
+    start: float
+    duration: float
+    teachers: set[str] = field(default_factory=set)
+    labs: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _SectionInfo:
+    line_number: int
+    number: str
+    blocks: list[_BlockInfo] = field(default_factory=list)
+
+
+@dataclass
+class _CourseInfo:
+    line_number: int
+    number: str
+    hours_per_week: float
+    needs_allocation: bool
+    section_numbers: set[str] = field(default_factory=set)
+    teachers: set[str] = field(default_factory=set)
+
+
+# ============================================================================
+# lint a file
+# ============================================================================
+def lint_file(file: str) -> list[LintMessage]:
+    """
+    Check a schedule csv file for problems
+    :param file: name of the file
+    :return: all the problems found, in line order
+    """
+    try:
+        with open(file, 'r', newline='') as f:
+            return lint_lines(f)
+    except OSError as e:
+        return [LintMessage(0, ERROR, f"Could not read {file}: {e}")]
+
+
+# ============================================================================
+# lint lines of csv text
+# ============================================================================
+def lint_lines(lines: Iterable[str]) -> list[LintMessage]:
+    """
+    Check the lines of a schedule csv file for problems
+    :param lines: the text of the csv file
+    :return: all the problems found, in line order
+    """
+    msgs: list[LintMessage] = []
+    teachers: set[str] = set()
+    labs: set[str] = set()
+    streams: set[str] = set()
+
+    current_type: Optional[str] = None
+    course: Optional[_CourseInfo] = None
+    section: Optional[_SectionInfo] = None
+    block: Optional[_BlockInfo] = None
+
+    def error(line: int, msg: str):
+        msgs.append(LintMessage(line, ERROR, msg))
+
+    def warning(line: int, msg: str):
+        msgs.append(LintMessage(line, WARNING, msg))
+
+    def end_section():
+        """same checks as Schedule.validate, for blocks and sections"""
+        if course is None or section is None:
+            return
+        for b in section.blocks:
+            if len(b.teachers) == 0:
+                error(b.line_number, f"{course.number}, section {section.number}: block has no assigned teachers")
+            if len(b.labs) == 0:
+                warning(b.line_number, f"{course.number}, section {section.number}: block has no assigned labs")
+            course.teachers.update(b.teachers)
+
+        duration = sum(b.duration for b in section.blocks)
+        if duration != course.hours_per_week:
+            error(section.line_number, f"{course.number}, section {section.number}: course hours "
+                                       f"({course.hours_per_week}) does not match assigned class time ({duration})")
+
+    def end_course():
+        """same checks as Schedule.validate, for courses"""
+        end_section()
+        if course is not None and course.needs_allocation and len(course.teachers) == 0:
+            error(course.line_number, f"Course {course.number} has no teachers")
+
+    def check_day(line: int, day: str) -> int:
+        week_day = WeekDay.get_from_string(day)
+        if week_day is None:
+            error(line, f"'{day}' is not a valid day")
+            return 0
+        return week_day.value
+
+    line_number = 0
+    for line_number, row in enumerate(csv.reader(lines, delimiter=',', quotechar='|',
+                                                 quoting=csv.QUOTE_MINIMAL), start=1):
+        if not row or row[0] == "":
+            continue
+
+        try:
+            match row[0]:
+                # -------------------------------------------------------------
+                # collections (teachers, labs, streams)
+                # -------------------------------------------------------------
+                case "lab":
+                    labs.add(row[1])
+                    current_type = "lab"
+
+                case "unavailable":
+                    if current_type != "lab":
+                        error(line_number, "unavailable time is not for a lab")
+                    (day, start, duration, movable) = row[1:5]
+                    check_day(line_number, day)
+                    float(start), float(duration), int(movable)
+
+                case "stream":
+                    streams.add(row[1])
+                    current_type = "stream"
+
+                case "teacher":
+                    (_, fname, lname, _, release) = row[1:6]
+                    teachers.add(teacher_id_from_name(fname, lname))
+                    float(release)
+                    current_type = "teacher"
+
+                # -------------------------------------------------------------
+                # courses/sections/blocks
+                # -------------------------------------------------------------
+                case "course":
+                    end_course()
+                    course, section, block = None, None, None
+                    (number, _, semester, allocation, hours) = row[1:6]
+                    SemesterType(int(semester))
+                    course = _CourseInfo(line_number, number, float(hours), bool(int(allocation)))
+
+                case "section":
+                    if course is None:
+                        error(line_number, "section is not part of a course")
+                        continue
+                    end_section()
+                    block = None
+                    (number, _, students) = row[2:5]
+                    if number != "" and number in course.section_numbers:
+                        error(line_number, f"{course.number}: section number {number} is not unique")
+                    course.section_numbers.add(number)
+                    section = _SectionInfo(line_number, number)
+                    int(students)
+
+                case "add_stream":
+                    if section is None:
+                        error(line_number, "stream is not added to a section")
+                    elif row[1] not in streams:
+                        error(line_number, f"unknown stream '{row[1]}'")
+
+                case "add_section_teacher":
+                    if section is None:
+                        error(line_number, "teacher is not added to a section")
+                        continue
+                    if row[1] not in teachers:
+                        error(line_number, f"unknown teacher '{row[1]}'")
+                        continue
+                    for b in section.blocks:
+                        b.teachers.add(row[1])
+                    if len(row) > 2 and row[2] != '':
+                        _set_teacher_allocation(section, row[1], float(row[2]))
+
+                case "add_block":
+                    if section is None:
+                        error(line_number, "block is not part of a section")
+                        continue
+                    (day, start, duration, movable) = row[2:6]
+                    week_day = check_day(line_number, day)
+                    int(movable)
+                    block = _BlockInfo(line_number, week_day, float(start), float(duration))
+                    section.blocks.append(block)
+
+                case "add_block_teacher":
+                    if block is None:
+                        error(line_number, "teacher is not added to a block")
+                    elif row[1] not in teachers:
+                        error(line_number, f"unknown teacher '{row[1]}'")
+                    else:
+                        block.teachers.add(row[1])
+
+                case "add_lab":
+                    if block is None:
+                        error(line_number, "lab is not added to a block")
+                    elif row[1] not in labs:
+                        error(line_number, f"unknown lab '{row[1]}'")
+                    else:
+                        block.labs.add(row[1])
+
+                case _:
+                    warning(line_number, f"unknown row type '{row[0]}' is ignored")
+
+        except (ValueError, IndexError) as e:
+            error(line_number, f"badly formed {row[0]} ({e}): {row}")
+
+    end_course()
+    msgs.sort(key=lambda m: m.line_number)
+    return msgs
+
+
+# ============================================================================
+# which blocks will a teacher be assigned to (the same as Section.set_teacher_allocation)
+# ============================================================================
+def _set_teacher_allocation(section: _SectionInfo, teacher: str, hours: float):
+    """
+    Setting the allocation of a section will add or remove the teacher from blocks, so the
+    same thing has to be done here to know if the blocks have teachers
+    """
+    blocks = sorted(section.blocks, key=lambda b: (b.day, b.start, b.duration))
+    for b in blocks:
+        b.teachers.discard(teacher)
+
+    if hours == 0:
+        return
+    for b in blocks_for_allocation(hours, blocks, lambda b: len(b.teachers) != 0) or ():
+        b.teachers.add(teacher)
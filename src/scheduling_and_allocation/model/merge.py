@@ -0,0 +1,235 @@
+"""
+Three-way merge of schedules that were edited at the same time.
+
+The base, ours and theirs schedules are indexed by key (see diff.index_schedule), and each
+key is merged field by field.  If both sides changed the same field differently, then our
+change is kept, and the conflict is reported.
+
+SYNOPSIS
+
+    merged, conflicts = merge_files("fall_base.csv", "fall_labs.csv", "fall_teachers.csv")
+    for conflict in conflicts:
+        print(conflict)
+    merged.write_file("fall.csv")
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .diff import index_schedule, describe_key, section_number, KEY, FIELDS
+from .enums import WeekDay, SemesterType
+from .time_slot import TimeSlot
+from .schedule import Schedule, load_many
+from .section import Section
+
+
+# ============================================================================
+# something that was changed on both sides
+# ============================================================================
+@dataclass
+class MergeConflict:
+    key: KEY
+    field: Optional[str]
+    base: Any
+    ours: Any
+    theirs: Any
+
+    # what happened, if it can not be described by the three values
+    message: str = ""
+
+    def __str__(self):
+        what = describe_key(self.key) if self.field is None else f"{describe_key(self.key)} {self.field}"
+        if self.message:
+            return f"CONFLICT {what}: {self.message}"
+        return f"CONFLICT {what}: base {self.base}, ours {self.ours}, theirs {self.theirs} (kept ours)"
+
+
+# ============================================================================
+# merge
+# ============================================================================
+def merge_files(base_file: str, ours_file: str, theirs_file: str) -> tuple[Schedule, list[MergeConflict]]:
+    """
+    Read and merge three schedule files (the files are read in parallel, and the conflicts are
+    only calculated for the merged schedule)
+    :return: the merged schedule, and a list of conflicts
+    """
+    base, ours, theirs = load_many((base_file, ours_file, theirs_file), calculate_conflicts=False)
+    return merge_schedules(base, ours, theirs)
+
+
+def merge_schedules(base: Schedule, ours: Schedule, theirs: Schedule) -> tuple[Schedule, list[MergeConflict]]:
+    """
+    Merge the changes made in 'ours' and 'theirs', both of which started as 'base'
+    :return: the merged schedule, and a list of conflicts
+    """
+    merged_index, conflicts = merge_indexes(index_schedule(base), index_schedule(ours), index_schedule(theirs))
+    schedule = schedule_from_index(merged_index, conflicts)
+    schedule.calculate_conflicts()
+    return schedule, conflicts
+
+
+def merge_indexes(base: dict[KEY, FIELDS], ours: dict[KEY, FIELDS],
+                  theirs: dict[KEY, FIELDS]) -> tuple[dict[KEY, FIELDS], list[MergeConflict]]:
+    """
+    Three-way merge of indexed schedules
+    :return: the merged index, and a list of conflicts
+    """
+    merged: dict[KEY, FIELDS] = {}
+    conflicts: list[MergeConflict] = []
+
+    for key in sorted(set(base) | set(ours) | set(theirs), key=_sort_key):
+        b, o, t = base.get(key), ours.get(key), theirs.get(key)
+
+        if o == t:
+            result = o
+        elif o == b:
+            result = t
+        elif t == b:
+            result = o
+
+        # one side removed it, the other side changed it
+        elif o is None or t is None:
+            conflicts.append(MergeConflict(key, None, b, o, t))
+            result = o
+
+        # both sides changed it, merge field by field
+        else:
+            result = {}
+            b = b if b is not None else {}
+            for name in o:
+                bf, of, tf = b.get(name), o.get(name), t.get(name)
+                if of == tf or tf == bf:
+                    result[name] = of
+                elif of == bf:
+                    result[name] = tf
+                else:
+                    conflicts.append(MergeConflict(key, name, bf, of, tf))
+                    result[name] = of
+
+        if result is not None:
+            merged[key] = result
+
+    _remove_orphans(merged, ours, theirs, conflicts)
+    return merged, conflicts
+
+
+# what each kind of thing belongs to
+_PARENTS = {"section": lambda key: ("course", key[1]),
+            "block": lambda key: ("section", key[1], key[2]),
+            "allocation": lambda key: ("section", key[1], key[2])}
+
+
+def _remove_orphans(merged: dict[KEY, FIELDS], ours: dict[KEY, FIELDS], theirs: dict[KEY, FIELDS],
+                    conflicts: list[MergeConflict]):
+    """
+    One side removed a course (or section) while the other side added or changed something in it,
+    so the merge has sections (or blocks/allocations) that do not belong to anything
+    """
+    for kind in ("section", "block", "allocation"):
+        for key in [k for k in merged if k[0] == kind]:
+            parent = _PARENTS[kind](key)
+            if parent in merged:
+                continue
+            removed_by = [side for side, index in (("ours", ours), ("theirs", theirs)) if parent not in index]
+            kept_by = [side for side, index in (("ours", ours), ("theirs", theirs)) if key in index]
+            conflicts.append(MergeConflict(
+                key, parent[0], None, ours.get(key), theirs.get(key),
+                message=f"{describe_key(parent)} was removed in {' and '.join(removed_by)}, "
+                        f"but {' and '.join(kept_by)} still has {describe_key(key)} (removed)"))
+            del merged[key]
+
+
+def _sort_key(key: KEY):
+    return key[0], tuple(str(k) for k in key[1:])
+
+
+# ============================================================================
+# create a schedule from an index
+# ============================================================================
+def schedule_from_index(index: dict[KEY, FIELDS], conflicts: Optional[list[MergeConflict]] = None) -> Schedule:
+    """
+    Create a schedule from indexed data (see diff.index_schedule)
+    :param index:
+    :param conflicts: if defined, anything that could not be added to the schedule is added to this list
+    """
+    conflicts = conflicts if conflicts is not None else []
+    schedule = Schedule()
+
+    def by_kind(kind: str):
+        return sorted(((k, v) for k, v in index.items() if k[0] == kind), key=lambda kv: _sort_key(kv[0]))
+
+    # resources
+    for (_, number), fields in by_kind("teacher"):
+        schedule.add_update_teacher(fields["firstname"], fields["lastname"], fields["department"],
+                                    fields["release"], teacher_id=number)
+    for (_, number), fields in by_kind("lab"):
+        lab = schedule.add_update_lab(number, fields["description"])
+        for day, start, duration, movable in fields["unavailable"]:
+            lab.add_unavailable_slot(TimeSlot(WeekDay(day), start, duration, movable))
+    for (_, number), fields in by_kind("stream"):
+        schedule.add_update_stream(number, fields["description"])
+
+    # courses and sections
+    for (_, number), fields in by_kind("course"):
+        schedule.add_update_course(number, fields["name"], SemesterType[fields["semester"]],
+                                   fields["hours_per_week"], fields["needs_allocation"])
+
+    # the sections, by the course and section numbers used in the keys
+    # (sections with the same number as another are added last, and then renumbered, because a
+    # course will not add a section with a number that it already has)
+    sections: dict[tuple[str, str], Section] = {}
+    for key, fields in sorted(by_kind("section"), key=lambda kv: section_number(kv[0][2]) != kv[0][2]):
+        _, course_number, number = key
+        course = schedule.get_course_by_number(course_number)
+        if course is None:
+            conflicts.append(MergeConflict(key, "course", None, None, None,
+                                           message=f"course {course_number} does not exist (section not added)"))
+            continue
+        if section_number(number) == number:
+            section = course.add_section(number, fields["name"])
+        else:
+            section = course.add_section("", fields["name"])
+            section.number = section_number(number)
+        sections[course_number, number] = section
+        section.num_students = fields["num_students"]
+        for stream_number in fields["streams"]:
+            stream = schedule.get_stream_by_number(stream_number)
+            if stream is not None:
+                section.add_stream(stream)
+
+    # blocks
+    for key, fields in by_kind("block"):
+        _, course_number, number, day, start, _ = key
+        section = sections.get((course_number, number))
+        if section is None:
+            conflicts.append(MergeConflict(key, "section", None, None, None,
+                                           message=f"section {course_number} section {number} "
+                                                   f"does not exist (block not added)"))
+            continue
+        block = section.add_block(WeekDay(day), start, fields["duration"], fields["movable"])
+        for teacher_number in fields["teachers"]:
+            teacher = schedule.get_teacher_by_number(teacher_number)
+            if teacher is None:
+                conflicts.append(MergeConflict(key, "teachers", None, teacher_number, None))
+            else:
+                block.add_teacher(teacher)
+        for lab_number in fields["labs"]:
+            lab = schedule.get_lab_by_number(lab_number)
+            if lab is None:
+                conflicts.append(MergeConflict(key, "labs", None, lab_number, None))
+            else:
+                block.add_lab(lab)
+
+    # allocations that are not defined by the teachers in the blocks (the blocks are not changed)
+    for key, fields in by_kind("allocation"):
+        _, course_number, number, teacher_number = key
+        section = sections.get((course_number, number))
+        teacher = schedule.get_teacher_by_number(teacher_number)
+        if section is None or teacher is None:
+            conflicts.append(MergeConflict(key, "hours", None, fields["hours"], None))
+            continue
+        section.set_section_defined_allocation(teacher, fields["hours"])
+
+    return schedule
+
@@ -0,0 +1,178 @@
+"""
+What-if allocation scenarios for a schedule.
+
+A scenario only remembers the allocations (hours for a teacher in a section) that are different
+from the schedule, so the courses, sections and blocks are shared with the schedule, and a
+scenario that is forked from another shares the other scenario's allocations until they are
+changed (copy-on-write).
+
+Switching to a scenario sets its allocations in the schedule (remembering the allocations and
+block teachers of each section that it changes), and switching back to the schedule puts exactly
+those back, so the schedule is never changed by a scenario.
+
+SYNOPSIS
+
+    scenarios = ScenarioSet(schedule)
+    fred = scenarios.new("Fred takes 420-ABC")
+    fred.set_teacher_allocation(section, fred_teacher, 3)
+    betty = scenarios.fork("Fred takes 420-ABC", "Betty takes 420-ABC")
+    betty.set_teacher_allocation(section, fred_teacher, 0)
+    betty.set_teacher_allocation(section, betty_teacher, 3)
+
+    scenarios.switch_to("Betty takes 420-ABC")      # the schedule now has Betty's allocations
+    scenarios.switch_to(None)                       # back to the original schedule
+"""
+from __future__ import annotations
+
+from collections import ChainMap
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .schedule import Schedule
+    from .section import Section
+    from .teacher import Teacher
+
+ALLOCATION_KEY = tuple  # (Section, Teacher)
+SECTION_SNAPSHOT = tuple  # what Section.allocation_snapshot returns
+
+
+# ============================================================================
+# a single scenario
+# ============================================================================
+class Scenario:
+    """Allocations that are different from the schedule"""
+
+    def __init__(self, name: str, scenarios: ScenarioSet, parent: Optional[Scenario] = None):
+        """
+        :param name:
+        :param scenarios: the set of scenarios that this scenario belongs to
+        :param parent: the scenario that this scenario starts from
+        """
+        self.name = name
+        self._scenarios = scenarios
+        if parent is None:
+            self._allocations: ChainMap[ALLOCATION_KEY, float] = ChainMap({})
+        else:
+            # the parent's allocations so far are shared, changes are made to new dictionaries
+            parent._allocations = parent._allocations.new_child()
+            self._allocations = ChainMap({}, *parent._allocations.maps[1:])
+
+    # -------------------------------------------------------------------------
+    # allocations
+    # -------------------------------------------------------------------------
+    def set_teacher_allocation(self, section: Section, teacher: Teacher, hours: float):
+        """Set the teacher's hours for this section (if this scenario is active, the schedule is changed too)"""
+        self._allocations[section, teacher] = hours
+        if self._scenarios.active is self:
+            self._scenarios.set_schedule_allocation(section, teacher, hours)
+
+    def get_teacher_allocation(self, section: Section, teacher: Teacher) -> float:
+        """The teacher's hours for this section in this scenario"""
+        key = (section, teacher)
+        if key in self._allocations:
+            return self._allocations[key]
+        return self._scenarios.original_allocation(section, teacher)
+
+    def allocations(self) -> dict[ALLOCATION_KEY, float]:
+        """All the allocations that are different from the schedule, (section, teacher) -> hours"""
+        return dict(self._allocations)
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"Scenario({self.name!r})"
+
+
+# ============================================================================
+# all the scenarios for a schedule
+# ============================================================================
+class ScenarioSet:
+    """The scenarios of a schedule, and which one (if any) is currently set in the schedule"""
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+        self._scenarios: dict[str, Scenario] = {}
+        self._active: Optional[Scenario] = None
+
+        # the original allocations and block teachers of the sections changed by the active scenario
+        self._original: dict[Section, SECTION_SNAPSHOT] = {}
+
+    # -------------------------------------------------------------------------
+    # creating scenarios
+    # -------------------------------------------------------------------------
+    def new(self, name: str) -> Scenario:
+        """A new scenario, starting with the schedule's allocations"""
+        return self._add(Scenario(name, self))
+
+    def fork(self, from_name: str, name: str) -> Scenario:
+        """A new scenario, starting with the allocations of another scenario"""
+        return self._add(Scenario(name, self, parent=self._scenarios[from_name]))
+
+    def _add(self, scenario: Scenario) -> Scenario:
+        if scenario.name in self._scenarios:
+            raise ValueError(f"There is already a scenario called '{scenario.name}'")
+        self._scenarios[scenario.name] = scenario
+        return scenario
+
+    def remove(self, name: str):
+        if self._active is not None and self._active.name == name:
+            self.switch_to(None)
+        self._scenarios.pop(name, None)
+
+    # -------------------------------------------------------------------------
+    # getting scenarios
+    # -------------------------------------------------------------------------
+    def __getitem__(self, name: str) -> Scenario:
+        return self._scenarios[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._scenarios
+
+    def __iter__(self):
+        return iter(self._scenarios.values())
+
+    def names(self) -> list[str]:
+        return list(self._scenarios.keys())
+
+    @property
+    def active(self) -> Optional[Scenario]:
+        """the scenario whose allocations are in the schedule, None if the schedule is not changed"""
+        return self._active
+
+    # -------------------------------------------------------------------------
+    # switch scenarios
+    # -------------------------------------------------------------------------
+    def switch_to(self, name: Optional[str]):
+        """
+        Set the allocations of the scenario in the schedule
+        :param name: the name of the scenario, None for the original schedule
+        """
+        scenario = self._scenarios[name] if name is not None else None
+        if scenario is self._active:
+            return
+
+        # put back the original allocations (exactly as they were)
+        for section, snapshot in self._original.items():
+            section.restore_allocation_snapshot(snapshot)
+        self._original.clear()
+        self._active = scenario
+
+        if scenario is not None:
+            for (section, teacher), hours in scenario.allocations().items():
+                self.set_schedule_allocation(section, teacher, hours)
+
+    def set_schedule_allocation(self, section: Section, teacher: Teacher, hours: float):
+        """change the allocation in the schedule, remembering what the original was"""
+        if section not in self._original:
+            self._original[section] = section.allocation_snapshot()
+        if section.get_teacher_allocation(teacher) != hours:
+            section.set_teacher_allocation(teacher, hours)
+
+    def original_allocation(self, section: Section, teacher: Teacher) -> float:
+        """the allocation in the schedule when there is no active scenario"""
+        if section not in self._original:
+            return section.get_teacher_allocation(teacher)
+        allocations, block_teachers = self._original[section]
+        return allocations.get(teacher, 0) + sum(b.duration for b, teachers in block_teachers.items()
+                                                 if teacher in teachers)
@@ -3,8 +3,14 @@ The over-arching class that contains ALL the information for scheduler and alloc
 """
 from __future__ import annotations
 
+import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from os import path
-from typing import Optional
+from pickle import PicklingError
+from typing import Optional, Iterable
+
+from ..Utilities.id_generator import IdGenerator
 
 from .exceptions import CouldNotWriteFileError, CouldNotReadFileError
 
@@ -17,7 +23,8 @@ from .section import Section
 from .enums import ConflictType
 from .conflicts import (set_block_conflicts, set_lunch_break_conflicts,
                         set_number_of_days_conflict, set_availability_hours_conflict, block_conflicts_time,
-                        has_lunch_break_conflict, has_number_of_days_conflict, has_availability_hours_conflict)
+                        has_lunch_break_conflict, has_number_of_days_conflict, has_availability_hours_conflict,
+                        drop_target_conflicts)
 from .enums import ResourceType, SemesterType
 from .serializor import CSVSerializor as Serializor
 
@@ -50,33 +57,79 @@ class Schedule:
         self._courses: dict[str, Course] = dict()
         self.filename = ""
 
+        # ids of sections and blocks are unique within this schedule only
+        self.section_ids = IdGenerator()
+        self.block_ids = IdGenerator()
+
+        # what the schedule looked like when it was last read or written
+        self._saved_file: Optional[str] = None
+        self._saved_fingerprint: str = self.fingerprint()
+
         if file is not None:
             self.read_file(file)
 
     # ------------------------------------------------------------------------
     # read file
     # ------------------------------------------------------------------------
-    def read_file(self, file):
-        """read a csv file containing the schedule info"""
+    def read_file(self, file, text: Optional[str] = None, calculate_conflicts: bool = True):
+        """read a csv file containing the schedule info
+        :param file: the name of the file
+        :param text: the contents of the file, if it has already been read
+        :param calculate_conflicts: find the conflicts once the schedule has been read
+        """
         try:
-            Serializor.read_file(self, file)
+            if text is None:
+                Serializor.read_file(self, file, calculate_conflicts)
+            else:
+                Serializor.read_lines(self, text.splitlines(keepends=True), calculate_conflicts)
         except Exception as e:
+            line_number, line = Serializor.last_line_read()
             msg = (f"Could not read\n {file}\n\n"
-                   f"Line {Serializor.last_line_number_read}: {Serializor.last_line_read}\n\n"
+                   f"Line {line_number}: {line}\n\n"
                    f"Error Message: {e}")
             raise CouldNotReadFileError(msg)
         self.filename = path.basename(file)
+        self._saved_file = path.abspath(file)
+        self._saved_fingerprint = self.fingerprint()
 
     # ------------------------------------------------------------------------
     # write file
     # ------------------------------------------------------------------------
-    def write_file(self, file):
-        """write to a csv file all the info about the schedule"""
+    def write_file(self, file, force: bool = False) -> bool:
+        """write to a csv file all the info about the schedule
+        :param file:
+        :param force: write the file even if nothing has changed since it was last read/written
+        :return: True if the file was written
+        """
         try:
-            Serializor.write(self, file)
+            text = Serializor.to_text(self)
+            fingerprint = self._fingerprint_of(text)
+            if (not force and fingerprint == self._saved_fingerprint
+                    and path.abspath(file) == self._saved_file and path.exists(file)):
+                return False
+            with open(file, 'w', newline='') as f:
+                f.write(text)
         except Exception as e:
             raise CouldNotWriteFileError(f"Could not read {file}, {e}")
         self.filename = path.basename(file)
+        self._saved_file = path.abspath(file)
+        self._saved_fingerprint = fingerprint
+        return True
+
+    # ------------------------------------------------------------------------
+    # has the schedule changed?
+    # ------------------------------------------------------------------------
+    def fingerprint(self) -> str:
+        """a hash of the contents of the schedule (the same contents give the same hash)"""
+        return self._fingerprint_of(Serializor.to_text(self))
+
+    @staticmethod
+    def _fingerprint_of(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def is_changed(self) -> bool:
+        """has the schedule changed since it was last read or written"""
+        return self.fingerprint() != self._saved_fingerprint
 
     # ------------------------------------------------------------------------
     # add/update course
@@ -93,7 +146,8 @@ class Schedule:
         """
         original_course: Course = self.get_course_by_number(number)
         if original_course is None:
-            course: Course = Course(number, name, semester, hours, needs_allocation)
+            course: Course = Course(number, name, semester, hours, needs_allocation,
+                                    section_ids=self.section_ids, block_ids=self.block_ids)
             self._courses[course.number] = course
             return course
         else:
@@ -155,6 +209,9 @@ class Schedule:
             self._teachers[teacher.number] = teacher
             return teacher
         else:
+            if (original_teacher.firstname, original_teacher.lastname) != (firstname, lastname):
+                for block in self.get_blocks_for_teacher(original_teacher):
+                    block.mark_changed()
             original_teacher.firstname = firstname
             original_teacher.lastname = lastname
             original_teacher.department = department
@@ -410,6 +467,60 @@ class Schedule:
             if teacher.release == 0:
                 set_number_of_days_conflict(self.get_blocks_for_teacher(teacher))
 
+    # --------------------------------------------------------
+    def get_blocks_sharing_resources(self, block: Block) -> tuple[Block, ...]:
+        """Returns the blocks (including this one) that have a teacher, lab or stream in common with the block"""
+        blocks: set[Block] = {block}
+        for resource in (*block.teachers(), *block.labs(), *block.streams()):
+            blocks.update(self.get_blocks_for_obj(resource))
+        return tuple(blocks)
+
+    # --------------------------------------------------------
+    def calculate_conflicts_for(self, block: Block) -> tuple[Block, ...]:
+        """
+        Recalculates the conflicts of the blocks that can be affected by this block changing time
+        (conflicts for every other block must already be up-to-date)
+        :return: the blocks whose conflicts were recalculated
+        """
+        affected = self.get_blocks_sharing_resources(block)
+
+        # all the resources of the affected blocks have to be checked again.  Blocks that are not affected
+        # can only get conflicts that they already have
+        teachers = {t for b in affected for t in b.teachers()}
+        labs = {lab for b in affected for lab in b.labs()}
+        streams = {s for b in affected for s in b.streams()}
+
+        for b in affected:
+            b.conflict = ConflictType.NONE
+
+        for teacher in teachers:
+            set_block_conflicts(self.get_blocks_for_teacher(teacher), ConflictType.TIME_TEACHER)
+        for stream in streams:
+            set_block_conflicts(self.get_blocks_for_stream(stream), ConflictType.TIME_STREAM)
+        for lab in labs:
+            set_block_conflicts(self.get_blocks_in_lab(lab), ConflictType.TIME_LAB)
+
+        for teacher in teachers:
+            set_lunch_break_conflicts(self.get_blocks_for_teacher(teacher))
+            set_availability_hours_conflict(self.get_blocks_for_teacher(teacher))
+            if teacher.release == 0:
+                set_number_of_days_conflict(self.get_blocks_for_teacher(teacher))
+
+        return affected
+
+    # --------------------------------------------------------
+    def drop_target_conflicts(self, block: Block) -> dict[tuple[int, float], int]:
+        """
+        How many conflicts (time conflicts with its teachers, labs and streams, and missing lunch breaks
+        for its teachers) the block would have at every day and start time, without moving it
+        :return: (day, start) -> number of conflicts
+        """
+        teacher_blocks = [self.get_blocks_for_teacher(teacher) for teacher in block.teachers()]
+        resource_blocks = [*teacher_blocks,
+                           *(self.get_blocks_in_lab(lab) for lab in block.labs()),
+                           *(self.get_blocks_for_stream(stream) for stream in block.streams())]
+        return drop_target_conflicts(block, resource_blocks, teacher_blocks)
+
     # --------------------------------------------------------
     # get conflict for a specific resource
     # --------------------------------------------------------
@@ -592,3 +703,73 @@ class Schedule:
             section = course.add_section()
             self.update_section(section, "", teachers, labs, [], blocks)
 
+
+# ============================================================================
+# read many schedules at the same time
+# ============================================================================
+def _read_text(file: str) -> str:
+    """read the contents of a file (done in a thread)"""
+    try:
+        with open(file, 'r', newline='') as f:
+            return f.read()
+    except OSError as e:
+        raise CouldNotReadFileError(f"Could not read\n {file}\n\nError Message: {e}")
+
+
+def _parse_schedule(file: str, text: str, calculate_conflicts: bool = True) -> Schedule:
+    """create a schedule from the contents of a file (done in a separate process)"""
+    schedule = Schedule()
+    schedule.read_file(file, text, calculate_conflicts)
+    return schedule
+
+
+def load_many(files: Iterable[str], return_exceptions: bool = False,
+              use_processes: bool = True, calculate_conflicts: bool = True) -> list[Schedule | CouldNotReadFileError]:
+    """
+    Read several schedule files in parallel.  The files are read in a thread pool, and parsed
+    in a process pool, so it should take about as long as the largest file.
+    :param files: the files to read
+    :param return_exceptions: if True, files that cannot be read return the exception instead
+    of a schedule, otherwise the first error is raised
+    :param use_processes: parse in a process pool (else parse in the thread pool)
+    :param calculate_conflicts: find the conflicts of each schedule once it has been read
+    :return: the schedules, in the same order as the files
+    """
+    files = list(files)
+    if not files:
+        return []
+
+    def _result(future) -> Schedule | CouldNotReadFileError:
+        try:
+            return future.result()
+        except CouldNotReadFileError as e:
+            if return_exceptions:
+                return e
+            raise
+
+    with ThreadPoolExecutor(max_workers=len(files)) as threads:
+        texts = [threads.submit(_read_text, file) for file in files]
+
+        # no point starting up other processes for only one file
+        if use_processes and len(files) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=len(files)) as processes:
+                    parsed = [_submit_parse(processes, file, text, calculate_conflicts)
+                              for file, text in zip(files, texts)]
+                    return [_result(future) for future in parsed]
+            except (BrokenProcessPool, PicklingError, OSError):
+                pass
+
+        parsed = [_submit_parse(threads, file, text, calculate_conflicts) for file, text in zip(files, texts)]
+        return [_result(future) for future in parsed]
+
+
+def _submit_parse(executor, file: str, text_future, calculate_conflicts: bool = True):
+    """parse the file once it has been read, passing along any read errors"""
+    try:
+        text = text_future.result()
+    except CouldNotReadFileError as e:
+        future = Future()
+        future.set_exception(e)
+        return future
+    return executor.submit(_parse_schedule, file, text, calculate_conflicts)
@@ -1,7 +1,8 @@
 
 from __future__ import annotations
 import re
-from typing import TYPE_CHECKING, Optional
+from itertools import count
+from typing import TYPE_CHECKING, Optional, Sequence, Callable, TypeVar
 from ..Utilities.id_generator import IdGenerator
 from . import WeekDay
 from .block import Block, DEFAULT_DURATION, DEFAULT_START, DEFAULT_DAY
@@ -18,6 +19,12 @@ DEFAULT_HOURS = 3
 
 section_ids = IdGenerator()
 
+# anything with a duration (a Block, or the block info used when checking a file)
+B = TypeVar("B")
+
+# version numbers are never reused, so they are unique across all sections
+_versions = count()
+
 
 def _validate_hours(hours: float) -> float:
     if hours <= 0:
@@ -25,6 +32,48 @@ def _validate_hours(hours: float) -> float:
     return hours
 
 
+# ============================================================================
+# which blocks should a teacher be assigned to, to be allocated some hours
+# ============================================================================
+def blocks_for_allocation(hours: float, blocks: Sequence[B], has_teachers: Callable[[B], bool]) -> Optional[list[B]]:
+    """
+    Find blocks whose durations add up to the hours (blocks that do not have teachers are preferred)
+    :param hours: the teacher's hours for the section
+    :param blocks: the section's blocks, in time order (without the teacher)
+    :param has_teachers: does a block already have teachers
+    :return: the blocks, or None if no combination of blocks adds up to the hours
+    """
+    if hours == sum(b.duration for b in blocks):
+        return list(blocks)
+
+    possible_paths: list[str] = []
+    _find_block_fit_for_allocation(hours, blocks, "", possible_paths)
+    if len(possible_paths) == 0:
+        return None
+
+    chosen = possible_paths[0]
+    for pp in possible_paths:
+        if not any(has_teachers(b) for tf, b in zip(pp, blocks) if tf == "T"):
+            chosen = pp
+            break
+    return [b for tf, b in zip(chosen, blocks) if tf == "T"]
+
+
+def _find_block_fit_for_allocation(hours: float, blocks: Sequence[B], path: str, possible_paths: list[str]):
+    if hours == 0:
+        possible_paths.append(path)
+        return
+    if len(blocks) == 0:
+        return
+
+    block, *blocks = blocks
+    if hours >= block.duration:
+        _find_block_fit_for_allocation(hours - block.duration, blocks, path + "T", possible_paths)
+
+    if hours <= sum(b.duration for b in blocks):
+        _find_block_fit_for_allocation(hours, blocks, path + "F", possible_paths)
+
+
 # ============================================================================
 # Section
 # ============================================================================
@@ -38,23 +87,26 @@ class Section:
     # CONSTRUCTOR
     # -------------------------------------------------------------------------
     def __init__(self, course: Course, number: str = "", name: str = "",
-                 section_id: Optional[int] = None):
+                 section_id: Optional[int] = None, section_ids: Optional[IdGenerator] = None):
         """
         Creates an instance of the Section class.
         :param number: The section's number.
         :param name:
+        :param section_ids: the id generator to use (defaults to the one shared by all sections)
         """
 
         self._streams: set[Stream] = set()
         self._allocation: dict[Teacher:float] = dict()
         self._blocks: set[Block] = set()
+        self._version = next(_versions)
 
         self.name = name
         self.number = number
         self.num_students: int = 0
         self.course = course
 
-        self._section_id = Section.section_ids.get_new_id(section_id)
+        section_ids = Section.section_ids if section_ids is None else section_ids
+        self._section_id = section_ids.get_new_id(section_id)
 
     # -------------------------------------------------------------------------
     # PROPERTIES
@@ -73,6 +125,29 @@ class Section:
         """ Gets the section's ID """
         return self._section_id
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._version = next(_versions)
+
+    @property
+    def number(self) -> str:
+        return self._number
+
+    @number.setter
+    def number(self, value: str):
+        self._number = value
+        self._version = next(_versions)
+
+    @property
+    def version(self) -> int:
+        """ Changes every time the name, number or streams of the section change (never reused) """
+        return self._version
+
     @property
     def title(self) -> str:
         """ Gets name if defined, otherwise 'Section num' """
@@ -103,7 +178,8 @@ class Section:
     def add_block(self, day: WeekDay | float = DEFAULT_DAY, start: float = DEFAULT_START,
                   duration: float = DEFAULT_DURATION, movable=True, block_id=None) -> Block:
         """ Creates and Assign a block to this section"""
-        block = Block(self, day, start, duration, movable=movable, block_id=block_id)
+        block = Block(self, day, start, duration, movable=movable, block_id=block_id,
+                      block_ids=self.course.block_ids)
         self._blocks.add(block)
         return block
 
@@ -191,6 +267,17 @@ class Section:
         teachers.update(self._allocation.keys())
         return tuple(sorted(teachers))
 
+    def section_defined_allocation(self, teacher: Teacher) -> float:
+        """the hours explicitly allocated to the teacher (not counting the blocks that the teacher is in)"""
+        return self._allocation.get(teacher, 0)
+
+    def set_section_defined_allocation(self, teacher: Teacher, hours: float):
+        """explicitly allocate hours to the teacher, without changing the teachers of the blocks"""
+        if hours:
+            self._allocation[teacher] = hours
+        else:
+            self._allocation.pop(teacher, None)
+
     def remove_allocation(self, teacher):
         self.remove_teacher(teacher)
         if teacher in self._allocation.keys():
@@ -217,40 +304,26 @@ class Section:
 
         # if number of hours is not equal to the total hours of the section,
         # try to find blocks to assign the teacher to
-        possible_paths = []
-        blocks = self.blocks()
-        self._find_block_fit_for_allocation(hours, blocks, "", possible_paths)
-
-        if len(possible_paths) != 0:
-            flag = False
-            for pp in possible_paths:
-                if all(len(b.teachers()) == 0 for tf, b in zip(pp, blocks) if tf == "T"):
-                    for block in (b for tf, b in zip(pp, blocks) if tf == "T"):
-                        block.add_teacher(teacher)
-                    flag = True
-                    break
-            if not flag:
-                for block in (b for tf, b in zip(possible_paths[0], blocks) if tf == "T"):
-                    block.add_teacher(teacher)
+        blocks = blocks_for_allocation(hours, self.blocks(), lambda b: len(b.teachers()) != 0)
+        if blocks is not None:
+            for block in blocks:
+                block.add_teacher(teacher)
         else:
             self._allocation[teacher] = hours
 
-    def _find_block_fit_for_allocation(self, hours, blocks, path="", possible_paths=None):
-        possible_paths = [] if possible_paths is None else possible_paths
-        if hours == 0:
-            possible_paths.append(path)
-            return
-        if len(blocks) == 0:
-            return
-
-        block, *blocks = blocks
-        if hours >= block.duration:
-            new_path = path + "T"
-            self._find_block_fit_for_allocation(hours - block.duration, blocks, new_path, possible_paths)
-
-        if hours <= sum((b.duration for b in blocks)):
-            new_path = path + "F"
-            self._find_block_fit_for_allocation(hours, blocks, new_path, possible_paths)
+    def allocation_snapshot(self) -> tuple[dict[Teacher, float], dict[Block, tuple[Teacher, ...]]]:
+        """the explicitly allocated hours, and the teachers of each block (see restore_allocation_snapshot)"""
+        return dict(self._allocation), {b: b.teachers() for b in self.blocks()}
+
+    def restore_allocation_snapshot(self, snapshot: tuple[dict[Teacher, float], dict[Block, tuple[Teacher, ...]]]):
+        """put back exactly what was in allocation_snapshot, without trying to fit teachers into blocks again"""
+        allocations, block_teachers = snapshot
+        self._allocation = dict(allocations)
+        for block, teachers in block_teachers.items():
+            if block in self._blocks and set(block.teachers()) != set(teachers):
+                block.remove_all_teachers()
+                for teacher in teachers:
+                    block.add_teacher(teacher)
 
     def has_allocated_teacher(self, teacher):
         return self.has_teacher(teacher) or teacher in self._allocation.keys()
@@ -279,10 +352,12 @@ class Section:
     def add_stream(self, stream: Stream):
         """ Assign streams to this section. """
         self._streams.add(stream)
+        self._version = next(_versions)
 
     def remove_stream(self, stream: Stream):
         """ Remove stream from this section. """
         self._streams.discard(stream)
+        self._version = next(_versions)
 
     def has_stream(self, stream: Stream) -> bool:
         """Check if a section has a stream """
@@ -291,6 +366,7 @@ class Section:
     def remove_all_streams(self):
         """ Removes all streams from this section """
         self._streams.clear()
+        self._version = next(_versions)
 
     # -------------------------------------------------------------------------
     # clear everything from the stream
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Any, Optional, TYPE_CHECKING, Iterable
 
 import csv
+import io
+import threading
 
 from . import TimeSlot
 from .enums import ResourceType, SemesterType
@@ -23,8 +25,8 @@ if TYPE_CHECKING:
 # TODO: not saving or reading synced blocks
 
 class CSVSerializor:
-    last_line_number_read:int  = -1
-    last_line_read:str = ""
+    # last line read is kept per thread, so that several files can be read at the same time
+    _last_read = threading.local()
 
     # ============================================================================
     # write csv file
@@ -33,86 +35,119 @@ class CSVSerializor:
     def write(schedule: Schedule, file: str):
         """Write all the details of the schedule to a file, throws an exception if the file cannot be written to"""
 
+        text = CSVSerializor.to_text(schedule)
         with open(file, 'w', newline='') as f:
-            w = csv.writer(f, delimiter=',',
-                           quotechar='|', quoting=csv.QUOTE_MINIMAL)
-
-            # --------------------------------------------------------------------
-            # write all the 'collectables' first
-            # --------------------------------------------------------------------
-            w.writerow([None, 'number', 'description'])
-            for lab in sorted(schedule.labs()):
-                w.writerow(["lab", lab.number, lab.description])
-                for unavail in lab.unavailable_slots():
-                    w.writerow(["unavailable", "", unavail.day, unavail.start, unavail.duration,
-                                int(unavail.movable)])
-            w.writerow([])
+            f.write(text)
 
-            w.writerow([None, 'number', 'description'])
-            for stream in sorted(schedule.streams()):
-                w.writerow(["stream", stream.number, stream.description])
-            w.writerow([])
+    # ============================================================================
+    # csv text (used for writing, and to see if the schedule has changed)
+    # ============================================================================
+    @staticmethod
+    def to_text(schedule: Schedule) -> str:
+        """All the details of the schedule as csv text"""
+
+        f = io.StringIO(newline='')
+        w = csv.writer(f, delimiter=',',
+                       quotechar='|', quoting=csv.QUOTE_MINIMAL)
+
+        # --------------------------------------------------------------------
+        # write all the 'collectables' first
+        # --------------------------------------------------------------------
+        w.writerow([None, 'number', 'description'])
+        for lab in sorted(schedule.labs()):
+            w.writerow(["lab", lab.number, lab.description])
+            for unavail in sorted(lab.unavailable_slots()):
+                w.writerow(["unavailable", "", unavail.day, unavail.start, unavail.duration,
+                            int(unavail.movable)])
+        w.writerow([])
+
+        w.writerow([None, 'number', 'description'])
+        for stream in sorted(schedule.streams()):
+            w.writerow(["stream", stream.number, stream.description])
+        w.writerow([])
+
+        w.writerow([None, 'number', 'first name', 'last name', 'department', 'release'])
+        for teacher in sorted(schedule.teachers(), key=lambda x: x.number):
+            w.writerow(
+                ["teacher", teacher.number, teacher.firstname, teacher.lastname,
+                 teacher.department, teacher.release])
+        w.writerow([])
+
+        # --------------------------------------------------------------------
+        # courses/sections/blocks
+        # --------------------------------------------------------------------
+        w.writerow([])
+        w.writerow([None, None, 'DESCRIPTION', 'OF', 'FIELDS'])
+        w.writerow([None, 'number', 'name', 'semester', 'needs allocation', 'hours_per_week', 'COURSE'])
+        w.writerow([None, 'id', 'number', 'name', 'students', 'SECTION'])
+        w.writerow([None, 'id', 'day', 'start', 'duration', 'movable', 'BLOCK'])
+        w.writerow([])
+        for course in sorted(schedule.courses()):
+            w.writerow(["course", course.number, course.name, course.semester.value,
+                        int(course.needs_allocation), course.hours_per_week])
+
+            for section in course.sections():
+                w.writerow([])
+                w.writerow(["section", None, section.number, section.name, section.num_students])
 
-            w.writerow([None, 'number', 'first name', 'last name', 'department', 'release'])
-            for teacher in sorted(schedule.teachers(), key=lambda x: x.number):
-                w.writerow(
-                    ["teacher", teacher.number, teacher.firstname, teacher.lastname,
-                     teacher.department, teacher.release])
-            w.writerow([])
+                for s in section.streams():
+                    w.writerow(["add_stream", s.number])
 
-            # --------------------------------------------------------------------
-            # courses/sections/blocks
-            # --------------------------------------------------------------------
-            w.writerow([])
-            w.writerow([None, None, 'DESCRIPTION', 'OF', 'FIELDS'])
-            w.writerow([None, 'number', 'name', 'semester', 'needs allocation', 'hours_per_week', 'COURSE'])
-            w.writerow([None, 'id', 'number', 'name', 'students', 'SECTION'])
-            w.writerow([None, 'id', 'day', 'start', 'duration', 'movable', 'BLOCK'])
-            w.writerow([])
-            for course in sorted(schedule.courses()):
-                w.writerow(["course", course.number, course.name, course.semester.value,
-                            int(course.needs_allocation), course.hours_per_week])
+                for block in section.blocks():
+                    w.writerow(["add_block", None, block.day.name, block.start,
+                                block.duration, int(block.movable)])
+                    for teacher in sorted(block.teachers(), key=lambda t: t.number):
+                        w.writerow(["add_block_teacher", teacher.number])
+                    for lab in sorted(block.labs(), key=lambda ll: ll.number):
+                        w.writerow(["add_lab", lab.number])
 
-                for section in course.sections():
+                if len(section.section_defined_teachers()) != 0:
                     w.writerow([])
-                    w.writerow(["section", None, section.number, section.name, section.num_students])
-
-                    for s in section.streams():
-                        w.writerow(["add_stream", s.number])
-
-                    for block in section.blocks():
-                        w.writerow(["add_block", None, block.day.name, block.start,
-                                    block.duration, int(block.movable)])
-                        for teacher in sorted(block.teachers(), key=lambda t: t.number):
-                            w.writerow(["add_block_teacher", teacher.number])
-                        for lab in sorted(block.labs(), key=lambda ll: ll.number):
-                            w.writerow(["add_lab", lab.number])
-
-                    if len(section.section_defined_teachers()) != 0:
-                        w.writerow([])
-                        w.writerow([None, None, None, 'assigne allocation, but not assigned to any blocks'])
-                        w.writerow([None, 'id', 'allocation'])
-                        for teacher in sorted(section.section_defined_teachers(), key=lambda t: t.number):
-                            w.writerow(["add_section_teacher", teacher.number, section.get_teacher_allocation(teacher)])
+                    w.writerow([None, None, None, 'assigne allocation, but not assigned to any blocks'])
+                    w.writerow([None, 'id', 'allocation'])
+                    for teacher in sorted(section.section_defined_teachers(), key=lambda t: t.number):
+                        w.writerow(["add_section_teacher", teacher.number, section.get_teacher_allocation(teacher)])
 
-                w.writerow([])
+            w.writerow([])
+        return f.getvalue()
 
     # ============================================================================
     # read from CSV file
     # ============================================================================
     @staticmethod
-    def read_file(schedule: Schedule, file: str):
+    def read_file(schedule: Schedule, file: str, calculate_conflicts: bool = True):
         """Parse the details of a schedule from a file, throws an exception if the file cannot be read from"""
 
-        CSVSerializor.last_line_number_read = -1
-        CSVSerializor.last_line_read = ""
-
         with open(file, 'r', newline='') as f:
-            reader = csv.reader(f, delimiter=',',
-                                quotechar='|', quoting=csv.QUOTE_MINIMAL)
-            CSVSerializor._parse_schedule_info(schedule, reader)
+            CSVSerializor.read_lines(schedule, f, calculate_conflicts)
+
+    # ============================================================================
+    # read from lines of text (already read from a file)
+    # ============================================================================
+    @staticmethod
+    def read_lines(schedule: Schedule, lines: Iterable[str], calculate_conflicts: bool = True):
+        """Parse the details of a schedule from lines of csv text
+        :param calculate_conflicts: find the conflicts once the schedule has been read
+        """
+
+        CSVSerializor._last_read.line_number = -1
+        CSVSerializor._last_read.row = ""
 
-        schedule.calculate_conflicts()
+        reader = csv.reader(lines, delimiter=',',
+                            quotechar='|', quoting=csv.QUOTE_MINIMAL)
+        CSVSerializor._parse_schedule_info(schedule, reader)
+
+        if calculate_conflicts:
+            schedule.calculate_conflicts()
+
+    # ============================================================================
+    # where were we when reading (for error messages)
+    # ============================================================================
+    @staticmethod
+    def last_line_read() -> tuple[int, str]:
+        """the line number and contents of the last line read (in this thread)"""
+        return (getattr(CSVSerializor._last_read, "line_number", -1),
+                getattr(CSVSerializor._last_read, "row", ""))
 
     # ============================================================================
     # parse the csv file from an iterable of lists
@@ -125,8 +160,8 @@ class CSVSerializor:
         block_obj: Optional[Block] = None
 
         for line_number, row in enumerate(reader, start=1):
-            CSVSerializor.last_line_number_read = line_number
-            CSVSerializor.last_line_read = row
+            CSVSerializor._last_read.line_number = line_number
+            CSVSerializor._last_read.row = row
 
             if not row or row[0] == "":
                 continue
@@ -2,6 +2,11 @@ from __future__ import annotations
 from .enums import ResourceType
 
 
+def teacher_id_from_name(firstname: str, lastname: str) -> str:
+    """the unique id of a teacher with this name"""
+    return f"{lastname}_{firstname}".replace(" ", "_")
+
+
 class Teacher:
     """Describes a teacher."""
 
@@ -20,8 +25,7 @@ class Teacher:
         self.department = department
         self.release = release
         self.resource_type = ResourceType.teacher
-        self._id = f"{self.lastname}_{self.firstname}"
-        self._id = self._id.replace(" ", "_")
+        self._id = teacher_id_from_name(firstname, lastname)
 
     # -------------------------------------------------------------------------
     # unique identifier
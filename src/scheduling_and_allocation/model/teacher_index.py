@@ -0,0 +1,95 @@
+"""
+Find the same teacher in the schedules of different semesters.
+
+Each semester is a different schedule, with different Teacher objects.  Teachers are matched
+by their teacher id (which is created from their name, ignoring case), and an optional alias
+table can be used when a teacher's name is written differently in different semesters.
+
+SYNOPSIS
+
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter},
+                         aliases={"Smith_Bob": "Smith_Robert"})
+    for semester, teacher in index.semesters(fall_teacher).items():
+        print(semester, teacher)
+"""
+from __future__ import annotations
+
+from typing import Any, Hashable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .schedule import Schedule
+    from .teacher import Teacher
+
+
+class TeacherIndex:
+    """Teachers of several schedules, indexed by their identity"""
+
+    # -------------------------------------------------------------------
+    # constructor
+    # --------------------------------------------------------------------
+    def __init__(self, schedules: Optional[dict[Hashable, Optional[Schedule]]] = None,
+                 aliases: Optional[dict[str, str]] = None):
+        """
+        :param schedules: schedule for each semester (semesters with no schedule are ignored)
+        :param aliases: alternate teacher id -> teacher id
+        """
+        self._aliases: dict[str, str] = {_normalize(alias): _normalize(teacher_id)
+                                         for alias, teacher_id in (aliases or {}).items()}
+        self._teachers: dict[str, dict[Hashable, Teacher]] = {}
+        for semester, schedule in (schedules or {}).items():
+            self.index_schedule(semester, schedule)
+
+    # -------------------------------------------------------------------------
+    # (re)index the teachers of a semester
+    # -------------------------------------------------------------------------
+    def index_schedule(self, semester: Hashable, schedule: Optional[Schedule]):
+        """
+        Replace the teachers for this semester with the teachers in the schedule
+        :param semester:
+        :param schedule: if None, the semester is removed from the index
+        """
+        for teachers in self._teachers.values():
+            teachers.pop(semester, None)
+        if schedule is not None:
+            for teacher in schedule.teachers():
+                self._teachers.setdefault(self.identity(teacher), {})[semester] = teacher
+
+    # -------------------------------------------------------------------------
+    # lookups
+    # -------------------------------------------------------------------------
+    def identity(self, teacher: Teacher | str) -> str:
+        """The id used to match this teacher (or teacher id) in all semesters"""
+        teacher_id = _normalize(teacher if isinstance(teacher, str) else teacher.teacher_id)
+        return self._aliases.get(teacher_id, teacher_id)
+
+    def semesters(self, teacher: Teacher | str) -> dict[Hashable, Teacher]:
+        """The teacher objects for this teacher, for each semester that they are in"""
+        return dict(self._teachers.get(self.identity(teacher), {}))
+
+    def teacher_in(self, teacher: Teacher | str, semester: Hashable) -> Optional[Teacher]:
+        """The teacher object in the specified semester that is the same teacher"""
+        return self._teachers.get(self.identity(teacher), {}).get(semester)
+
+    def identities(self) -> list[str]:
+        """The identities of all the teachers in all the semesters"""
+        return sorted(self._teachers.keys())
+
+    # -------------------------------------------------------------------------
+    # combine values for the same teacher
+    # -------------------------------------------------------------------------
+    def totals(self, *values: dict[Teacher, Any]) -> dict[str, Any]:
+        """
+        Add up values (like CI) that are for different semesters, for each teacher
+        :param values: a dictionary of teacher -> value, for any number of semesters
+        :return: identity -> total
+        """
+        totals: dict[str, Any] = {}
+        for semester_values in values:
+            for teacher, value in semester_values.items():
+                key = self.identity(teacher)
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+def _normalize(teacher_id: str) -> str:
+    return teacher_id.strip().replace(" ", "_").lower()
@@ -5,9 +5,15 @@ from typing import Any, Callable
 from functools import partial
 import os
 
+from tkinter import ttk
+
 from ..modified_tk.Scrolled import Scrolled
 from ..modified_tk.FindImages import get_image_dir
 from ..modified_tk.InitGuiFontsAndColours import TkColours
+from ..modified_tk.Viewport import Viewport
+
+# how many rows to show before the size of the window is known
+INITIAL_ROWS = 20
 
 # TODO:  Maybe refactor the method for config_specs, etc.
 #        Check DynamicTree methods (if was coded after this was)
@@ -15,14 +21,19 @@ from ..modified_tk.InitGuiFontsAndColours import TkColours
 # NOTES TO DEVELOPERS
 # =================================================================================================
 # 1. columns and rows:
-#    the 0th grid row is the label row, and the data row starts at 0, but is in grid row 1
+#    the 0th grid row is the label row, and the first visible row is in grid row 1
 #    the 0th grid column is the delete button, and the data column starts at 0, but is in grid column 1
 #    if there is a button at the end of the row, the grid column will be the data column + 1
 #    i.e.
-#           grid_row = data_row + 1
+#           grid_row = slot + 1
 #           grid_column = data_column + 1
 #           del_button_column = 0
 #           button_column = self.number_of_columns + 2
+#
+# 2. only the visible rows have widgets:
+#    the data is kept in self._rows (a list of rows, each a list of strings), and there are only
+#    enough rows of widgets (slots) to fill the window.  When scrolling, the same widgets show
+#    different rows of data.  self.rows_view knows which data row is shown in which slot.
 # -------------------------------------------------------------------------------------------------
 
 class TableEntry(tk.Frame):
@@ -67,6 +78,10 @@ Public Methods
         Reads the data in the row, and returns the data in a list (note that all data will be a string)
     put(row:int, col:int, datum:Any)
         Puts the string version of the data into the Entry widget at row,col
+    set_data(data:list[list[Any]])
+        Replaces all the data in the table (the widgets are not recreated)
+    clear_data()
+        Removes the data from all the cells
     cget(option:str)
         Returns the value of that particular option
     configure(option_name=value, ...)
@@ -147,7 +162,21 @@ Example::
         self._cget = dict()
         self.frame = None
         self.__scrolled_frame = None
-        self.__delete_photo = None
+        self.__vertical_scrollbar = None
+        self.delete_photo = None
+
+        # the data, and which rows of the data are visible
+        self._rows: list[list[str]] = list()
+        self.rows_view = Viewport()
+        self._loading = False
+
+        # the widgets for each slot (a visible row)
+        self._titles: list[Label] = list()
+        self._entries: list[list[Entry]] = list()
+        self._vars: list[list[StringVar]] = list()
+        self._delete_buttons: list[Button] = list()
+        self._row_buttons: list[Button] = list()
+        self._slot_of_widget: dict[Entry, tuple[int, int]] = dict()
 
         # ---------------------------------------------------------------
         # configuration and defaults
@@ -191,163 +220,58 @@ Example::
     # ====================================================================================
     def add_empty_row(self):
         """Add an empty row at the end of the 'spreadsheet'"""
-        column_widths = self.cget("colwidths")
-        columns_enabled_disabled = self.cget("disabled")
-        if columns_enabled_disabled is None:
-            columns_enabled_disabled = []
-
-        # make sure lists are long enough
-        while len(column_widths) < self.number_of_columns + 1:
-            column_widths.append(0)
-        while len(columns_enabled_disabled) < self.number_of_columns + 1:
-            columns_enabled_disabled.append(False)
-
-        # --------------------------------------------------------------------------------
-        # add the grid_row
-        # --------------------------------------------------------------------------------
-        # always add new grid_row at the end of the existing EditResources widget
-        grid_row = self.number_of_rows + 1
-
-        # for each column, add an entry box
-        for data_col in range(0, self.number_of_columns):
-
-            # set the column width if defined, else use the default width
-            column_widths[data_col] = column_widths[data_col] if column_widths[data_col] else self.cget("defwidth")
-
-            # if there is something already there, delete it
-            old = self.__get_widget_in_row_col(grid_row, data_col + 1)
-            if old:
-                old.destroy()
-
-            # make entry widget
-            w = Entry(self.frame,
-                      width=column_widths[data_col],
-                      bg=self.colours.DataBackground,
-                      fg=self.colours.DataForeground,
-                      disabledbackground=self.colours.DisabledBackground,
-                      disabledforeground=self.colours.DataForeground,
-                      relief="ridge",
-                      )
-
-            # if the column has been set to disabled, disable it
-            if columns_enabled_disabled[data_col]:
-                w.configure(state="disabled")
-
-            # put widget in appropriate grid column and row
-            w.grid(column=data_col + 1, sticky="nsew", row=grid_row)
-
-            # key bindings for this entry widget
-            w.bind("<Tab>", partial(self.__next_cell, w))
-            w.bind("<Key-Return>", partial(self.__next_cell, w))
-            w.bind("<Shift-Tab>", partial(self.__prev_cell, w))
-            w.bind("<Key-Left>", partial(self.__prev_cell, w))
-            w.bind("<Key-leftarrow>", partial(self.__prev_cell, w))
-            w.bind("<Key-Up>", partial(self.__prev_row, w))
-            w.bind("<Key-uparrow>", partial(self.__prev_row, w))
-            w.bind("<Key-Down>", partial(self.__next_row, w))
-            w.bind("<Key-downarrow>", partial(self.__next_row, w))
-            w.bind("<Key-Right>", partial(self.__next_cell, w))
-            w.bind("<Key-rightarrow>", partial(self.__next_cell, w))
-            w.bind("<Button>", partial(self.__select_all, w))
-
-            # I want my bindings to happen BEFORE the class bindings
-            # TODO: This is not working properly, <TAB> still behaves weirdly
-            bindtags = w.bindtags()
-            w.bindtags((bindtags[1], bindtags[0], bindtags[2], bindtags[3]))
-
-        # keep our grid_row count up to date
-        self.configure(rows=grid_row)
-
-        # add a `delete button` in the first column
-        self.__add_delete_btn_to_row(grid_row)
-
-        # if we need a grid_row button, add that to the last column
-        self.__add_btn_to_end_of_row(grid_row)
-
-        # we've added a new grid_row, so we need to adjust the size of the scrollable frame
-        self.__adjust_size_of_frame()
+        self.configure(rows=self.number_of_rows + 1)
 
     # ====================================================================================
     # read row
     # ====================================================================================
     def read_row(self, data_row: int) -> list[str]:
         """Get the data from the specified row"""
-        data = list()
-        grid_row = data_row + 1
-
-        # cannot select the data from the title row
-        if grid_row < 1:
-            return data
-
-        # get all the data from all the Entry widgets
-        for data_col in range(0, self.number_of_columns):
-            w = self.__get_widget_in_row_col(grid_row, data_col + 1)
-            if w:
-                value = w.get()
-                value = value.strip()
-                data.append(value)
-        return data
+        if not 0 <= data_row < len(self._rows):
+            return list()
+        return [value.strip() for value in self._rows[data_row]]
 
     # ===================================================================
     # put data
     # ===================================================================
     def put(self, data_row: int, data_col: int, data: Any):
         """Put data into a cell specified by row and col"""
-        if data_row < 0:
+        if data_row < 0 or not 0 <= data_col < self.number_of_columns:
             return
 
-        grid_row = data_row + 1
-        grid_col = data_col + 1
-
         # add rows, if required
-        if grid_row > self.number_of_rows:
-            for _ in range(grid_row - self.number_of_rows):
-                self.add_empty_row()
+        if data_row >= self.number_of_rows:
+            self.configure(rows=data_row + 1)
 
-        # get the entry widget
-        w = self.__get_widget_in_row_col(grid_row, grid_col)
-        if not w or not isinstance(w, Entry):
-            return
+        self._rows[data_row][data_col] = str(data)
 
-        # we have to disable Entry widgets before this can work
-        disabled_flag = w.cget("state") == "disabled"
-        if disabled_flag:
-            w.configure(state="normal")
+        # if the row is visible, show the data
+        slot = self.rows_view.slot(data_row)
+        if slot is not None:
+            self._loading = True
+            self._vars[slot][data_col].set(str(data))
+            self._loading = False
 
-        # remove what was there and insert the data
-        w.delete(0, 'end')
-        w.insert(0, data)
-
-        # if entry widget was disabled, set it back to disabled
-        if disabled_flag:
-            w.configure(state="disabled")
+    # ===================================================================
+    # set data
+    # ===================================================================
+    def set_data(self, data: list[list[Any]]):
+        """Replace all the data in the table, one list per row"""
+        columns = self.number_of_columns
+        self._rows = [[str(datum) for datum in row[:columns]] + [""] * (columns - len(row[:columns]))
+                      for row in data]
+        self.__configure_save(rows=len(self._rows))
+        self.rows_view.resize(total=len(self._rows))
+        self.__refresh()
 
     # ===================================================================
     # clear data
     # ===================================================================
     def clear_data(self):
-        """Put data into a cell specified by row and col"""
-        for data_row in range(self.number_of_rows):
-            grid_row = data_row + 1
-            for data_col in range(self.number_of_columns):
-                grid_col = data_col + 1
-
-                # get the entry widget
-                w = self.__get_widget_in_row_col(grid_row, grid_col)
-                if not w or not isinstance(w, Entry):
-                    return
-
-                # we have to disable Entry widgets before this can work
-                disabled_flag = w.cget("state") == "disabled"
-                if disabled_flag:
-                    w.configure(state="normal")
-
-                # remove what was there and insert the data
-                w.delete(0, 'end')
-
-                # if entry widget was disabled, set it back to disabled
-                if disabled_flag:
-                    w.configure(state="disabled")
+        """Remove the data from all the cells"""
+        for row in self._rows:
+            row[:] = [""] * self.number_of_columns
+        self.__refresh()
 
     # =================================================================================================
     # configure, cget, etc
@@ -368,18 +292,20 @@ Example::
     # ====================================================================================
     # add the user defined button at end of row
     # ====================================================================================
-    def __add_btn_to_end_of_row(self, grid_row):
+    def __add_btn_to_end_of_row(self, slot):
         if self.cget("buttoncmd"):
             b = Button(self.frame,
                        text=self.cget("buttontext"),
                        )
-            b.configure(command=partial(self.__button_cmd, b))
-            b.grid(column=self.number_of_columns + 1, sticky="nsew", row=grid_row)
+            b.configure(command=partial(self.__button_cmd, slot))
+            b.grid(column=self.number_of_columns + 1, sticky="nsew", row=slot + 1)
+            self._row_buttons.append(b)
+            self.__bind_mouse_wheel(b)
 
     # ====================================================================================
     # add the "delete" button at the beginning of a row
     # ====================================================================================
-    def __add_delete_btn_to_row(self, grid_row):
+    def __add_delete_btn_to_row(self, slot):
         b = Button(self.frame,
                    relief="flat",
                    highlightbackground=self.colours.HighlightBackground,
@@ -389,42 +315,96 @@ Example::
             b.configure(image=self.delete_photo)
         else:
             b.configure(text="del")
-        b.configure(command=partial(self.__delete_row, b))
-        b.grid(column=0, sticky="nsew", row=grid_row)
+        b.configure(command=partial(self.__delete_row, slot))
+        b.grid(column=0, sticky="nsew", row=slot + 1)
+        self._delete_buttons.append(b)
+        self.__bind_mouse_wheel(b)
 
         # disable button?
         if self.__are_all_columns_disabled():
             b.configure(state='disabled')
 
     # ====================================================================================
-    # after a row add or row delete, adjust the size of the frame
+    # add a row of widgets (a slot) that can show any row of data
     # ====================================================================================
-    def __adjust_size_of_frame(self):
-        # --------------------------------------------------------------------------------
-        # adjust height of pane
-        # --------------------------------------------------------------------------------
-        height = 0
-        for row in range(self.number_of_rows + 1):
-            w = self.__get_widget_in_row_col(row, 1)
-            if not w:
-                continue
-            height += w.winfo_height()
+    def __add_slot(self):
+        column_widths = self.cget("colwidths")
+        columns_enabled_disabled = self.cget("disabled")
+        if columns_enabled_disabled is None:
+            columns_enabled_disabled = []
+
+        # make sure lists are long enough
+        while len(column_widths) < self.number_of_columns + 1:
+            column_widths.append(0)
+        while len(columns_enabled_disabled) < self.number_of_columns + 1:
+            columns_enabled_disabled.append(False)
+
+        slot = len(self._entries)
+        self._entries.append([])
+        self._vars.append([])
+
+        # for each column, add an entry box
+        for data_col in range(0, self.number_of_columns):
+
+            # set the column width if defined, else use the default width
+            column_widths[data_col] = column_widths[data_col] if column_widths[data_col] else self.cget("defwidth")
+
+            # make entry widget
+            var = StringVar(value="")
+            w = Entry(self.frame,
+                      textvariable=var,
+                      width=column_widths[data_col],
+                      bg=self.colours.DataBackground,
+                      fg=self.colours.DataForeground,
+                      disabledbackground=self.colours.DisabledBackground,
+                      disabledforeground=self.colours.DataForeground,
+                      relief="ridge",
+                      )
+            var.trace_add('write', partial(self.__cell_changed, slot, data_col))
 
-        height += 2 * self.cget('border')
-        height += self.__scrolled_frame.Subwidget("xscrollbar").winfo_height()
-        self.frame.configure(height=height)
-        self.update()
+            # if the column has been set to disabled, disable it
+            if columns_enabled_disabled[data_col]:
+                w.configure(state="disabled", takefocus=0)
+
+            # put widget in appropriate grid column and row
+            w.grid(column=data_col + 1, sticky="nsew", row=slot + 1)
+            self._entries[slot].append(w)
+            self._vars[slot].append(var)
+            self._slot_of_widget[w] = slot, data_col
+
+            # key bindings for this entry widget
+            w.bind("<Tab>", partial(self.__next_cell, w))
+            w.bind("<Key-Return>", partial(self.__next_cell, w))
+            w.bind("<Shift-Tab>", partial(self.__prev_cell, w))
+            w.bind("<Key-Left>", partial(self.__prev_cell, w))
+            w.bind("<Key-leftarrow>", partial(self.__prev_cell, w))
+            w.bind("<Key-Up>", partial(self.__prev_row, w))
+            w.bind("<Key-uparrow>", partial(self.__prev_row, w))
+            w.bind("<Key-Down>", partial(self.__next_row, w))
+            w.bind("<Key-downarrow>", partial(self.__next_row, w))
+            w.bind("<Key-Right>", partial(self.__next_cell, w))
+            w.bind("<Key-rightarrow>", partial(self.__next_cell, w))
+            w.bind("<Button>", partial(self.__select_all, w))
+            self.__bind_mouse_wheel(w)
+
+            # I want my bindings to happen BEFORE the class bindings
+            # TODO: This is not working properly, <TAB> still behaves weirdly
+            bindtags = w.bindtags()
+            w.bindtags((bindtags[1], bindtags[0], bindtags[2], bindtags[3]))
+
+        # add a `delete button` in the first column
+        self.__add_delete_btn_to_row(slot)
+
+        # if we need a row button, add that to the last column
+        self.__add_btn_to_end_of_row(slot)
 
     # =================================================================================================
     # Generic function that applies calls a function for all Entry widgets
     # =================================================================================================
     def __apply_to_all_entry_widgets(self, func: callable):
-        if self.number_of_columns and self.number_of_rows:
-            for grid_col in range(1, self.number_of_columns + 1):
-                for grid_row in range(1, self.number_of_rows + 1):
-                    w = self.__get_widget_in_row_col(grid_row, grid_col)
-                    if w is not None:
-                        func(w, grid_row, grid_col)
+        for slot, widgets in enumerate(self._entries):
+            for data_col, w in enumerate(widgets):
+                func(w, slot + 1, data_col + 1)
 
     # ====================================================================================
     # are all columns disabled?
@@ -438,16 +418,33 @@ Example::
             flag = flag and col
         return flag
 
+    # ====================================================================================
+    # mouse wheel scrolls the rows
+    # ====================================================================================
+    def __bind_mouse_wheel(self, w):
+        w.bind("<MouseWheel>", lambda e: self.__scroll("scroll", -1 if e.delta > 0 else 1, "units"))
+        w.bind("<Button-4>", lambda *_: self.__scroll("scroll", -1, "units"))
+        w.bind("<Button-5>", lambda *_: self.__scroll("scroll", 1, "units"))
+
     # ====================================================================================
     # callback for button at end of row being clicked
     # ====================================================================================
-    def __button_cmd(self, btn, **kwargs):
-        if self.cget("buttoncmd"):
-            grid_row, grid_col = self.__get_row_col_of_widget(btn)
-            data_row = grid_row - 1
+    def __button_cmd(self, slot, **kwargs):
+        data_row = self.rows_view.index(slot)
+        if self.cget("buttoncmd") and data_row is not None:
             data = self.read_row(data_row)
             self.cget("buttoncmd")(data)
 
+    # ====================================================================================
+    # the user has typed something into a cell
+    # ====================================================================================
+    def __cell_changed(self, slot, data_col, *_):
+        if self._loading:
+            return
+        data_row = self.rows_view.index(slot)
+        if data_row is not None:
+            self._rows[data_row][data_col] = self._vars[slot][data_col].get()
+
     # ====================================================================================
     # change focus to next cell (bound to Entry widgets)
     # ====================================================================================
@@ -456,45 +453,46 @@ Example::
         if w:
             w.selection_clear()
 
-        (grid_row, grid_col) = self.__get_row_col_of_widget(w)
-        grid_col = grid_col + x_dir
-        grid_row = grid_row + y_dir
+        slot, data_col = self._slot_of_widget.get(w, (0, 0))
+        data_row = self.rows_view.index(slot) or 0
+        disabled_list = self.cget("disabled")
 
-        # if at end of row, scroll around to beginning of next row,
-        # ignoring the 'delete' button
-        if grid_col > self.number_of_columns:
-            grid_row = grid_row + 1
-            grid_col = 1
+        # move, skipping over disabled columns
+        for _ in range(self.number_of_columns):
+            data_col = data_col + x_dir
+            data_row = data_row + y_dir
 
-        # if at beginning of row, go to the end of the previous row
-        if grid_col < 1:
-            grid_row = grid_row - 1
-            grid_col = self.number_of_columns
+            # if at end of row, scroll around to beginning of next row,
+            # ignoring the 'delete' button
+            if data_col >= self.number_of_columns:
+                data_row = data_row + 1
+                data_col = 0
 
-        # if we have exceeded the number of rows, create a new empty row
-        if grid_row > self.number_of_rows:
-            self.add_empty_row()
-            #self.__scrolled_frame.update_scrollbars()
+            # if at beginning of row, go to the end of the previous row
+            if data_col < 0:
+                data_row = data_row - 1
+                data_col = self.number_of_columns - 1
 
-        # can't go less than zero
-        if grid_row < 0:
-            grid_row = 0
+            if data_col >= len(disabled_list) or not disabled_list[data_col]:
+                break
+            x_dir, y_dir = x_dir or 1, 0
 
-        # set the focus, and move the scrollbars appropriately
-        w2 = self.__get_widget_in_row_col(grid_row, grid_col)
-        if w2:
-            self.__scrolled_frame.see(w2)
-            self.update()
-            if isinstance(w2, Entry):
-                w2.focus_set()
-                w2.selection_range(0, 'end')
+        # can't go less than zero
+        if data_row < 0:
+            data_row = 0
 
-                # if we land on a disabled widget, keep moving
-                disabled_list = self.cget("disabled")
-                if disabled_list[grid_col - 1]:
-                    self.winfo_toplevel().after(20,lambda:self.__change_focus_to_new_cell(w2, x_dir, y_dir))
+        # if we have exceeded the number of rows, create a new empty row
+        if data_row >= self.number_of_rows:
+            self.add_empty_row()
 
-        self.update()
+        # set the focus, and move the scrollbars appropriately
+        if self.rows_view.see(data_row):
+            self.__refresh()
+        slot = self.rows_view.slot(data_row)
+        if slot is not None and slot < len(self._entries):
+            w2 = self._entries[slot][data_col]
+            w2.focus_set()
+            w2.selection_range(0, 'end')
 
         # According to the documentation, this should prevent the event
         # from propagating to the next internal event handlers
@@ -527,17 +525,17 @@ Example::
             col_widths[data_col] = col_widths[data_col] if col_widths[data_col] else self.cget("defwidth")
             w = Label(self.frame, text=titles[data_col], width=col_widths[data_col])
             w.grid(column=data_col + 1, sticky='nsew', row=0)
+            self._titles.append(w)
 
         self.__configure_save(colwidths=col_widths)
 
     # ====================================================================================
     # delete a row
     # ====================================================================================
-    def __delete_row(self, b):
-        grid_row, _ = self.__get_row_col_of_widget(b)
-        if grid_row == 0:
-            return  # cannot delete the header row
-        data_row = grid_row - 1
+    def __delete_row(self, slot):
+        data_row = self.rows_view.index(slot)
+        if data_row is None:
+            return
 
         # run user supplied callback first
         delete_callback = self.cget("delete")
@@ -545,22 +543,9 @@ Example::
             data = self.read_row(data_row)
             delete_callback(data)
 
-
-        # we want to move everything up
-        for grid_row in range(grid_row + 1, self.number_of_rows + 1):
-            for grid_col in range(1, self.number_of_columns + 2):
-                w1 = self.__get_widget_in_row_col(grid_row-1, grid_col)
-                w2 = self.__get_widget_in_row_col(grid_row, grid_col)
-                if w1:
-                    was_state = w1.cget('state')
-                    w1.configure(state="normal")
-                    w1.delete(0, 'end')
-                    if w2:
-                        w1.insert(0, w2.get())
-                    w1.configure(state=was_state)
-
-        # adjust the number of rows
-        self.configure(rows=self.number_of_rows - 1)
+        # everything below moves up
+        del self._rows[data_row]
+        self.configure(rows=len(self._rows))
 
     # ===================================================================
     # draw the widgets onto the scrollable frame
@@ -570,51 +555,29 @@ Example::
         # create header row
         self.__create_header_row()
 
-        # add rows
-        num_of_rows = self.number_of_rows
-        self.configure(rows=0)
-        for r in range(0, num_of_rows):
-            self.add_empty_row()
+        # add enough rows of widgets to show the visible rows
+        while len(self._entries) < self.rows_view.size:
+            self.__add_slot()
+        self.__refresh()
 
         # calculate the width of the row, to set the pane width
         width_total = 0
-        for c in range(self.number_of_columns + 1):
-            w = self.__get_widget_in_row_col(1, c)
-            if w is not None:
-                width_total += w.winfo_width() + 12
-
-            if self.cget("buttoncmd"):
-                width_total += 100
-
-            width_total += 2 * self.cget("border")
-            self.frame.configure(width=width_total)
+        for w in (*self._delete_buttons[:1], *(self._entries[0] if self._entries else [])):
+            width_total += w.winfo_reqwidth() + 12
 
-    # ===================================================================
-    # get row/col of a widget
-    # ===================================================================
-    def __get_row_col_of_widget(self, w: Entry):
-        if w:
-            i = w.grid_info()
-            return i["row"], i["column"]
-        return 0, 0
+        if self.cget("buttoncmd"):
+            width_total += 100
 
-    # ===================================================================
-    # get widget in row/col
-    # ===================================================================
-    def __get_widget_in_row_col(self, r, c) -> Entry | None:
-        """get the widget in the row/col"""
-        w = self.frame.grid_slaves(r, c)
-        if w:
-            return w[0]
-        return None
+        width_total += 2 * self.cget("border")
+        self.frame.configure(width=width_total)
 
     # ===================================================================
     def __next_cell(self, w: Any, *args, **kwargs):
-        self.__change_focus_to_new_cell(w, 1, 0)
+        return self.__change_focus_to_new_cell(w, 1, 0)
 
     # ===================================================================
     def __next_row(self, w: Any, *args, **kwargs):
-        self.__change_focus_to_new_cell(w, 0, 1)
+        return self.__change_focus_to_new_cell(w, 0, 1)
 
     # ===================================================================
     # populate the frame
@@ -622,12 +585,17 @@ Example::
     def __populate_the_frame(self, **kwargs):
 
         # ---------------------------------------------------------------
-        # create a scrolled pane
+        # create a scrolled pane (scrolls horizontally, the rows are scrolled by
+        # showing different data in the same widgets)
         # ---------------------------------------------------------------
-        scrolled_frame = Scrolled(self, "Frame", scrollbars="se", border=2, relief="flat")
+        self.__vertical_scrollbar = ttk.Scrollbar(self, orient='vertical', takefocus=0, command=self.__scroll)
+        self.__vertical_scrollbar.pack(side='right', fill='y')
+
+        scrolled_frame = Scrolled(self, "Frame", scrollbars="s", border=2, relief="flat")
         scrolled_frame.pack(side='left', fill='both')
         self.__scrolled_frame = scrolled_frame
         self.frame = scrolled_frame.Subwidget("Frame")
+        self.__bind_mouse_wheel(self.frame)
 
         # ---------------------------------------------------------------
         # define the 'delete' image
@@ -641,15 +609,71 @@ Example::
         to_configure = self._defaults.copy()
         to_configure.update(kwargs)
         self.__configure_save(**to_configure)
+        self._rows = [[""] * self.number_of_columns for _ in range(self.number_of_rows)]
+        self.rows_view = Viewport(self.number_of_rows, INITIAL_ROWS)
         self.__draw()
 
+        # show as many rows as will fit in the window
+        scrolled_frame.Subwidget("scrollable").bind("<Configure>", self.__resized)
+
     # ====================================================================================
     def __prev_cell(self, w: Any, *args, **kwargs):
-        self.__change_focus_to_new_cell(w, -1, 0)
+        return self.__change_focus_to_new_cell(w, -1, 0)
 
     # ====================================================================================
     def __prev_row(self, w: Any, *args, **kwargs):
-        self.__change_focus_to_new_cell(w, 0, -1)
+        return self.__change_focus_to_new_cell(w, 0, -1)
+
+    # ====================================================================================
+    # show the visible rows of data in the widgets
+    # ====================================================================================
+    def __refresh(self):
+        self._loading = True
+        try:
+            for slot, (widgets, variables) in enumerate(zip(self._entries, self._vars)):
+                data_row = self.rows_view.index(slot)
+                row_widgets = [*widgets, self._delete_buttons[slot], *self._row_buttons[slot:slot + 1]]
+                if data_row is None:
+                    for w in row_widgets:
+                        w.grid_remove()
+                    continue
+                for w in row_widgets:
+                    w.grid()
+                for var, value in zip(variables, self._rows[data_row]):
+                    var.set(value)
+        finally:
+            self._loading = False
+
+        self.__vertical_scrollbar.set(*self.rows_view.fractions())
+
+    # ====================================================================================
+    # the window has changed size, so the number of visible rows may have changed
+    # ====================================================================================
+    def __resized(self, e):
+        if not self._entries:
+            return
+        row_height = max(w.winfo_reqheight() for w in (*self._entries[0], self._delete_buttons[0]))
+        header_height = max((w.winfo_reqheight() for w in self._titles), default=0)
+        scrollbar = self.__scrolled_frame.Subwidget("xscrollbar")
+        height = e.height - header_height - (scrollbar.winfo_height() if scrollbar else 0)
+
+        if self.rows_view.resize(size=max(height // max(row_height, 1), 1)) or \
+                len(self._entries) < self.rows_view.size:
+            while len(self._entries) < self.rows_view.size:
+                self.__add_slot()
+            self.__refresh()
+
+    # ====================================================================================
+    # scroll the rows (arguments from the scrollbar)
+    # ====================================================================================
+    def __scroll(self, *args):
+        if self.rows_view.command(*args):
+
+            # the focus would otherwise stay with a widget that is now showing a different row
+            if self.focus_get() in self._slot_of_widget:
+                self.frame.focus_set()
+            self.__refresh()
+        return "break"
 
     # ====================================================================================
     # binding subroutine for clicking mouse button on entry widget
@@ -669,7 +693,8 @@ Example::
         while len(title_list) < self.number_of_columns:
             title_list.append("")
         self.__configure_save(titles=title_list)
-        self.__apply_to_all_entry_widgets(lambda w, r, c: w.configure(text=title_list[c - 1]))
+        for data_col, w in enumerate(self._titles):
+            w.configure(text=title_list[data_col])
         return self.cget('titles')
 
     # ====================================================================================
@@ -690,6 +715,8 @@ Example::
                 w.configure(state='normal')
 
         self.__apply_to_all_entry_widgets(_disable_widget)
+        for b in self._delete_buttons:
+            b.configure(state='disabled' if self.__are_all_columns_disabled() else 'normal')
         return self.cget('disabled')
 
     # ====================================================================================
@@ -740,8 +767,13 @@ Example::
     # ====================================================================================
     # set the number of rows
     # ====================================================================================
-    def __set_rows(self, rows: list):
+    def __set_rows(self, rows: int):
+        while len(self._rows) < rows:
+            self._rows.append([""] * self.number_of_columns)
+        del self._rows[rows:]
         self.__configure_save(rows=rows)
+        self.rows_view.resize(total=rows)
+        self.__refresh()
         return self.cget("rows")
 
     # ====================================================================================
@@ -0,0 +1,95 @@
+"""
+Keeps track of which part of a long list (rows or columns) is visible, so that only the
+visible items need widgets (the widgets are reused for different items as the view scrolls)
+"""
+from __future__ import annotations
+
+from typing import Literal
+
+
+class Viewport:
+    """
+        ┌───┬───┬───┬───┬───┬───┬───┬───┬───┬───┐
+        │ 0 │ 1 │ 2 │ 3 │ 4 │ 5 │ 6 │ 7 │ 8 │ 9 │    <- total = 10
+        └───┴───┴───┼───┼───┼───┼───┼───┴───┴───┘
+                    └── first = 3, size = 4 ──┘
+
+    The size is the number of items that fit in the window, which may be more than the total
+    """
+
+    def __init__(self, total: int = 0, size: int = 1):
+        self.total = total
+        self.size = max(size, 1)
+        self.first = 0
+
+    # -------------------------------------------------------------------------
+    # what is visible
+    # -------------------------------------------------------------------------
+    @property
+    def last(self) -> int:
+        """the index after the last visible item"""
+        return min(self.first + self.size, self.total)
+
+    def visible(self) -> range:
+        return range(self.first, self.last)
+
+    def index(self, slot: int) -> int | None:
+        """the item shown in this slot (slot 0 is the first visible item), None if nothing is shown"""
+        index = self.first + slot
+        return index if 0 <= slot < self.size and index < self.total else None
+
+    def slot(self, index: int) -> int | None:
+        """the slot that this item is shown in, None if not visible"""
+        return index - self.first if self.first <= index < self.last else None
+
+    def fractions(self) -> tuple[float, float]:
+        """the visible part, as fractions of the total (what a scrollbar wants)"""
+        if self.total == 0:
+            return 0.0, 1.0
+        return self.first / self.total, self.last / self.total
+
+    # -------------------------------------------------------------------------
+    # changing what is visible
+    # -------------------------------------------------------------------------
+    def resize(self, size: int = None, total: int = None) -> bool:
+        """change the number of visible items or total items, returns True if anything changed"""
+        before = (self.first, self.size, self.total)
+        if size is not None:
+            self.size = max(size, 1)
+        if total is not None:
+            self.total = total
+        self._limit()
+        return before != (self.first, self.size, self.total)
+
+    def scroll_to(self, first: int) -> bool:
+        """make this the first visible item, returns True if the view moved"""
+        before = self.first
+        self.first = first
+        self._limit()
+        return before != self.first
+
+    def scroll(self, number: int, what: Literal["units", "pages"] = "units") -> bool:
+        step = max(self.size - 1, 1) if what == "pages" else 1
+        return self.scroll_to(self.first + number * step)
+
+    def moveto(self, fraction: float) -> bool:
+        return self.scroll_to(round(float(fraction) * self.total))
+
+    def see(self, index: int) -> bool:
+        """scroll as little as possible so that this item is visible"""
+        if index < self.first:
+            return self.scroll_to(index)
+        if index >= self.first + self.size:
+            return self.scroll_to(index - self.size + 1)
+        return False
+
+    def command(self, *args) -> bool:
+        """handle the arguments given by a scrollbar ('moveto', fraction) or ('scroll', n, 'units'/'pages')"""
+        if args and args[0] == "moveto":
+            return self.moveto(float(args[1]))
+        if args and args[0] == "scroll":
+            return self.scroll(int(args[1]), args[2])
+        return False
+
+    def _limit(self):
+        self.first = max(0, min(self.first, self.total - self.size))
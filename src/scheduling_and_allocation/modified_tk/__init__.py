@@ -8,6 +8,7 @@ from .Scrolled import Scrolled
 from .idlelib_tooltip import Hovertip
 from .Pane import Pane
 from .ToolBar import ToolBar
+from .Viewport import Viewport
 
 from . import InitGuiFontsAndColours
 
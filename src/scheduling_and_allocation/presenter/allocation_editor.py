@@ -2,8 +2,8 @@ import re
 from dataclasses import dataclass
 
 from ..gui_pages.allocation_grid_tk import AllocationGridTk
-from ..model import Schedule, Course, Section, Teacher
-from ..ci_calculator.ci_calculation import calculate_ci
+from ..model import Schedule, Course, Section, Teacher, TeacherIndex
+from ..ci_calculator.ci_calculation import calculate_ci, calculate_ci_for_all, ci_calculators_for_all, CICalc
 
 # =====================================================================================================================
 # InnerData and SummaryRow data classes
@@ -31,7 +31,8 @@ class AllocationEditor:
     # -----------------------------------------------------------------------------------------------------------------
     # constructor
     # -----------------------------------------------------------------------------------------------------------------
-    def __init__(self, set_dirty_flag, frame, schedule: Schedule, other_schedules: list[Schedule] = None):
+    def __init__(self, set_dirty_flag, frame, schedule: Schedule, other_schedules: list[Schedule] = None,
+                 teacher_index: TeacherIndex = None, gui=None):
         """
         Add teachers to course/sections, specifying hours.
         NOTE: Teachers will be added to all blocks if there are blocks,
@@ -39,11 +40,16 @@ class AllocationEditor:
         :param frame: container where to draw gui stuff
         :param schedule: schedule
         :param other_schedules: schedules that are not part of this semester (used to calculate total CI)
+        :param teacher_index: used to find the same teacher in the other schedules
+        :param gui: the allocation grid (optional, for testing)
         """
         self.set_dirty_flag = set_dirty_flag
         self.frame = frame
         self.schedule = schedule
         self.other_schedules = [] if other_schedules is None else other_schedules
+        if teacher_index is None:
+            teacher_index = TeacherIndex(dict(enumerate((schedule, *self.other_schedules))))
+        self.teacher_index = teacher_index
 
         self.teachers = schedule.teachers()
         self.courses = schedule.courses_with_allocation()
@@ -54,13 +60,27 @@ class AllocationEditor:
         self.inner_data: dict[tuple[int,int],InnerData] = {}
         self.data_numbers_only: dict[tuple[int,int], float] = {}
 
-        self.gui = AllocationGridTk(frame,
-                        rows=len(self.teachers),
-                        col_merge=[c.number_of_sections() for c in self.courses] ,
-                        summary_merge = [len(self.summary_headings)],
-                        cb_process_data_change=lambda *args: self.data_change_handler(*args),
-                        bottom_cell_valid = lambda c: float(c) == 0.0,
-                        )
+        # running totals, so that changing one cell only updates what has changed
+        self._ci_calcs: dict[Teacher, CICalc] = {}
+        self._other_ci: dict[str, float] = {}
+        self._allocated_per_col: dict[int, float] = {}
+
+        # what is shown in the grid, so that a refresh only updates what has changed
+        self._layout = self._layout_of(schedule)
+        self._sections: list[Section] = [section for course in self.courses for section in course.sections()]
+        self._summaries: list[list[str]] = []
+        self._remaining: list[str] = []
+
+        if gui is not None:
+            self.gui = gui
+        else:
+            self.gui = AllocationGridTk(frame,
+                            rows=len(self.teachers),
+                            col_merge=[c.number_of_sections() for c in self.courses] ,
+                            summary_merge = [len(self.summary_headings)],
+                            cb_process_data_change=lambda *args: self.data_change_handler(*args),
+                            bottom_cell_valid = lambda c: float(c) == 0.0,
+                            )
         self.populate()
 
 
@@ -71,20 +91,14 @@ class AllocationEditor:
 
         teachers = self.teachers
         courses = self.courses
+        teachers_text, courses_text, courses_balloon, sections_text = self._layout
 
-        teachers_text = list(map(lambda a: f"{a.firstname} {a.lastname[0:1]}.", teachers))
-        courses_text = list(map(lambda a: str(re.sub(r'\s*\d\d\d-', '', a.number)), courses))
-        courses_balloon = list(map(lambda a: f" {a.name} ({a.hours_per_week})" , courses))
-
-        teacher_summaries:list[list[str]] = []
         data_numbers_only: dict[tuple[int,int], float] = {}
 
         # loop over the courses/sections, and save info into appropriate data structures
         col = 0
-        sections_text: list[str] = []
         for course in courses:
             for section in course.sections():
-                sections_text.append(section.number)
 
                 # save info for each teacher ( for each course/sections)
                 for row, teacher in enumerate(teachers):
@@ -96,25 +110,87 @@ class AllocationEditor:
 
                 col += 1
 
-        # get the summary info for each teacher
-        for row, teacher in enumerate(teachers):
-            teacher_stats = self._calculate_summary(row)
-            teacher_summaries.append([teacher_stats.release,
-                                      teacher_stats.total_hrs,
-                                      teacher_stats.semester_ci,
-                                      teacher_stats.year_ci])
-
-        # get unallocated hours for each course/section
-        remaining_hours = AllocationEditor._calculate_unallocated_hours(self.inner_data)
+        self._calculate_totals()
 
         # add all the data to the gui Allocation Grid
         self.gui.populate(
             courses_text, courses_balloon, sections_text,
             teachers_text, data_numbers_only, [""], self.summary_headings,
-            teacher_summaries, self.remaining_text,
-            [f"{v:.1f}" for v in remaining_hours]
+            self._summaries, self.remaining_text, self._remaining
         )
 
+    # -----------------------------------------------------------------------------------------------------------------
+    # the schedule was changed somewhere else (another tab), update only the cells that are different
+    # -----------------------------------------------------------------------------------------------------------------
+    def is_current(self) -> bool:
+        """True if the grid still has the same teachers, courses and sections as the schedule"""
+        if self._layout != self._layout_of(self.schedule):
+            return False
+
+        # a teacher or section may have been replaced by another one with the same name
+        sections = [section for course in self.schedule.courses_with_allocation() for section in course.sections()]
+        return (all(a is b for a, b in zip(self.schedule.teachers(), self.teachers))
+                and all(a is b for a, b in zip(sections, self._sections)))
+
+    def refresh(self):
+        """
+        Show the current allocations, CI and unallocated hours
+        NOTE: if teachers, courses or sections have been added/removed, a new editor is required (see is_current)
+        """
+        for (row, col), datum in self.inner_data.items():
+            hours = datum.section.get_teacher_allocation(datum.teacher)
+            if hours != datum.hours:
+                datum.hours = hours
+                self.gui.update_data('data', row, col, hours)
+
+        summaries, remaining = self._summaries, self._remaining
+        self._calculate_totals()
+
+        for row, summary in enumerate(self._summaries):
+            for col, text in enumerate(summary):
+                if summaries[row][col] != text:
+                    self.gui.update_data('summary', row, col, text)
+        for col, text in enumerate(self._remaining):
+            if remaining[col] != text:
+                self.gui.update_data('bottom', 0, col, text)
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # the summary of each teacher, and the unallocated hours of each section
+    # -----------------------------------------------------------------------------------------------------------------
+    def _calculate_totals(self):
+
+        # get the summary info for each teacher (CI for all teachers is calculated all at once)
+        self._ci_calcs = ci_calculators_for_all(self.schedule)
+        self._other_ci = self.teacher_index.totals(*(calculate_ci_for_all(other) for other in self.other_schedules))
+        self._summaries = []
+        for row, teacher in enumerate(self.teachers):
+            teacher_stats = self._calculate_summary(row, self._ci_calcs.get(teacher))
+            self._summaries.append([teacher_stats.release,
+                                    teacher_stats.total_hrs,
+                                    teacher_stats.semester_ci,
+                                    teacher_stats.year_ci])
+
+        # get unallocated hours for each course/section
+        remaining_hours = AllocationEditor._calculate_unallocated_hours(self.inner_data)
+        self._remaining = [f"{v:.1f}" for v in remaining_hours]
+        self._allocated_per_col = {}
+        for (_, col), datum in self.inner_data.items():
+            self._allocated_per_col[col] = self._allocated_per_col.get(col, 0) + datum.hours
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # the headings of the grid (if any of these change, the grid has to be recreated)
+    # -----------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _layout_of(schedule: Schedule) -> tuple[list[str], list[str], list[str], list[str]]:
+        teachers = schedule.teachers()
+        courses = schedule.courses_with_allocation()
+
+        teachers_text = list(map(lambda a: f"{a.firstname} {a.lastname[0:1]}.", teachers))
+        courses_text = list(map(lambda a: str(re.sub(r'\s*\d\d\d-', '', a.number)), courses))
+        courses_balloon = list(map(lambda a: f" {a.name} ({a.hours_per_week})" , courses))
+        sections_text = [section.number for course in courses for section in course.sections()]
+        return teachers_text, courses_text, courses_balloon, sections_text
+
 
     # -----------------------------------------------------------------------------------------------------------------
     # data change handler
@@ -122,36 +198,50 @@ class AllocationEditor:
     def data_change_handler(self, row, col, value):
 
         # update schedule
+        teacher = self.teachers[row]
         info = self.inner_data[row,col]
+        previous_hours = info.hours
         self.inner_data[row,col].hours = float(value)
-        info.section.set_teacher_allocation(self.teachers[row], float(value))
-
-        summary = self._calculate_summary(row)
-        self.gui.update_data('summary',row,0, summary.release)
-        self.gui.update_data('summary',row,1, summary.total_hrs)
-        self.gui.update_data('summary',row,2, summary.semester_ci)
-        self.gui.update_data('summary',row,3, summary.year_ci)
-
-        remaining_hours = AllocationEditor._calculate_unallocated_hours(self.inner_data)
-        self.gui.update_data('bottom', 0, col, remaining_hours[col])
+        info.section.set_teacher_allocation(teacher, float(value))
+
+        # only this teacher's hours for this section have changed, so just update the running totals
+        if teacher not in self._ci_calcs:
+            self._ci_calcs[teacher] = CICalc(teacher, self.schedule)
+            self._ci_calcs[teacher].release = teacher.release or 0
+        self._ci_calcs[teacher].set_section_hours(info.course, info.section,
+                                                  info.section.get_teacher_allocation(teacher))
+
+        summary = self._calculate_summary(row, self._ci_calcs[teacher])
+        self._summaries[row] = [summary.release, summary.total_hrs, summary.semester_ci, summary.year_ci]
+        for summary_col, text in enumerate(self._summaries[row]):
+            self.gui.update_data('summary', row, summary_col, text)
+
+        self._allocated_per_col[col] = self._allocated_per_col.get(col, 0) + info.hours - previous_hours
+        self._remaining[col] = f"{info.course.hours_per_week - self._allocated_per_col[col]:.1f}"
+        self.gui.update_data('bottom', 0, col, self._remaining[col])
         self.set_dirty_flag(True)
 
     # -----------------------------------------------------------------------------------------------------------------
     # calculate the summary for a particular row (ci/ total hrs/ etc)
     # -----------------------------------------------------------------------------------------------------------------
-    def _calculate_summary(self, row):
+    def _calculate_summary(self, row, semester_calc: CICalc = None):
+        """
+        :param row: the row of the teacher
+        :param semester_calc: CI info for this teacher for this semester, if already calculated
+        """
         teacher = self.teachers[row]
-        hrs = 0
-        for course in self.schedule.get_courses_for_teacher(teacher):
-            for section in course.sections():
-                hrs += section.get_teacher_allocation(teacher)
-        semester_ci = calculate_ci(teacher=teacher, schedule=self.schedule)
-
-        yearly_ci = semester_ci
-        for other in self.other_schedules:
-            other_teacher = other.get_teacher_by_name(teacher.firstname, teacher.lastname)
-            if other_teacher is not None:
-                yearly_ci += calculate_ci(other_teacher, schedule=other)
+        if semester_calc is not None:
+            hrs = semester_calc.hours
+            semester_ci = semester_calc.ci
+        else:
+            hrs = 0
+            for course in self.schedule.get_courses_for_teacher(teacher):
+                for section in course.sections():
+                    hrs += section.get_teacher_allocation(teacher)
+            semester_ci = calculate_ci(teacher=teacher, schedule=self.schedule)
+
+        # CI for the other semesters was calculated for all teachers when populating
+        yearly_ci = semester_ci + self._other_ci.get(self.teacher_index.identity(teacher), 0)
 
         # convert all the numbers into their appropriate string variations
         return (SummaryRow(release="" if teacher.release == 0 else f"{teacher.release:6.3f}",
@@ -11,8 +11,9 @@ from .menus_main_menu_allocation import set_menu_event_handler_allocation, main_
 from .student_numbers import StudentNumbers
 
 from ..Utilities import Preferences
+from ..ci_calculator.allocation_balancer import balance_allocations
 from ..gui_pages.allocation_manager_tk import AllocationManagerTk, set_main_page_event_handler
-from ..model import SemesterType, Schedule, ResourceType, CouldNotReadFileError
+from ..model import SemesterType, Schedule, ResourceType, CouldNotReadFileError, load_many, TeacherIndex
 
 # =====================================================================================
 # Notebook book-keeping
@@ -46,9 +47,13 @@ class AllocationManager:
         self.preferences: Preferences = Preferences()
         self.schedules: dict[SemesterType, Optional[Schedule]] = {s:None for s in VALID_SEMESTERS}
         self._previous_filenames: dict[SemesterType, str] = {s:"" for s in VALID_SEMESTERS}
-        self._dirty_flag = False
+        self._dirty_flags: dict[SemesterType, bool] = {s:False for s in VALID_SEMESTERS}
         self.current_tab: Optional[str] = None
         self.standard_page = None
+        self.teacher_index = TeacherIndex(aliases=self.preferences.teacher_aliases())
+        self._teachers_edited: set[SemesterType] = set()
+        self._allocation_frames: dict[SemesterType, Any] = {}
+        self._allocation_editors: dict[SemesterType, AllocationEditor] = {}
 
         # gui is optional so that we can test the presenter more readily
         if gui:
@@ -58,8 +63,6 @@ class AllocationManager:
 
         self._schedule_filenames: dict[SemesterType, PATH] = {s:"" for s in VALID_SEMESTERS}
 
-        self._allocation_manager_already_open = False
-
         # --------------------------------------------------------------------
         # required notebook pages
         # --------------------------------------------------------------------
@@ -93,6 +96,7 @@ class AllocationManager:
         set_menu_event_handler_allocation("file_open", self.open_menu_event)
         set_menu_event_handler_allocation("file_save", self.save_schedule)
         set_menu_event_handler_allocation("file_exit", self.menu_exit_event)
+        set_menu_event_handler_allocation("balance_ci", self.balance_ci_event)
 
         self.gui.toggle_auto_save = self.auto_save_set
 
@@ -144,14 +148,31 @@ class AllocationManager:
     # ============================================================================================
     @property
     def dirty_flag(self) -> bool:
-        """is the data different from what was saved on disk?"""
-        return self._dirty_flag
+        """is the data different from what was saved on disk (for any semester)?"""
+        return len(self.dirty_semesters()) != 0
 
     @dirty_flag.setter
     def dirty_flag(self, value):
-        self._dirty_flag = value
+        for semester in VALID_SEMESTERS:
+            self._dirty_flags[semester] = value
         self.set_dirty_indicator()
 
+    def is_dirty(self, semester: SemesterType) -> bool:
+        """has the data for this semester been edited since it was last saved?"""
+        return self.schedules.get(semester, None) is not None and self._dirty_flags[semester]
+
+    def dirty_semesters(self) -> list[SemesterType]:
+        """which semesters have been edited since they were last saved"""
+        return [semester for semester in VALID_SEMESTERS if self.is_dirty(semester)]
+
+    def unsaved_semesters(self) -> list[SemesterType]:
+        """
+        which edited semesters are really different from what was saved (an edit may have been undone).
+        Compares the fingerprints of the schedules, so only used when deciding whether to save
+        """
+        return [semester for semester in self.dirty_semesters()
+                if self.schedules[semester].is_changed() or not self._schedule_filenames.get(semester, "")]
+
     # ============================================================================================
     # Events ... open
     # ============================================================================================
@@ -177,15 +198,24 @@ class AllocationManager:
         filename = self.preferences.previous_file()
         self._open_file(filename, semester)
 
-    def _open_file(self, filename: str, semester):
-        """generic open file method"""
+    def _open_file(self, filename: str, semester, schedule: Optional[Schedule | CouldNotReadFileError] = None):
+        """generic open file method
+        :param filename:
+        :param semester:
+        :param schedule: the schedule (or read error) if the file has already been read
+        """
         if filename:
             try:
-                schedule = Schedule(filename)
-                self._allocation_manager_already_open = False
+                if schedule is None:
+                    schedule = Schedule(filename)
+                if isinstance(schedule, CouldNotReadFileError):
+                    raise schedule
+                self._allocation_editors.pop(semester, None)
                 self.schedules[semester] = schedule
+                self.teacher_index.index_schedule(semester, schedule)
                 self.schedule_filename(semester, filename)
-                self.dirty_flag = False
+                self._dirty_flags[semester] = False
+                self.set_dirty_indicator()
                 if self.standard_page is not None:
                     self.gui.create_standard_page(self._notebook_tabs)
 
@@ -199,19 +229,24 @@ class AllocationManager:
     def new_menu_event(self, semester: SemesterType):
         """create a new file"""
         schedule = Schedule()
+        self._allocation_editors.pop(semester, None)
         self.schedules[semester] = schedule
+        self.teacher_index.index_schedule(semester, schedule)
         self.schedule_filename(semester, "")
-        self.dirty_flag = True
+        self._dirty_flags[semester] = True
+        self.set_dirty_indicator()
         self.gui.create_standard_page(self._notebook_tabs, reset=True)
 
     # ============================================================================================
     # Event handlers - save
     # ============================================================================================
     def save_schedule(self, *_):
-        """generic save file method"""
+        """generic save file method, only semesters that have changed are saved"""
 
-        for semester in self.schedules.keys():
-            if self.schedules[semester] is None:
+        unsaved = self.unsaved_semesters()
+        for semester in self.dirty_semesters():
+            if semester not in unsaved:
+                self._dirty_flags[semester] = False
                 continue
             filename = self._schedule_filenames.get(semester, None)
 
@@ -220,15 +255,16 @@ class AllocationManager:
 
             if filename is not None and filename != "":
                 self.schedules[semester].write_file(filename)
-                self.dirty_flag = False
+                self._dirty_flags[semester] = False
                 self.schedule_filename(semester,filename)
+        self.set_dirty_indicator()
 
     # ============================================================================================
     # Event handlers - exit
     # ============================================================================================
     def exit_event(self, *_):
         """program is exiting"""
-        if self.dirty_flag:
+        if self.dirty_flag and self.unsaved_semesters():
             ans = self.gui.ask_yes_no("File", "Save File?")
             if ans:
                 self.save_schedule()
@@ -236,18 +272,44 @@ class AllocationManager:
     def menu_exit_event(self, _:SemesterType):
         self.gui.exit_schedule()
 
+    # ============================================================================================
+    # Event handlers - balance CI
+    # ============================================================================================
+    def balance_ci_event(self, semester: SemesterType):
+        """propose allocations that even out the CI of the teachers, and use them if the user agrees"""
+        schedule = self.schedules.get(semester, None)
+        if schedule is None:
+            return
+        proposal = balance_allocations(schedule)
+        if len(proposal.allocations) == 0:
+            self.gui.show_message("Balance CI", "The CI can not be made any more even")
+            return
+        if not self.gui.ask_yes_no("Balance CI", f"Change {len(proposal.allocations)} allocations?",
+                                   detail=f"The difference between the highest and lowest CI will go from "
+                                          f"{proposal.spread_before:.1f} to {proposal.spread_after:.1f}"):
+            return
+
+        proposal.apply()
+        self.set_dirty_method(True, semester)
+        if self.current_tab == f"{semester.name} {self.NB_allocation}" and semester in self._allocation_frames:
+            self.update_allocation(self._allocation_frames[semester], semester)
+
     # ============================================================================================
     # Event handlers - go
     # ============================================================================================
     def go(self):
 
+        # read all the selected files at the same time
+        filenames = {semester: self.gui.selected_files[semester].get() for semester in VALID_SEMESTERS}
+        to_read = [s for s in VALID_SEMESTERS if filenames[s] != "" and filenames[s] != str(None)]
+        schedules = dict(zip(to_read, load_many((filenames[s] for s in to_read), return_exceptions=True)))
+
         for semester in VALID_SEMESTERS:
-            if (self.gui.selected_files[semester].get() == "" or
-                self.gui.selected_files[semester].get() == str(None)):
+            if semester not in schedules:
                 self.new_menu_event(semester)
-                self.set_dirty_method(False)
+                self.set_dirty_method(False, semester)
             else:
-                self._open_file(self.gui.selected_files[semester].get(), semester)
+                self._open_file(filenames[semester], semester, schedules[semester])
         self.standard_page = self.gui.create_standard_page(self._notebook_tabs)
         self.set_dirty_indicator()
 
@@ -263,43 +325,53 @@ class AllocationManager:
         self.current_tab = name
         if name == "fall":
             self.gui.select_tab(f"fall {self.NB_allocation}")
-            self._allocation_manager_already_open = False
         if name == "winter":
             self.gui.select_tab(f"winter {self.NB_allocation}")
-            self._allocation_manager_already_open = False
         for semester in VALID_SEMESTERS:
             if name == f"{semester.name} {self.NB_allocation}":
                 self.update_allocation(frame, semester)
             if name == f"{semester.name} {self.NB_course}":
                 self.update_edit_courses(frame, semester)
-                self._allocation_manager_already_open = False
             elif name == f"{semester.name} {self.NB_teacher}":
                 self.update_edit_teachers(frame, semester)
-                self._allocation_manager_already_open = False
             elif name == f"{semester.name} {self.NB_students}":
                 self.update_edit_students(frame, semester)
-                self._allocation_manager_already_open = False
 
     # ==================================================================
     # update the allocation frame
     # ==================================================================
     def update_allocation(self, frame, semester):
-        if not self._allocation_manager_already_open:
-            other_schedules = [self.schedules[s] for s in VALID_SEMESTERS if s != semester]
-            AllocationEditor(
-                self.set_dirty_method,
-                frame,
-                schedule=self.schedules[semester],
-                other_schedules = other_schedules
-            )
-        self._allocation_manager_already_open = True
+        """
+        Show the allocation editor for this semester.  The editor is kept, so if only allocations,
+        release or student numbers have changed since it was last shown, only those cells are updated
+        """
+        self._allocation_frames[semester] = frame
+        for edited in self._teachers_edited:
+            self.teacher_index.index_schedule(edited, self.schedules[edited])
+        self._teachers_edited.clear()
+
+        other_schedules = [self.schedules[s] for s in VALID_SEMESTERS if s != semester]
+        editor = self._allocation_editors.get(semester, None)
+        if (editor is not None and editor.frame is frame and editor.schedule is self.schedules[semester]
+                and editor.is_current()):
+            editor.other_schedules = other_schedules
+            editor.refresh()
+            return
+
+        self._allocation_editors[semester] = AllocationEditor(
+            partial(self.set_dirty_method, semester=semester),
+            frame,
+            schedule=self.schedules[semester],
+            other_schedules = other_schedules,
+            teacher_index = self.teacher_index
+        )
 
     # ==================================================================
     # draw_edit_courses
     # ==================================================================
     def update_edit_courses(self, frame, semester):
         """A page where courses can be added/modified or deleted"""
-        data_entry = EditCourses(self.set_dirty_method, frame, self.schedules[semester])
+        data_entry = EditCourses(partial(self.set_dirty_method, semester=semester), frame, self.schedules[semester])
         data_entry.schedule = self.schedules[semester]
         data_entry.refresh()
 
@@ -308,38 +380,47 @@ class AllocationManager:
     # ==================================================================
     def update_edit_teachers(self, frame, semester):
         """A page where teacher can be added/modified or deleted"""
-        data_entry = EditResources(self.set_dirty_method, frame, ResourceType.teacher,
+        data_entry = EditResources(partial(self.set_dirty_method, semester=semester), frame, ResourceType.teacher,
                                    self.schedules[semester], self.preferences)
         data_entry.schedule = self.schedules[semester]
         data_entry.refresh()
 
+        # teachers may be added or removed, so index them again when the next allocation page is created
+        self._teachers_edited.add(semester)
+
     # ==================================================================
     # update_edit_students
     # ==================================================================
     def update_edit_students(self, frame, semester):
-        data_entry = StudentNumbers(self.set_dirty_method, frame, self.schedules[semester])
+        data_entry = StudentNumbers(partial(self.set_dirty_method, semester=semester), frame, self.schedules[semester])
         data_entry.refresh()
 
     # ==================================================================
     # schedule has been modified, update gui as required
     # ==================================================================
-    def set_dirty_method(self, value: Optional[bool] = None) -> bool:
+    def set_dirty_method(self, value: Optional[bool] = None, semester: Optional[SemesterType] = None) -> bool:
+        """
+        :param value: has the data been changed (None if only asking)
+        :param semester: which semester was changed (None for all of them)
+        """
+        if value is not None:
+            for s in VALID_SEMESTERS if semester is None else (semester,):
+                self._dirty_flags[s] = value
 
-        # if value is true, and autosave is on, save the file
+        # if value is true, and autosave is on, save the file (only semesters that have changed)
         if value and self.preferences.auto_save():
             self.save_schedule()
-            value = False
 
-        if value is not None:
-            self.dirty_flag = value
+        self.set_dirty_indicator()
         return self.dirty_flag
 
     # ============================================================================================
     # Event handler, auto save setting changed
     # ============================================================================================
     def set_dirty_indicator(self):
-        if self.gui and self.dirty_flag:
-            self.gui.dirty_text = "UNSAVED"
+        dirty_semesters = self.dirty_semesters()
+        if self.gui and dirty_semesters:
+            self.gui.dirty_text = "UNSAVED: " + ", ".join(s.name for s in dirty_semesters)
         else:
             self.gui.dirty_text = self.auto_save_text
 
@@ -0,0 +1,88 @@
+"""
+The text that is displayed on a block in a view (no gui required, so that views can be exported without Tk)
+"""
+from __future__ import annotations
+
+import re
+
+from ..model import Block
+from ..model.enums import ResourceType
+
+# =====================================================================================================================
+# block labels, only recalculated if the block (or the scale) has changed
+# (block id, resource type, scale) -> (block version, block duration, text)
+# =====================================================================================================================
+_block_labels: dict[tuple[int, ResourceType, float], tuple[tuple[int, int], float, str]] = {}
+
+
+# =====================================================================================================================
+# get block text
+# =====================================================================================================================
+def get_block_text(block: Block, resource_type, scale=1) -> str:
+    """
+    :param block: The block object
+    :param scale: the scale of the view
+    :param resource_type: Teacher | Stream | Lab
+    """
+    key = (block.id, resource_type, scale)
+    label = _block_labels.get(key)
+    if label is not None and label[0:2] == (block.version, block.duration):
+        return label[2]
+
+    block_text = make_block_text(block, resource_type, scale)
+    _block_labels[key] = (block.version, block.duration, block_text)
+    return block_text
+
+
+def make_block_text(block: Block, resource_type, scale=1) -> str:
+    """
+    :param block: The block object
+    :param scale: the scale of the view
+    :param resource_type: Teacher | Stream | Lab
+    """
+
+    # course & section & streams
+    course_number = ""
+    section_number = ""
+    if block.section:
+        course_number = block.section.course.number if scale > 0.5 else re.split("[-*]", block.section.course.number)
+        section_number = block.section.title
+
+    # labs
+    lab_numbers = ", ".join(l.number for l in block.labs())
+    lab_numbers = lab_numbers if scale > .75 else lab_numbers[0:16] + "..."
+    lab_numbers = lab_numbers if scale > .50 else lab_numbers[0:7] + "..."
+    if resource_type == ResourceType.lab and (scale <= .75 or block.duration <= 1):
+            lab_numbers = ""
+    lab_numbers = "" if resource_type == ResourceType.lab and block.duration <= 1 else lab_numbers
+
+    # streams
+    stream_numbers = ",".join(s.number for s in block.streams())
+    stream_numbers = stream_numbers if scale > .75 else stream_numbers[0:11] + "..."
+    stream_numbers = stream_numbers if scale > .50 else stream_numbers[0:7] + "..."
+    if resource_type == ResourceType.stream and (scale <= .75 or block.duration <= 1):
+            stream_numbers = ""
+
+    # teachers
+    teachers_name = ""
+    if len(block.teachers()) <= 2:
+        for t in block.teachers():
+            if len(str(t)) > 12:
+                teachers_name = teachers_name + f"{t.firstname} {t.lastname[0:1]}.\n"
+            else:
+                teachers_name = teachers_name + f"{str(t)}\n"
+    teachers_name = teachers_name.rstrip()
+    teachers_name = teachers_name if scale > .75 else teachers_name[0:11] + "..."
+    teachers_name = teachers_name if scale > .50 else teachers_name[0:7] + "..."
+    if resource_type == ResourceType.teacher:
+        if scale < .75 or block.duration <= 1:
+            teachers_name = ""
+
+    # define what to display
+    block_text = f"{course_number}\n{section_number}\n"
+    block_text = block_text + teachers_name + "\n" if teachers_name else block_text
+    block_text = block_text + lab_numbers + "\n" if lab_numbers else block_text
+    block_text = block_text + stream_numbers + "\n" if stream_numbers else block_text
+
+    block_text = block_text.rstrip()
+    return block_text
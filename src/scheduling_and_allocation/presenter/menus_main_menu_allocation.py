@@ -20,6 +20,7 @@ MAIN_MENU_EVENT_HANDLER_NAMES_ALLOCATION = Literal[
     "file_save_as",
     "file_exit",
     "auto_save",
+    "balance_ci",
 ]
 
 
@@ -68,6 +69,17 @@ def main_menu_allocation(semesters:list[SemesterType]) -> tuple[list[str], dict[
                                  )
                         )
     # -----------------------------------------------------------------------------------------
+    # Allocation menu
+    # -----------------------------------------------------------------------------------------
+    allocation_menu = MenuItem(name='allocation', menu_type=MenuType.Cascade, label='Allocation')
+    for semester in semesters:
+        allocation_menu.add_child(MenuItem(name=f"balance_{semester.name}", menu_type=MenuType.Command,
+                                           label=f'Balance {semester.name} CI',
+                                           command=partial(MAIN_MENU_EVENT_HANDLERS_ALLOCATION["balance_ci"], semester)
+                                           )
+                                  )
+
+    # -----------------------------------------------------------------------------------------
     # Auto Save - coding is in the main-tk
     # -----------------------------------------------------------------------------------------
 
@@ -81,5 +93,6 @@ def main_menu_allocation(semesters:list[SemesterType]) -> tuple[list[str], dict[
 
     # return list of top level menu items
     menu.append(file_menu)
+    menu.append(allocation_menu)
 
     return toolbar_order, toolbar_info, menu
@@ -24,6 +24,14 @@ MAIN_MENU_EVENT_HANDLER_NAMES = Literal[
     "print_latex_teacher",
     "print_latex_lab",
     "print_latex_streams",
+    "print_pdf_teacher_one_file",
+    "print_pdf_lab_one_file",
+    "print_pdf_streams_one_file",
+    "print_pdf_all_one_file",
+    "print_latex_teacher_one_file",
+    "print_latex_lab_one_file",
+    "print_latex_streams_one_file",
+    "print_latex_all_one_file",
     "validate",
 ]
 
@@ -135,6 +143,18 @@ def main_menu() -> tuple[list[str], dict[str, ToolbarItem], list[MenuItem]]:
                                   command=lambda *_: MAIN_MENU_EVENT_HANDLERS["print_latex_streams"]()
                                   )
                          )
+
+    # all the schedules in one file (one page per schedule)
+    for parent_menu, canvas_name in ((pdf_menu, "pdf"), (latex_menu, "latex")):
+        one_file_menu = MenuItem(menu_type=MenuType.Cascade, label='One File')
+        parent_menu.add_child(MenuItem(menu_type=MenuType.Separator))
+        parent_menu.add_child(one_file_menu)
+        for label, name in (('Teacher Schedules', 'teacher'), ('Lab Schedules', 'lab'),
+                            ('Stream Schedules', 'streams'), ('All Schedules', 'all')):
+            one_file_menu.add_child(MenuItem(
+                menu_type=MenuType.Command, label=label,
+                command=lambda *_, event=f"print_{canvas_name}_{name}_one_file": MAIN_MENU_EVENT_HANDLERS[event]()
+            ))
     # -----------------------------------------------------------------------------------------
     # Auto Save - taken care of if main_tk
     # -----------------------------------------------------------------------------------------
@@ -0,0 +1,164 @@
+"""
+# ============================================================================
+# An overview of the class times for all resources of one type (teachers, labs or streams),
+# one lane per resource, all on the same weekly timeline
+#
+# Events triggered by OverviewTk
+#   get_lane_blocks(lane, detailed, scale)
+#   open_view(lane)
+#   on_closing(*_)
+#
+# Methods called from ViewsController
+#   refresh()
+#   close()
+# ============================================================================
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ..gui_pages.overview_tk import OverviewTk
+from ..model import Block, Schedule, Teacher, Lab, Stream, ConflictType, ResourceType
+from .view import View
+
+if TYPE_CHECKING:
+    from .views_controller import ViewsController
+
+RESOURCE = Teacher | Lab | Stream
+
+
+# =====================================================================================================================
+# what is drawn in a lane
+# =====================================================================================================================
+@dataclass
+class OverviewBlock:
+    day: int
+    start: float
+    duration: float
+    conflict: ConflictType = ConflictType.NONE
+    movable: bool = True
+    text: str = ""
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+# =====================================================================================================================
+# occupancy (for when there is no room to show the individual blocks)
+# =====================================================================================================================
+def occupancy(blocks: list[OverviewBlock]) -> list[OverviewBlock]:
+    """
+    merge blocks that overlap or touch on the same day into one block, with all of their conflicts
+    :param blocks:
+    :return: the merged blocks, sorted by day and time
+    """
+    merged: list[OverviewBlock] = []
+    for block in sorted(blocks, key=lambda b: (b.day, b.start)):
+        last = merged[-1] if merged else None
+        if last is not None and last.day == block.day and block.start <= last.end:
+            last.duration = max(last.end, block.end) - last.start
+            last.conflict |= block.conflict
+            last.movable = last.movable and block.movable
+        else:
+            merged.append(OverviewBlock(block.day, block.start, block.duration, block.conflict, block.movable))
+    return merged
+
+
+# =====================================================================================================================
+# Overview
+# =====================================================================================================================
+class Overview:
+    """Overview - all the resources of one type in one window"""
+
+    def __init__(self, views_controller: ViewsController, frame, schedule: Schedule,
+                 resource_type: ResourceType, gui: OverviewTk = None):
+        """
+        :param views_controller: opens the individual views
+        :param frame: container
+        :param schedule:
+        :param resource_type: teacher, lab or stream
+        :param gui: doesn't need to be set except when setting up for a test suite
+        """
+        self.views_controller = views_controller
+        self.schedule = schedule
+        self.resource_type = resource_type
+        self.resources: list[RESOURCE] = []
+        self._lane_blocks: dict[str, list[Block]] = {}
+
+        if gui is None:
+            self.gui = OverviewTk(frame, f"All {resource_type.name}s", resource_type)
+        else:
+            self.gui = gui
+
+        self.gui.get_lane_blocks_handler = self.get_lane_blocks
+        self.gui.open_view_handler = self.open_view
+        self.gui.on_closing_handler = self.on_closing
+
+        self.refresh()
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # refresh (the schedule has changed)
+    # ----------------------------------------------------------------------------------------------------------------
+    def refresh(self):
+        """find the blocks for every resource (in one pass over the schedule) and redraw the visible lanes"""
+        match self.resource_type:
+            case ResourceType.teacher:
+                self.resources = sorted(self.schedule.teachers())
+            case ResourceType.lab:
+                self.resources = sorted(self.schedule.labs())
+            case ResourceType.stream:
+                self.resources = sorted(self.schedule.streams())
+
+        self._lane_blocks = {resource.number: [] for resource in self.resources}
+        for block in self.schedule.blocks():
+            match self.resource_type:
+                case ResourceType.teacher:
+                    resources = block.teachers()
+                case ResourceType.lab:
+                    resources = block.labs()
+                case _:
+                    resources = block.streams()
+            for resource in resources:
+                if resource.number in self._lane_blocks:
+                    self._lane_blocks[resource.number].append(block)
+
+        self.gui.set_lanes([str(resource) for resource in self.resources])
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # what to draw in a lane (get_lane_blocks_handler)
+    # ----------------------------------------------------------------------------------------------------------------
+    def get_lane_blocks(self, lane: int, detailed: bool, scale: float = 1) -> list[OverviewBlock]:
+        """
+        :param lane: which resource
+        :param detailed: if true, every block with its text, else only when the resource is busy
+        :param scale: the scale used to create the block text
+        """
+        if not 0 <= lane < len(self.resources):
+            return []
+
+        blocks = [OverviewBlock(block.day.value, block.start, block.duration, block.conflict, block.movable)
+                  for block in self._lane_blocks[self.resources[lane].number]]
+        if not detailed:
+            return occupancy(blocks)
+
+        for overview_block, block in zip(blocks, self._lane_blocks[self.resources[lane].number]):
+            overview_block.text = View.get_block_text(block, resource_type=self.resource_type, scale=scale)
+        return blocks
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # open the view of one resource (open_view_handler)
+    # ----------------------------------------------------------------------------------------------------------------
+    def open_view(self, lane: int):
+        if 0 <= lane < len(self.resources):
+            self.views_controller.call_view(self.resources[lane])
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # closing
+    # ----------------------------------------------------------------------------------------------------------------
+    def on_closing(self, *_):
+        self.views_controller.overview_is_closing(self.resource_type)
+
+    def close(self):
+        self.gui.kill()
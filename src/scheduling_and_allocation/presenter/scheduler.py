@@ -35,14 +35,13 @@
 
 from __future__ import annotations
 
-from enum import Enum
 from functools import partial
+from os import path
 from typing import Optional
 
 from .edit_resources import EditResources
 from .edit_courses import EditCourses
 from .menus_main_menu_scheduler import set_menu_event_handler, main_menu
-from .view import View
 from .views_controller import ViewsController
 from .notebook_tab_data import NBTabInfo
 
@@ -51,12 +50,7 @@ from ..gui_pages.scheduler_tk import SchedulerTk, set_main_page_event_handler
 from ..model import Schedule, ResourceType
 from ..model.exceptions import CouldNotReadFileError
 from ..gui_generics.read_only_text_tk import ReadOnlyTextTk
-from ..export.view_export_canvases import PDFCanvas, LatexCanvas
-from ..gui_pages.view_canvas_tk import ViewCanvasTk
-
-class CanvasType(Enum):
-    latex = 1
-    pdf = 2
+from ..export.batch_export import BatchExport, ExportJob, CanvasType, export_jobs, EXTENSIONS
 
 # =====================================================================================
 # Scheduler
@@ -135,6 +129,12 @@ class Scheduler:
         set_menu_event_handler("print_latex_teacher", partial(self.print_views, ResourceType.teacher, CanvasType.latex))
         set_menu_event_handler("print_latex_lab", partial(self.print_views, ResourceType.lab, CanvasType.latex))
         set_menu_event_handler("print_latex_streams", partial(self.print_views, ResourceType.stream, CanvasType.latex))
+        for name, r_type in (("teacher", ResourceType.teacher), ("lab", ResourceType.lab),
+                             ("streams", ResourceType.stream), ("all", None)):
+            set_menu_event_handler(f"print_pdf_{name}_one_file",
+                                   partial(self.print_views, r_type, CanvasType.pdf, True))
+            set_menu_event_handler(f"print_latex_{name}_one_file",
+                                   partial(self.print_views, r_type, CanvasType.latex, True))
 
         self.gui.toggle_auto_save = self.auto_save_set
 
@@ -412,17 +412,19 @@ class Scheduler:
     # ==================================================================
     # print_views
     # ==================================================================
-    def print_views(self, resource_type, canvas_type: CanvasType):
+    def print_views(self, resource_type: Optional[ResourceType], canvas_type: CanvasType, one_file: bool = False):
         """
         print the schedule 'views'
-        :param resource_type:
+        :param resource_type: teacher, lab or stream (None for all of them)
         :param canvas_type: pdf or latex
+        :param one_file: if true, all the views are pages of one file, else one file per view
         :return:
         """
 
         # no schedule yet
         if not self.schedule:
             self.gui.show_error("Export", "Cannot export - There is no schedule")
+            return
 
         # should not print if the schedule is not saved
         if self.dirty_flag:
@@ -433,54 +435,44 @@ class Scheduler:
                 )
             return
 
-        # gather info
-        resources = ()
-        match resource_type:
-            case ResourceType.teacher:
-                resources = self.schedule.teachers()
-            case ResourceType.lab:
-                resources = self.schedule.labs()
-            case ResourceType.stream:
-                resources = self.schedule.streams()
-
-        # loop over each resource and create file
+        # gather what needs to be drawn for each resource (the files are written in other processes)
         save_dir = self.preferences.current_dir() or self.preferences.home_directory()
-        for resource in resources:
+        resource_types = (resource_type,) if resource_type is not None else \
+            (ResourceType.teacher, ResourceType.lab, ResourceType.stream)
+        jobs: list[ExportJob] = []
+        for r_type in resource_types:
+            group = f"{r_type.name.capitalize()}s" if len(resource_types) > 1 else ""
+            jobs.extend(export_jobs(self.schedule, r_type, canvas_type, str(save_dir), group))
+
+        if not jobs:
+            return
 
-            # pdf or latex
-            if canvas_type == CanvasType.pdf:
-                cn = PDFCanvas(title=str(resource), schedule_name=self.schedule.filename,
-                               directory=save_dir)
-                vc = ViewCanvasTk(cn, 0.8)
-            else:
-                cn = LatexCanvas(title=str(resource), schedule_name=self.schedule.filename,
-                               directory=save_dir)
-                vc = cn
-
-            # get all the blocks
-            blocks = ()
-            match resource_type:
-                case ResourceType.teacher:
-                    blocks = self.schedule.get_blocks_for_teacher(resource)
-                case ResourceType.lab:
-                    blocks = self.schedule.get_blocks_in_lab(resource)
-                case ResourceType.stream:
-                    blocks = self.schedule.get_blocks_for_stream(resource)
-
-            # draw the blocks
-            for block in blocks:
-                text = View.get_block_text(block, scale=1, resource_type=ResourceType.teacher)
-
-                day, start_time, duration = View._block_to_floats(block)
-
-                vc.draw_block(resource_type=ResourceType.teacher,
-                              day=day, start_time=start_time, duration=duration,
-                              text=text,
-                              gui_tag="",
-                              movable=True,
-                              )
-            # write to file
-            cn.save()
+        # write the files in the background, and keep the user informed
+        what = f"{resource_type.name}s" if resource_type is not None else "all"
+        document = None
+        if one_file:
+            name = path.splitext(path.basename(self.schedule.filename))[0] or "schedule"
+            document = path.join(str(save_dir), f"{name}_{what}.{EXTENSIONS[canvas_type]}")
+        exporter = BatchExport(jobs, document=document, title=f"{self.schedule.filename} ({what})")
+        exporter.start()
+
+        def _poll() -> tuple[int, int, bool]:
+            progress = exporter.progress()
+            return progress.done, progress.total, progress.finished
+
+        self.gui.show_progress(title="Export",
+                               msg=f"Exporting {len(jobs)} views to {document if one_file else save_dir}",
+                               poll_handler=_poll, cancel_handler=exporter.cancel,
+                               finished_handler=partial(self._export_finished, exporter))
+
+    def _export_finished(self, exporter: BatchExport):
+        """all the files have been written (or the export was cancelled)"""
+        progress = exporter.wait()
+        if progress.errors:
+            self.gui.show_error("Export", f"{len(progress.errors)} files could not be exported",
+                                "\n".join(progress.errors))
+        elif progress.cancelled:
+            self.gui.show_message("Export", f"Export cancelled, {len(progress.files)} files were written")
 
     # ==================================================================
     # validate
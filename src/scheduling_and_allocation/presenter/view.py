@@ -7,6 +7,7 @@
 #   draw_blocks()
 #   on_closing(_*)
 #   open_companion_view(gui_id)
+#   get_drop_targets(gui_id)
 #   gui_block_is_moving(gui_id,  gui_block_day, gui_block_start_time)
 #   gui_block_has_dropped(gui_id)
 #
@@ -24,20 +25,34 @@
 # ============================================================================
 """
 from __future__ import annotations
-import re
+from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING, Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable, Iterable
 
 from ..gui_generics.menu_and_toolbars import MenuItem, MenuType
 from ..Utilities.id_generator import IdGenerator
 from ..gui_pages.view_dynamic_tk import ViewDynamicTk
 from ..model import Block, Teacher, Stream, Lab, Schedule
-from ..model.enums import ResourceType
+from ..model.enums import ResourceType, ConflictType
+from .block_text import get_block_text, make_block_text
 if TYPE_CHECKING:
     from ..presenter.views_controller import ViewsController
 
 RESOURCE = Lab | Stream | Teacher
 
+
+# =====================================================================================================================
+# what has been drawn on the gui for a block (so that only changes need to be redrawn)
+# =====================================================================================================================
+@dataclass
+class GuiBlockState:
+    day: int
+    start: float
+    duration: float
+    text: str
+    movable: bool
+    conflict: Optional[ConflictType] = None
+
 # =====================================================================================================================
 # use an generator to always guarantee that the new id will be unique
 # =====================================================================================================================
@@ -63,8 +78,13 @@ class View:
         self.resource = resource
         self.schedule = schedule
         self.gui_blocks: dict[str, Block] = {}
+        self._gui_tags: dict[int, str] = {}
         self.dirty_flag_method = dirty_flag_method
 
+        # what is currently drawn for each gui block, and at what scale
+        self._drawn: dict[str, GuiBlockState] = {}
+        self._drawn_scale: Optional[float] = None
+
         # get the resource type from the resource object, and all its blocks
         resource_type = ResourceType.none
         if isinstance(resource, Teacher):
@@ -88,6 +108,7 @@ class View:
         self.gui.refresh_blocks_handler = self.draw_blocks
         self.gui.on_closing_handler = self.on_closing
         self.gui.double_click_block_handler = self.open_companion_view
+        self.gui.get_drop_targets_handler = self.get_drop_targets
         self.gui.gui_block_is_moving_handler = self.gui_block_is_moving
         self.gui.gui_block_has_dropped_handler = self.gui_block_has_dropped
         self.gui.undo_handler = self.views_controller.undo
@@ -107,6 +128,8 @@ class View:
         """
         block.movable = not block.movable
         self.gui.modify_movable(gui_id, block.movable)
+        if gui_id in self._drawn:
+            self._drawn[gui_id].movable = block.movable
 
         # very important, let the gui controller _know_ that the gui block has been modified
         self.views_controller.notify_block_movable_toggled( block)
@@ -124,7 +147,7 @@ class View:
     # ----------------------------------------------------------------------------------------------------------------
     def draw_blocks(self):
         """
-        draw blocks onto Canvas
+        draw blocks onto Canvas.  Blocks that are already drawn are only updated if they have changed
         """
 
         # get all the blocks for this resource/schedule
@@ -137,30 +160,78 @@ class View:
             case ResourceType.lab:
                 blocks = self.schedule.get_blocks_in_lab(self.resource)
 
-        # create all the gui blocks and draw them
-        self.gui_blocks.clear()
-
-        for block in blocks:
+        # if the scale has changed, the canvas has been redrawn, so there are no gui blocks anymore
+        scale = self.gui.get_scale()
+        if scale != self._drawn_scale:
+            self.gui_blocks.clear()
+            self._gui_tags.clear()
+            self._drawn.clear()
+            self._drawn_scale = scale
 
-            gui_block_id: int = _gui_block_ids.get_new_id()
-            gui_tag = f"gui_tag_{gui_block_id}"
-            self.gui_blocks[gui_tag] = block
+        # gui blocks that no longer have a block (left over from this loop) will be removed
+        old_gui_tags = {block: gui_tag for gui_tag, block in self.gui_blocks.items()}
 
-            text = self.get_block_text(block, scale = self.gui.get_scale(),resource_type = self.resource_type)
+        for block in blocks:
+            text = self.get_block_text(block, scale = scale, resource_type = self.resource_type)
             day, start_time, duration = self._block_to_floats(block)
 
-            self.gui.draw_block(resource_type=self.resource_type,
-                                day=day, start_time=start_time, duration=duration,
-                                text=text,
-                                gui_block_id=gui_tag,
-                                movable=block.movable)
-            self.gui.colour_block(gui_tag, self.resource_type, block.movable, conflict=block.conflict)
+            # a gui block that has changed size is simply redrawn
+            gui_tag = old_gui_tags.pop(block, None)
+            if gui_tag is not None and self._drawn[gui_tag].duration != duration:
+                self._remove_gui_block(gui_tag)
+                gui_tag = None
+
+            # new gui block
+            if gui_tag is None:
+                gui_block_id: int = _gui_block_ids.get_new_id()
+                gui_tag = f"gui_tag_{gui_block_id}"
+                self.gui_blocks[gui_tag] = block
+                self._gui_tags[block.id] = gui_tag
+                self._drawn[gui_tag] = GuiBlockState(day, start_time, duration, text, block.movable)
+
+                self.gui.draw_block(resource_type=self.resource_type,
+                                    day=day, start_time=start_time, duration=duration,
+                                    text=text,
+                                    gui_block_id=gui_tag,
+                                    movable=block.movable)
+                self._colour_gui_block(gui_tag, block)
+                continue
+
+            # existing gui block, only update what has changed
+            drawn = self._drawn[gui_tag]
+            if (drawn.day, drawn.start) != (day, start_time):
+                self.gui.move_gui_block(gui_tag, day, start_time)
+                drawn.day, drawn.start = day, start_time
+            if drawn.text != text:
+                self.gui.set_block_text(gui_tag, text)
+                drawn.text = text
+            if drawn.movable != block.movable:
+                self.gui.modify_movable(gui_tag, block.movable)
+            self._colour_gui_block(gui_tag, block)
+
+        for gui_tag in old_gui_tags.values():
+            self._remove_gui_block(gui_tag)
+
+    def _remove_gui_block(self, gui_tag: str):
+        self.gui.remove_block(gui_tag)
+        block = self.gui_blocks.pop(gui_tag, None)
+        if block is not None:
+            self._gui_tags.pop(block.id, None)
+        self._drawn.pop(gui_tag, None)
+
+    def _colour_gui_block(self, gui_tag: str, block: Block):
+        """colour the gui block, if its movability or conflict has changed since it was last coloured"""
+        drawn = self._drawn[gui_tag]
+        if drawn.conflict is not None and (drawn.movable, drawn.conflict) == (block.movable, block.conflict):
+            return
+        self.gui.colour_block(gui_tag, self.resource_type, block.movable, conflict=block.conflict)
+        drawn.movable, drawn.conflict = block.movable, block.conflict
 
     # ----------------------------------------------------------------------------------------------------------------
     # is block in this view?
     # ----------------------------------------------------------------------------------------------------------------
     def is_block_in_view(self, block):
-        return block in self.gui_blocks.values()
+        return block.id in self._gui_tags
 
     # ----------------------------------------------------------------------------------------------------------------
     # important tidy-up stuff (on_closing_handler)
@@ -183,6 +254,20 @@ class View:
         block = self.gui_blocks[gui_tag]
         self.views_controller.open_companion_view(block)
 
+    # ----------------------------------------------------------------------------------------------------------------
+    # where can the block be dropped (get_drop_targets_handler)
+    # ----------------------------------------------------------------------------------------------------------------
+    def get_drop_targets(self, gui_id: str) -> dict[tuple[int, float], int]:
+        """
+        The number of conflicts the block would have at every day and start time
+        :param gui_id: the id of the gui representation of the block
+        :return: (day, start) -> number of conflicts
+        """
+        block: Block = self.gui_blocks.get(gui_id, None)
+        if block is None:
+            return {}
+        return self.schedule.drop_target_conflicts(block)
+
     # ----------------------------------------------------------------------------------------------------------------
     # gui_block_is_moving (gui_block_is_moving_handler)
     # ----------------------------------------------------------------------------------------------------------------
@@ -204,14 +289,18 @@ class View:
             self._block_original_day = block.day.value
 
         # update the block by snapping to time and day, although it doesn't update the gui block
+        snapped = (block.day, block.start)
         block.start = gui_block_start_time
         block.snap_to_day(gui_block_day)
         block.snap_to_time()
-        self.schedule.calculate_conflicts()
-        self.refresh_block_colours()
-        #self.gui.colour_block(gui_id, self.resource_type, is_movable=block.movable, conflict = block.conflict)
+
+        # conflicts can only change if the block has snapped to a different time, and then only
+        # for blocks that share a resource with it
+        if (block.day, block.start) != snapped:
+            self.schedule.calculate_conflicts_for(block)
 
         # very important, let the gui controller _know_ that the gui block has been moved
+        # (it will update the colours of the blocks in all the views, including this one)
         self.views_controller.notify_block_move(self.resource.number, block, gui_block_day, gui_block_start_time)
 
         # don't set dirty flag until block has dropped!
@@ -232,6 +321,7 @@ class View:
         # set the gui block coordinates to match the block
         # (which is constantly being snapped to grid during the move process)
         self.gui.move_gui_block(gui_id, block.day.value,block.start)
+        self._drawn[gui_id].day, self._drawn[gui_id].start = block.day.value, block.start
 
         # has the block actually moved?
         if self._block_original_start_time is None or self._block_original_day is None:
@@ -332,18 +422,30 @@ class View:
         :param day: the day that the **gui block** needs to be moved to (not necessarily the same as the block)
         :param start_time: the time that the **gui block** needs to be moved to (not necessarily the same as the block)
         """
-        gui_id = self._get_gui_id_from_block(block.number)
+        gui_id = self._get_gui_id_from_block(block)
+        if gui_id is None:
+            return
         self.gui.move_gui_block(gui_id, day, start_time)
+        self._drawn[gui_id].day, self._drawn[gui_id].start = day, start_time
 
 
     # ----------------------------------------------------------------------------------------------------------------
     # refresh block colour (used by Views Controller & View)
     # ----------------------------------------------------------------------------------------------------------------
-    def refresh_block_colours(self):
-        """Go through all blocks, and adjust colours as required"""
+    def refresh_block_colours(self, blocks: Optional[Iterable[Block]] = None):
+        """
+        Go through all blocks, and adjust colours as required
+        :param blocks: only these blocks (if they are in this view), default all
+        """
+        if blocks is None:
+            for gui_tag, block in self.gui_blocks.items():
+                self._colour_gui_block(gui_tag, block)
+            return
 
-        for gui_tag, block in self.gui_blocks.items():
-            self.gui.colour_block(gui_tag, self.resource_type, is_movable=block.movable, conflict = block.conflict)
+        for block in blocks:
+            gui_tag = self._get_gui_id_from_block(block)
+            if gui_tag is not None:
+                self._colour_gui_block(gui_tag, block)
 
     # ----------------------------------------------------------------------------------------------------------------
     # get block text
@@ -355,52 +457,12 @@ class View:
         :param scale: the scale of the view
         :param resource_type: Teacher | Stream | Lab
         """
+        return get_block_text(block, resource_type, scale)
 
-        # course & section & streams
-        course_number = ""
-        section_number = ""
-        if block.section:
-            course_number = block.section.course.number if scale > 0.5 else re.split("[-*]", block.section.course.number)
-            section_number = block.section.title
-
-        # labs
-        lab_numbers = ", ".join(l.number for l in block.labs())
-        lab_numbers = lab_numbers if scale > .75 else lab_numbers[0:16] + "..."
-        lab_numbers = lab_numbers if scale > .50 else lab_numbers[0:7] + "..."
-        if resource_type == ResourceType.lab and (scale <= .75 or block.duration <= 1):
-                lab_numbers = ""
-        lab_numbers = "" if resource_type == ResourceType.lab and block.duration <= 1 else lab_numbers
-
-        # streams
-        stream_numbers = ",".join(s.number for s in block.streams())
-        stream_numbers = stream_numbers if scale > .75 else stream_numbers[0:11] + "..."
-        stream_numbers = stream_numbers if scale > .50 else stream_numbers[0:7] + "..."
-        if resource_type == ResourceType.stream and (scale <= .75 or block.duration <= 1):
-                stream_numbers = ""
-
-        # teachers
-        teachers_name = ""
-        if len(block.teachers()) <= 2:
-            for t in block.teachers():
-                if len(str(t)) > 12:
-                    teachers_name = teachers_name + f"{t.firstname} {t.lastname[0:1]}.\n"
-                else:
-                    teachers_name = teachers_name + f"{str(t)}\n"
-        teachers_name = teachers_name.rstrip()
-        teachers_name = teachers_name if scale > .75 else teachers_name[0:11] + "..."
-        teachers_name = teachers_name if scale > .50 else teachers_name[0:7] + "..."
-        if resource_type == ResourceType.teacher:
-            if scale < .75 or block.duration <= 1:
-                teachers_name = ""
-
-        # define what to display
-        block_text = f"{course_number}\n{section_number}\n"
-        block_text = block_text + teachers_name + "\n" if teachers_name else block_text
-        block_text = block_text + lab_numbers + "\n" if lab_numbers else block_text
-        block_text = block_text + stream_numbers + "\n" if stream_numbers else block_text
-
-        block_text = block_text.rstrip()
-        return block_text
+    @staticmethod
+    def _make_block_text( block: Block, resource_type, scale=1):
+        """the block text, without using the saved labels"""
+        return make_block_text(block, resource_type, scale)
 
     # ----------------------------------------------------------------------------------------------------------------
     # draw - called by Views Controller
@@ -419,9 +481,6 @@ class View:
     # ----------------------------------------------------------------------------------------------------------------
     # get gui id from block
     # ----------------------------------------------------------------------------------------------------------------
-    def _get_gui_id_from_block(self, block_number: str) -> Optional[str]:
-        for g,b in self.gui_blocks.items():
-            if b.number == block_number:
-                return g
-        return None
+    def _get_gui_id_from_block(self, block: Block) -> Optional[str]:
+        return self._gui_tags.get(block.id)
 
@@ -4,6 +4,7 @@
 #
 # Events triggered by ViewsControllerTk
 #   call_view(resource)
+#   call_overview(resource_type)
 #
 # Events triggered by ViewDynamicTk
 #   undo()
@@ -22,14 +23,18 @@
 #
 #   remove_all_redoes()
 #   view_is_closing(self.resource)
+#
+# Feedback from Overviews
+#   overview_is_closing(self.resource_type)
 # ============================================================================
 """
 
-from typing import Callable, Optional, Literal
+from typing import Callable, Optional, Literal, Iterable
 
 from ..gui_pages.views_controller_tk import ViewsControllerTk
 from ..model import ResourceType, Schedule, Stream, Teacher, Lab, Block
 from .view import View
+from .overview import Overview
 
 RESOURCE = Teacher | Lab | Stream
 
@@ -89,9 +94,16 @@ class ViewsController:
         self.frame = frame
         self.schedule = schedule
         self._views: dict[str, View] = {}
+        self._overviews: dict[ResourceType, Overview] = {}
         self._undo: list[Action] = []
         self._redo: list[Action] = []
 
+        # the block that was last moved, and where it was (so that dragging only updates what has changed)
+        self._last_move: Optional[tuple[Block, object, float]] = None
+
+        # which views are showing a block (block id -> view ids), filled in as required
+        self._block_views: dict[int, list[str]] = {}
+
 
         self.resources = {
             ResourceType.teacher: list(self.schedule.teachers()),
@@ -102,16 +114,24 @@ class ViewsController:
         if gui is not None:
             self.gui = gui
         else:
-            self.gui = ViewsControllerTk(frame, self.resources, self.call_view)
+            self.gui = ViewsControllerTk(frame, self.resources, self.call_view, self.call_overview)
 
 
     # -----------------------------------------------------------------------------------------------------------------
     # refresh
     # -----------------------------------------------------------------------------------------------------------------
-    def refresh(self):
+    def refresh(self, resources: Optional[Iterable[RESOURCE]] = None):
         """
         sets the button colours for view choices depending on the most severe conflict for that resource
+        :param resources: only update the buttons for these resources (conflicts must already be up-to-date),
+                          default is to recalculate all conflicts and update all the buttons
         """
+        if resources is not None:
+            for resource in resources:
+                conflict = self.schedule.resource_conflict(resource)
+                conflict = conflict.most_severe(resource.resource_type)
+                self.gui.set_button_colour(resource.number, resource.resource_type, conflict)
+            return
 
         # if resources have changed, then we need to close all the views, and create a new gui
         resources = {
@@ -127,7 +147,7 @@ class ViewsController:
                 break
         if redrawing:
             self.resources = resources
-            self.gui = ViewsControllerTk(self.frame, self.resources, self.call_view)
+            self.gui = ViewsControllerTk(self.frame, self.resources, self.call_view, self.call_overview)
 
         # update the colours
         self.schedule.calculate_conflicts()
@@ -151,22 +171,91 @@ class ViewsController:
             return
 
         self._views[resource.number] = View(self, self.frame, self.schedule, resource, self.dirty_flag_method)
+        self._block_views.clear()
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # call overview
+    # -----------------------------------------------------------------------------------------------------------------
+    def call_overview(self, resource_type: ResourceType):
+        """
+        creates the overview of all resources of this type, or if it already exists, makes it visible
+        :param resource_type:
+        """
+        if resource_type in self._overviews:
+            self._overviews[resource_type].gui.raise_to_top()
+            return
+
+        self._overviews[resource_type] = Overview(self, self.frame, self.schedule, resource_type)
+
+    def overview_is_closing(self, resource_type: ResourceType):
+        """overview has been closed, update our internal database"""
+        self._overviews.pop(resource_type, None)
+
+    def _refresh_overviews(self):
+        """the overviews show every block, so they are redrawn whenever a block changes"""
+        for overview in self._overviews.values():
+            overview.refresh()
+
+    # -----------------------------------------------------------------------------------------------------------------
+    # what views are showing this block
+    # -----------------------------------------------------------------------------------------------------------------
+    def _views_showing(self, block: Block) -> dict[str, View]:
+        """
+        the views that are showing this block (remembered until the views or their blocks change)
+        :param block:
+        """
+        view_ids = self._block_views.get(block.id)
+        if view_ids is None:
+            view_ids = [view_id for view_id, view in self._views.items() if view.is_block_in_view(block)]
+            self._block_views[block.id] = view_ids
+        return {view_id: self._views[view_id] for view_id in view_ids if view_id in self._views}
 
 
     # -----------------------------------------------------------------------------------------------------------------
     # notify block move
     # -----------------------------------------------------------------------------------------------------------------
     def notify_block_move(self, resource_number: Optional[str], moved_block: Block, day: float, start_time:float):
-        """A GUI block has been modified in a view, so propagate this information to the other views"""
+        """
+        A GUI block has been modified in a view, so propagate this information to the other views
 
-        self.refresh()
+        While a block is being dragged, this is called for every step.  The conflicts only need updating when
+        the block snaps to a different time, and then only for the blocks that share a resource with it
+        (the conflicts of these blocks must already have been recalculated)
+        """
+        position = (moved_block, moved_block.day, moved_block.start)
+        same_block = self._last_move is not None and self._last_move[0] is moved_block
+        snapped_to_new_time = same_block and self._last_move != position
+        self._last_move = position
+
+        # which blocks need to be recoloured (None is all of them)
+        changed_blocks: Optional[tuple[Block, ...]] = None
+        if snapped_to_new_time:
+            changed_blocks = self.schedule.get_blocks_sharing_resources(moved_block)
+            self.refresh({r for b in changed_blocks for r in (*b.teachers(), *b.labs(), *b.streams())})
+        elif same_block:
+            changed_blocks = ()
+        else:
+            self.refresh()
 
         # update any view that has the same block that was moved
-        for view_id, view in self._views.items():
+        for view_id, view in self._views_showing(moved_block).items():
             if resource_number is None or view_id != resource_number:
-                if view.is_block_in_view(moved_block):
-                    view.move_gui_block_to(moved_block, day, start_time)
-            view.refresh_block_colours()
+                view.move_gui_block_to(moved_block, day, start_time)
+
+        # update the colours of the blocks, but only in the views that show them
+        if changed_blocks is None:
+            for view in self._views.values():
+                view.refresh_block_colours()
+        elif changed_blocks:
+            views: dict[str, View] = {}
+            for block in changed_blocks:
+                views.update(self._views_showing(block))
+            for view in views.values():
+                view.refresh_block_colours(changed_blocks)
+
+        # while dragging, the overviews are only redrawn when the block snaps to a different time
+        if snapped_to_new_time or not same_block:
+            self._refresh_overviews()
 
     # -----------------------------------------------------------------------------------------------------------------
     # notify block movable toggled
@@ -179,6 +268,7 @@ class ViewsController:
         # update any view that has the same block that was moved
         for view_id, view in self._views.items():
             view.refresh_block_colours()
+        self._refresh_overviews()
 
     # ----------------------------------------------------------------------------------------------------------------
     # notify move block to a different resource
@@ -199,6 +289,7 @@ class ViewsController:
                 block.remove_lab(from_resource)
                 block.add_lab(to_resource)
         self.schedule.calculate_conflicts()
+        self._block_views.clear()
 
         if from_resource.number in self._views.keys():
             self._views[from_resource.number].draw()
@@ -211,6 +302,7 @@ class ViewsController:
             self.call_view(to_resource)
 
         self.refresh()
+        self._refresh_overviews()
 
         self.dirty_flag_method(True)
 
@@ -239,6 +331,7 @@ class ViewsController:
             self._views.pop(resource.number)
         except KeyError:
             pass
+        self._block_views.clear()
 
     # -----------------------------------------------------------------------------------------------------------------
     # save changes to undo db
@@ -339,6 +432,7 @@ class ViewsController:
     def redraw_all(self):
         """redraw all the views and update button choices"""
         self.schedule.calculate_conflicts()
+        self._block_views.clear()
 
         for resource, view in self._views.items():
             teacher_numbers = (x.number for x in self.schedule.teachers())
@@ -351,6 +445,8 @@ class ViewsController:
             else:
                 view.draw()
 
+        self._refresh_overviews()
+
     # ----------------------------------------------------------------------------------------------------------------
     # kill bill!
     # ----------------------------------------------------------------------------------------------------------------
@@ -358,3 +454,5 @@ class ViewsController:
         """vicious!"""
         for view in self._views.values():
             view.close()
+        for overview in self._overviews.values():
+            overview.close()
@@ -0,0 +1,98 @@
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType
+from src.scheduling_and_allocation.ci_calculator.ci_calculation import calculate_ci
+from src.scheduling_and_allocation.ci_calculator.allocation_balancer import balance_allocations
+
+DATA_DIR = path.join(path.dirname(__file__), "..", "unit_tests_presenter")
+
+
+# ============================================================================
+# helpers
+# ============================================================================
+def allocated_hours(section):
+    teachers = set(section.teachers()) | set(section.section_defined_teachers())
+    return sum(section.get_teacher_allocation(t) for t in teachers)
+
+
+def small_schedule():
+    schedule = Schedule()
+    jane = schedule.add_update_teacher("Jane", "Doe")
+    schedule.add_update_teacher("John", "Smith")
+    schedule.add_update_teacher("Sam", "Jones", release=0.25)
+    course = schedule.add_update_course("420-101", "Programming", SemesterType.fall, 3)
+    for number in ("1", "2", "3", "4"):
+        section = course.add_section(number)
+        section.num_students = 30
+        section.add_block(1, 8, 1.5)
+        section.add_block(3, 8, 1.5)
+        section.set_teacher_allocation(jane, 3)
+    return schedule
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_balance_reduces_spread():
+    schedule = small_schedule()
+    proposal = balance_allocations(schedule)
+    assert proposal.spread_after < proposal.spread_before
+    assert len(proposal.allocations) > 0
+
+
+def test_schedule_not_changed_until_applied():
+    schedule = small_schedule()
+    jane = schedule.get_teacher_by_name("Jane", "Doe")
+    before = calculate_ci(jane, schedule)
+    balance_allocations(schedule)
+    assert calculate_ci(jane, schedule) == before
+
+
+@pytest.mark.parametrize("filename", ["data_fall.csv", "data_winter.csv"])
+def test_applied_proposal_matches_ci_and_course_hours(filename):
+    schedule = Schedule(path.join(DATA_DIR, filename))
+    proposal = balance_allocations(schedule)
+    proposal.apply()
+
+    for teacher, ci in proposal.ci.items():
+        assert ci == pytest.approx(calculate_ci(teacher, schedule))
+    for course in schedule.courses_with_allocation():
+        for section in course.sections():
+            if section not in proposal.unallocated:
+                assert allocated_hours(section) == pytest.approx(course.hours_per_week)
+
+
+def test_release_gets_fewer_hours():
+    schedule = small_schedule()
+    proposal = balance_allocations(schedule)
+    proposal.apply()
+    sam = schedule.get_teacher_by_name("Sam", "Jones")
+    john = schedule.get_teacher_by_name("John", "Smith")
+    course = schedule.get_course_by_number("420-101")
+    sam_hours = sum(s.get_teacher_allocation(sam) for s in course.sections())
+    john_hours = sum(s.get_teacher_allocation(john) for s in course.sections())
+    assert sam_hours < john_hours
+
+
+def test_locked_allocations_are_not_changed():
+    schedule = small_schedule()
+    jane = schedule.get_teacher_by_name("Jane", "Doe")
+    course = schedule.get_course_by_number("420-101")
+    locked = {(section, jane) for section in course.sections()}
+    proposal = balance_allocations(schedule, locked=locked)
+    assert all(key not in locked for key in proposal.allocations)
+
+
+def test_unallocated_hours_are_allocated():
+    schedule = small_schedule()
+    jane = schedule.get_teacher_by_name("Jane", "Doe")
+    course = schedule.get_course_by_number("420-101")
+    for section in course.sections():
+        section.set_teacher_allocation(jane, 0)
+    proposal = balance_allocations(schedule)
+    proposal.apply()
+    assert len(proposal.unallocated) == 0
+    for section in course.sections():
+        assert allocated_hours(section) == pytest.approx(3)
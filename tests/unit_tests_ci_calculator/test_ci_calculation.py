@@ -0,0 +1,78 @@
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule, ScenarioSet, Teacher
+from src.scheduling_and_allocation.ci_calculator.ci_calculation import calculate_ci, calculate_ci_for_all, \
+    ci_calculators_for_all, compare_scenarios
+from src.scheduling_and_allocation.ci_calculator.ci_formula import DEFAULT_FORMULA
+
+DATA_DIR = path.join(path.dirname(__file__), "..", "unit_tests_presenter")
+
+
+# ============================================================================
+# tests
+# ============================================================================
+@pytest.mark.parametrize("filename", ["data_fall.csv", "data_winter.csv", "data_test.csv"])
+def test_ci_for_all_is_same_as_ci_for_each(filename):
+    schedule = Schedule(path.join(DATA_DIR, filename))
+    all_ci = calculate_ci_for_all(schedule)
+    assert set(all_ci.keys()) == set(schedule.teachers())
+    for teacher in schedule.teachers():
+        assert all_ci[teacher] == pytest.approx(calculate_ci(teacher, schedule))
+
+
+def test_ci_for_all_with_no_allocation():
+    schedule = Schedule()
+    teacher = schedule.add_update_teacher("Jane", "Doe", release=0.5)
+    assert calculate_ci_for_all(schedule)[teacher] == pytest.approx(calculate_ci(teacher, schedule))
+
+
+@pytest.mark.parametrize("filename", ["data_fall.csv", "data_winter.csv"])
+def test_changing_one_section_is_same_as_recalculating(filename):
+    schedule = Schedule(path.join(DATA_DIR, filename))
+    calcs = ci_calculators_for_all(schedule)
+
+    for course in schedule.courses():
+        for section in course.sections():
+            for teacher in list(section.teachers()):
+                for hours in (0, course.hours_per_week, section.get_teacher_allocation(teacher)):
+                    section.set_teacher_allocation(teacher, hours)
+                    calcs[teacher].set_section_hours(course, section, section.get_teacher_allocation(teacher))
+                    assert calcs[teacher].ci == pytest.approx(calculate_ci(teacher, schedule))
+
+
+def test_compare_scenarios_is_same_as_switching():
+    schedule = Schedule(path.join(DATA_DIR, "data_fall.csv"))
+    scenarios = ScenarioSet(schedule)
+    course = schedule.courses_with_allocation()[0]
+    section = course.sections()[0]
+    teacher = section.teachers()[0]
+    other = next(t for t in schedule.teachers() if t != teacher)
+
+    scenarios.new("swap").set_teacher_allocation(section, teacher, 0)
+    scenarios["swap"].set_teacher_allocation(section, other, section.get_teacher_allocation(teacher))
+    scenarios.fork("swap", "half").set_teacher_allocation(section, teacher, 1)
+    scenarios.switch_to("half")
+
+    comparison = compare_scenarios(scenarios)
+    for name in (None, "swap", "half"):
+        scenarios.switch_to(name)
+        for t in schedule.teachers():
+            assert comparison[name][t] == pytest.approx(calculate_ci(t, schedule))
+
+
+def test_compare_scenarios_with_new_teacher():
+    schedule = Schedule(path.join(DATA_DIR, "data_fall.csv"))
+    formula = DEFAULT_FORMULA.replace(hours_factor=1)
+    scenarios = ScenarioSet(schedule)
+    section = schedule.courses_with_allocation()[0].sections()[0]
+    new_teacher = Teacher("New", "Teacher")
+
+    scenarios.new("new").set_teacher_allocation(section, new_teacher, 3)
+    comparison = compare_scenarios(scenarios, formula)
+    assert new_teacher not in comparison[None]
+
+    scenarios.switch_to("new")
+    assert comparison["new"][new_teacher] == pytest.approx(calculate_ci(new_teacher, schedule, formula))
+    assert comparison["new"][new_teacher] != pytest.approx(calculate_ci(new_teacher, schedule))
@@ -0,0 +1,60 @@
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule
+from src.scheduling_and_allocation.ci_calculator.ci_calculation import ci_calculators_for_all, calculate_ci_for_all
+from src.scheduling_and_allocation.ci_calculator.ci_formula import CIFormula, CIColumns, DEFAULT_FORMULA, \
+    load_formulas, sensitivity
+
+DATA_DIR = path.join(path.dirname(__file__), "..", "unit_tests_presenter")
+
+
+# ============================================================================
+# tests
+# ============================================================================
+@pytest.mark.parametrize("filename", ["data_fall.csv", "data_winter.csv", "data_test.csv"])
+def test_evaluate_is_same_as_each_teacher(filename):
+    calcs = list(ci_calculators_for_all(Schedule(path.join(DATA_DIR, filename))).values())
+    columns = CIColumns.from_calculators(calcs)
+    assert len(columns) == len(calcs)
+    assert DEFAULT_FORMULA.evaluate(columns) == [calc.ci for calc in calcs]
+
+
+def test_changed_constants():
+    schedule = Schedule(path.join(DATA_DIR, "data_fall.csv"))
+    formula = DEFAULT_FORMULA.replace(hours_factor=0, pes_factor=0, prep_factor=0)
+    calcs = ci_calculators_for_all(schedule, formula)
+    for teacher, calc in calcs.items():
+        parts = calc.breakdown()
+        assert parts.hours == 0
+        assert calc.ci == pytest.approx(parts.pes + parts.prep + parts.release)
+    assert DEFAULT_FORMULA.hours_factor != 0
+
+
+def test_sensitivity():
+    schedule = Schedule(path.join(DATA_DIR, "data_fall.csv"))
+    calcs = ci_calculators_for_all(schedule)
+    columns = CIColumns.from_calculators(calcs.values())
+    low_limit = DEFAULT_FORMULA.replace(pes_bonus_limit=0)
+    results = sensitivity(columns, {"now": DEFAULT_FORMULA, "low": low_limit})
+    assert results["now"] == list(calculate_ci_for_all(schedule).values())
+    assert results["low"] == list(calculate_ci_for_all(schedule, low_limit).values())
+    assert all(low >= now for low, now in zip(results["low"], results["now"]))
+
+
+def test_load_formulas(tmp_path):
+    file = tmp_path / "formulas.ini"
+    file.write_text("[2023]\n\n[2027]\npes_bonus_limit = 400\nhours_factor = 1.5\n")
+    formulas = load_formulas(str(file))
+    assert formulas["2023"] == CIFormula(version="2023")
+    assert formulas["2027"].pes_bonus_limit == 400
+    assert formulas["2027"].hours_factor == 1.5
+    assert formulas["2027"].pes_factor == DEFAULT_FORMULA.pes_factor
+
+
+def test_load_formulas_unknown_constant(tmp_path):
+    file = tmp_path / "formulas.ini"
+    file.write_text("[2027]\nnot_a_constant = 1\n")
+    with pytest.raises(ValueError):
+        load_formulas(str(file))
@@ -0,0 +1,97 @@
+import io
+import csv
+import json
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType
+from src.scheduling_and_allocation.ci_calculator.ci_calculation import calculate_ci
+from src.scheduling_and_allocation.ci_calculator.ci_formula import DEFAULT_FORMULA
+from src.scheduling_and_allocation.ci_calculator.ci_report import department_report, write_csv, write_json, \
+    UnallocatedHours
+
+DATA_DIR = path.join(path.dirname(__file__), "..", "unit_tests_presenter")
+
+
+# ============================================================================
+# helpers
+# ============================================================================
+def schedules():
+    return {SemesterType.fall: Schedule(path.join(DATA_DIR, "data_fall.csv")),
+            SemesterType.winter: Schedule(path.join(DATA_DIR, "data_winter.csv"))}
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_report_ci_matches_calculate_ci():
+    semesters = schedules()
+    report = department_report(semesters)
+    for semester, schedule in semesters.items():
+        for teacher in schedule.teachers():
+            row = next(t for t in report.teachers if t.teacher == str(teacher))
+            semester_ci = row.semesters[semester.name]
+            assert semester_ci.ci == pytest.approx(calculate_ci(teacher, schedule))
+            assert semester_ci.ci == pytest.approx(semester_ci.pes_ci + semester_ci.prep_ci +
+                                                   semester_ci.hours_ci + semester_ci.release_ci)
+
+
+def test_report_with_formula():
+    semesters = schedules()
+    formula = DEFAULT_FORMULA.replace(hours_factor=0)
+    report = department_report(semesters, formula=formula)
+    for semester, schedule in semesters.items():
+        for teacher in schedule.teachers():
+            row = next(t for t in report.teachers if t.teacher == str(teacher))
+            assert row.semesters[semester.name].hours_ci == 0
+            assert row.semesters[semester.name].ci == pytest.approx(calculate_ci(teacher, schedule, formula))
+
+
+def test_year_ci_adds_semesters():
+    report = department_report(schedules())
+    for teacher in report.teachers:
+        assert teacher.year_ci == pytest.approx(sum(s.ci for s in teacher.semesters.values()))
+
+
+def test_unallocated_hours():
+    schedule = Schedule()
+    teacher = schedule.add_update_teacher("Jane", "Doe")
+    course = schedule.add_update_course("420-ABC", "Programming", SemesterType.fall, 3)
+    for number in ("1", "2"):
+        section = course.add_section(number)
+        section.add_block(1, 8, 1.5)
+        section.add_block(3, 8, 1.5)
+    course.get_section_by_number("1").set_teacher_allocation(teacher, 1.5)
+    course.get_section_by_number("2").set_teacher_allocation(teacher, 3)
+    not_allocated = schedule.add_update_course("420-XYZ", "No allocation", SemesterType.fall, 3,
+                                               needs_allocation=False)
+    not_allocated.add_section("1").add_block(1, 8, 3)
+
+    report = department_report({SemesterType.fall: schedule})
+    assert report.unallocated == [UnallocatedHours("fall", "420-ABC", "1", 1.5)]
+
+
+def test_missing_semester_is_ignored():
+    report = department_report({SemesterType.fall: Schedule(path.join(DATA_DIR, "data_fall.csv")),
+                                SemesterType.summer: None})
+    assert report.semesters == ["fall"]
+
+
+def test_write_csv():
+    report = department_report(schedules())
+    f = io.StringIO()
+    write_csv(report, f)
+    rows = list(csv.reader(io.StringIO(f.getvalue())))
+    assert rows[0][0] == "teacher"
+    assert rows[0][-1] == "year_ci"
+    assert len(rows) == len(report.teachers) + 3 + len(report.unallocated)
+
+
+def test_write_json():
+    report = department_report(schedules())
+    f = io.StringIO()
+    write_json(report, f)
+    data = json.loads(f.getvalue())
+    assert data["semesters"] == ["fall", "winter"]
+    assert len(data["teachers"]) == len(report.teachers)
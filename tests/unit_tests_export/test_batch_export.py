@@ -0,0 +1,120 @@
+from os import path
+
+from src.scheduling_and_allocation.export.batch_export import BatchExport, ExportJob, ExportBlock, CanvasType, \
+    export_view, export_document
+
+
+def _jobs(directory, canvas_type, number) -> list[ExportJob]:
+    return [ExportJob(canvas_type=canvas_type, title=f"Teacher {i}", schedule_name="test.csv",
+                      directory=str(directory),
+                      blocks=[ExportBlock(1, 8.0, 1.5, "420-ABC\n1"), ExportBlock(3, 13.5, 2, "420-DEF\n2")])
+            for i in range(number)]
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_export_view_latex(tmp_path):
+    job = _jobs(tmp_path, CanvasType.latex, 1)[0]
+    filename = export_view(job)
+    assert filename == f"{tmp_path}/teacher_0.tex"
+    with open(filename) as fh:
+        tex = fh.read()
+    assert "Teacher 0" in tex
+    assert r"(\wednesday,13.5) {420-DEF \\ 2 }" in tex
+
+
+def test_export_view_pdf(tmp_path):
+    job = _jobs(tmp_path, CanvasType.pdf, 1)[0]
+    filename = export_view(job)
+    with open(filename, "rb") as fh:
+        assert fh.read(4) == b"%PDF"
+
+
+def test_batch_export_writes_every_file(tmp_path):
+    exporter = BatchExport(_jobs(tmp_path, CanvasType.pdf, 4))
+    exporter.start()
+    progress = exporter.wait()
+
+    assert progress.finished
+    assert progress.done == 4
+    assert not progress.errors
+    assert sorted(progress.files) == [f"{tmp_path}/teacher_{i}.pdf" for i in range(4)]
+    assert all(path.exists(f) for f in progress.files)
+
+
+def test_batch_export_reports_errors(tmp_path):
+    exporter = BatchExport(_jobs(path.join(tmp_path, "does_not_exist"), CanvasType.latex, 2), use_processes=False)
+    exporter.start()
+    progress = exporter.wait()
+
+    assert progress.finished
+    assert len(progress.errors) == 2
+    assert progress.files == []
+
+
+def test_batch_export_cancel(tmp_path):
+    exporter = BatchExport(_jobs(tmp_path, CanvasType.latex, 50), use_processes=False, max_workers=1)
+    exporter.start()
+    exporter.cancel()
+    progress = exporter.wait()
+
+    assert progress.cancelled
+    assert progress.finished
+    assert progress.done == 50
+    assert len(progress.files) < 50
+
+
+def test_export_latex_document(tmp_path):
+    jobs = _jobs(tmp_path, CanvasType.latex, 3)
+    filename = export_document(jobs, f"{tmp_path}/all.tex")
+    with open(filename) as fh:
+        tex = fh.read()
+
+    # one preamble, one page per resource
+    assert tex.count(r"\documentclass") == 1
+    assert tex.count(r"\end{document}") == 1
+    assert tex.count(r"\begin{tikzpicture}") == 3
+    assert tex.count(r"\clearpage") == 2
+    assert tex.index("Teacher 0") < tex.index("Teacher 1") < tex.index("Teacher 2")
+
+
+def test_export_pdf_document(tmp_path):
+    jobs = _jobs(tmp_path, CanvasType.pdf, 3)
+    for job in jobs:
+        job.group = "Teachers"
+    pages = []
+    filename = export_document(jobs, f"{tmp_path}/all.pdf", title="all", page_done=lambda: pages.append(1))
+    with open(filename, "rb") as fh:
+        pdf = fh.read()
+
+    # three pages, bookmarked under 'Teachers'
+    assert len(pages) == 3
+    assert b"/Count 3" in pdf
+    assert b"/Outlines" in pdf
+    assert pdf.index(b"/Title (Teachers)") < pdf.index(b"/Title (Teacher 0)") < pdf.index(b"/Title (Teacher 2)")
+    assert not path.exists(f"{tmp_path}/teacher_0.pdf")
+
+
+def test_batch_export_one_document(tmp_path):
+    exporter = BatchExport(_jobs(tmp_path, CanvasType.latex, 5), document=f"{tmp_path}/all.tex")
+    exporter.start()
+    progress = exporter.wait()
+
+    assert progress.finished
+    assert progress.done == 5
+    assert progress.files == [f"{tmp_path}/all.tex"]
+
+
+def test_batch_export_one_document_cancel(tmp_path):
+    exporter = BatchExport(_jobs(tmp_path, CanvasType.latex, 200), document=f"{tmp_path}/all.tex")
+    exporter.cancel()
+    exporter.start()
+    progress = exporter.wait()
+
+    # the document is still a complete latex document
+    assert progress.finished
+    with open(f"{tmp_path}/all.tex") as fh:
+        tex = fh.read()
+    assert tex.count(r"\begin{tikzpicture}") < 200
+    assert tex.rstrip().endswith(r"\end{document}")
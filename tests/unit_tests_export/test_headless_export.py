@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import xml.dom.minidom
+from os import path
+
+from src.scheduling_and_allocation.export.batch_export import BatchExport, CanvasType, export_jobs
+from src.scheduling_and_allocation.gui_generics.view_layout import ViewLayout
+from src.scheduling_and_allocation.model import Schedule, ResourceType
+
+SCHEDULE_FILE = path.join(path.dirname(__file__), "..", "unit_tests_model", "data_test_good_input.csv")
+SRC_DIR = path.join(path.dirname(__file__), "..", "..", "src")
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_layout_coordinates():
+    layout = ViewLayout(1)
+    x1, y1, x2, y2 = layout.get_coords(2, 9.5, 1.5)
+    assert (x1, x2) == (200, 299)
+    assert (y1, y2) == (60 + 1.5 * 60, 60 + 3 * 60 - 1)
+    day, start, duration = layout.coords_to_day_time_duration(x1, y1, y2)
+    assert (day, start, duration) == (2, 9.5, 1.5)
+
+
+def test_layout_scale():
+    small = ViewLayout(0.5)
+    large = ViewLayout(1)
+    assert small.size()[0] < large.size()[0]
+    assert small.size()[1] < large.size()[1]
+
+
+def test_export_jobs():
+    schedule = Schedule(SCHEDULE_FILE)
+    jobs = export_jobs(schedule, ResourceType.lab, CanvasType.svg, "somewhere", "Labs")
+    assert [job.title for job in jobs] == [str(lab) for lab in schedule.labs()]
+    for job, lab in zip(jobs, schedule.labs()):
+        assert len(job.blocks) == len(schedule.get_blocks_in_lab(lab))
+        assert job.group == "Labs"
+        assert job.directory == "somewhere"
+
+
+def test_export_svg(tmp_path):
+    schedule = Schedule(SCHEDULE_FILE)
+    jobs = export_jobs(schedule, ResourceType.teacher, CanvasType.svg, str(tmp_path))
+    exporter = BatchExport(jobs, use_processes=False)
+    exporter.start()
+    progress = exporter.wait()
+
+    assert not progress.errors
+    assert len(progress.files) == len(schedule.teachers())
+    for file in progress.files:
+        document = xml.dom.minidom.parse(file)
+        assert document.documentElement.tagName == "svg"
+
+
+def test_command_line_export_does_not_need_tk(tmp_path):
+    code = ("import sys\n"
+            "from scheduling_and_allocation.SchedulerProgram import export_views\n"
+            f"status = export_views({SCHEDULE_FILE!r}, 'pdf', 'stream', {str(tmp_path)!r}, True)\n"
+            "assert 'tkinter' not in sys.modules\n"
+            "sys.exit(status)\n")
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == f"{tmp_path}/data_test_good_input_streams.pdf"
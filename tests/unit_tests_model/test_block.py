@@ -574,3 +574,22 @@ def test_synced_blocks_interdependence_works_as_expected():
     block1._time_slot.time_start = 9.5
     assert block3._time_slot.time_start == block2._time_slot.time_start == block4._time_slot.time_start == 11.5
     assert block1._time_slot.time_start == 9.5
+
+
+def test_version_changes_when_labels_change():
+    """version changes if teachers, labs, or section info changes, but not if the time changes"""
+    section = Section(course, "1")
+    block = Block(section, 1, 8, 2, True)
+    versions = [block.version]
+
+    block.add_teacher(Teacher("Jane", "Doe"))
+    versions.append(block.version)
+    block.add_lab(Lab("P107"))
+    versions.append(block.version)
+    section.name = "evening"
+    versions.append(block.version)
+    block.start = 10
+    block.day = 2
+
+    assert len(set(versions)) == 4
+    assert block.version == versions[-1]
@@ -0,0 +1,84 @@
+from os import path
+
+from src.scheduling_and_allocation.model import Schedule, diff_schedules, index_schedule
+from src.scheduling_and_allocation.model.merge import schedule_from_index
+
+SCHEDULE_FILE = path.join(path.dirname(__file__), "data_test_good_input.csv")
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_same_schedule_has_no_differences():
+    assert diff_schedules(Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE)) == []
+
+
+def test_added_and_removed():
+    old = Schedule(SCHEDULE_FILE)
+    new = Schedule(SCHEDULE_FILE)
+    removed = new.courses()[0]
+    new.remove_course(removed)
+    new.add_update_course("999-999", "Brand New")
+    new.add_update_lab("Z100", "new lab")
+
+    changes = diff_schedules(old, new)
+    actions = {(c.action, c.key) for c in changes}
+    assert ("added", ("course", "999-999")) in actions
+    assert ("removed", ("course", removed.number)) in actions
+    assert ("added", ("lab", "Z100")) in actions
+    for section in removed.sections():
+        assert ("removed", ("section", removed.number, section.number)) in actions
+
+    # resources are reported before courses
+    kinds = [c.kind for c in changes]
+    assert kinds.index("lab") < kinds.index("course")
+
+
+def test_changed_fields():
+    old = Schedule(SCHEDULE_FILE)
+    new = Schedule(SCHEDULE_FILE)
+    course = new.courses()[1]
+    section = course.sections()[0]
+    section.num_students += 5
+    teacher = new.teachers()[0]
+    teacher.release += 1
+
+    changes = diff_schedules(old, new)
+    assert len(changes) == 2
+    by_kind = {c.kind: c for c in changes}
+    assert by_kind["teacher"].changed_fields() == ["release"]
+    assert by_kind["section"].changed_fields() == ["num_students"]
+    assert by_kind["section"].key == ("section", course.number, section.number)
+
+
+def test_moved_block_is_a_change():
+    old = Schedule(SCHEDULE_FILE)
+    new = Schedule(SCHEDULE_FILE)
+    block = new.courses()[1].sections()[0].blocks()[0]
+    block.start = block.start + 1
+
+    changes = diff_schedules(old, new)
+    assert len(changes) == 1
+    assert changes[0].action == "changed"
+    assert changes[0].kind == "block"
+    assert changes[0].changed_fields() == ["time"]
+
+
+def test_blocks_in_same_slot_and_duplicate_sections_are_all_compared():
+    old = Schedule()
+    course = old.add_update_course("420-ABC", "Programming")
+    for number in ("1", "2"):
+        section = course.add_section(number)
+        section.add_block(1, 8, 1.5)
+        section.add_block(1, 8, 1.5)
+    section.number = "1"
+    new = schedule_from_index(index_schedule(old))
+    assert len(index_schedule(old)) == 7
+    assert diff_schedules(old, new) == []
+
+    teacher = new.add_update_teacher("Jane", "Doe")
+    new.courses()[0].sections()[1].blocks()[1].add_teacher(teacher)
+    changes = diff_schedules(old, new)
+    assert [(c.action, c.kind) for c in changes] == [("added", "teacher"), ("changed", "block")]
+    assert changes[1].key[2] == "1#2"
+    assert changes[1].changed_fields() == ["teachers"]
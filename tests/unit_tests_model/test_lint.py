@@ -0,0 +1,108 @@
+from os import path
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType, lint_file, lint_lines
+
+HEADER = """lab,P107,
+stream,1A,
+teacher,Moose_Bullwinkle,Bullwinkle,Moose,CompSci,0.0
+"""
+
+
+def _lint(text: str):
+    return lint_lines(text.splitlines(keepends=True))
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_good_schedule_has_no_problems():
+    msgs = _lint(HEADER + """course,420-1B4,Computers,1,1,3.0
+section,,1,Section 1,17
+add_stream,1A
+add_block,,Tuesday,15,3.0,0
+add_block_teacher,Moose_Bullwinkle
+add_lab,P107
+""")
+    assert msgs == []
+
+
+def test_unknown_references():
+    msgs = _lint(HEADER + """course,420-1B4,Computers,1,1,3.0
+section,,1,Section 1,17
+add_stream,1Z
+add_block,,Tuesday,15,3.0,0
+add_block_teacher,Moose_Bullwinkle
+add_block_teacher,Nobody_Here
+add_lab,P999
+add_lab,P107
+""")
+    assert [(m.line_number, m.level) for m in msgs] == [(6, "ERROR"), (9, "ERROR"), (10, "ERROR")]
+    assert "1Z" in msgs[0].message
+    assert "Nobody_Here" in msgs[1].message
+    assert "P999" in msgs[2].message
+
+
+def test_duplicate_section_numbers_and_bad_days():
+    msgs = _lint(HEADER + """course,420-1B4,Computers,1,0,3.0
+section,,1,Section 1,17
+add_block,,Tuesday,15,3.0,0
+add_block_teacher,Moose_Bullwinkle
+add_lab,P107
+section,,1,Section 1 again,17
+add_block,,Blursday,15,3.0,0
+add_block_teacher,Moose_Bullwinkle
+add_lab,P107
+""")
+    assert [(m.line_number, m.level) for m in msgs] == [(9, "ERROR"), (10, "ERROR")]
+    assert "not unique" in msgs[0].message
+    assert "Blursday" in msgs[1].message
+
+
+def test_hours_do_not_match_and_reports_everything():
+    msgs = _lint(HEADER + """course,420-1B4,Computers,1,1,4.0
+section,,1,Section 1,seventeen
+add_block,,Tuesday,15,3.0,0
+""")
+    levels = [(m.line_number, m.level) for m in msgs]
+    assert (4, "ERROR") in levels      # no teachers for course
+    assert (5, "ERROR") in levels      # hours do not match, and badly formed student number
+    assert (6, "ERROR") in levels      # block has no teacher
+    assert (6, "WARNING") in levels    # block has no lab
+    assert levels == sorted(levels, key=lambda x: x[0])
+
+
+def test_same_problems_as_validate():
+    """every problem that validate finds is also found by the linter"""
+    file = path.join(path.dirname(__file__), "data_test_good_input.csv")
+    errors = [m for m in lint_file(file) if m.level == "ERROR"]
+    warnings = [m for m in lint_file(file) if m.level == "WARNING"]
+    validate = [m for m in Schedule(file).validate() if m != ""]
+    assert len(errors) == len([m for m in validate if "ERROR" in m])
+    assert len(warnings) == len([m for m in validate if "WARNING" in m])
+
+
+def test_teacher_names_with_spaces(tmp_path):
+    schedule = Schedule()
+    teacher = schedule.add_update_teacher("Mary Ann", "Smith")
+    lab = schedule.add_update_lab("P107")
+    course = schedule.add_update_course("420-1B4", "Computers", SemesterType.fall, 3)
+    section = course.add_section("1")
+    for day in (1, 3):
+        block = section.add_block(day, 8, 1.5)
+        block.add_lab(lab)
+    section.set_teacher_allocation(teacher, 1.5)
+    file = str(tmp_path / "spaces.csv")
+    schedule.write_file(file, force=True)
+
+    # only the wednesday block has no teacher
+    validate = [m for m in Schedule(file).validate() if m != ""]
+    errors = [m for m in lint_file(file) if m.level == "ERROR"]
+    assert len(validate) == 1
+    assert len(errors) == 1
+    assert "block has no assigned teachers" in errors[0].message
+
+
+def test_missing_file():
+    msgs = lint_file("no_such_file.csv")
+    assert len(msgs) == 1
+    assert msgs[0].level == "ERROR"
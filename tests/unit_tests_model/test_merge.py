@@ -0,0 +1,96 @@
+from os import path
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType, diff_schedules, merge_schedules, merge_files, \
+    load_many
+from src.scheduling_and_allocation.model.diff import index_schedule
+from src.scheduling_and_allocation.model.merge import schedule_from_index
+
+SCHEDULE_FILE = path.join(path.dirname(__file__), "data_test_good_input.csv")
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_schedule_from_index_is_the_same_schedule():
+    schedule = Schedule(SCHEDULE_FILE)
+    assert diff_schedules(schedule, schedule_from_index(index_schedule(schedule))) == []
+
+
+def test_no_changes():
+    merged, conflicts = merge_files(SCHEDULE_FILE, SCHEDULE_FILE, SCHEDULE_FILE)
+    assert conflicts == []
+    assert diff_schedules(Schedule(SCHEDULE_FILE), merged) == []
+
+
+def test_changes_from_both_sides_are_merged():
+    base, ours, theirs = Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE)
+    ours.courses()[1].sections()[0].num_students = 99
+    theirs.courses()[1].sections()[0].name = "renamed"
+    theirs.add_update_lab("Z100", "new lab")
+    removed = ours.courses()[0]
+    ours.remove_course(removed)
+
+    merged, conflicts = merge_schedules(base, ours, theirs)
+    assert conflicts == []
+    section = merged.get_course_by_number(base.courses()[1].number).sections()[0]
+    assert section.num_students == 99
+    assert section.name == "renamed"
+    assert merged.get_lab_by_number("Z100") is not None
+    assert merged.get_course_by_number(removed.number) is None
+
+
+def test_conflicts_keep_ours():
+    base, ours, theirs = Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE)
+    ours.teachers()[0].release = 4
+    theirs.teachers()[0].release = 5
+
+    merged, conflicts = merge_schedules(base, ours, theirs)
+    assert len(conflicts) == 1
+    assert conflicts[0].key == ("teacher", ours.teachers()[0].number)
+    assert conflicts[0].field == "release"
+    assert merged.get_teacher_by_number(ours.teachers()[0].number).release == 4
+
+
+def test_files_are_read_without_conflicts():
+    base, ours = load_many((SCHEDULE_FILE, SCHEDULE_FILE), calculate_conflicts=False)
+    assert not any(block.conflict for block in base.blocks())
+    merged, _ = merge_schedules(base, ours, ours)
+    assert any(block.conflict for block in merged.blocks())
+    assert (sorted(b.conflict.value for b in merged.blocks())
+            == sorted(b.conflict.value for b in Schedule(SCHEDULE_FILE).blocks()))
+
+
+def test_removed_course_still_used_by_other_side():
+    base, ours, theirs = Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE), Schedule(SCHEDULE_FILE)
+    course = theirs.courses()[0]
+    theirs.remove_course(course)
+    ours.get_course_by_number(course.number).add_section("99", "new section")
+
+    merged, conflicts = merge_schedules(base, ours, theirs)
+    assert merged.get_course_by_number(course.number) is None
+    assert len(conflicts) == 1
+    assert conflicts[0].key == ("section", course.number, "99")
+    assert str(conflicts[0]) == (f"CONFLICT section {course.number} section 99 course: course {course.number} "
+                                 f"was removed in theirs, but ours still has section {course.number} section 99 "
+                                 f"(removed)")
+
+
+def test_both_sides_change_block_teacher():
+    base = Schedule()
+    for name in ("A", "B", "C"):
+        base.add_update_teacher(name, "T")
+    section = base.add_update_course("420-X", "Course", SemesterType.fall, 3).add_section("1")
+    section.add_block(1, 8, 3).add_teacher(base.get_teacher_by_number("T_A"))
+
+    sides = []
+    for new_teacher in ("T_B", "T_C"):
+        side = schedule_from_index(index_schedule(base))
+        block = side.get_course_by_number("420-X").get_section_by_number("1").blocks()[0]
+        block.remove_teacher(side.get_teacher_by_number("T_A"))
+        block.add_teacher(side.get_teacher_by_number(new_teacher))
+        sides.append(side)
+
+    merged, conflicts = merge_schedules(base, *sides)
+    assert [(c.key[0], c.field) for c in conflicts] == [("block", "teachers")]
+    block = merged.get_course_by_number("420-X").get_section_by_number("1").blocks()[0]
+    assert [t.number for t in block.teachers()] == ["T_B"]
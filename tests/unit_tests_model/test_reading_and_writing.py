@@ -5,7 +5,7 @@ from os import path
 
 import pytest
 
-from src.scheduling_and_allocation.model import Schedule
+from src.scheduling_and_allocation.model import Schedule, load_many, CouldNotReadFileError
 
 
 def test_read():
@@ -52,3 +52,63 @@ def test_blocks_movable_is_correct():
     for b in blocks:
         assert b.movable()
 
+
+
+def test_load_many():
+    """reading many files at once gives the same thing as reading them one at a time"""
+    files = [path.dirname(__file__) + "/data_test_good_input.csv",
+             path.dirname(__file__) + "/data_empty_test.csv"]
+    schedules = load_many(files)
+    assert len(schedules) == 2
+    for file, schedule in zip(files, schedules):
+        expected = Schedule(file)
+        assert len(schedule.blocks()) == len(expected.blocks())
+        assert len(schedule.teachers()) == len(expected.teachers())
+
+
+def test_load_many_ids_are_per_schedule():
+    """each schedule has its own id space for sections and blocks"""
+    file = path.dirname(__file__) + "/data_test_good_input.csv"
+    first, second = load_many([file, file], use_processes=False)
+    assert sorted(b.id for b in first.blocks()) == sorted(b.id for b in second.blocks())
+    assert sorted(s.id for s in first.sections()) == sorted(s.id for s in second.sections())
+
+
+def test_load_many_bad_file():
+    """bad files either raise an error, or return the error"""
+    files = [path.dirname(__file__) + "/data_test_good_input.csv", "no_such_file.csv"]
+    with pytest.raises(CouldNotReadFileError):
+        load_many(files)
+    schedules = load_many(files, return_exceptions=True)
+    assert isinstance(schedules[0], Schedule)
+    assert isinstance(schedules[1], CouldNotReadFileError)
+
+
+def test_fingerprint_changes_with_contents():
+    schedule = Schedule(path.dirname(__file__) + "/data_test_good_input.csv")
+    assert not schedule.is_changed()
+    original = schedule.fingerprint()
+
+    teacher = schedule.teachers()[0]
+    teacher.release += 1
+    assert schedule.is_changed()
+    assert schedule.fingerprint() != original
+
+    teacher.release -= 1
+    assert not schedule.is_changed()
+    assert schedule.fingerprint() == original
+
+
+def test_write_skipped_if_not_changed(tmp_path):
+    file = str(tmp_path / "schedule.csv")
+    schedule = Schedule(path.dirname(__file__) + "/data_test_good_input.csv")
+    assert schedule.write_file(file)
+    assert not schedule.write_file(file)
+    assert schedule.write_file(file, force=True)
+
+    schedule.teachers()[0].release += 1
+    assert schedule.write_file(file)
+    assert not schedule.is_changed()
+
+    # a different file is always written
+    assert schedule.write_file(str(tmp_path / "other.csv"))
@@ -0,0 +1,105 @@
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType, ScenarioSet
+
+
+# ============================================================================
+# helpers
+# ============================================================================
+def schedule_with_section():
+    schedule = Schedule()
+    fred = schedule.add_update_teacher("Fred", "Flintstone")
+    betty = schedule.add_update_teacher("Betty", "Rubble")
+    course = schedule.add_update_course("420-ABC", "Programming", SemesterType.fall, 3)
+    section = course.add_section("1")
+    section.num_students = 30
+    section.add_block(1, 8, 1.5)
+    section.add_block(3, 8, 1.5)
+    return schedule, section, fred, betty
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_scenario_does_not_change_schedule_until_active():
+    schedule, section, fred, betty = schedule_with_section()
+    scenarios = ScenarioSet(schedule)
+    scenario = scenarios.new("fred")
+    scenario.set_teacher_allocation(section, fred, 3)
+    assert section.get_teacher_allocation(fred) == 0
+    assert scenario.get_teacher_allocation(section, fred) == 3
+
+
+def test_switch_to_and_back():
+    schedule, section, fred, betty = schedule_with_section()
+    section.set_teacher_allocation(betty, 1.5)
+    scenarios = ScenarioSet(schedule)
+    scenarios.new("fred").set_teacher_allocation(section, fred, 3)
+    scenarios["fred"].set_teacher_allocation(section, betty, 0)
+
+    scenarios.switch_to("fred")
+    assert section.get_teacher_allocation(fred) == 3
+    assert section.get_teacher_allocation(betty) == 0
+
+    scenarios.switch_to(None)
+    assert section.get_teacher_allocation(fred) == 0
+    assert section.get_teacher_allocation(betty) == 1.5
+
+
+def test_active_scenario_changes_schedule():
+    schedule, section, fred, betty = schedule_with_section()
+    scenarios = ScenarioSet(schedule)
+    scenario = scenarios.new("fred")
+    scenarios.switch_to("fred")
+    scenario.set_teacher_allocation(section, fred, 3)
+    assert section.get_teacher_allocation(fred) == 3
+    assert scenario.get_teacher_allocation(section, betty) == 0
+    scenarios.switch_to(None)
+    assert section.get_teacher_allocation(fred) == 0
+
+
+def test_fork_shares_allocations_until_changed():
+    schedule, section, fred, betty = schedule_with_section()
+    scenarios = ScenarioSet(schedule)
+    fred_takes = scenarios.new("fred")
+    fred_takes.set_teacher_allocation(section, fred, 3)
+
+    betty_takes = scenarios.fork("fred", "betty")
+    assert betty_takes.get_teacher_allocation(section, fred) == 3
+    betty_takes.set_teacher_allocation(section, fred, 0)
+    betty_takes.set_teacher_allocation(section, betty, 3)
+    fred_takes.set_teacher_allocation(section, betty, 1.5)
+
+    assert fred_takes.get_teacher_allocation(section, fred) == 3
+    assert fred_takes.get_teacher_allocation(section, betty) == 1.5
+    assert betty_takes.get_teacher_allocation(section, fred) == 0
+    assert betty_takes.get_teacher_allocation(section, betty) == 3
+
+
+def test_duplicate_name():
+    schedule, *_ = schedule_with_section()
+    scenarios = ScenarioSet(schedule)
+    scenarios.new("fred")
+    with pytest.raises(ValueError):
+        scenarios.new("fred")
+
+
+def test_switch_back_does_not_change_schedule():
+    schedule, section, fred, betty = schedule_with_section()
+    monday, wednesday = sorted(section.blocks(), key=lambda b: b.day.value)
+    wednesday.add_teacher(fred)
+    fingerprint = schedule.fingerprint()
+
+    scenarios = ScenarioSet(schedule)
+    scenarios.new("x").set_teacher_allocation(section, fred, 3)
+    scenarios.switch_to("x")
+    assert section.get_teacher_allocation(fred) == 3
+    assert scenarios["x"].get_teacher_allocation(section, fred) == 3
+    assert scenarios.original_allocation(section, fred) == 1.5
+    scenarios.switch_to(None)
+
+    assert monday.teachers() == ()
+    assert wednesday.teachers() == (fred,)
+    assert schedule.fingerprint() == fingerprint
@@ -808,3 +808,81 @@ def test_calculate_conflicts():
     """too much trouble to test this right now"""
     # TODO: write this test
     assert True
+
+
+def test_calculate_conflicts_for_block_matches_full_calculation():
+    s = Schedule()
+    l1 = Lab('ABC')
+    s._labs = {l1.number: l1}
+    st1 = Stream('ABC')
+    s._streams = {st1.number: st1}
+    t1 = Teacher("ABC", "Doe")
+    t2 = Teacher("DEF", "Doe")
+    s._teachers = {t1.number: t1, t2.number: t2}
+
+    c1 = s.add_update_course("C1")
+    c2 = s.add_update_course("C2")
+    s1 = c1.add_section("1")
+    s2 = c2.add_section("1")
+    b1 = s1.add_block(WeekDay.Monday, 9.0, 1)
+    b2 = s1.add_block(WeekDay.Tuesday, 9.0, 1)
+    b3 = s2.add_block(WeekDay.Monday, 10.0, 1)
+    c1.add_teacher(t1)
+    c2.add_teacher(t1)
+    s2.add_stream(st1)
+    s1.add_stream(st1)
+    c1.add_lab(l1)
+    s.calculate_conflicts()
+    before = b3.conflict
+
+    # move b1 on top of b3, and only recalculate the blocks that share resources
+    b1.start = 10.0
+    affected = s.calculate_conflicts_for(b1)
+    assert set(affected) == {b1, b2, b3}
+    incremental = [(b.conflict, s.resource_conflict(r)) for b in (b1, b2, b3) for r in (t1, t2, l1, st1)]
+    assert b3.conflict != before
+
+    s.calculate_conflicts()
+    full = [(b.conflict, s.resource_conflict(r)) for b in (b1, b2, b3) for r in (t1, t2, l1, st1)]
+    assert incremental == full
+
+
+def test_drop_target_conflicts():
+    s = Schedule()
+    st1 = Stream('ABC')
+    s._streams = {st1.number: st1}
+    t1 = Teacher("ABC", "Doe")
+    s._teachers = {t1.number: t1}
+
+    c1 = s.add_update_course("C1")
+    c2 = s.add_update_course("C2")
+    c3 = s.add_update_course("C3")
+    s1 = c1.add_section("1")
+    s2 = c2.add_section("1")
+    s3 = c3.add_section("1")
+    b1 = s1.add_block(WeekDay.Monday, 9.0, 1)
+    b2 = s1.add_block(WeekDay.Tuesday, 9.0, 1)
+    b3 = s2.add_block(WeekDay.Monday, 10.0, 1)
+    s3.add_block(WeekDay.Monday, 11.0, 2)
+    for c in (c1, c2, c3):
+        c.add_teacher(t1)
+    s1.add_stream(st1)
+    s2.add_stream(st1)
+
+    targets = s.drop_target_conflicts(b3)
+
+    # every half-hour, on every day, where a one-hour block fits
+    assert len(targets) == 5 * 19
+    assert targets[(1, 8.0)] == 0
+    assert targets[(1, 8.5)] == 2
+    assert targets[(1, 9.0)] == 2
+    assert targets[(2, 9.0)] == 2
+    assert targets[(1, 10.0)] == 0
+    assert targets[(1, 12.5)] == 1
+
+    # no lunch break left for the teacher, only when the block covers 13:00 to 14:00
+    assert targets[(1, 13.0)] == 1
+    assert targets[(1, 13.5)] == 0
+
+    # the block has not been moved
+    assert (b3.day, b3.start) == (WeekDay.Monday, 10.0)
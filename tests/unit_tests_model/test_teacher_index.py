@@ -0,0 +1,61 @@
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule, SemesterType, TeacherIndex
+
+
+# ============================================================================
+# helpers
+# ============================================================================
+def two_semesters():
+    fall = Schedule()
+    winter = Schedule()
+    fall.add_update_teacher("Jane", "Doe")
+    fall.add_update_teacher("Bob", "Smith")
+    winter.add_update_teacher("jane", "doe")
+    winter.add_update_teacher("Robert", "Smith")
+    return fall, winter
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_same_teacher_different_case():
+    fall, winter = two_semesters()
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter})
+    jane = fall.get_teacher_by_name("Jane", "Doe")
+    assert index.teacher_in(jane, SemesterType.winter) is winter.get_teacher_by_name("jane", "doe")
+    assert set(index.semesters(jane).keys()) == {SemesterType.fall, SemesterType.winter}
+
+
+def test_different_names_are_different_teachers():
+    fall, winter = two_semesters()
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter})
+    bob = fall.get_teacher_by_name("Bob", "Smith")
+    assert index.teacher_in(bob, SemesterType.winter) is None
+
+
+def test_alias():
+    fall, winter = two_semesters()
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter},
+                         aliases={"Smith_Bob": "Smith_Robert"})
+    bob = fall.get_teacher_by_name("Bob", "Smith")
+    assert index.teacher_in(bob, SemesterType.winter) is winter.get_teacher_by_name("Robert", "Smith")
+    assert index.teacher_in("Smith_Robert", SemesterType.fall) is bob
+
+
+def test_index_schedule_replaces_semester():
+    fall, winter = two_semesters()
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter})
+    winter.remove_teacher(winter.get_teacher_by_name("jane", "doe"))
+    index.index_schedule(SemesterType.winter, winter)
+    assert index.teacher_in("Doe_Jane", SemesterType.winter) is None
+    assert index.teacher_in("Doe_Jane", SemesterType.fall) is not None
+
+
+def test_totals():
+    fall, winter = two_semesters()
+    index = TeacherIndex({SemesterType.fall: fall, SemesterType.winter: winter})
+    totals = index.totals({t: 10.0 for t in fall.teachers()}, {t: 1.5 for t in winter.teachers()})
+    assert totals[index.identity("Doe_Jane")] == pytest.approx(11.5)
+    assert totals[index.identity("Smith_Bob")] == pytest.approx(10.0)
+    assert totals[index.identity("Smith_Robert")] == pytest.approx(1.5)
@@ -0,0 +1,92 @@
+from os import path
+
+import pytest
+
+from src.scheduling_and_allocation.model import Schedule
+from src.scheduling_and_allocation.presenter.allocation_editor import AllocationEditor
+
+SCHEDULE_FILE = path.dirname(__file__) + "/data_test.csv"
+
+
+# ============================================================================
+# overload the gui
+# ============================================================================
+class AllocationGridTest:
+    def __init__(self):
+        self.populated = 0
+        self.updates = []
+
+    def populate(self, *args):
+        self.populated += 1
+        self.summaries = args[7]
+        self.bottom = args[9]
+
+    def update_data(self, which, row, col, value):
+        self.updates.append((which, row, col, value))
+
+
+@pytest.fixture()
+def schedule():
+    return Schedule(SCHEDULE_FILE)
+
+
+@pytest.fixture()
+def gui():
+    return AllocationGridTest()
+
+
+# ============================================================================
+# tests
+# ============================================================================
+def test_refresh_without_changes_updates_nothing(schedule, gui):
+    editor = AllocationEditor(lambda *_: None, None, schedule, gui=gui)
+    editor.refresh()
+    assert editor.is_current()
+    assert gui.populated == 1
+    assert gui.updates == []
+
+
+def test_refresh_updates_only_changed_cells(schedule, gui):
+    editor = AllocationEditor(lambda *_: None, None, schedule, gui=gui)
+    (row, col), datum = next(((loc, d) for loc, d in editor.inner_data.items() if d.hours == 0))
+    datum.section.set_teacher_allocation(datum.teacher, 2)
+
+    editor.refresh()
+    assert editor.is_current()
+    assert ('data', row, col, 2) in gui.updates
+    assert {(which, r) for which, r, _, _ in gui.updates if which == 'summary'} == {('summary', row)}
+    assert [c for which, _, c, _ in gui.updates if which == 'bottom'] == [col]
+
+    # same as a new editor
+    other = AllocationGridTest()
+    AllocationEditor(lambda *_: None, None, schedule, gui=other)
+    assert other.summaries == editor._summaries
+    assert other.bottom == editor._remaining
+
+
+def test_refresh_after_release_changes(schedule, gui):
+    editor = AllocationEditor(lambda *_: None, None, schedule, gui=gui)
+    teacher = editor.teachers[0]
+    teacher.release = 0.5
+    editor.refresh()
+    assert ('summary', 0, 0, " 0.500") in gui.updates
+
+
+def test_adding_a_teacher_needs_a_new_editor(schedule, gui):
+    editor = AllocationEditor(lambda *_: None, None, schedule, gui=gui)
+    schedule.add_update_teacher("Yogi", "Bear")
+    assert not editor.is_current()
+
+
+def test_cell_edit_then_refresh(schedule, gui):
+    editor = AllocationEditor(lambda *_: None, None, schedule, gui=gui)
+    (row, col), datum = next(((loc, d) for loc, d in editor.inner_data.items() if d.hours == 0))
+    editor.data_change_handler(row, col, 3)
+
+    # the allocation is put back somewhere else
+    datum.section.set_teacher_allocation(datum.teacher, 0)
+    gui.updates.clear()
+    editor.refresh()
+    assert ('data', row, col, 0) in gui.updates
+    assert any(which == 'summary' and r == row for which, r, _, _ in gui.updates)
+    assert any(which == 'bottom' and c == col for which, _, c, _ in gui.updates)
@@ -0,0 +1,122 @@
+import pytest
+
+from src.scheduling_and_allocation.model import ResourceType, ConflictType, Schedule, WeekDay, SemesterType
+from src.scheduling_and_allocation.presenter.overview import Overview, OverviewBlock, occupancy
+
+
+# =====================================================================================================================
+# Overview Gui Test class
+# =====================================================================================================================
+class OverviewTkTest:
+    def __init__(self):
+        self.get_lane_blocks_handler = lambda *_: []
+        self.open_view_handler = lambda lane: None
+        self.on_closing_handler = lambda *_: None
+        self.lanes = []
+        self.killed = False
+
+    def set_lanes(self, names):
+        self.lanes = names
+
+    def kill(self):
+        self.killed = True
+
+
+class ViewsControllerTest:
+    def __init__(self):
+        self.views = []
+        self.closed = None
+
+    def call_view(self, resource):
+        self.views.append(resource)
+
+    def overview_is_closing(self, resource_type):
+        self.closed = resource_type
+
+
+# =====================================================================================================================
+# fixtures
+# =====================================================================================================================
+@pytest.fixture()
+def schedule_obj():
+    schedule = Schedule()
+    t1 = schedule.add_update_teacher("Jane", "Doe", teacher_id="1")
+    t2 = schedule.add_update_teacher("John", "Doe", teacher_id="2")
+    schedule.add_update_teacher("Babe", "Ruth", teacher_id="3")
+    l1 = schedule.add_update_lab("P107", "C-Lab")
+
+    c_001 = schedule.add_update_course("001", "BasketWeaving", SemesterType.fall)
+    s_001_1 = c_001.add_section("1", section_id=1)
+    b1 = s_001_1.add_block(WeekDay.Monday, 8)
+    b2 = s_001_1.add_block(WeekDay.Monday, 9)
+    b3 = s_001_1.add_block(WeekDay.Tuesday, 10)
+    b1.add_teacher(t1)
+    b2.add_teacher(t1)
+    b3.add_teacher(t2)
+    b1.add_lab(l1)
+    return schedule
+
+
+# =====================================================================================================================
+# tests
+# =====================================================================================================================
+def test_occupancy_merges_overlapping_blocks():
+    """blocks that overlap or touch on the same day are merged, keeping all conflicts"""
+    blocks = [OverviewBlock(1, 9.5, 1.5, ConflictType.LUNCH),
+              OverviewBlock(1, 8, 1.5, ConflictType.NONE),
+              OverviewBlock(1, 13, 1, movable=False),
+              OverviewBlock(2, 8, 1)]
+
+    merged = occupancy(blocks)
+
+    assert [(b.day, b.start, b.duration) for b in merged] == [(1, 8, 3), (1, 13, 1), (2, 8, 1)]
+    assert merged[0].conflict == ConflictType.LUNCH
+    assert not merged[1].movable
+
+
+def test_one_lane_per_resource(schedule_obj):
+    """each teacher gets a lane, even if they have no blocks"""
+    gui = OverviewTkTest()
+    overview = Overview(ViewsControllerTest(), "", schedule_obj, ResourceType.teacher, gui=gui)
+
+    assert gui.lanes == [str(t) for t in sorted(schedule_obj.teachers())]
+    assert gui.get_lane_blocks_handler == overview.get_lane_blocks
+
+
+def test_lane_blocks_detailed_and_not(schedule_obj):
+    """detailed lanes have every block with its text, otherwise only the occupied times"""
+    overview = Overview(ViewsControllerTest(), "", schedule_obj, ResourceType.teacher, gui=OverviewTkTest())
+    lane = overview.resources.index(schedule_obj.get_teacher_by_name("Jane", "Doe"))
+
+    detailed = overview.get_lane_blocks(lane, detailed=True)
+    summary = overview.get_lane_blocks(lane, detailed=False)
+
+    assert len(detailed) == 2
+    assert all(b.text for b in detailed)
+    assert [(b.day, b.start, b.duration) for b in summary] == [(1, 8, 2.5)]
+    assert overview.get_lane_blocks(len(overview.resources), detailed=True) == []
+
+
+def test_refresh_after_schedule_change(schedule_obj):
+    """blocks assigned to a teacher after the overview was created show up after a refresh"""
+    overview = Overview(ViewsControllerTest(), "", schedule_obj, ResourceType.teacher, gui=OverviewTkTest())
+    teacher = schedule_obj.get_teacher_by_name("Babe", "Ruth")
+    lane = overview.resources.index(teacher)
+    assert overview.get_lane_blocks(lane, detailed=True) == []
+
+    schedule_obj.blocks()[0].add_teacher(teacher)
+    overview.refresh()
+
+    assert len(overview.get_lane_blocks(lane, detailed=True)) == 1
+
+
+def test_open_view_and_close(schedule_obj):
+    """double-clicking a lane opens the view for the resource, closing informs the views controller"""
+    vc = ViewsControllerTest()
+    overview = Overview(vc, "", schedule_obj, ResourceType.lab, gui=OverviewTkTest())
+
+    overview.open_view(0)
+    overview.on_closing()
+
+    assert vc.views == [schedule_obj.get_lab_by_number("P107")]
+    assert vc.closed == ResourceType.lab
@@ -34,6 +34,9 @@ class ViewDynamicTkTest:
         # handles a double click on a gui block
         self.double_click_block_handler: Callable[[str], None] = lambda gui_id: None
 
+        # returns the number of conflicts a gui block would have at each (day, start)
+        self.get_drop_targets_handler: Callable[[str], dict[tuple[int, float], int]] = lambda gui_id: {}
+
         # handles the movement of a gui block
         self.gui_block_is_moving_handler: Callable[[str, float, float], None] = lambda gui_id, day, start: None
 
@@ -47,6 +50,8 @@ class ViewDynamicTkTest:
 
         self.draw_blocks_info = {}
         self.colour_blocks_info = {}
+        self.draw_blocks_text = {}
+        self.removed_blocks = []
 
     def get_scale(self):
         return 1
@@ -69,6 +74,13 @@ class ViewDynamicTkTest:
     def modify_movable(self, gui_id, flag):
         pass
 
+    def set_block_text(self, gui_block_id: str, text: str):
+        self.draw_blocks_text[gui_block_id] = text
+
+    def remove_block(self, gui_block_id: str):
+        self.draw_blocks_info.pop(gui_block_id, None)
+        self.removed_blocks.append(gui_block_id)
+
 
 # =====================================================================================================================
 # Views Controller
@@ -281,6 +293,60 @@ def test_draw_blocks(schedule_obj, view_control, gui):
                                                 block.duration, block.movable)
         assert gui.colour_blocks_info[gui_id] == (ResourceType.teacher, block.movable, block.conflict )
 
+def test_draw_blocks_only_updates_what_has_changed(schedule_obj, view_control, gui):
+    """redraw the blocks after the schedule has changed
+    1. unchanged gui blocks are kept, and are not redrawn
+    2. blocks that no longer belong to the resource are removed
+    3. blocks that have been moved keep their gui ids
+    """
+
+    # prepare
+    teacher = schedule_obj.get_teacher_by_name("Jane","Doe")
+    view = View(view_control,"", schedule_obj, resource=teacher,
+                dirty_flag_method = dirty_flag_method, gui=gui )
+    block1, block2 = schedule_obj.get_blocks_for_teacher(teacher)
+    gui_ids = {block: gui_id for gui_id, block in view.gui_blocks.items()}
+    gui.draw_blocks_info.clear()
+    gui.colour_blocks_info.clear()
+
+    # execute
+    view.draw_blocks()
+
+    # verify
+    assert len(gui.draw_blocks_info) == 0
+    assert len(gui.colour_blocks_info) == 0
+
+    # execute
+    block1.remove_teacher(teacher)
+    block2.start = 13
+    view.draw_blocks()
+
+    # verify
+    assert gui.removed_blocks == [gui_ids[block1]]
+    assert not view.is_block_in_view(block1)
+    assert view.gui_blocks == {gui_ids[block2]: block2}
+    assert len(gui.draw_blocks_info) == 0
+
+def test_block_text_only_changes_when_block_changes(schedule_obj):
+    """block text is remembered until the block or the scale changes"""
+
+    # prepare
+    teacher = schedule_obj.get_teacher_by_name("Jane","Doe")
+    lab = schedule_obj.get_lab_by_number("P322")
+    block = schedule_obj.get_blocks_for_teacher(teacher)[0]
+    text = View.get_block_text(block, ResourceType.teacher)
+
+    # execute
+    same_text = View.get_block_text(block, ResourceType.teacher)
+    block.add_lab(lab)
+    new_text = View.get_block_text(block, ResourceType.teacher)
+
+    # verify
+    assert same_text is text
+    assert "P322" not in text
+    assert "P322" in new_text
+    assert new_text == View._make_block_text(block, ResourceType.teacher)
+
 def test_view_keeps_track_of_blocks_and_gui_ids(schedule_obj, view_control, gui):
     """Create the view
     1. Able to determine if a certain block is in the view
@@ -447,6 +513,29 @@ def test_handle_double_click(schedule_obj, view_control, gui):
     # verify
     assert view_control.open_companion_view_called == block
 
+def test_get_drop_targets(schedule_obj, view_control, gui):
+    """block is about to be dragged
+    1. the number of conflicts at every place it could be dropped comes from the schedule
+    2. block has not moved
+    """
+
+    # prepare
+    teacher = schedule_obj.get_teacher_by_name("Jane","Doe")
+    view = View(view_control,"", schedule_obj, resource=teacher,
+                dirty_flag_method = dirty_flag_method, gui=gui )
+    gui_id = list(view.gui_blocks.keys())[0]
+    block = view.gui_blocks[gui_id]
+    o_day, o_start = block.day, block.start
+
+    # execute
+    targets = gui.get_drop_targets_handler(gui_id)
+
+    # validate
+    assert targets == schedule_obj.drop_target_conflicts(block)
+    assert (block.day, block.start) == (o_day, o_start)
+    assert gui.get_drop_targets_handler("no such block") == {}
+
+
 def test_gui_block_is_moving(schedule_obj, view_control, gui):
     """block is moving
     1. view_control is informed
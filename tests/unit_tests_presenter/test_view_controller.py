@@ -45,7 +45,7 @@ class ViewTest:
         self.move_gui_block_args.append((block, day, start_time))
         MOVE_GUI_BLOCK_TO += 1
 
-    def refresh_block_colours(self):
+    def refresh_block_colours(self, blocks=None):
         global REFRESH_COLOURS_CALLED
         REFRESH_COLOURS_CALLED += 1
 
@@ -59,6 +59,15 @@ class ViewTest:
     def is_block_in_view(self, block):
         return True
 
+class OverviewTest:
+    def __init__(self, views_controller, frame, schedule, resource_type, gui=None):
+        self.gui = GUI()
+        self.refreshed = 0
+
+    def refresh(self):
+        self.refreshed += 1
+
+
 # =====================================================================================================================
 # ViewsControllerTestTkTest
 # =====================================================================================================================
@@ -259,6 +268,32 @@ def test_block_moved_view_updated(schedule_obj, gui, monkeypatch):
     # verify
     assert MOVE_GUI_BLOCK_TO == 1
 
+def test_block_moved_only_views_showing_block_updated(schedule_obj, gui, monkeypatch):
+    """block has moved
+    1. only the views that show the block are told to update their gui_block positions
+    2. the views are only asked if they show the block once
+    """
+
+    # prepare
+    monkeypatch.setattr("src.scheduling_and_allocation.presenter.views_controller.View", ViewTest)
+    vc = ViewsController(dirty_flag_method, "", schedule_obj, gui)
+    teacher: Teacher = schedule_obj.get_teacher_by_name("Jane","Doe")
+    teacher2: Teacher = schedule_obj.get_teacher_by_name("John","Doe")
+    block1 = schedule_obj.get_blocks_for_teacher(teacher)[0]
+    vc.call_view(teacher)
+    vc.call_view(teacher2)
+    asked = []
+    vc._views[teacher2.number].is_block_in_view = lambda block: asked.append(block) or False
+
+    # execute
+    vc.notify_block_move(None, block1, block1.day.value, block1.start)
+    vc.notify_block_move(None, block1, block1.day.value, block1.start + 0.5)
+
+    # verify
+    assert len(vc._views[teacher.number].move_gui_block_args) == 2
+    assert len(vc._views[teacher2.number].move_gui_block_args) == 0
+    assert asked == [block1]
+
 def test_block_movable_changed(schedule_obj, gui, monkeypatch):
     """block movable has been changed
     1. NOTE: dirty flag is updated in the view where the event happened
@@ -509,3 +544,34 @@ def test_undo_redo_no_action_required(schedule_obj, gui, monkeypatch):
     vc.redo()
     vc.redo()
 
+
+
+def test_overviews_refreshed_when_blocks_change(schedule_obj, gui, monkeypatch):
+    """open overviews are redrawn when a block is moved, made movable, given to another resource, or undone
+    (but not for every step of a drag that stays at the same time)"""
+    monkeypatch.setattr("src.scheduling_and_allocation.presenter.views_controller.View", ViewTest)
+    monkeypatch.setattr("src.scheduling_and_allocation.presenter.views_controller.Overview", OverviewTest)
+    vc = ViewsController(dirty_flag_method, "", schedule_obj, gui)
+    teacher1: Teacher = schedule_obj.get_teacher_by_name("Jane","Doe")
+    teacher2: Teacher = schedule_obj.get_teacher_by_name("John","Doe")
+    block = schedule_obj.get_blocks_for_teacher(teacher1)[0]
+    vc.call_overview(ResourceType.teacher)
+    overview = vc._overviews[ResourceType.teacher]
+
+    # drag the block, it only snaps to a new time once
+    vc.notify_block_move(None, block, block.day.value, block.start)
+    vc.notify_block_move(None, block, block.day.value, block.start + 0.1)
+    block.start = block.start + 0.5
+    vc.notify_block_move(None, block, block.day.value, block.start)
+    assert overview.refreshed == 2
+
+    block.movable = not block.movable
+    vc.notify_block_movable_toggled(block)
+    assert overview.refreshed == 3
+
+    vc.notify_move_block_to_resource(ResourceType.teacher, block, teacher1, teacher2)
+    assert overview.refreshed == 4
+
+    vc.save_action_block_movable_toggled(block, not block.movable)
+    vc.undo()
+    assert overview.refreshed == 5
@@ -0,0 +1,63 @@
+from src.scheduling_and_allocation.modified_tk.Viewport import Viewport
+
+
+def test_visible_items():
+    view = Viewport(total=10, size=4)
+    assert list(view.visible()) == [0, 1, 2, 3]
+    assert view.index(0) == 0
+    assert view.index(4) is None
+    assert view.slot(3) == 3
+    assert view.slot(4) is None
+
+
+def test_window_bigger_than_total():
+    view = Viewport(total=3, size=10)
+    assert list(view.visible()) == [0, 1, 2]
+    assert view.index(3) is None
+    assert not view.scroll(1)
+    assert view.fractions() == (0.0, 1.0)
+
+
+def test_scroll_stays_in_range():
+    view = Viewport(total=10, size=4)
+    assert view.scroll(3)
+    assert view.first == 3
+    assert view.index(0) == 3
+    assert view.slot(3) == 0
+    assert view.slot(2) is None
+
+    view.scroll(1, "pages")
+    assert view.first == 6
+    assert not view.scroll(5)
+    assert view.first == 6
+    view.scroll(-100)
+    assert view.first == 0
+
+
+def test_see_scrolls_as_little_as_possible():
+    view = Viewport(total=20, size=5)
+    assert not view.see(4)
+    assert view.see(5)
+    assert view.first == 1
+    assert view.see(0)
+    assert view.first == 0
+
+
+def test_scrollbar_commands():
+    view = Viewport(total=20, size=5)
+    assert view.command("moveto", "0.5")
+    assert view.first == 10
+    assert view.fractions() == (0.5, 0.75)
+    assert view.command("scroll", "-1", "units")
+    assert view.first == 9
+    assert not view.command("bogus")
+
+
+def test_resize_keeps_view_in_range():
+    view = Viewport(total=20, size=5)
+    view.scroll_to(15)
+    assert view.resize(size=10)
+    assert view.first == 10
+    assert view.resize(total=12)
+    assert view.first == 2
+    assert list(view.visible()) == list(range(2, 12))